@@ -17,6 +17,7 @@ from app.common.database import Base
 from app.trading.models.position import Position  # noqa: F401
 from app.trading.models.cycle_history import CycleHistory  # noqa: F401
 from app.trading.models.order import Order  # noqa: F401
+from app.trading.models.daily_snapshot import DailySnapshot  # noqa: F401
 
 # Alembic Config 객체
 config = context.config
@@ -48,7 +49,12 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """마이그레이션 실행"""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite는 ALTER가 제한적이라 테이블 재생성(batch) 방식으로 변경
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
 
     with context.begin_transaction():
         context.run_migrations()
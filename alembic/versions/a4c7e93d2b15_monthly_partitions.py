@@ -0,0 +1,144 @@
+"""monthly partitions for orders and daily_snapshots
+
+Revision ID: a4c7e93d2b15
+Revises: f2b9d4e61c38
+Create Date: 2026-10-19 20:07:14.662093
+
+Postgres 전용 - 다른 DB에서는 아무것도 하지 않는다.
+기존 테이블을 월 단위 RANGE 파티션 테이블로 옮긴다. 기존 데이터가 있는 달부터 3개월 뒤까지
+파티션을 만들고, 이후 파티션은 app.trading.repository.partitions가 만든다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c7e93d2b15'
+down_revision: Union[str, Sequence[str], None] = 'f2b9d4e61c38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+
+def _create_partitions(table: str, column: str, unique: str | None = None) -> None:
+    """기존 데이터의 첫 달부터 MONTHS_AHEAD개월 뒤까지 월 파티션 생성"""
+    unique_index = (
+        f"EXECUTE format('CREATE UNIQUE INDEX %I ON %I ({unique})', "
+        f"part || '_{unique}', part);"
+        if unique
+        else ""
+    )
+    op.execute(f"""
+        DO $$
+        DECLARE
+            cur date := date_trunc(
+                'month', coalesce((SELECT min({column}) FROM {table}_legacy), now())
+            )::date;
+            last_month date := (
+                date_trunc('month', now()) + interval '{MONTHS_AHEAD} months'
+            )::date;
+            part text;
+        BEGIN
+            WHILE cur <= last_month LOOP
+                part := format('{table}_y%sm%s', to_char(cur, 'YYYY'), to_char(cur, 'MM'));
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF {table} FOR VALUES FROM (%L) TO (%L)',
+                    part, cur, (cur + interval '1 month')::date
+                );
+                {unique_index}
+                cur := (cur + interval '1 month')::date;
+            END LOOP;
+        END $$;
+    """)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # orders - 기본키 (id, created_at), client_order_id 유일 인덱스는 파티션마다
+    op.execute("ALTER TABLE orders RENAME TO orders_legacy")
+    op.execute("ALTER TABLE orders_legacy RENAME CONSTRAINT orders_pkey TO orders_legacy_pkey")
+    for index in (
+        'ix_orders_symbol',
+        'ix_orders_client_order_id',
+        'ix_orders_symbol_cycle_created',
+        'ix_orders_created_at_id',
+    ):
+        op.execute(f"DROP INDEX {index}")
+    op.execute(
+        "CREATE TABLE orders (LIKE orders_legacy INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    op.execute("ALTER TABLE orders ADD CONSTRAINT orders_pkey PRIMARY KEY (id, created_at)")
+    op.execute("CREATE INDEX ix_orders_symbol ON orders (symbol)")
+    op.execute(
+        "CREATE INDEX ix_orders_symbol_cycle_created ON orders (symbol, cycle_number, created_at)"
+    )
+    op.execute("CREATE INDEX ix_orders_created_at_id ON orders (created_at, id)")
+    _create_partitions('orders', 'created_at', unique='client_order_id')
+    op.execute("INSERT INTO orders SELECT * FROM orders_legacy")
+    op.execute("DROP TABLE orders_legacy")
+
+    # daily_snapshots - (symbol, trading_date) 유일 제약은 파티션 키를 포함하므로 그대로
+    op.execute("ALTER TABLE daily_snapshots RENAME TO daily_snapshots_legacy")
+    op.execute(
+        "ALTER TABLE daily_snapshots_legacy "
+        "RENAME CONSTRAINT daily_snapshots_pkey TO daily_snapshots_legacy_pkey"
+    )
+    op.execute(
+        "ALTER TABLE daily_snapshots_legacy "
+        "RENAME CONSTRAINT uq_daily_snapshots_symbol_date TO uq_daily_snapshots_legacy"
+    )
+    op.execute(
+        "CREATE TABLE daily_snapshots (LIKE daily_snapshots_legacy INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (trading_date)"
+    )
+    op.execute(
+        "ALTER TABLE daily_snapshots "
+        "ADD CONSTRAINT daily_snapshots_pkey PRIMARY KEY (id, trading_date)"
+    )
+    op.execute(
+        "ALTER TABLE daily_snapshots "
+        "ADD CONSTRAINT uq_daily_snapshots_symbol_date UNIQUE (symbol, trading_date)"
+    )
+    _create_partitions('daily_snapshots', 'trading_date')
+    op.execute("INSERT INTO daily_snapshots SELECT * FROM daily_snapshots_legacy")
+    op.execute("DROP TABLE daily_snapshots_legacy")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # 파티션을 합쳐 일반 테이블로 (분리(DETACH)된 보관 파티션은 옮기지 않음)
+    op.execute("CREATE TABLE orders_plain (LIKE orders INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO orders_plain SELECT * FROM orders")
+    op.execute("DROP TABLE orders")
+    op.execute("ALTER TABLE orders_plain RENAME TO orders")
+    op.execute("ALTER TABLE orders ADD CONSTRAINT orders_pkey PRIMARY KEY (id)")
+    op.create_index(op.f('ix_orders_symbol'), 'orders', ['symbol'], unique=False)
+    op.create_index(
+        op.f('ix_orders_client_order_id'), 'orders', ['client_order_id'], unique=True
+    )
+    op.create_index(
+        'ix_orders_symbol_cycle_created', 'orders',
+        ['symbol', 'cycle_number', 'created_at'], unique=False,
+    )
+    op.create_index('ix_orders_created_at_id', 'orders', ['created_at', 'id'], unique=False)
+
+    op.execute("CREATE TABLE daily_snapshots_plain (LIKE daily_snapshots INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO daily_snapshots_plain SELECT * FROM daily_snapshots")
+    op.execute("DROP TABLE daily_snapshots")
+    op.execute("ALTER TABLE daily_snapshots_plain RENAME TO daily_snapshots")
+    op.execute(
+        "ALTER TABLE daily_snapshots ADD CONSTRAINT daily_snapshots_pkey PRIMARY KEY (id)"
+    )
+    op.execute(
+        "ALTER TABLE daily_snapshots "
+        "ADD CONSTRAINT uq_daily_snapshots_symbol_date UNIQUE (symbol, trading_date)"
+    )
@@ -0,0 +1,31 @@
+"""position version
+
+Revision ID: b6d3f8a21c47
+Revises: a4c7e93d2b15
+Create Date: 2026-10-19 21:32:05.417260
+
+포지션 낙관적 잠금 - 갱신할 때마다 version이 1씩 오르고, UPDATE는 읽은 version과 같을 때만 반영된다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d3f8a21c47'
+down_revision: Union[str, Sequence[str], None] = 'a4c7e93d2b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'positions', sa.Column('version', sa.Integer(), server_default='1', nullable=False)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('positions', 'version')
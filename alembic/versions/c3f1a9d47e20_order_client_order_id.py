@@ -0,0 +1,32 @@
+"""order client_order_id
+
+Revision ID: c3f1a9d47e20
+Revises: b18e15aba6a1
+Create Date: 2026-10-19 10:12:41.218530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f1a9d47e20'
+down_revision: Union[str, Sequence[str], None] = 'b18e15aba6a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orders', sa.Column('client_order_id', sa.String(length=64), nullable=True))
+    op.create_index(
+        op.f('ix_orders_client_order_id'), 'orders', ['client_order_id'], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_orders_client_order_id'), table_name='orders')
+    op.drop_column('orders', 'client_order_id')
@@ -0,0 +1,27 @@
+"""order kiwoom_order_id index
+
+Revision ID: c8e4a1d93f56
+Revises: b6d3f8a21c47
+Create Date: 2026-10-20 09:41:27.805312
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e4a1d93f56'
+down_revision: Union[str, Sequence[str], None] = 'b6d3f8a21c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_orders_kiwoom_order_id', 'orders', ['kiwoom_order_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_orders_kiwoom_order_id', table_name='orders')
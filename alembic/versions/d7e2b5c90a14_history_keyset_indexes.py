@@ -0,0 +1,41 @@
+"""history keyset indexes
+
+Revision ID: d7e2b5c90a14
+Revises: c3f1a9d47e20
+Create Date: 2026-10-19 14:03:27.551902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7e2b5c90a14'
+down_revision: Union[str, Sequence[str], None] = 'c3f1a9d47e20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_orders_symbol_cycle_created', 'orders',
+        ['symbol', 'cycle_number', 'created_at'], unique=False,
+    )
+    op.create_index('ix_orders_created_at_id', 'orders', ['created_at', 'id'], unique=False)
+    op.create_index(
+        'ix_cycle_histories_symbol_cycle_ended', 'cycle_histories',
+        ['symbol', 'cycle_number', 'ended_at'], unique=False,
+    )
+    op.create_index(
+        'ix_cycle_histories_ended_at_id', 'cycle_histories', ['ended_at', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_cycle_histories_ended_at_id', table_name='cycle_histories')
+    op.drop_index('ix_cycle_histories_symbol_cycle_ended', table_name='cycle_histories')
+    op.drop_index('ix_orders_created_at_id', table_name='orders')
+    op.drop_index('ix_orders_symbol_cycle_created', table_name='orders')
@@ -0,0 +1,66 @@
+"""cycle_performance materialized view
+
+Revision ID: e5a8c1f37b62
+Revises: d7e2b5c90a14
+Create Date: 2026-10-19 16:41:05.183264
+
+Postgres 전용 - 다른 DB에서는 아무것도 하지 않는다.
+정의는 app.trading.repository.analytics.stats_query와 같다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a8c1f37b62'
+down_revision: Union[str, Sequence[str], None] = 'd7e2b5c90a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("""
+        CREATE MATERIALIZED VIEW cycle_performance AS
+        WITH ranked AS (
+            SELECT
+                symbol,
+                profit,
+                CAST(profit_rate AS FLOAT) AS profit_rate,
+                end_proceeds,
+                EXTRACT(epoch FROM ended_at - started_at) / 86400.0 AS days,
+                first_value(start_investment) OVER w AS first_investment,
+                CAST(end_proceeds AS FLOAT) / CAST(max(start_investment) OVER (
+                    w ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+                ) AS FLOAT) - 1 AS drawdown,
+                row_number() OVER (
+                    PARTITION BY symbol ORDER BY ended_at DESC, id DESC
+                ) AS recency
+            FROM cycle_histories
+            WINDOW w AS (PARTITION BY symbol ORDER BY ended_at, id)
+        )
+        SELECT
+            symbol,
+            count(*) AS cycles,
+            sum(CASE WHEN profit > 0 THEN 1 ELSE 0 END) AS wins,
+            avg(days) AS avg_cycle_days,
+            avg(profit_rate) AS avg_profit_rate,
+            sum(profit) AS total_profit,
+            CAST(max(CASE WHEN recency = 1 THEN end_proceeds END) AS FLOAT)
+                / CAST(max(first_investment) AS FLOAT) - 1 AS cumulative_return,
+            min(drawdown) AS max_drawdown
+        FROM ranked
+        GROUP BY symbol
+    """)
+    # REFRESH ... CONCURRENTLY에 필요
+    op.execute("CREATE UNIQUE INDEX ix_cycle_performance_symbol ON cycle_performance (symbol)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS cycle_performance")
@@ -0,0 +1,42 @@
+"""daily snapshots
+
+Revision ID: f2b9d4e61c38
+Revises: e5a8c1f37b62
+Create Date: 2026-10-19 18:22:50.904517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b9d4e61c38'
+down_revision: Union[str, Sequence[str], None] = 'e5a8c1f37b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('daily_snapshots',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('symbol', sa.String(length=10), nullable=False),
+    sa.Column('trading_date', sa.Date(), nullable=False),
+    sa.Column('cycle_number', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('avg_price', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('close', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('investment', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('unrealized_pnl', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('splits_used', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('symbol', 'trading_date', name='uq_daily_snapshots_symbol_date')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('daily_snapshots')
@@ -2,6 +2,7 @@
 
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -13,6 +14,13 @@ class EmergencySellMode(str, Enum):
     WAIT = "wait"  # 목표 수익률 도달까지 대기
 
 
+class InstrumentType(str, Enum):
+    """호가단위 체계 구분"""
+
+    STOCK = "stock"  # 주식 (2023.01 개편 기준)
+    ETF = "etf"  # ETF/ETN/ELW
+
+
 class Settings(BaseSettings):
     """애플리케이션 설정"""
 
@@ -27,9 +35,32 @@ class Settings(BaseSettings):
     kiwoom_app_secret: str
     kiwoom_account_no: str
     kiwoom_is_mock: bool = True
+    kiwoom_cassette_mode: str = "off"  # off, record, replay
+    kiwoom_cassette_path: str = "cassettes/kiwoom.jsonl"
+    kiwoom_rate_limit_per_sec: float = 0.0  # 클라이언트 초당 호출 제한 (0 = 제한 없음)
+    kiwoom_timeout: float = 5.0  # 조회 요청 타임아웃 (초)
+    kiwoom_order_timeout: float = 3.0  # 주문/취소 요청 타임아웃 (초, 결과 불명 시 대조 후 재시도)
 
-    # Database
+    # Database (postgresql+asyncpg://... 또는 sqlite+aiosqlite:///파일 | :memory:)
     database_url: str
+    sqlite_journal_mode: str = "wal"  # SQLite 저널 모드 (wal, delete 등)
+    sqlite_synchronous: str = "normal"  # SQLite 동기화 수준 (WAL에서는 normal 권장)
+    db_pool_size: int = 5  # 유지할 풀 연결 수
+    db_max_overflow: int = 5  # 몰릴 때 추가로 여는 연결 수
+    db_pool_recycle: int = 1800  # 이 시간(초)이 지난 연결은 새로 연결
+    db_pool_timeout: float = 10.0  # 풀 체크아웃 최대 대기 (초)
+    db_pool_pre_ping: bool = True  # 체크아웃 때 끊긴 연결 확인
+    db_pool_warmup: bool = True  # 시작 시 풀 연결을 미리 열어 둠
+    db_statement_cache_size: int = 100  # asyncpg prepared statement 캐시 (PgBouncer면 0)
+
+    write_behind_enabled: bool = False  # 주문/사이클 기록을 저널 후 백그라운드 배치 반영
+    write_behind_journal: str = "data/write_behind.jsonl"
+    write_behind_flush_seconds: float = 1.0  # 배치 반영 주기
+    partition_months_ahead: int = 3  # 미리 만들어 둘 월 파티션 수 (Postgres)
+    partition_retention_months: int = 0  # 이번 달 포함 보존 개월 수 (0: 정리 안 함)
+    partition_archive: bool = True  # 보존 기간 지난 파티션: True 분리(보관), False 삭제
+    position_cache_enabled: bool = False  # 포지션 메모리 캐시 (시작 시 적재, 갱신은 커밋 후 반영)
+    analytics_materialized_view: bool = False  # 성과 통계 구체화 뷰 (Postgres, 사이클 완료 시 갱신)
 
     # Telegram
     telegram_bot_token: str
@@ -37,16 +68,41 @@ class Settings(BaseSettings):
 
     # Trading
     trading_symbol: str = "133690"
+    trading_symbols: str = ""  # 다종목 매수 작업 대상 (쉼표 구분, 비우면 trading_symbol)
     total_investment: Decimal = Decimal("10000000")
     num_splits: int = 40
     profit_target: Decimal = Decimal("1.10")  # 1.10 = +10%
     emergency_sell_mode: EmergencySellMode = EmergencySellMode.QUARTER
+    trading_instrument_type: InstrumentType = InstrumentType.ETF  # 호가단위 체계
+    intraday_triggers: bool = False  # 목표가 매도를 09:00 지정가 대신 장중 트리거로 처리
+    trigger_poll_seconds: int = 5  # 트리거 시세 폴링 주기
+    order_sweep_concurrency: int = 4  # 미체결 정리 시 동시 취소/정정 수
+    order_submit_concurrency: int = 8  # 매수 작업 시 동시 주문 제출 수
+    order_submit_retries: int = 2  # 결과 불명(타임아웃 등) 주문의 재제출 횟수
+
+    # Observability
+    metrics_enabled: bool = True
+    metrics_host: str = "127.0.0.1"
+    metrics_port: int = 9464
+    tracing_exporter: str = "none"  # none, file, otlp
+    tracing_file: str = "traces/traces.jsonl"
+    tracing_otlp_endpoint: str = "http://127.0.0.1:4318"
+    tracing_sample_ratio: float = 1.0
+    tracing_slow_threshold: float = 10.0  # 초과 시 소요시간 분해 로그
+    profile_jobs: str = ""  # 다음 1회 프로파일링할 작업 (쉼표 구분, "all")
+    profile_dir: str = "profiles"
 
     @property
     def investment_per_split(self) -> Decimal:
         """1회 분할 매수 금액"""
         return self.total_investment / self.num_splits
 
+    @property
+    def symbol_list(self) -> list[str]:
+        """매수 작업 대상 종목"""
+        symbols = [s.strip() for s in self.trading_symbols.split(",") if s.strip()]
+        return list(dict.fromkeys(symbols)) or [self.trading_symbol]
+
     @property
     def kiwoom_base_url(self) -> str:
         """키움 REST API 기본 URL"""
@@ -55,4 +111,24 @@ class Settings(BaseSettings):
         return "https://api.kiwoom.com"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """설정 인스턴스 반환 (최초 호출 시 .env 로드)"""
+    return Settings()
+
+
+class _LazySettings:
+    """첫 속성 접근 시점에 Settings를 생성하는 프록시
+
+    임포트만으로 .env 검증이 일어나지 않도록 하여
+    전략/테스트 모듈을 설정 없이 가볍게 임포트할 수 있게 한다.
+    """
+
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
+
+    def __repr__(self) -> str:
+        return f"<LazySettings loaded={get_settings.cache_info().currsize > 0}>"
+
+
+settings: Settings = _LazySettings()  # type: ignore[assignment]
@@ -0,0 +1,124 @@
+"""원화 금액/비율 고정소수점 타입
+
+- Won: 원 단위 정수 금액 (int 하위 타입이라 산술은 int 속도, Decimal과 비교 가능)
+- Rate: 1e-6 단위 정수 비율 (1.10 → Rate(1_100_000))
+- Rounding: 모든 변환에 반올림 규칙을 명시한다
+    DOWN    내림 (매수가, 주문 수량, 분할 금액)
+    UP      올림 (매도 목표가)
+    HALF_UP 반올림 (평단가/수익률 기록)
+
+Decimal은 DB(Numeric) 경계와 외부 입력에서만 쓰고, 계산 경로는 정수로 처리한다.
+예외: 포지션 평단가/매입금액은 0.01원 단위(Numeric(15, 2))라 Decimal로 계산한다 (정수 0.01원으로
+바꿔도 컬럼 경계의 Decimal 변환 비용이 더 커서 빨라지지 않음). 그 평단가로 목표가를 낼 때
+(Rate.apply)는 Decimal을 정확한 정수 분수로 바꿔 정수 연산한다.
+"""
+
+from decimal import ROUND_CEILING, ROUND_FLOOR, ROUND_HALF_UP, Decimal
+from enum import Enum
+
+RATE_SCALE = 1_000_000
+
+
+class Rounding(str, Enum):
+    """반올림 규칙"""
+
+    DOWN = "down"  # -∞ 방향
+    UP = "up"  # +∞ 방향
+    HALF_UP = "half_up"  # 0.5 이상 올림
+
+
+# 핫 루프용 별칭 (Enum 멤버 속성 조회 비용 회피)
+DOWN, UP, HALF_UP = Rounding.DOWN, Rounding.UP, Rounding.HALF_UP
+
+_DECIMAL_ROUNDING = {
+    Rounding.DOWN: ROUND_FLOOR,
+    Rounding.UP: ROUND_CEILING,
+    Rounding.HALF_UP: ROUND_HALF_UP,
+}
+
+
+def div_round(numerator: int, denominator: int, rounding: Rounding = DOWN) -> int:
+    """정수 나눗셈 (반올림 규칙 적용, denominator > 0)"""
+    if rounding is DOWN:
+        return numerator // denominator
+    if rounding is UP:
+        return -(-numerator // denominator)
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+class Won(int):
+    """원 단위 정수 금액"""
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, value: "int | Decimal | str", rounding: Rounding = DOWN) -> "Won":
+        """정수/Decimal/문자열 → Won (소수부는 rounding 규칙으로 처리)"""
+        if type(value) is cls:
+            return value
+        if isinstance(value, int):
+            return cls(value)
+        if isinstance(value, str):
+            try:
+                return cls(int(value))
+            except ValueError:
+                value = Decimal(value)
+        whole = int(value)
+        if whole == value:
+            return cls(whole)
+        return cls(int(value.to_integral_value(rounding=_DECIMAL_ROUNDING[rounding])))
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(int(self))
+
+    def split(self, parts: int) -> "Won":
+        """1/parts 금액 (내림)"""
+        return Won(self // parts)
+
+    def shares(self, price: int) -> int:
+        """이 금액으로 살 수 있는 수량 (내림)"""
+        return self // price if price > 0 else 0
+
+    def __repr__(self) -> str:
+        return f"Won({int(self)})"
+
+    __str__ = int.__repr__  # 주문 파라미터 등 문자열은 숫자 그대로
+
+
+class Rate(int):
+    """1e-6 단위 고정소수점 비율"""
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, value: "Decimal | str | float | int") -> "Rate":
+        """실수 비율 → Rate (1e-6 미만 반올림)"""
+        scaled = Decimal(str(value)) * RATE_SCALE
+        return cls(int(scaled.to_integral_value(rounding=ROUND_HALF_UP)))
+
+    @classmethod
+    def ratio(cls, numerator: int, denominator: int) -> "Rate":
+        """numerator / denominator (반올림)"""
+        if denominator <= 0:
+            return cls(0)
+        return cls(div_round(int(numerator) * RATE_SCALE, int(denominator), HALF_UP))
+
+    def apply(self, amount: "int | Decimal", rounding: Rounding = DOWN) -> Won:
+        """amount × 비율 → Won"""
+        if isinstance(amount, int):
+            return Won(div_round(amount * self, RATE_SCALE, rounding))
+        numerator, denominator = amount.as_integer_ratio()  # Decimal → 정확한 정수 분수
+        return Won(div_round(numerator * self, denominator * RATE_SCALE, rounding))
+
+    def to_decimal(self, places: int | None = None) -> Decimal:
+        """Decimal 비율 (places 지정 시 해당 자릿수로 반올림)"""
+        value = Decimal(int(self)) / RATE_SCALE
+        if places is None:
+            return value
+        return value.quantize(Decimal(1).scaleb(-places), rounding=ROUND_HALF_UP)
+
+    def __repr__(self) -> str:
+        return f"Rate({self.to_decimal()})"
+
+    def __str__(self) -> str:
+        return str(self.to_decimal())
@@ -0,0 +1,116 @@
+"""작업 단위 온디맨드 프로파일링
+
+재배포 없이 다음 스케줄러 작업 1회를 cProfile로 프로파일링한다.
+- 환경변수 `PROFILE_JOBS` (시작 시 예약, 예: "execute_buy_order" 또는 "all")
+- SIGUSR1 시그널 (다음 작업 1회 예약)
+
+"all" 예약은 정해진 시각 작업에만 적용되고, 짧은 주기 폴링 작업은 이름으로 예약해야 한다.
+한 번에 하나의 작업만 프로파일링하며, 진행 중에 시작한 작업은 예약을 소진하지 않는다.
+
+결과는 `{job}_{YYYYmmdd_HHMMSS}.prof`와 누적시간 상위 함수 요약 `.txt`로 저장된다.
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from app.common.utils import get_kst_now
+
+logger = logging.getLogger(__name__)
+
+ANY_JOB = "all"
+
+
+def _normalize(job_id: str) -> str:
+    """job_execute_buy_order → execute_buy_order"""
+    return job_id.strip().removeprefix("job_")
+
+
+class JobProfiler:
+    """예약된 작업을 1회 프로파일링"""
+
+    def __init__(self, output_dir: str | Path = "profiles", top_n: int = 30):
+        self.output_dir = Path(output_dir)
+        self.top_n = top_n
+        self._armed: set[str] = set()
+        self._active = False  # cProfile은 동시에 하나만 활성화 가능 (3.12+는 ValueError)
+
+    def arm(self, job_id: str = ANY_JOB) -> None:
+        """다음 실행 1회 프로파일링 예약"""
+        self._armed.add(_normalize(job_id))
+        logger.info(f"프로파일링 예약: {job_id}")
+
+    def arm_from_spec(self, spec: str) -> None:
+        """쉼표 구분 작업 목록 예약 ("all" 가능)"""
+        for job_id in filter(None, (s.strip() for s in spec.split(","))):
+            self.arm(job_id)
+
+    def _consume(self, job_id: str, explicit_only: bool = False) -> bool:
+        """예약 확인 후 소진 (explicit_only면 "all" 예약은 남겨 둠)"""
+        job_id = _normalize(job_id)
+        if job_id in self._armed:
+            self._armed.discard(job_id)
+            return True
+        if not explicit_only and ANY_JOB in self._armed:
+            self._armed.discard(ANY_JOB)
+            return True
+        return False
+
+    @contextmanager
+    def profile(self, job_id: str, explicit_only: bool = False) -> Iterator[Path | None]:
+        """예약된 경우에만 블록을 프로파일링 (아니면 no-op)
+
+        Args:
+            explicit_only: 이름으로 예약된 경우에만 프로파일링 (폴링 작업용)
+        """
+        if self._active or not self._consume(job_id, explicit_only):
+            yield None
+            return
+
+        timestamp = get_kst_now().strftime("%Y%m%d_%H%M%S")
+        path = self.output_dir / f"{_normalize(job_id)}_{timestamp}.prof"
+        profiler = cProfile.Profile()
+        self._active = True
+        profiler.enable()
+        try:
+            yield path
+        finally:
+            profiler.disable()
+            self._active = False
+            self._save(profiler, path)
+
+    def _save(self, profiler: cProfile.Profile, path: Path) -> None:
+        """프로파일 및 요약 저장 (실패해도 작업에 영향 없음)"""
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(path)
+
+            stream = io.StringIO()
+            stats = pstats.Stats(profiler, stream=stream)
+            stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_n)
+            summary = stream.getvalue()
+            path.with_suffix(".txt").write_text(summary, encoding="utf-8")
+
+            logger.info(f"프로파일 저장: {path} (요약: {path.with_suffix('.txt')})")
+        except Exception as e:
+            logger.warning(f"프로파일 저장 실패 (무시됨): {e}")
+
+
+_profiler = JobProfiler()
+
+
+def get_profiler() -> JobProfiler:
+    """전역 프로파일러"""
+    return _profiler
+
+
+def configure_profiling(output_dir: str, armed_jobs: str = "") -> JobProfiler:
+    """전역 프로파일러 설정"""
+    _profiler.output_dir = Path(output_dir)
+    if armed_jobs:
+        _profiler.arm_from_spec(armed_jobs)
+    return _profiler
@@ -0,0 +1,297 @@
+"""경량 트레이싱 - 작업 단위 span 트리 기록
+
+스케줄러 작업마다 루트 span을 열고, 그 안에서 실행되는
+API 요청/레포지토리 호출/알림 전송을 자식 span으로 기록한다.
+루트 span 종료 시 트레이스 전체를 OTLP JSON 포맷으로 내보낸다.
+
+- 파일 익스포터: 한 줄에 트레이스 하나 (collector의 otlpjsonfile 리시버 호환)
+- OTLP 익스포터: `{endpoint}/v1/traces`로 HTTP POST
+- 루트 span 밖에서 열린 span은 기록하지 않는다 (no-op)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "kang-stock"
+
+
+@dataclass
+class Span:
+    """span 정보"""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    end_ns: int | None = None
+    attributes: dict = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def duration(self) -> float:
+        """소요시간 (초)"""
+        if self.end_ns is None:
+            return 0.0
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+_trace_spans: ContextVar[list[Span] | None] = ContextVar("trace_spans", default=None)
+
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp_json(spans: list[Span]) -> dict:
+    """span 목록 → OTLP ExportTraceServiceRequest (JSON 매핑)"""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": SERVICE_NAME}}
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "app.common.tracing"},
+                        "spans": [
+                            {
+                                "traceId": s.trace_id,
+                                "spanId": s.span_id,
+                                "parentSpanId": s.parent_id or "",
+                                "name": s.name,
+                                "kind": 1,  # INTERNAL
+                                "startTimeUnixNano": str(s.start_ns),
+                                "endTimeUnixNano": str(s.end_ns or s.start_ns),
+                                "attributes": [
+                                    {"key": k, "value": _otlp_value(v)}
+                                    for k, v in s.attributes.items()
+                                ],
+                                "status": (
+                                    {"code": 2, "message": s.error}
+                                    if s.error
+                                    else {"code": 1}
+                                ),
+                            }
+                            for s in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def format_breakdown(spans: list[Span]) -> str:
+    """트레이스 소요시간 분해 (들여쓰기 트리)"""
+    children: dict[str | None, list[Span]] = {}
+    for s in spans:
+        children.setdefault(s.parent_id, []).append(s)
+
+    lines: list[str] = []
+
+    def _walk(parent_id: str | None, depth: int) -> None:
+        for s in sorted(children.get(parent_id, []), key=lambda x: x.start_ns):
+            attrs = " ".join(f"{k}={v}" for k, v in s.attributes.items())
+            line = f"{'  ' * depth}{s.name} {s.duration * 1000:.1f}ms {attrs}".rstrip()
+            lines.append(line + (" ❌" if s.error else ""))
+            _walk(s.span_id, depth + 1)
+
+    _walk(None, 0)
+    return "\n".join(lines)
+
+
+class SpanExporter:
+    """익스포터 인터페이스"""
+
+    def export(self, spans: list[Span]) -> None:
+        raise NotImplementedError
+
+    async def shutdown(self) -> None:
+        pass
+
+
+class FileSpanExporter(SpanExporter):
+    """JSON Lines 파일 익스포터 (트레이스당 1줄)"""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def export(self, spans: list[Span]) -> None:
+        line = json.dumps(to_otlp_json(spans), ensure_ascii=False, separators=(",", ":"))
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class OTLPHttpSpanExporter(SpanExporter):
+    """OTLP/HTTP JSON 익스포터 (백그라운드 전송)"""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.timeout = timeout
+        self._tasks: set[asyncio.Task] = set()
+
+    def export(self, spans: list[Span]) -> None:
+        payload = to_otlp_json(spans)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("이벤트 루프 없음 - 트레이스 전송 생략")
+            return
+        task = loop.create_task(self._post(payload))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _post(self, payload: dict) -> None:
+        import httpx
+
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.post(self.url, json=payload)
+                response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"트레이스 전송 실패 (무시됨): {e}")
+
+    async def shutdown(self) -> None:
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+class Tracer:
+    """트레이서 - 루트 span 샘플링 및 트레이스 단위 내보내기"""
+
+    def __init__(
+        self,
+        exporter: SpanExporter | None = None,
+        sample_ratio: float = 1.0,
+        slow_threshold: float | None = None,
+    ):
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+        self.slow_threshold = slow_threshold
+
+    @contextmanager
+    def root_span(self, name: str, **attributes) -> Iterator[Span | None]:
+        """트레이스 시작 (샘플링 대상이 아니면 None)"""
+        if self.exporter is None or random.random() >= self.sample_ratio:
+            yield None
+            return
+
+        spans: list[Span] = []
+        spans_token = _trace_spans.set(spans)
+        try:
+            with self._span(name, attributes, os.urandom(16).hex(), None, spans) as root:
+                yield root
+        finally:
+            _trace_spans.reset(spans_token)
+            self._finish_trace(root, spans)
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span | None]:
+        """자식 span (진행 중인 트레이스가 없으면 no-op)"""
+        spans = _trace_spans.get()
+        parent = _current_span.get()
+        if spans is None or parent is None:
+            yield None
+            return
+
+        with self._span(name, attributes, parent.trace_id, parent.span_id, spans) as span:
+            yield span
+
+    @contextmanager
+    def _span(
+        self,
+        name: str,
+        attributes: dict,
+        trace_id: str,
+        parent_id: str | None,
+        spans: list[Span],
+    ) -> Iterator[Span]:
+        span = Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=os.urandom(8).hex(),
+            parent_id=parent_id,
+            start_ns=time.time_ns(),
+            attributes=dict(attributes),
+        )
+        spans.append(span)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            _current_span.reset(token)
+
+    def _finish_trace(self, root: Span, spans: list[Span]) -> None:
+        if self.slow_threshold is not None and root.duration >= self.slow_threshold:
+            logger.warning(
+                f"느린 작업 감지 ({root.duration:.2f}s) - 소요시간 분해:\n"
+                f"{format_breakdown(spans)}"
+            )
+        try:
+            self.exporter.export(spans)
+        except Exception as e:
+            logger.warning(f"트레이스 내보내기 실패 (무시됨): {e}")
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """전역 트레이서"""
+    return _tracer
+
+
+def configure_tracing(
+    exporter: str,
+    file_path: str = "traces/traces.jsonl",
+    otlp_endpoint: str = "http://127.0.0.1:4318",
+    sample_ratio: float = 1.0,
+    slow_threshold: float | None = None,
+) -> Tracer:
+    """전역 트레이서 설정
+
+    Args:
+        exporter: "file" | "otlp" | "none"
+        sample_ratio: 루트 span 샘플링 비율 (0.0 ~ 1.0)
+        slow_threshold: 이 시간(초) 이상 걸린 작업은 분해 결과를 로그로 남김
+    """
+    if exporter == "file":
+        span_exporter: SpanExporter | None = FileSpanExporter(file_path)
+    elif exporter == "otlp":
+        span_exporter = OTLPHttpSpanExporter(otlp_endpoint)
+    else:
+        span_exporter = None
+
+    _tracer.exporter = span_exporter
+    _tracer.sample_ratio = sample_ratio
+    _tracer.slow_threshold = slow_threshold
+    return _tracer
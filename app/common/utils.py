@@ -11,6 +11,15 @@ def get_kst_now() -> datetime:
     return datetime.now(KST)
 
 
+def kst_now_naive() -> datetime:
+    """현재 KST 시간 (timezone 없음) - DB 타임스탬프 컬럼 기본값
+
+    주문/히스토리의 생성 시각은 DB now() 대신 항상 이 값으로 Python에서 채운다
+    (직접 저장과 쓰기 지연 저장이 같은 시계를 쓰고, 조회 조건의 KST 시각과 비교 가능).
+    """
+    return get_kst_now().replace(tzinfo=None)
+
+
 def get_kst_today() -> datetime:
     """오늘 날짜 00:00:00 KST 반환"""
     now = get_kst_now()
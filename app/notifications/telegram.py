@@ -1,37 +1,64 @@
 """텔레그램 알림 서비스"""
 
 import logging
-
-from telegram import Bot
+from typing import TYPE_CHECKING
 
 from app.common.config import settings
+from app.common.metrics import REGISTRY
+from app.common.tracing import get_tracer
 from app.common.utils import format_currency, format_percentage, get_kst_now
-from app.trading.models.cycle_history import CycleHistory
-from app.trading.models.order import Order
-from app.trading.models.position import Position
+
+if TYPE_CHECKING:
+    from telegram import Bot
+
+    from app.trading.models.cycle_history import CycleHistory
+    from app.trading.models.order import Order
+    from app.trading.models.position import Position
+    from app.trading.repository.analytics import CycleStats
 
 logger = logging.getLogger(__name__)
+tracer = get_tracer()
+
+NOTIFICATION_PENDING = REGISTRY.gauge(
+    "notification_queue_depth", "전송 대기/진행 중인 알림 수"
+)
+NOTIFICATION_LATENCY = REGISTRY.histogram(
+    "notification_send_seconds", "텔레그램 알림 전송 지연시간"
+)
 
 
 class NotificationService:
     """텔레그램 알림 서비스"""
 
     def __init__(self):
-        self.bot = Bot(token=settings.telegram_bot_token)
+        self._bot: "Bot | None" = None
         self.chat_id = settings.telegram_chat_id
 
+    @property
+    def bot(self) -> "Bot":
+        """텔레그램 봇 (첫 전송 시 생성)"""
+        if self._bot is None:
+            from telegram import Bot
+
+            self._bot = Bot(token=settings.telegram_bot_token)
+        return self._bot
+
     async def _send(self, message: str) -> None:
         """메시지 전송"""
+        NOTIFICATION_PENDING.inc()
         try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode="HTML",
-            )
+            with NOTIFICATION_LATENCY.time(), tracer.span("telegram.send"):
+                await self.bot.send_message(
+                    chat_id=self.chat_id,
+                    text=message,
+                    parse_mode="HTML",
+                )
         except Exception as e:
             logger.error(f"텔레그램 전송 실패: {e}")
+        finally:
+            NOTIFICATION_PENDING.dec()
 
-    async def send_startup(self, position: Position) -> None:
+    async def send_startup(self, position: "Position") -> None:
         """시작 알림"""
         message = f"""
 🚀 <b>무한매수법 시작</b>
@@ -45,7 +72,7 @@ class NotificationService:
 """
         await self._send(message.strip())
 
-    async def send_buy_order(self, order: Order) -> None:
+    async def send_buy_order(self, order: "Order") -> None:
         """매수 주문 알림"""
         message = f"""
 📥 <b>매수 주문</b>
@@ -59,7 +86,7 @@ class NotificationService:
 """
         await self._send(message.strip())
 
-    async def send_sell_order(self, order: Order) -> None:
+    async def send_sell_order(self, order: "Order") -> None:
         """매도 주문 알림"""
         message = f"""
 📤 <b>매도 주문 설정</b>
@@ -77,7 +104,7 @@ class NotificationService:
         order_type: str,
         quantity: int,
         price: float,
-        position: Position,
+        position: "Position",
     ) -> None:
         """체결 알림"""
         emoji = "✅" if order_type == "매수" else "💵"
@@ -94,7 +121,7 @@ class NotificationService:
 """
         await self._send(message.strip())
 
-    async def send_emergency_sell(self, order: Order) -> None:
+    async def send_emergency_sell(self, order: "Order") -> None:
         """긴급 매도 알림"""
         message = f"""
 ⚠️ <b>긴급 매도 (쿼터 손절)</b>
@@ -107,7 +134,7 @@ class NotificationService:
 """
         await self._send(message.strip())
 
-    async def send_cycle_complete(self, history: CycleHistory) -> None:
+    async def send_cycle_complete(self, history: "CycleHistory") -> None:
         """사이클 완료 알림"""
         emoji = "🎉" if history.profit > 0 else "😢"
         message = f"""
@@ -134,8 +161,18 @@ class NotificationService:
 """
         await self._send(message.strip())
 
-    async def send_daily_report(self, position: Position) -> None:
-        """일일 리포트"""
+    async def send_daily_report(
+        self, position: "Position", stats: "CycleStats | None" = None
+    ) -> None:
+        """일일 리포트 (stats: 완료 사이클 통계)"""
+        performance = ""
+        if stats is not None and stats.cycles:
+            performance = f"""
+완료 사이클: {stats.cycles}회 (승률 {format_percentage(stats.win_rate)})
+평균 사이클: {stats.avg_cycle_days:.1f}일
+누적 수익률: {format_percentage(stats.cumulative_return)}
+최대 낙폭: {format_percentage(-stats.max_drawdown)}
+"""
         message = f"""
 📋 <b>일일 리포트</b>
 
@@ -145,7 +182,7 @@ class NotificationService:
 투자금: {format_currency(position.current_investment)}
 분할: {position.splits_used}/40회
 사이클: {position.cycle_count}회차
-
+{performance}
 ⏰ {get_kst_now().strftime('%Y-%m-%d %H:%M')}
 """
         await self._send(message.strip())
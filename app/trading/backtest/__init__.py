@@ -0,0 +1,19 @@
+"""백테스트 - 실제 TradingService를 과거 가격으로 구동"""
+
+from app.trading.backtest.engine import (
+    BacktestConfig,
+    Backtester,
+    BacktestResult,
+    run_backtest,
+)
+from app.trading.backtest.replay import Bar, PriceReplayAPI, load_bars_csv
+
+__all__ = [
+    "BacktestConfig",
+    "Backtester",
+    "BacktestResult",
+    "Bar",
+    "PriceReplayAPI",
+    "load_bars_csv",
+    "run_backtest",
+]
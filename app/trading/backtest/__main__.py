@@ -0,0 +1,58 @@
+"""백테스트 CLI
+
+    uv run python -m app.trading.backtest prices.csv --investment 10000000 --profit-target 1.10
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from decimal import Decimal
+
+from app.common.config import EmergencySellMode, InstrumentType
+from app.trading.backtest.engine import BacktestConfig, run_backtest
+from app.trading.backtest.replay import load_bars_csv
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="무한매수법 이벤트 기반 백테스트")
+    parser.add_argument("csv", help="일봉 CSV (date,open,high,low,close)")
+    parser.add_argument("--symbol", default="133690")
+    parser.add_argument("--investment", type=Decimal, default=Decimal("10000000"))
+    parser.add_argument("--splits", type=int, default=40)
+    parser.add_argument("--profit-target", type=Decimal, default=Decimal("1.10"))
+    parser.add_argument(
+        "--emergency-sell-mode",
+        choices=[m.value for m in EmergencySellMode],
+        default=EmergencySellMode.QUARTER.value,
+    )
+    parser.add_argument("--fee-rate", type=Decimal, default=Decimal("0"), help="체결 수수료율")
+    parser.add_argument(
+        "--instrument-type",
+        choices=[t.value for t in InstrumentType],
+        default=InstrumentType.ETF.value,
+        help="호가단위 체계",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="주문/체결 로그 출력")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.ERROR,
+        format="%(levelname)s - %(message)s",
+    )
+    config = BacktestConfig(
+        symbol=args.symbol,
+        total_investment=args.investment,
+        num_splits=args.splits,
+        profit_target=args.profit_target,
+        emergency_sell_mode=EmergencySellMode(args.emergency_sell_mode),
+        fee_rate=args.fee_rate,
+        instrument_type=InstrumentType(args.instrument_type),
+    )
+    result = asyncio.run(run_backtest(load_bars_csv(args.csv), config))
+    print(result.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
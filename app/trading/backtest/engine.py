@@ -0,0 +1,172 @@
+"""이벤트 기반 백테스트 엔진
+
+실제 TradingService 메서드를 스케줄러와 같은 순서로 호출한다.
+DB 대신 인메모리 레포지토리, 증권사 대신 PriceReplayAPI를 주입하므로
+운영 코드 경로를 그대로 타면서도 수년치를 수 초 안에 돌릴 수 있다.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from datetime import time as dtime
+from decimal import Decimal
+
+from app.common.config import EmergencySellMode, InstrumentType, Settings
+from app.common.utils import KST
+from app.trading.backtest.replay import Bar, PriceReplayAPI
+from app.trading.models.cycle_history import CycleHistory
+from app.trading.models.order import Order
+from app.trading.repository.memory import (
+    InMemoryOrderRepository,
+    InMemoryPositionRepository,
+    InMemorySession,
+)
+
+logger = logging.getLogger(__name__)
+
+# 스케줄러 작업 시각 (KST)
+SELL_ORDER_TIME = dtime(9, 0)
+BUY_ORDER_TIME = dtime(14, 30)
+CHECK_EXECUTION_TIME = dtime(15, 40)
+
+
+@dataclass
+class BacktestConfig:
+    """백테스트 파라미터 (Settings의 매매 항목과 동일)"""
+
+    symbol: str = "133690"
+    total_investment: Decimal = Decimal("10000000")
+    num_splits: int = 40
+    profit_target: Decimal = Decimal("1.10")
+    emergency_sell_mode: EmergencySellMode = EmergencySellMode.QUARTER
+    fee_rate: Decimal = Decimal("0")
+    instrument_type: InstrumentType = InstrumentType.ETF
+
+    def to_settings(self) -> Settings:
+        """TradingService에 주입할 Settings (.env 검증 없이 생성)"""
+        return Settings.model_construct(
+            trading_symbol=self.symbol,
+            total_investment=self.total_investment,
+            num_splits=self.num_splits,
+            profit_target=self.profit_target,
+            emergency_sell_mode=self.emergency_sell_mode,
+            trading_instrument_type=self.instrument_type,
+        )
+
+
+@dataclass
+class BacktestResult:
+    """백테스트 결과"""
+
+    config: BacktestConfig
+    equity: list[tuple[date, Decimal]] = field(default_factory=list)
+    orders: list[Order] = field(default_factory=list)
+    cycles: list[CycleHistory] = field(default_factory=list)
+    errors: list[tuple[date, str, str]] = field(default_factory=list)
+    fees: Decimal = Decimal("0")
+    elapsed: float = 0.0
+
+    @property
+    def final_equity(self) -> Decimal:
+        return self.equity[-1][1] if self.equity else self.config.total_investment
+
+    @property
+    def total_return(self) -> Decimal:
+        """누적 수익률 (0.1 = +10%)"""
+        return self.final_equity / self.config.total_investment - 1
+
+    @property
+    def max_drawdown(self) -> Decimal:
+        """최대 낙폭 (0.2 = -20%)"""
+        peak = Decimal("0")
+        worst = Decimal("0")
+        for _, value in self.equity:
+            peak = max(peak, value)
+            if peak > 0:
+                worst = max(worst, 1 - value / peak)
+        return worst
+
+    def summary(self) -> str:
+        start = self.equity[0][0] if self.equity else "-"
+        end = self.equity[-1][0] if self.equity else "-"
+        return (
+            f"기간: {start} ~ {end} ({len(self.equity)}거래일, {self.elapsed:.2f}초)\n"
+            f"최종 평가금: {self.final_equity:,.0f}원 (수익률 {self.total_return * 100:+.2f}%)\n"
+            f"최대 낙폭: {self.max_drawdown * 100:.2f}%\n"
+            f"주문: {len(self.orders)}건 / 완료 사이클: {len(self.cycles)}회 / "
+            f"수수료: {self.fees:,.0f}원 / 오류: {len(self.errors)}건"
+        )
+
+
+class Backtester:
+    """TradingService를 일봉 순서대로 구동하는 백테스터"""
+
+    def __init__(self, config: BacktestConfig, symbol_name: str = ""):
+        from app.trading.services.trading import TradingService
+
+        self.config = config
+        self._now = datetime.now(KST)
+        self.session = InMemorySession(clock=self._clock)
+        self.position_repo = InMemoryPositionRepository(clock=self._clock)
+        self.api = PriceReplayAPI(
+            symbol=config.symbol,
+            initial_cash=config.total_investment,
+            symbol_name=symbol_name,
+            fee_rate=config.fee_rate,
+        )
+        self.service = TradingService(
+            self.session,  # type: ignore[arg-type]
+            self.api,
+            position_repo=self.position_repo,  # type: ignore[arg-type]
+            order_repo=InMemoryOrderRepository(self.session),  # type: ignore[arg-type]
+            config=config.to_settings(),
+        )
+
+    def _clock(self) -> datetime:
+        return self._now
+
+    def _at(self, day: date, at: dtime) -> None:
+        self._now = datetime.combine(day, at, tzinfo=KST)
+
+    async def _job(self, day: date, job_id: str, action) -> None:
+        """스케줄러 작업과 동일하게 예외는 기록 후 계속"""
+        try:
+            await action()
+        except Exception as e:
+            logger.debug(f"[{day}] {job_id} 실패: {e}")
+            self._result.errors.append((day, job_id, str(e)))
+
+    async def run(self, bars: list[Bar]) -> BacktestResult:
+        """전체 기간 실행"""
+        started = time.perf_counter()
+        self._result = result = BacktestResult(config=self.config)
+        service = self.service
+
+        for bar in bars:
+            self._at(bar.date, SELL_ORDER_TIME)
+            self.api.start_day(bar)
+            await self._job(bar.date, "sell_order", service.execute_daily_sell_order)
+
+            self._at(bar.date, BUY_ORDER_TIME)
+            self.api.intraday()
+            await self._job(bar.date, "buy_order", service.execute_daily_buy_order)
+
+            self.api.close_day()
+            self._at(bar.date, CHECK_EXECUTION_TIME)
+            await self._job(bar.date, "check_execution", service.check_order_execution)
+
+            result.equity.append((bar.date, self.api.equity))
+
+        result.orders = self.session.orders
+        result.cycles = self.session.cycles
+        result.fees = self.api.fees
+        result.elapsed = time.perf_counter() - started
+        return result
+
+
+async def run_backtest(
+    bars: list[Bar], config: BacktestConfig | None = None, symbol_name: str = ""
+) -> BacktestResult:
+    """일봉 목록으로 백테스트 1회 실행"""
+    return await Backtester(config or BacktestConfig(), symbol_name).run(bars)
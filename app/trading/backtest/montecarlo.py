@@ -0,0 +1,373 @@
+"""몬테카를로 시뮬레이터 - 부트스트랩 가격 경로 × 무한매수법 규칙 (NumPy 벡터화)
+
+과거 일봉의 (시가, 고가, 종가)/전일종가 비율을 하루 단위로 (블록) 부트스트랩하여
+경로 수 × 거래일 수 2차원 배열을 만들고, 모든 경로에 매매 규칙을 한 번에 적용한다.
+total_investment 결정을 위해 단일 과거 경로 대신 사이클 길이/낙폭/쿼터 손절 횟수/
+사이클 수익의 분포(백분위)를 본다.
+
+규칙은 이벤트 기반 백테스트(PriceReplayAPI 체결 규칙)와 같되 다음을 단순화한다.
+- 목표가 매도가 체결된 날은 당일 매수를 하지 않는다 (사이클 즉시 완료).
+- 평단가는 체결가 가중평균으로 계산한다.
+부트스트랩 가격과 목표가는 종목 구분(instrument_type)의 호가 격자로 일괄 반올림한다.
+
+    uv run python -m app.trading.backtest.montecarlo prices.csv --paths 10000 --days 750
+
+NumPy 필요: `uv sync --extra sim`
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+
+import numpy as np
+
+from app.common.config import EmergencySellMode, InstrumentType
+from app.common.money import HALF_UP, UP
+from app.trading.backtest.engine import BacktestConfig
+from app.trading.backtest.replay import Bar
+from app.trading.strategy.price_grid import get_grid
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# 이 경로 수 이상이면 프로세스 병렬 실행
+PARALLEL_MIN_PATHS = 20_000
+
+
+def bar_returns(bars: list[Bar]) -> np.ndarray:
+    """일봉 → (N-1, 3) 배열 [시가, 고가, 종가] / 전일 종가"""
+    prev = np.array([float(b.close) for b in bars[:-1]])
+    ohc = np.array([[float(b.open), float(b.high), float(b.close)] for b in bars[1:]])
+    return ohc / prev[:, None]
+
+
+def bootstrap_paths(
+    returns: np.ndarray,
+    n_paths: int,
+    n_days: int,
+    start_price: float,
+    block_size: int = 1,
+    rng: np.random.Generator | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(블록) 부트스트랩 가격 경로 생성
+
+    Args:
+        returns: bar_returns() 결과
+        block_size: 1이면 일 단위 iid, 그 이상이면 연속 구간(순환) 단위로 추출
+
+    Returns:
+        (open, high, close) 각각 (n_paths, n_days)
+    """
+    rng = rng or np.random.default_rng()
+    n = len(returns)
+    n_blocks = -(-n_days // block_size)
+    starts = rng.integers(0, n, size=(n_paths, n_blocks))
+    idx = (starts[:, :, None] + np.arange(block_size)) % n
+    idx = idx.reshape(n_paths, -1)[:, :n_days]
+
+    sampled = returns[idx]  # (paths, days, 3)
+    close = start_price * np.cumprod(sampled[:, :, 2], axis=1)
+    prev_close = np.empty_like(close)
+    prev_close[:, 0] = start_price
+    prev_close[:, 1:] = close[:, :-1]
+    return sampled[:, :, 0] * prev_close, sampled[:, :, 1] * prev_close, close
+
+
+@dataclass
+class MonteCarloResult:
+    """경로별/사이클별 시뮬레이션 결과"""
+
+    n_paths: int
+    n_days: int
+    final_equity: np.ndarray  # (paths,)
+    max_drawdown: np.ndarray  # (paths,)
+    emergency_sells: np.ndarray  # (paths,)
+    cycles: np.ndarray  # (paths,) 완료 사이클 수
+    cycle_length: np.ndarray  # (완료 사이클,) 거래일
+    cycle_profit: np.ndarray  # (완료 사이클,) 수익률
+    elapsed: float = 0.0
+    initial_investment: float = 0.0
+    equity_curve: np.ndarray | None = None  # (paths, days), record_equity=True일 때만
+
+    def percentiles(self, q: tuple[int, ...] = PERCENTILES) -> dict[str, dict[int, float]]:
+        """지표별 백분위"""
+
+        def pct(values: np.ndarray) -> dict[int, float]:
+            if values.size == 0:
+                return {p: float("nan") for p in q}
+            return dict(zip(q, np.percentile(values, q).tolist()))
+
+        return {
+            "total_return": pct(self.final_equity / self.initial_investment - 1),
+            "max_drawdown": pct(self.max_drawdown),
+            "emergency_sells": pct(self.emergency_sells),
+            "cycles": pct(self.cycles),
+            "cycle_length": pct(self.cycle_length),
+            "cycle_profit": pct(self.cycle_profit),
+        }
+
+    def summary(self) -> str:
+        labels = {
+            "total_return": ("누적 수익률", "%"),
+            "max_drawdown": ("최대 낙폭", "%"),
+            "emergency_sells": ("쿼터 손절 횟수", ""),
+            "cycles": ("완료 사이클 수", ""),
+            "cycle_length": ("사이클 길이(일)", ""),
+            "cycle_profit": ("사이클 수익률", "%"),
+        }
+        header = "".join(f"{f'p{p}':>10}" for p in PERCENTILES)
+        lines = [
+            f"{self.n_paths:,}개 경로 × {self.n_days}거래일 ({self.elapsed:.2f}초)",
+            f"{'':16}{header}",
+        ]
+        for key, values in self.percentiles().items():
+            name, unit = labels[key]
+            scale = 100 if unit == "%" else 1
+            row = "".join(f"{v * scale:>10.2f}" for v in values.values())
+            lines.append(f"{name:16}{row}")
+        return "\n".join(lines)
+
+
+def simulate_paths(
+    open_: np.ndarray,
+    high: np.ndarray,
+    close: np.ndarray,
+    config: BacktestConfig,
+    num_splits: np.ndarray | None = None,
+    profit_target: np.ndarray | None = None,
+    record_equity: bool = False,
+) -> MonteCarloResult:
+    """모든 경로에 무한매수법 규칙을 동시에 적용
+
+    Args:
+        num_splits, profit_target: 경로별 파라미터 (None이면 config 값) -
+            같은 가격 경로를 복제해 넘기면 파라미터 그리드를 한 번에 평가할 수 있다
+        record_equity: 경로별 일간 평가금 기록
+    """
+    started = time.perf_counter()
+    n_paths, n_days = close.shape
+    if num_splits is None:
+        num_splits = config.num_splits
+    target_ratio = np.broadcast_to(
+        float(config.profit_target) if profit_target is None else profit_target, n_paths
+    )
+    fee = float(config.fee_rate)
+    quarter = config.emergency_sell_mode == EmergencySellMode.QUARTER
+    initial = float(config.total_investment)
+    grid = get_grid(config.instrument_type)
+
+    cash = np.full(n_paths, initial)
+    invest = cash.copy()
+    qty = np.zeros(n_paths, dtype=np.int64)
+    avg = np.zeros(n_paths)
+    target = np.zeros(n_paths)  # 호가 올림한 목표가 (평단가가 바뀔 때만 다시 계산)
+    splits = np.zeros(n_paths, dtype=np.int64)
+    cycle_start = np.zeros(n_paths, dtype=np.int64)
+    cycles = np.zeros(n_paths, dtype=np.int64)
+    emergency_sells = np.zeros(n_paths, dtype=np.int64)
+    peak = cash.copy()
+    max_dd = np.zeros(n_paths)
+    curve = np.empty((n_paths, n_days)) if record_equity else None
+    lengths: list[np.ndarray] = []
+    profits: list[np.ndarray] = []
+
+    for t in range(n_days):
+        o, h, c = open_[:, t], high[:, t], close[:, t]
+        holding = qty > 0
+
+        # 09:00 목표가 매도 → 장중 고가 도달 시 체결 → 사이클 완료
+        sold = holding & (h >= target)
+        if sold.any():
+            fill = np.maximum(target[sold], o[sold])
+            cash[sold] += fill * qty[sold] * (1 - fee)
+            lengths.append(t - cycle_start[sold] + 1)
+            profits.append(cash[sold] / invest[sold] - 1)
+            invest[sold] = cash[sold]
+            qty[sold] = 0
+            avg[sold] = 0.0
+            target[sold] = 0.0
+            splits[sold] = 0
+            cycles[sold] += 1
+            cycle_start[sold] = t + 1
+
+        active = ~sold
+        exhausted = active & (splits >= num_splits)
+
+        # 14:30 분할 소진 → 쿼터 손절 (종가 체결)
+        if quarter:
+            sell_qty = qty // 4
+            emergency = exhausted & (sell_qty > 0)
+            cash[emergency] += c[emergency] * sell_qty[emergency] * (1 - fee)
+            qty[emergency] -= sell_qty[emergency]
+            emergency_sells += emergency
+
+        # 14:30 매수 (목표가 이상이면 대기) → 종가 체결
+        buy_qty = np.floor(invest / num_splits / c).astype(np.int64)
+        cost = buy_qty * c * (1 + fee)
+        buy = (
+            active
+            & ~exhausted
+            & ~(holding & (c >= target))
+            & (buy_qty > 0)
+            & (cost <= cash)
+        )
+        if buy.any():
+            new_qty = qty[buy] + buy_qty[buy]
+            avg[buy] = (avg[buy] * qty[buy] + c[buy] * buy_qty[buy]) / new_qty
+            target[buy] = grid.round_array(avg[buy] * target_ratio[buy], UP)
+            qty[buy] = new_qty
+            cash[buy] -= cost[buy]
+            splits[buy] += 1
+
+        equity = cash + qty * c
+        if curve is not None:
+            curve[:, t] = equity
+        np.maximum(peak, equity, out=peak)
+        np.maximum(max_dd, 1 - equity / peak, out=max_dd)
+
+    return MonteCarloResult(
+        n_paths=n_paths,
+        n_days=n_days,
+        final_equity=cash + qty * close[:, -1],
+        max_drawdown=max_dd,
+        emergency_sells=emergency_sells,
+        cycles=cycles,
+        cycle_length=np.concatenate(lengths) if lengths else np.array([], dtype=np.int64),
+        cycle_profit=np.concatenate(profits) if profits else np.array([]),
+        elapsed=time.perf_counter() - started,
+        initial_investment=initial,
+        equity_curve=curve,
+    )
+
+
+def _simulate_chunk(
+    returns: np.ndarray,
+    n_paths: int,
+    n_days: int,
+    start_price: float,
+    block_size: int,
+    seed: np.random.SeedSequence,
+    config: BacktestConfig,
+) -> MonteCarloResult:
+    """워커 프로세스: 경로 생성 + 시뮬레이션 (큰 배열은 프로세스 간 전달하지 않음)"""
+    paths = bootstrap_paths(
+        returns, n_paths, n_days, start_price, block_size, np.random.default_rng(seed)
+    )
+    grid = get_grid(config.instrument_type)
+    return simulate_paths(
+        *(grid.round_array(p, HALF_UP) for p in paths), config
+    )
+
+
+def _merge(results: list[MonteCarloResult]) -> MonteCarloResult:
+    first = results[0]
+    return MonteCarloResult(
+        n_paths=sum(r.n_paths for r in results),
+        n_days=first.n_days,
+        final_equity=np.concatenate([r.final_equity for r in results]),
+        max_drawdown=np.concatenate([r.max_drawdown for r in results]),
+        emergency_sells=np.concatenate([r.emergency_sells for r in results]),
+        cycles=np.concatenate([r.cycles for r in results]),
+        cycle_length=np.concatenate([r.cycle_length for r in results]),
+        cycle_profit=np.concatenate([r.cycle_profit for r in results]),
+        initial_investment=first.initial_investment,
+    )
+
+
+def run_monte_carlo(
+    bars: list[Bar],
+    config: BacktestConfig | None = None,
+    n_paths: int = 10_000,
+    n_days: int = 750,
+    block_size: int = 1,
+    seed: int | None = None,
+    workers: int | None = None,
+) -> MonteCarloResult:
+    """과거 일봉으로부터 몬테카를로 시뮬레이션
+
+    Args:
+        workers: 프로세스 수 (None이면 CPU 수, 경로 수가 적으면 단일 프로세스)
+    """
+    started = time.perf_counter()
+    config = config or BacktestConfig()
+    returns = bar_returns(bars)
+    start_price = float(bars[-1].close)
+
+    workers = workers or os.cpu_count() or 1
+    if n_paths < PARALLEL_MIN_PATHS:
+        workers = 1
+
+    chunk_sizes = [len(c) for c in np.array_split(np.arange(n_paths), workers) if len(c)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    args = [
+        (returns, size, n_days, start_price, block_size, s, config)
+        for size, s in zip(chunk_sizes, seeds)
+    ]
+
+    if len(args) == 1:
+        results = [_simulate_chunk(*args[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=len(args)) as pool:
+            results = list(pool.map(_simulate_chunk, *zip(*args)))
+
+    result = _merge(results)
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def main() -> int:
+    from app.trading.backtest.replay import load_bars_csv
+
+    parser = argparse.ArgumentParser(description="무한매수법 몬테카를로 시뮬레이션")
+    parser.add_argument("csv", help="일봉 CSV (date,open,high,low,close)")
+    parser.add_argument("--paths", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=750, help="경로 길이 (거래일)")
+    parser.add_argument("--block", type=int, default=1, help="블록 부트스트랩 길이 (1 = iid)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--investment", type=Decimal, default=Decimal("10000000"))
+    parser.add_argument("--splits", type=int, default=40)
+    parser.add_argument("--profit-target", type=Decimal, default=Decimal("1.10"))
+    parser.add_argument(
+        "--emergency-sell-mode",
+        choices=[m.value for m in EmergencySellMode],
+        default=EmergencySellMode.QUARTER.value,
+    )
+    parser.add_argument("--fee-rate", type=Decimal, default=Decimal("0"))
+    parser.add_argument(
+        "--instrument-type",
+        choices=[t.value for t in InstrumentType],
+        default=InstrumentType.ETF.value,
+        help="호가단위 체계",
+    )
+    args = parser.parse_args()
+
+    config = BacktestConfig(
+        total_investment=args.investment,
+        num_splits=args.splits,
+        profit_target=args.profit_target,
+        emergency_sell_mode=EmergencySellMode(args.emergency_sell_mode),
+        fee_rate=args.fee_rate,
+        instrument_type=InstrumentType(args.instrument_type),
+    )
+    result = run_monte_carlo(
+        load_bars_csv(args.csv),
+        config,
+        n_paths=args.paths,
+        n_days=args.days,
+        block_size=args.block,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    print(result.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""가격 재생 API - 일봉을 시간순으로 재생하는 StockAPIBase 구현
+
+거래일 하루는 다음 순서로 진행된다 (스케줄러 작업 시각과 동일).
+
+    start_day(bar)   09:00  현재가 = 시가, 전일 미체결 주문 만료
+    intraday()       14:30  현재가 = 종가 (장 마감 직전 근사)
+    close_day()      15:30  미체결 지정가 주문을 일봉 고가/저가로 체결 판정
+
+체결 규칙:
+- 장 시작 전(09:00) 주문은 하루 전체 가격을 볼 수 있다.
+  - 매도 지정가: 고가 >= 지정가면 체결 (시가가 이미 지정가 이상이면 시가로 체결)
+  - 매수 지정가: 저가 <= 지정가면 체결 (시가가 이미 지정가 이하이면 시가로 체결)
+- 장중(14:30) 주문은 제출 이전의 시가/고가/저가를 쓰지 않는다 (미래 정보 사용 방지).
+  제출 시점 현재가(종가)로 체결 가능한 주문만 종가로 체결한다.
+- 같은 날 매도를 매수보다 먼저 처리한다.
+"""
+
+import csv
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from app.trading.external_api.base import (
+    BalanceInfo,
+    HoldingInfo,
+    OrderResult,
+    PriceInfo,
+    StockAPIBase,
+)
+
+
+class OrderRejectedError(Exception):
+    """주문 거부 (잔고/보유수량 부족 등)"""
+
+
+@dataclass(frozen=True)
+class Bar:
+    """일봉"""
+
+    date: date
+    open: Decimal
+    high: Decimal
+    low: Decimal
+    close: Decimal
+
+
+def load_bars_csv(path: str | Path) -> list[Bar]:
+    """CSV 일봉 로드 (date,open,high,low,close 또는 date,close)"""
+    bars = []
+    with Path(path).open(encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            close = Decimal(row["close"])
+            bars.append(
+                Bar(
+                    date=date.fromisoformat(row["date"]),
+                    open=Decimal(row.get("open") or close),
+                    high=Decimal(row.get("high") or close),
+                    low=Decimal(row.get("low") or close),
+                    close=close,
+                )
+            )
+    bars.sort(key=lambda b: b.date)
+    return bars
+
+
+class PriceReplayAPI(StockAPIBase):
+    """일봉 재생 기반 모의 증권사 API (단일 종목)"""
+
+    def __init__(
+        self,
+        symbol: str,
+        initial_cash: Decimal,
+        symbol_name: str = "",
+        fee_rate: Decimal = Decimal("0"),
+    ):
+        self.symbol = symbol
+        self.symbol_name = symbol_name or f"종목{symbol}"
+        self.fee_rate = fee_rate
+
+        self.cash = initial_cash
+        self.quantity = 0
+        self.avg_price = Decimal("0")
+        self.fees = Decimal("0")
+
+        self.bar: Bar | None = None
+        self.prev_close: Decimal | None = None
+        self.current_price = Decimal("0")
+        self._pending: list[OrderResult] = []
+        self._order_counter = 0
+        self._session_open = False  # intraday() 이후 = 장중 주문
+        self._in_session: set[str] = set()  # 장중에 제출된 주문번호
+
+    # ── 시간 진행 ──────────────────────────────────────────
+
+    def start_day(self, bar: Bar) -> None:
+        """장 시작 - 전일 미체결 주문은 만료"""
+        if self.bar is not None:
+            self.prev_close = self.bar.close
+        self.bar = bar
+        self.current_price = bar.open
+        for order in self._pending:
+            order.status = "CANCELLED"
+        self._pending = []
+        self._session_open = False
+        self._in_session.clear()
+
+    def intraday(self) -> None:
+        """장중 (매수 주문 시각) - 현재가를 종가로"""
+        self.current_price = self.bar.close
+        self._session_open = True
+
+    def close_day(self) -> list[OrderResult]:
+        """장 마감 - 미체결 주문 체결 판정 후 체결분 반환"""
+        bar = self.bar
+        filled = []
+        for order in sorted(self._pending, key=lambda o: o.order_type != "SELL"):
+            if order.order_id in self._in_session:
+                # 장중 주문 - 제출 이후 가격은 종가뿐
+                if order.order_type == "SELL" and bar.close >= order.price:
+                    self._fill_sell(order, bar.close)
+                elif order.order_type == "BUY" and bar.close <= order.price:
+                    self._fill_buy(order, bar.close)
+                else:
+                    continue
+            elif order.order_type == "SELL" and bar.high >= order.price:
+                self._fill_sell(order, max(order.price, bar.open))
+            elif order.order_type == "BUY" and bar.low <= order.price:
+                self._fill_buy(order, min(order.price, bar.open))
+            else:
+                continue
+            filled.append(order)
+        self._pending = [o for o in self._pending if o.status == "PENDING"]
+        self.current_price = bar.close
+        return filled
+
+    @property
+    def equity(self) -> Decimal:
+        """평가금액 (예수금 + 보유 평가액)"""
+        return self.cash + self.current_price * self.quantity
+
+    # ── 체결 ──────────────────────────────────────────────
+
+    def _fill_buy(self, order: OrderResult, price: Decimal) -> None:
+        amount = price * order.quantity
+        fee = amount * self.fee_rate
+        if amount + fee > self.cash:
+            order.status = "CANCELLED"
+            return
+        self.cash -= amount + fee
+        self.fees += fee
+        total_cost = self.avg_price * self.quantity + amount
+        self.quantity += order.quantity
+        self.avg_price = total_cost / self.quantity
+        order.price = price
+        order.status = "FILLED"
+
+    def _fill_sell(self, order: OrderResult, price: Decimal) -> None:
+        quantity = min(order.quantity, self.quantity)
+        amount = price * quantity
+        fee = amount * self.fee_rate
+        self.cash += amount - fee
+        self.fees += fee
+        self.quantity -= quantity
+        if self.quantity == 0:
+            self.avg_price = Decimal("0")
+        order.price = price
+        order.status = "FILLED"
+
+    def _submit(self, order_type: str, symbol: str, quantity: int, price: Decimal) -> OrderResult:
+        if symbol != self.symbol:
+            raise OrderRejectedError(f"재생 데이터에 없는 종목: {symbol}")
+        if quantity <= 0:
+            raise OrderRejectedError(f"주문 수량 오류: {quantity}")
+        self._order_counter += 1
+        order = OrderResult(
+            order_id=f"BT{self._order_counter:07d}",
+            symbol=symbol,
+            order_type=order_type,
+            quantity=quantity,
+            price=price,
+            status="PENDING",
+        )
+        self._pending.append(order)
+        if self._session_open:
+            self._in_session.add(order.order_id)
+        return order
+
+    # ── StockAPIBase ──────────────────────────────────────
+
+    async def get_token(self) -> str:
+        return "backtest"
+
+    async def get_price(self, symbol: str) -> PriceInfo:
+        prev_close = self.prev_close or self.bar.open
+        return PriceInfo(
+            symbol=symbol,
+            symbol_name=self.symbol_name,
+            current_price=self.current_price,
+            prev_close=prev_close,
+            change_rate=(self.current_price / prev_close - 1) * 100,
+        )
+
+    async def get_balance(self) -> BalanceInfo:
+        return BalanceInfo(total_deposit=self.cash, available_amount=self.cash)
+
+    async def get_holdings(self) -> list[HoldingInfo]:
+        if self.quantity == 0:
+            return []
+        return [
+            HoldingInfo(
+                symbol=self.symbol,
+                symbol_name=self.symbol_name,
+                quantity=self.quantity,
+                avg_price=self.avg_price,
+                current_price=self.current_price,
+                profit_rate=(self.current_price / self.avg_price - 1) * 100,
+            )
+        ]
+
+    async def buy(self, symbol: str, quantity: int, price: Decimal) -> OrderResult:
+        """지정가 매수 (주문 가능 금액 초과 시 거부)"""
+        reserved = sum(o.price * o.quantity for o in self._pending if o.order_type == "BUY")
+        if price * quantity * (1 + self.fee_rate) + reserved > self.cash:
+            raise OrderRejectedError(f"주문 가능 금액 부족: {price * quantity:,.0f}원")
+        return self._submit("BUY", symbol, quantity, price)
+
+    async def sell(self, symbol: str, quantity: int, price: Decimal) -> OrderResult:
+        """지정가 매도 (보유 수량 초과 시 거부)"""
+        if quantity > self.quantity:
+            raise OrderRejectedError(f"매도 가능 수량 부족: {quantity} > {self.quantity}")
+        return self._submit("SELL", symbol, quantity, price)
+
+    async def get_pending_orders(self) -> list[OrderResult]:
+        return list(self._pending)
+
+    async def cancel_order(self, order_id: str, symbol: str = "", quantity: int = 0) -> bool:
+        for order in self._pending:
+            if order.order_id == order_id:
+                order.status = "CANCELLED"
+                self._pending.remove(order)
+                return True
+        return False
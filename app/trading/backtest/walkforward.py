@@ -0,0 +1,332 @@
+"""워크포워드 최적화 - 구간별 학습/검증으로 과최적화 없는 표본 외 성과 측정
+
+전체 기간을 겹치는 (학습 train_days, 검증 test_days) 구간으로 나누고, 구간마다
+1. 학습 구간에서 num_splits × profit_target 그리드를 벡터화 시뮬레이터로 한 번에 평가해
+   최적 파라미터를 고르고
+2. 바로 다음 검증 구간에서 그 파라미터로 성과를 낸 뒤
+3. 검증 구간 평가금 곡선을 이어 붙여 표본 외(out-of-sample) 곡선을 만든다.
+
+검증 구간은 현금 100%에서 시작하고 구간 끝에서 평가금으로 정산한다 (구간 간 포지션 이월 없음).
+구간 결과는 입력 일봉/그리드/설정의 해시로 캐시하므로, 새 데이터를 추가해 다시 돌리면
+새로 생긴 구간만 계산한다. 구간들은 여러 프로세스에서 병렬로 처리한다.
+
+    uv run python -m app.trading.backtest.walkforward prices.csv --train 500 --test 125 \\
+        --splits 20 30 40 --targets 1.05 1.10 1.15
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from decimal import Decimal
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+
+from app.common.config import EmergencySellMode, InstrumentType
+from app.trading.backtest.engine import BacktestConfig
+from app.trading.backtest.montecarlo import simulate_paths
+from app.trading.backtest.replay import Bar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = ".cache/walkforward"
+OBJECTIVES = ("total_return", "calmar")
+
+# 결과 형식/규칙이 바뀌면 올려서 기존 캐시 무효화
+CACHE_VERSION = 2
+
+
+@dataclass
+class WindowResult:
+    """구간 1개 결과"""
+
+    train_start: date
+    train_end: date
+    test_start: date
+    test_end: date
+    num_splits: int
+    profit_target: float
+    train_score: float
+    test_return: float
+    test_max_drawdown: float
+    test_dates: list[date] = field(default_factory=list)
+    test_equity: list[float] = field(default_factory=list)  # 1.0 기준 평가금 비율
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        for key in ("train_start", "train_end", "test_start", "test_end"):
+            data[key] = data[key].isoformat()
+        data["test_dates"] = [d.isoformat() for d in self.test_dates]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WindowResult":
+        data = dict(data)
+        for key in ("train_start", "train_end", "test_start", "test_end"):
+            data[key] = date.fromisoformat(data[key])
+        data["test_dates"] = [date.fromisoformat(d) for d in data["test_dates"]]
+        return cls(**data)
+
+
+@dataclass
+class WalkForwardResult:
+    """전체 워크포워드 결과"""
+
+    windows: list[WindowResult]
+    cached: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def equity_curve(self) -> list[tuple[date, float]]:
+        """검증 구간을 이어 붙인 표본 외 평가금 곡선 (시작 = 1.0)"""
+        curve = []
+        level = 1.0
+        for window in self.windows:
+            curve.extend((d, level * v) for d, v in zip(window.test_dates, window.test_equity))
+            if window.test_equity:
+                level *= window.test_equity[-1]
+        return curve
+
+    @property
+    def total_return(self) -> float:
+        curve = self.equity_curve
+        return curve[-1][1] - 1 if curve else 0.0
+
+    @property
+    def max_drawdown(self) -> float:
+        values = np.array([v for _, v in self.equity_curve])
+        if values.size == 0:
+            return 0.0
+        return float(np.max(1 - values / np.maximum.accumulate(values)))
+
+    def summary(self) -> str:
+        lines = [
+            f"{'검증 구간':25} {'분할':>4} {'목표':>6} {'학습점수':>9} {'검증수익':>9} {'낙폭':>7}"
+        ]
+        for w in self.windows:
+            lines.append(
+                f"{w.test_start} ~ {w.test_end} {w.num_splits:>4} {w.profit_target:>6.3f} "
+                f"{w.train_score:>9.4f} {w.test_return * 100:>8.2f}% "
+                f"{w.test_max_drawdown * 100:>6.2f}%"
+            )
+        lines.append(
+            f"표본 외 누적 수익률: {self.total_return * 100:+.2f}% / "
+            f"최대 낙폭: {self.max_drawdown * 100:.2f}% "
+            f"({len(self.windows)}구간, 캐시 {self.cached}, {self.elapsed:.2f}초)"
+        )
+        return "\n".join(lines)
+
+
+def split_windows(n_bars: int, train_days: int, test_days: int) -> list[tuple[int, int, int]]:
+    """(학습 시작, 검증 시작, 검증 끝) 인덱스 목록 - 검증 구간 길이만큼 전진"""
+    windows = []
+    start = 0
+    while start + train_days < n_bars:
+        test_start = start + train_days
+        windows.append((start, test_start, min(test_start + test_days, n_bars)))
+        start += test_days
+    return windows
+
+
+def _ohc(bars: list[Bar]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """일봉 → (1, 일수) 시가/고가/종가 배열"""
+    arr = np.array([[float(b.open), float(b.high), float(b.close)] for b in bars]).T
+    return arr[0][None, :], arr[1][None, :], arr[2][None, :]
+
+
+def _score(final_return: np.ndarray, max_drawdown: np.ndarray, objective: str) -> np.ndarray:
+    if objective == "calmar":
+        return final_return / np.maximum(max_drawdown, 1e-6)
+    return final_return
+
+
+def evaluate_window(
+    train: list[Bar],
+    test: list[Bar],
+    grid: list[tuple[int, float]],
+    config: BacktestConfig,
+    objective: str = "total_return",
+) -> WindowResult:
+    """학습 구간 그리드 탐색 → 검증 구간 평가"""
+    # 학습: 같은 경로를 그리드 크기만큼 복제해 한 번에 시뮬레이션
+    o, h, c = (np.repeat(a, len(grid), axis=0) for a in _ohc(train))
+    splits = np.array([g[0] for g in grid], dtype=np.int64)
+    targets = np.array([g[1] for g in grid])
+    trained = simulate_paths(o, h, c, config, num_splits=splits, profit_target=targets)
+    scores = _score(
+        trained.final_equity / trained.initial_investment - 1, trained.max_drawdown, objective
+    )
+    best = int(np.argmax(scores))
+
+    tested = simulate_paths(
+        *_ohc(test),
+        config,
+        num_splits=splits[best : best + 1],
+        profit_target=targets[best : best + 1],
+        record_equity=True,
+    )
+    equity = tested.equity_curve[0] / tested.initial_investment
+
+    return WindowResult(
+        train_start=train[0].date,
+        train_end=train[-1].date,
+        test_start=test[0].date,
+        test_end=test[-1].date,
+        num_splits=int(splits[best]),
+        profit_target=float(targets[best]),
+        train_score=float(scores[best]),
+        test_return=float(equity[-1] - 1),
+        test_max_drawdown=float(tested.max_drawdown[0]),
+        test_dates=[b.date for b in test],
+        test_equity=equity.tolist(),
+    )
+
+
+def _cache_key(
+    train: list[Bar],
+    test: list[Bar],
+    grid: list[tuple[int, float]],
+    config: BacktestConfig,
+    objective: str,
+) -> str:
+    payload = json.dumps(
+        {
+            "version": CACHE_VERSION,
+            "bars": [
+                [b.date.isoformat(), str(b.open), str(b.high), str(b.close)]
+                for b in train + test
+            ],
+            "train": len(train),
+            "grid": grid,
+            "config": [
+                str(config.total_investment),
+                config.emergency_sell_mode.value,
+                str(config.fee_rate),
+                config.instrument_type.value,
+            ],
+            "objective": objective,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def walk_forward(
+    bars: list[Bar],
+    train_days: int,
+    test_days: int,
+    num_splits: list[int],
+    profit_targets: list[float],
+    config: BacktestConfig | None = None,
+    objective: str = "total_return",
+    cache_dir: str | Path | None = DEFAULT_CACHE_DIR,
+    workers: int | None = None,
+) -> WalkForwardResult:
+    """워크포워드 최적화 실행
+
+    Args:
+        cache_dir: 구간 결과 캐시 디렉터리 (None이면 캐시 안 함)
+        workers: 프로세스 수 (None이면 CPU 수)
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"지원하지 않는 목적함수: {objective} ({', '.join(OBJECTIVES)})")
+
+    started = time.perf_counter()
+    config = config or BacktestConfig()
+    grid = [(int(s), float(t)) for s, t in product(num_splits, profit_targets)]
+    cache = Path(cache_dir) if cache_dir is not None else None
+    if cache is not None:
+        cache.mkdir(parents=True, exist_ok=True)
+
+    results: list[WindowResult | None] = []
+    todo: list[tuple[int, Path | None, tuple]] = []
+    for i, (train_start, test_start, test_end) in enumerate(
+        split_windows(len(bars), train_days, test_days)
+    ):
+        train, test = bars[train_start:test_start], bars[test_start:test_end]
+        path = cache / f"{_cache_key(train, test, grid, config, objective)}.json" if cache else None
+        if path is not None and path.exists():
+            results.append(WindowResult.from_dict(json.loads(path.read_text())))
+            continue
+        results.append(None)
+        todo.append((i, path, (train, test, grid, config, objective)))
+
+    cached = len(results) - len(todo)
+    workers = min(workers or os.cpu_count() or 1, len(todo)) if todo else 0
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            computed = list(pool.map(evaluate_window, *zip(*(args for _, _, args in todo))))
+    else:
+        computed = [evaluate_window(*args) for _, _, args in todo]
+
+    for (i, path, _), window in zip(todo, computed):
+        results[i] = window
+        if path is not None:
+            path.write_text(json.dumps(window.to_dict()))
+
+    logger.info(f"워크포워드: {len(results)}구간 (캐시 {cached}, 계산 {len(todo)})")
+    return WalkForwardResult(
+        windows=results, cached=cached, elapsed=time.perf_counter() - started
+    )
+
+
+def main() -> int:
+    from app.trading.backtest.replay import load_bars_csv
+
+    parser = argparse.ArgumentParser(description="무한매수법 워크포워드 최적화")
+    parser.add_argument("csv", help="일봉 CSV (date,open,high,low,close)")
+    parser.add_argument("--train", type=int, default=500, help="학습 구간 (거래일)")
+    parser.add_argument("--test", type=int, default=125, help="검증 구간 (거래일)")
+    parser.add_argument("--splits", type=int, nargs="+", default=[20, 30, 40])
+    parser.add_argument("--targets", type=float, nargs="+", default=[1.05, 1.10, 1.15])
+    parser.add_argument("--objective", choices=OBJECTIVES, default="total_return")
+    parser.add_argument("--investment", type=Decimal, default=Decimal("10000000"))
+    parser.add_argument(
+        "--emergency-sell-mode",
+        choices=[m.value for m in EmergencySellMode],
+        default=EmergencySellMode.QUARTER.value,
+    )
+    parser.add_argument("--fee-rate", type=Decimal, default=Decimal("0"))
+    parser.add_argument(
+        "--instrument-type",
+        choices=[t.value for t in InstrumentType],
+        default=InstrumentType.ETF.value,
+        help="호가단위 체계",
+    )
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    config = BacktestConfig(
+        total_investment=args.investment,
+        emergency_sell_mode=EmergencySellMode(args.emergency_sell_mode),
+        fee_rate=args.fee_rate,
+        instrument_type=InstrumentType(args.instrument_type),
+    )
+    result = walk_forward(
+        load_bars_csv(args.csv),
+        train_days=args.train,
+        test_days=args.test,
+        num_splits=args.splits,
+        profit_targets=args.targets,
+        config=config,
+        objective=args.objective,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        workers=args.workers,
+    )
+    print(result.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
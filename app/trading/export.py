@@ -0,0 +1,182 @@
+"""주문/사이클 기록 내보내기 CLI - 서버 측 커서로 배치 단위 스트리밍 (메모리 사용량 일정)
+
+    uv run python -m app.trading.export orders orders.csv --symbol 133690 --since 2024-01-01
+    uv run python -m app.trading.export cycles cycles.parquet
+
+Parquet은 pyarrow 필요: `uv sync --extra export` (배치마다 row group 1개씩 기록)
+"""
+
+import argparse
+import asyncio
+import csv
+import logging
+import sys
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable
+from uuid import UUID
+
+from sqlalchemy import Column, RowMapping, Table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.trading.models.cycle_history import CycleHistory
+from app.trading.models.order import Order
+from app.trading.repository.cycle_history import CycleHistoryRepository
+from app.trading.repository.order import OrderRepository
+
+logger = logging.getLogger(__name__)
+
+SOURCES: dict[str, tuple[Table, type]] = {
+    "orders": (Order.__table__, OrderRepository),
+    "cycles": (CycleHistory.__table__, CycleHistoryRepository),
+}
+
+
+def _csv_value(value) -> object:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class CsvSink:
+    """CSV 기록 (헤더 + 배치마다 바로 기록)"""
+
+    def __init__(self, path: Path, table: Table):
+        self.columns = [c.name for c in table.columns]
+        self._file = path.open("w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+
+    def write(self, rows: list[RowMapping]) -> None:
+        self._writer.writerows([_csv_value(row[c]) for c in self.columns] for row in rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _arrow_type(column: Column):
+    import pyarrow as pa
+
+    python_type = column.type.python_type
+    if python_type is Decimal:
+        return pa.decimal128(column.type.precision, column.type.scale)
+    if python_type is datetime:
+        return pa.timestamp("us")
+    if python_type is int:
+        return pa.int64()
+    return pa.string()  # str, UUID
+
+
+class ParquetSink:
+    """Parquet 기록 (배치마다 row group 1개)"""
+
+    def __init__(self, path: Path, table: Table):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.columns = list(table.columns)
+        self.schema = pa.schema(
+            [pa.field(c.name, _arrow_type(c), nullable=bool(c.nullable)) for c in self.columns]
+        )
+        self._writer = pq.ParquetWriter(str(path), self.schema)
+
+    def write(self, rows: list[RowMapping]) -> None:
+        import pyarrow as pa
+
+        arrays = {
+            c.name: [str(r[c.name]) if isinstance(r[c.name], UUID) else r[c.name] for r in rows]
+            for c in self.columns
+        }
+        self._writer.write_table(pa.table(arrays, schema=self.schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+SINKS = {"csv": CsvSink, "parquet": ParquetSink}
+
+
+async def export(
+    source: str,
+    path: str | Path,
+    fmt: str | None = None,
+    symbol: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    batch_size: int = 5000,
+    session_factory: Callable[[], AsyncSession] | None = None,
+) -> int:
+    """기록을 파일로 내보내기 → 행 수
+
+    Args:
+        source: "orders" 또는 "cycles"
+        fmt: "csv" / "parquet" (None이면 파일 확장자로 판단)
+    """
+    if session_factory is None:
+        from app.common.database import async_session
+
+        session_factory = async_session
+
+    path = Path(path)
+    fmt = fmt or path.suffix.lstrip(".").lower()
+    if fmt not in SINKS:
+        raise ValueError(f"지원하지 않는 형식: {fmt} (csv, parquet)")
+    table, repository = SOURCES[source]
+
+    sink = SINKS[fmt](path, table)
+    count = 0
+    try:
+        async with session_factory() as session:
+            repo = repository(session)
+            async for rows in repo.stream(symbol, since, until, batch_size=batch_size):
+                sink.write(rows)
+                count += len(rows)
+                logger.info(f"{source}: {count:,}행 기록")
+    finally:
+        sink.close()
+    return count
+
+
+async def _run(args: argparse.Namespace) -> int:
+    from app.common.database import dispose_engine
+
+    try:
+        return await export(
+            args.source,
+            args.output,
+            args.format,
+            symbol=args.symbol,
+            since=args.since,
+            until=args.until,
+            batch_size=args.batch_size,
+        )
+    finally:
+        await dispose_engine()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="주문/사이클 기록 내보내기")
+    parser.add_argument("source", choices=list(SOURCES))
+    parser.add_argument("output", help="출력 파일 (.csv / .parquet)")
+    parser.add_argument("--format", choices=list(SINKS), help="기본: 출력 파일 확장자")
+    parser.add_argument("--symbol")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="이후 기록만 (포함)")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="이전 기록만 (미포함)")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("-v", "--verbose", action="store_true", help="진행 로그 출력")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.ERROR,
+        format="%(levelname)s - %(message)s",
+    )
+    count = asyncio.run(_run(args))
+    print(f"{args.source}: {count:,}행 → {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,7 +7,6 @@ from app.trading.external_api.base import (
     PriceInfo,
     StockAPIBase,
 )
-from app.trading.external_api.kiwoom import KiwoomAPIError, KiwoomRestAPI
 from app.trading.external_api.mock import MockStockAPI
 
 __all__ = [
@@ -20,3 +19,12 @@ __all__ = [
     "KiwoomAPIError",
     "MockStockAPI",
 ]
+
+
+def __getattr__(name: str):
+    # 키움 클라이언트는 httpx 로드 비용이 있어 실제 사용 시점에 임포트
+    if name in ("KiwoomRestAPI", "KiwoomAPIError"):
+        from app.trading.external_api import kiwoom
+
+        return getattr(kiwoom, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
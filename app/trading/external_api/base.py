@@ -3,6 +3,9 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import AsyncIterator
+
+from app.common.money import Won
 
 
 @dataclass
@@ -11,8 +14,8 @@ class PriceInfo:
 
     symbol: str
     symbol_name: str
-    current_price: Decimal
-    prev_close: Decimal
+    current_price: Won
+    prev_close: Won
     change_rate: Decimal
 
 
@@ -24,7 +27,7 @@ class OrderResult:
     symbol: str
     order_type: str  # "BUY" | "SELL"
     quantity: int
-    price: Decimal
+    price: Won
     status: str  # "PENDING" | "FILLED" | "CANCELLED"
 
 
@@ -32,8 +35,8 @@ class OrderResult:
 class BalanceInfo:
     """계좌 잔고 정보"""
 
-    total_deposit: Decimal  # 예수금 총액
-    available_amount: Decimal  # 주문 가능 금액
+    total_deposit: Won  # 예수금 총액
+    available_amount: Won  # 주문 가능 금액
 
 
 @dataclass
@@ -43,8 +46,8 @@ class HoldingInfo:
     symbol: str
     symbol_name: str
     quantity: int
-    avg_price: Decimal
-    current_price: Decimal
+    avg_price: Won
+    current_price: Won
     profit_rate: Decimal
 
 
@@ -72,12 +75,12 @@ class StockAPIBase(ABC):
         pass
 
     @abstractmethod
-    async def buy(self, symbol: str, quantity: int, price: Decimal) -> OrderResult:
+    async def buy(self, symbol: str, quantity: int, price: Won) -> OrderResult:
         """지정가 매수 주문"""
         pass
 
     @abstractmethod
-    async def sell(self, symbol: str, quantity: int, price: Decimal) -> OrderResult:
+    async def sell(self, symbol: str, quantity: int, price: Won) -> OrderResult:
         """지정가 매도 주문"""
         pass
 
@@ -86,6 +89,10 @@ class StockAPIBase(ABC):
         """미체결 주문 조회"""
         pass
 
+    async def iter_pending_orders(self) -> AsyncIterator[list[OrderResult]]:
+        """미체결 주문 조회 - 페이지 단위 (기본: 전체를 한 번에)"""
+        yield await self.get_pending_orders()
+
     @abstractmethod
     async def cancel_order(self, order_id: str, symbol: str = "", quantity: int = 0) -> bool:
         """주문 취소
@@ -0,0 +1,196 @@
+"""키움 API 요청/응답 녹화·재생 (httpx 전송 계층)
+
+- RecordingTransport: 실제 전송 계층을 감싸 모든 요청/응답을 JSON Lines 파일에
+  한 줄씩 append 한다. 인증 정보(appkey/secretkey/token/Authorization)는 가린다.
+- ReplayTransport: 녹화 파일을 읽어 같은 요청에 같은 응답을 녹화 순서대로 돌려준다.
+  네트워크/브로커 없이 특정 거래일을 오프라인으로 재현·벤치마크·프로파일링할 수 있다.
+
+    api = KiwoomRestAPI(transport=ReplayTransport("cassettes/2026-10-19.jsonl"))
+"""
+
+import json
+import logging
+from collections import deque
+from pathlib import Path
+
+import httpx
+
+from app.common.utils import get_kst_now
+
+logger = logging.getLogger(__name__)
+
+REDACTED = "***"
+SECRET_KEYS = frozenset({"appkey", "secretkey", "token", "acnt_no"})
+
+# 매칭/재현에 필요한 헤더만 보관
+REQUEST_HEADERS = ("api-id", "cont-yn", "next-key")
+RESPONSE_HEADERS = ("api-id", "cont-yn", "next-key", "content-type")
+
+
+class CassetteMissError(httpx.TransportError):
+    """녹화에 없는 요청"""
+
+
+def redact(value):
+    """민감 키 값을 재귀적으로 가림"""
+    if isinstance(value, dict):
+        return {k: REDACTED if k in SECRET_KEYS else redact(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [redact(v) for v in value]
+    return value
+
+
+def _decode(content: bytes):
+    if not content:
+        return None
+    try:
+        return json.loads(content)
+    except ValueError:
+        return content.decode("utf-8", errors="replace")
+
+
+def _request_entry(request: httpx.Request) -> dict:
+    return {
+        "method": request.method,
+        "path": request.url.path,
+        "headers": {h: request.headers[h] for h in REQUEST_HEADERS if h in request.headers},
+        "body": redact(_decode(request.content)),
+    }
+
+
+def _match_key(entry: dict) -> str:
+    return json.dumps(
+        [entry["method"], entry["path"], entry["headers"], entry["body"]],
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """요청/응답을 녹화하는 전송 계층"""
+
+    def __init__(self, path: str | Path, inner: httpx.AsyncBaseTransport | None = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.inner = inner or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.inner.handle_async_request(request)
+        content = await response.aread()
+        await response.aclose()
+
+        try:
+            self._append(request, response, content)
+        except Exception as e:
+            logger.warning(f"녹화 실패 (무시됨): {e}")
+
+        # 본문은 이미 디코딩됨 - 전송 관련 헤더 제거
+        headers = [
+            (k, v)
+            for k, v in response.headers.items()
+            if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=headers,
+            content=content,
+            request=request,
+        )
+
+    def _append(self, request: httpx.Request, response: httpx.Response, content: bytes) -> None:
+        entry = {
+            "ts": get_kst_now().isoformat(timespec="milliseconds"),
+            "request": _request_entry(request),
+            "response": {
+                "status": response.status_code,
+                "headers": {
+                    h: response.headers[h] for h in RESPONSE_HEADERS if h in response.headers
+                },
+                "body": redact(_decode(content)),
+            },
+        }
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+def load_cassette(path: str | Path) -> list[dict]:
+    """녹화 파일 로드 (깨진 마지막 줄은 무시)"""
+    entries = []
+    with Path(path).open(encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                logger.warning(f"녹화 파일 {path}:{line_no} 손상 - 건너뜀")
+    return entries
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """녹화된 응답을 결정적으로 돌려주는 전송 계층
+
+    Args:
+        strict: True면 같은 요청의 녹화분을 모두 소진한 뒤 에러,
+                False면 마지막 응답을 반복
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        entries: list[dict] | None = None,
+        strict: bool = False,
+    ):
+        self.strict = strict
+        self._queues: dict[str, deque[dict]] = {}
+        self._last: dict[str, dict] = {}
+        for entry in entries if entries is not None else load_cassette(path):
+            key = _match_key(entry["request"])
+            self._queues.setdefault(key, deque()).append(entry["response"])
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        entry = _request_entry(request)
+        key = _match_key(entry)
+        queue = self._queues.get(key)
+
+        if queue:
+            recorded = self._last[key] = queue.popleft()
+        elif key in self._last and not self.strict:
+            recorded = self._last[key]
+        else:
+            raise CassetteMissError(
+                f"녹화에 없는 요청: {entry['method']} {entry['path']} "
+                f"{entry['headers'].get('api-id', '')}",
+                request=request,
+            )
+
+        body = recorded["body"]
+        content = (
+            json.dumps(body, ensure_ascii=False).encode()
+            if not isinstance(body, str)
+            else body.encode()
+        )
+        return httpx.Response(
+            status_code=recorded["status"],
+            headers=recorded["headers"],
+            content=content,
+            request=request,
+        )
+
+
+def transport_from_settings() -> httpx.AsyncBaseTransport | None:
+    """설정(KIWOOM_CASSETTE_MODE)에 따른 전송 계층"""
+    from app.common.config import settings
+
+    mode = settings.kiwoom_cassette_mode
+    if mode == "record":
+        logger.info(f"키움 API 녹화 모드: {settings.kiwoom_cassette_path}")
+        return RecordingTransport(settings.kiwoom_cassette_path)
+    if mode == "replay":
+        logger.info(f"키움 API 재생 모드: {settings.kiwoom_cassette_path}")
+        return ReplayTransport(settings.kiwoom_cassette_path)
+    return None
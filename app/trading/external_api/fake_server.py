@@ -0,0 +1,346 @@
+"""로컬 Fake 키움 REST 서버 (ASGI) - 부하 테스트/통합 테스트용
+
+KiwoomRestAPI가 사용하는 엔드포인트를 실제와 같은 응답 형태로 흉내낸다.
+- /oauth2/token
+- /api/dostk/stkinfo (ka10001)
+- /api/dostk/acnt    (kt00001, kt00018, ka10075) - cont-yn/next-key 연속조회
+- /api/dostk/ordr    (kt10000, kt10001, kt10003)
+
+api-id별 지연시간 분포, 초당 요청 제한(초과 시 429 + return_code 5),
+무작위 에러 주입을 설정할 수 있다.
+
+    # 프로세스 내 사용
+    transport = httpx.ASGITransport(app=FakeKiwoomServer())
+    api = KiwoomRestAPI(transport=transport)
+
+    # 별도 프로세스 (uvicorn 설치 시)
+    uvicorn app.trading.external_api.fake_server:app --port 8081
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+THROTTLE_CODE = 5
+THROTTLE_MESSAGE = "허용된 요청 개수를 초과하였습니다"
+INVALID_TOKEN_CODE = 8005
+
+
+@dataclass
+class LatencyModel:
+    """응답 지연시간 분포 (초)
+
+    Args:
+        kind: "fixed" | "uniform" | "lognormal"
+        median: fixed/lognormal 중앙값, uniform 하한
+        spread: uniform 상한 / lognormal sigma
+    """
+
+    kind: str = "fixed"
+    median: float = 0.0
+    spread: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            return rng.uniform(self.median, self.spread)
+        if self.kind == "lognormal":
+            return self.median * rng.lognormvariate(0.0, self.spread)
+        return self.median
+
+
+@dataclass
+class FakeOrder:
+    """Fake 서버 주문"""
+
+    ord_no: str
+    stk_cd: str
+    side: str  # "BUY" | "SELL"
+    qty: int
+    price: int
+    remaining: int
+
+
+@dataclass
+class FakeAccount:
+    """Fake 계좌 상태"""
+
+    deposit: int = 100_000_000
+    holdings: dict[str, list[int]] = field(default_factory=dict)  # 종목 → [수량, 매입단가]
+    orders: dict[str, FakeOrder] = field(default_factory=dict)
+
+
+class FakeKiwoomServer:
+    """Fake 키움 REST 서버 (ASGI 앱)"""
+
+    def __init__(
+        self,
+        latency: LatencyModel | dict[str, LatencyModel] | None = None,
+        rate_limit_per_sec: float | None = None,
+        error_rate: float = 0.0,
+        page_size: int = 20,
+        seed: int | None = None,
+    ):
+        self.latency = latency
+        self.rate_limit_per_sec = rate_limit_per_sec
+        self.error_rate = error_rate
+        self.page_size = page_size
+        self.rng = random.Random(seed)
+
+        self.account = FakeAccount()
+        self.prices: dict[str, int] = {}
+        self.base_prices: dict[str, int] = {}  # 전일종가
+        self.tokens: set[str] = set()
+        self.request_counts: dict[str, int] = {}
+        self._recent: deque[float] = deque()
+        self._order_seq = 0
+
+    # ---- 상태 조작 (테스트용) ----
+
+    def set_price(self, symbol: str, price: int) -> None:
+        self.prices[symbol] = price
+
+    def add_holding(self, symbol: str, quantity: int, avg_price: int) -> None:
+        self.account.holdings[symbol] = [quantity, avg_price]
+
+    def fill_all(self) -> None:
+        """미체결 주문 전량 체결"""
+        for order in list(self.account.orders.values()):
+            self._fill(order)
+
+    def _fill(self, order: FakeOrder) -> None:
+        qty, amount = order.remaining, order.remaining * order.price
+        holding = self.account.holdings.setdefault(order.stk_cd, [0, 0])
+        if order.side == "BUY":
+            total = holding[0] * holding[1] + amount
+            holding[0] += qty
+            holding[1] = total // holding[0]
+            self.account.deposit -= amount
+        else:
+            holding[0] -= qty
+            self.account.deposit += amount
+            if holding[0] <= 0:
+                del self.account.holdings[order.stk_cd]
+        del self.account.orders[order.ord_no]
+
+    def _price(self, symbol: str) -> int:
+        """종목별 랜덤워크 현재가"""
+        if symbol not in self.prices:
+            self.prices[symbol] = 10_000 + (sum(map(ord, symbol)) * 37) % 90_000
+        price = self.prices[symbol]
+        price = max(100, int(price * (1 + self.rng.gauss(0, 0.002))))
+        self.prices[symbol] = price
+        return price
+
+    # ---- ASGI ----
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            while (await receive())["type"] != "lifespan.shutdown":
+                await send({"type": "lifespan.startup.complete"})
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        headers = {k.decode("latin-1").lower(): v.decode() for k, v in scope["headers"]}
+        payload = json.loads(body or b"{}")
+        status, data, extra_headers = await self.handle(scope["path"], headers, payload)
+
+        raw = json.dumps(data, ensure_ascii=False).encode()
+        response_headers = [
+            (b"content-type", b"application/json;charset=UTF-8"),
+            (b"content-length", str(len(raw)).encode()),
+            *((k.encode(), v.encode()) for k, v in extra_headers.items()),
+        ]
+        await send({"type": "http.response.start", "status": status, "headers": response_headers})
+        await send({"type": "http.response.body", "body": raw})
+
+    async def handle(self, path: str, headers: dict, payload: dict) -> tuple[int, dict, dict]:
+        """요청 처리 → (HTTP 상태, 바디, 추가 헤더)"""
+        api_id = headers.get("api-id", "token" if path == "/oauth2/token" else "")
+        self.request_counts[api_id] = self.request_counts.get(api_id, 0) + 1
+
+        await self._sleep(api_id)
+
+        if self._throttled():
+            return 429, {
+                "return_code": THROTTLE_CODE,
+                "return_msg": f"{THROTTLE_MESSAGE}[1700:{THROTTLE_MESSAGE}. API ID={api_id}]",
+            }, {}
+
+        if path == "/oauth2/token":
+            return self._issue_token(payload)
+
+        token = headers.get("authorization", "").removeprefix("Bearer ")
+        if token not in self.tokens:
+            return 200, {
+                "return_code": INVALID_TOKEN_CODE,
+                "return_msg": "Token이 유효하지 않습니다",
+            }, {}
+
+        if self.error_rate and self.rng.random() < self.error_rate:
+            return 500, {"return_code": 1, "return_msg": "일시적인 오류가 발생했습니다"}, {}
+
+        handler = self._handlers().get((path, api_id))
+        if handler is None:
+            return 404, {"return_code": 2, "return_msg": f"지원하지 않는 API: {api_id}"}, {}
+
+        next_key = headers.get("next-key", "") if headers.get("cont-yn") == "Y" else ""
+        data, extra = handler(payload, next_key)
+        return 200, {"return_code": 0, "return_msg": "정상적으로 처리되었습니다", **data}, {
+            "api-id": api_id,
+            **extra,
+        }
+
+    def _handlers(self) -> dict:
+        return {
+            ("/api/dostk/stkinfo", "ka10001"): self._ka10001,
+            ("/api/dostk/acnt", "kt00001"): self._kt00001,
+            ("/api/dostk/acnt", "kt00018"): self._kt00018,
+            ("/api/dostk/acnt", "ka10075"): self._ka10075,
+            ("/api/dostk/ordr", "kt10000"): lambda p, _: self._order(p, "BUY"),
+            ("/api/dostk/ordr", "kt10001"): lambda p, _: self._order(p, "SELL"),
+            ("/api/dostk/ordr", "kt10003"): self._kt10003,
+        }
+
+    async def _sleep(self, api_id: str) -> None:
+        model = self.latency
+        if isinstance(model, dict):
+            model = model.get(api_id) or model.get("default")
+        if model is not None:
+            delay = model.sample(self.rng)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    def _throttled(self) -> bool:
+        """1초 슬라이딩 윈도우 요청 제한"""
+        if not self.rate_limit_per_sec:
+            return False
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] >= 1.0:
+            self._recent.popleft()
+        if len(self._recent) >= self.rate_limit_per_sec:
+            return True
+        self._recent.append(now)
+        return False
+
+    def _issue_token(self, payload: dict) -> tuple[int, dict, dict]:
+        if not payload.get("appkey") or not payload.get("secretkey"):
+            return 400, {
+                "error_code": "INVALID_CLIENT",
+                "error_description": "appkey/secretkey가 필요합니다",
+            }, {}
+        token = f"fake-{len(self.tokens) + 1:06d}-{self.rng.getrandbits(64):016x}"
+        self.tokens.add(token)
+        return 200, {
+            "return_code": 0,
+            "return_msg": "정상적으로 처리되었습니다",
+            "token_type": "bearer",
+            "token": token,
+            "expires_dt": "29991231235959",
+        }, {}
+
+    def _paginate(self, items: list, next_key: str) -> tuple[list, dict]:
+        start = int(next_key or 0)
+        end = start + self.page_size
+        if end < len(items):
+            return items[start:end], {"cont-yn": "Y", "next-key": str(end)}
+        return items[start:], {"cont-yn": "N", "next-key": ""}
+
+    def _ka10001(self, payload: dict, _next_key: str) -> tuple[dict, dict]:
+        symbol = payload.get("stk_cd", "")
+        price = self._price(symbol)
+        base = self.base_prices.setdefault(symbol, price)
+        rate = (Decimal(price) / Decimal(base) - 1) * 100
+        sign = "+" if price >= base else "-"
+        return {
+            "stk_cd": symbol,
+            "stk_nm": f"FAKE{symbol}",
+            "cur_prc": f"{sign}{price}",
+            "base_pric": str(base),
+            "flu_rt": f"{sign}{abs(rate):.2f}",
+        }, {}
+
+    def _kt00001(self, _payload: dict, _next_key: str) -> tuple[dict, dict]:
+        reserved = sum(
+            o.remaining * o.price for o in self.account.orders.values() if o.side == "BUY"
+        )
+        return {
+            "entr": f"{self.account.deposit:015d}",
+            "ord_alow_amt": f"{self.account.deposit - reserved:015d}",
+        }, {}
+
+    def _kt00018(self, _payload: dict, next_key: str) -> tuple[dict, dict]:
+        items = [
+            {
+                "stk_cd": symbol,
+                "stk_nm": f"FAKE{symbol}",
+                "rmnd_qty": f"{qty:012d}",
+                "pur_pric": f"{avg:012d}",
+                "cur_prc": f"{self.prices.get(symbol, avg):012d}",
+                "prft_rt": f"{(self.prices.get(symbol, avg) / avg - 1) * 100:.2f}",
+            }
+            for symbol, (qty, avg) in sorted(self.account.holdings.items())
+        ]
+        page, extra = self._paginate(items, next_key)
+        return {"acnt_evlt_remn_indv_tot": page}, extra
+
+    def _ka10075(self, _payload: dict, next_key: str) -> tuple[dict, dict]:
+        items = [
+            {
+                "ord_no": o.ord_no,
+                "stk_cd": o.stk_cd,
+                "trde_tp": "2" if o.side == "BUY" else "1",
+                "ord_qty": str(o.qty),
+                "oso_qty": str(o.remaining),
+                "ord_pric": str(o.price),
+            }
+            for o in self.account.orders.values()
+        ]
+        page, extra = self._paginate(items, next_key)
+        return {"oso": page}, extra
+
+    def _order(self, payload: dict, side: str) -> tuple[dict, dict]:
+        self._order_seq += 1
+        ord_no = f"{self._order_seq:07d}"
+        qty = int(payload.get("ord_qty", "0"))
+        self.account.orders[ord_no] = FakeOrder(
+            ord_no=ord_no,
+            stk_cd=payload.get("stk_cd", ""),
+            side=side,
+            qty=qty,
+            price=int(payload.get("ord_uv", "0")),
+            remaining=qty,
+        )
+        return {"ord_no": ord_no, "dmst_stex_tp": payload.get("dmst_stex_tp", "KRX")}, {}
+
+    def _kt10003(self, payload: dict, _next_key: str) -> tuple[dict, dict]:
+        order = self.account.orders.get(payload.get("orig_ord_no", ""))
+        if order is None:
+            return {"return_code": 20, "return_msg": "원주문이 존재하지 않습니다"}, {}
+
+        cancel_qty = int(payload.get("cncl_qty", "0")) or order.remaining
+        cancel_qty = min(cancel_qty, order.remaining)
+        order.remaining -= cancel_qty
+        if order.remaining == 0:
+            del self.account.orders[order.ord_no]
+
+        self._order_seq += 1
+        return {
+            "ord_no": f"{self._order_seq:07d}",
+            "base_orig_ord_no": order.ord_no,
+            "cncl_qty": str(cancel_qty),
+        }, {}
+
+
+# uvicorn 등에서 바로 띄울 수 있는 기본 인스턴스
+app = FakeKiwoomServer()
@@ -1,12 +1,18 @@
 """키움 REST API 클라이언트"""
 
+import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from decimal import Decimal
+from typing import AsyncIterator
 
 import httpx
 
 from app.common.config import settings
+from app.common.metrics import REGISTRY
+from app.common.money import Rounding, Won
+from app.common.tracing import get_tracer
 from app.common.utils import get_kst_now
 from app.trading.external_api.base import (
     BalanceInfo,
@@ -15,8 +21,27 @@ from app.trading.external_api.base import (
     PriceInfo,
     StockAPIBase,
 )
+from app.trading.external_api.ratelimit import RateLimiter
 
 logger = logging.getLogger(__name__)
+tracer = get_tracer()
+
+REQUEST_LATENCY = REGISTRY.histogram(
+    "kiwoom_request_seconds", "키움 REST API 요청 지연시간", ("api_id",)
+)
+REQUEST_ERRORS = REGISTRY.counter(
+    "kiwoom_request_errors_total", "키움 REST API 요청 에러 수", ("api_id", "code")
+)
+RATE_LIMIT_WAIT = REGISTRY.histogram(
+    "kiwoom_rate_limit_wait_seconds", "요청 속도 제한 대기시간", ("api_id",)
+)
+
+# ka10075 미체결요청 파라미터
+PENDING_ORDER_PARAMS = {
+    "all_stk_tp": "0",  # 전체종목
+    "trde_tp": "0",     # 전체(매수+매도)
+    "stex_tp": "1",     # KRX
+}
 
 
 class KiwoomAPIError(Exception):
@@ -28,10 +53,77 @@ class KiwoomAPIError(Exception):
         super().__init__(f"[{code}] {message}")
 
 
+def _strip_sign(value: str | None) -> str:
+    """부호/콤마 제거 (예: "+25,525" → "25525")"""
+    return (value or "0").replace(",", "").lstrip("+-") or "0"
+
+
+def parse_price(symbol: str, data: dict) -> PriceInfo:
+    """ka10001 응답 → PriceInfo"""
+    # 응답 필드 (output 래퍼 없음)
+    # cur_prc: 현재가 (예: "+25525")
+    # base_pric: 기준가/전일종가 (예: "25275")
+    # flu_rt: 등락률 (예: "+0.99")
+    return PriceInfo(
+        symbol=symbol,
+        symbol_name=data.get("stk_nm", ""),
+        current_price=Won.of(_strip_sign(data.get("cur_prc"))),
+        prev_close=Won.of(_strip_sign(data.get("base_pric"))),
+        change_rate=Decimal(_strip_sign(data.get("flu_rt"))),
+    )
+
+
+def parse_balance(data: dict) -> BalanceInfo:
+    """kt00001 응답 → BalanceInfo"""
+    output = data.get("output", data)
+    if isinstance(output, list) and output:
+        output = output[0]
+
+    return BalanceInfo(
+        total_deposit=Won.of(output.get("entr", "0")),
+        available_amount=Won.of(output.get("ord_alow_amt", "0")),
+    )
+
+
+def parse_holdings(data: dict) -> list[HoldingInfo]:
+    """kt00018 응답 → HoldingInfo 목록"""
+    # 보유종목 리스트: acnt_evlt_remn_indv_tot
+    return [
+        HoldingInfo(
+            symbol=item.get("stk_cd", ""),
+            symbol_name=item.get("stk_nm", ""),
+            quantity=int(item.get("rmnd_qty", "0")),
+            avg_price=Won.of(item.get("pur_pric", "0"), Rounding.HALF_UP),
+            current_price=Won.of(item.get("cur_prc", "0")),
+            profit_rate=Decimal(item.get("prft_rt", "0")),
+        )
+        for item in data.get("acnt_evlt_remn_indv_tot", [])
+    ]
+
+
+def parse_pending_orders(data: dict) -> list[OrderResult]:
+    """ka10075 응답 → 미체결 OrderResult 목록"""
+    orders = []
+    for item in data.get("oso", []):
+        # trde_tp: 1=매도, 2=매수
+        order_type = "BUY" if item.get("trde_tp") == "2" else "SELL"
+        orders.append(
+            OrderResult(
+                order_id=item.get("ord_no", ""),
+                symbol=item.get("stk_cd", ""),
+                order_type=order_type,
+                quantity=int(item.get("oso_qty", "0")),  # 미체결수량
+                price=Won.of(item.get("ord_pric", "0")),
+                status="PENDING",
+            )
+        )
+    return orders
+
+
 class KiwoomRestAPI(StockAPIBase):
     """키움 REST API 클라이언트 구현"""
 
-    def __init__(self):
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None):
         self.base_url = settings.kiwoom_base_url
         self.app_key = settings.kiwoom_app_key
         self.app_secret = settings.kiwoom_app_secret
@@ -39,41 +131,69 @@ class KiwoomRestAPI(StockAPIBase):
 
         self._token: str | None = None
         self._token_expires_at: datetime | None = None
-
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=30.0,
-        )
+        self._token_lock = asyncio.Lock()
+
+        # 테스트/재현용 전송 계층 주입 (None이면 설정에 따라 녹화/재생 또는 실제 네트워크)
+        if transport is None and settings.kiwoom_cassette_mode != "off":
+            from app.trading.external_api.cassette import transport_from_settings
+
+            transport = transport_from_settings()
+        self._transport = transport
+        self._http: httpx.AsyncClient | None = None
+
+        # 초당 호출 제한 (0이면 제한 없음)
+        rate = settings.kiwoom_rate_limit_per_sec
+        self._limiter = RateLimiter(rate) if rate > 0 else None
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """HTTP 클라이언트 (첫 요청 시 생성)"""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=settings.kiwoom_timeout,
+                transport=self._transport,
+            )
+        return self._http
 
     async def close(self):
         """클라이언트 종료"""
-        await self._client.aclose()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def _token_valid(self) -> bool:
+        """토큰이 있고 만료 1시간 전이 아닌지"""
+        return (
+            self._token is not None
+            and self._token_expires_at is not None
+            and get_kst_now() < self._token_expires_at - timedelta(hours=1)
+        )
 
     async def _ensure_token(self) -> str:
         """토큰 유효성 확인 및 갱신"""
-        now = get_kst_now()
+        if self._token_valid():
+            return self._token
 
-        # 토큰이 없거나 만료 1시간 전이면 갱신
-        if (
-            self._token is None
-            or self._token_expires_at is None
-            or now >= self._token_expires_at - timedelta(hours=1)
-        ):
-            self._token = await self.get_token()
+        # 동시 요청이 몰려도 토큰 발급은 1회만
+        async with self._token_lock:
+            if not self._token_valid():
+                self._token = await self.get_token()
 
         return self._token
 
     async def get_token(self) -> str:
         """인증 토큰 발급"""
-        response = await self._client.post(
-            "/oauth2/token",
-            json={
-                "grant_type": "client_credentials",
-                "appkey": self.app_key,
-                "secretkey": self.app_secret,
-            },
-            headers={"Content-Type": "application/json"},
-        )
+        with tracer.span("kiwoom.token"):
+            response = await self._client.post(
+                "/oauth2/token",
+                json={
+                    "grant_type": "client_credentials",
+                    "appkey": self.app_key,
+                    "secretkey": self.app_secret,
+                },
+                headers={"Content-Type": "application/json"},
+            )
 
         data = response.json()
 
@@ -97,30 +217,109 @@ class KiwoomRestAPI(StockAPIBase):
         api_id: str,
         params: dict | None = None,
         json_data: dict | None = None,
+        timeout: float | None = None,
+    ) -> dict:
+        """API 요청 공통 메서드 (timeout: 요청별 타임아웃, 기본은 KIWOOM_TIMEOUT)"""
+        data, _ = await self._request_with_headers(
+            method, endpoint, api_id, params, json_data, timeout=timeout
+        )
+        return data
+
+    async def _iter_pages(
+        self,
+        endpoint: str,
+        api_id: str,
+        params: dict,
+        max_pages: int = 50,
+    ) -> AsyncIterator[dict]:
+        """연속조회(cont-yn/next-key) 요청 - 페이지별 응답 바디를 도착하는 대로 반환"""
+        data, headers = await self._request_with_headers("POST", endpoint, api_id, params)
+        yield data
+
+        pages = 1
+        while headers.get("cont-yn") == "Y" and pages < max_pages:
+            data, headers = await self._request_with_headers(
+                "POST",
+                endpoint,
+                api_id,
+                params,
+                extra_headers={"cont-yn": "Y", "next-key": headers.get("next-key", "")},
+            )
+            yield data
+            pages += 1
+
+    async def _request_paged(
+        self,
+        endpoint: str,
+        api_id: str,
+        params: dict,
+        list_key: str,
+        max_pages: int = 50,
     ) -> dict:
-        """API 요청 공통 메서드"""
+        """연속조회 요청 - 모든 페이지의 list_key 항목을 합쳐 반환"""
+        first: dict | None = None
+        items: list = []
+        async for page in self._iter_pages(endpoint, api_id, params, max_pages):
+            if first is None:
+                first = page
+            items.extend(page.get(list_key) or [])
+
+        first[list_key] = items
+        return first
+
+    async def _request_with_headers(
+        self,
+        method: str,
+        endpoint: str,
+        api_id: str,
+        params: dict | None = None,
+        json_data: dict | None = None,
+        extra_headers: dict | None = None,
+        timeout: float | None = None,
+    ) -> tuple[dict, httpx.Headers]:
+        """API 요청 - (응답 바디, 응답 헤더) 반환"""
         token = await self._ensure_token()
 
         headers = {
             "Content-Type": "application/json;charset=UTF-8",
             "Authorization": f"Bearer {token}",
             "api-id": api_id,
+            **(extra_headers or {}),
         }
 
+        if self._limiter is not None:
+            RATE_LIMIT_WAIT.labels(api_id).observe(await self._limiter.acquire())
+
         # 키움 REST API는 대부분 POST + Body 파라미터 사용
         # 문서상 Method: POST, Body parameters
-        response = await self._client.post(endpoint, headers=headers, json=params or json_data)
+        started = time.perf_counter()
+        try:
+            with tracer.span("kiwoom.request", api_id=api_id, endpoint=endpoint) as span:
+                response = await self._client.post(
+                    endpoint,
+                    headers=headers,
+                    json=params or json_data,
+                    timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+                )
+                data = response.json()
+                if span is not None:
+                    span.set_attribute("http.status_code", response.status_code)
+                    span.set_attribute("return_code", data.get("return_code", 0))
+        except Exception as e:
+            REQUEST_ERRORS.labels(api_id, type(e).__name__).inc()
+            raise
+        finally:
+            REQUEST_LATENCY.labels(api_id).observe(time.perf_counter() - started)
 
-        data = response.json()
-        
         # 에러 체크 (return_code != 0 이면 에러)
         if data.get("return_code") and data["return_code"] != 0:
+            REQUEST_ERRORS.labels(api_id, str(data["return_code"])).inc()
             raise KiwoomAPIError(
                 code=str(data.get("return_code", "UNKNOWN")),
                 message=data.get("return_msg", "알 수 없는 오류"),
             )
 
-        return data
+        return data, response.headers
 
     async def get_price(self, symbol: str) -> PriceInfo:
         """현재가 조회 (주식기본정보)"""
@@ -132,22 +331,7 @@ class KiwoomRestAPI(StockAPIBase):
             params={"stk_cd": symbol},
         )
 
-        # 응답 필드 (output 래퍼 없음)
-        # cur_prc: 현재가 (예: "+25525")
-        # base_pric: 기준가/전일종가 (예: "25275")
-        # flu_rt: 등락률 (예: "+0.99")
-        
-        current_price = data.get("cur_prc", "0").replace(",", "").lstrip("+-")
-        base_price = data.get("base_pric", "0").replace(",", "").lstrip("+-")
-        change_rate = data.get("flu_rt", "0").replace(",", "").lstrip("+-")
-
-        return PriceInfo(
-            symbol=symbol,
-            symbol_name=data.get("stk_nm", ""),
-            current_price=Decimal(current_price or "0"),
-            prev_close=Decimal(base_price or "0"),
-            change_rate=Decimal(change_rate or "0"),
-        )
+        return parse_price(symbol, data)
 
     async def get_balance(self) -> BalanceInfo:
         """계좌 잔고 조회"""
@@ -162,61 +346,39 @@ class KiwoomRestAPI(StockAPIBase):
         # 디버깅: 응답 필드 확인용 로그
         logger.info(f"Balance (kt00001) Body: {data}")
 
-        output = data.get("output", data)
-        if isinstance(output, list) and output:
-             output = output[0]
-
-        return BalanceInfo(
-            total_deposit=Decimal(output.get("entr", "0")),
-            available_amount=Decimal(output.get("ord_alow_amt", "0")),
-        )
+        return parse_balance(data)
 
     async def get_holdings(self) -> list[HoldingInfo]:
         """보유 종목 조회"""
         # kt00018: 계좌평가잔고내역요청
-        data = await self._request(
-            method="POST",
+        data = await self._request_paged(
             endpoint="/api/dostk/acnt",
             api_id="kt00018",
             params={
                 "qry_tp": "2",  # 개별조회
                 "dmst_stex_tp": "KRX",  # 한국거래소
             },
+            list_key="acnt_evlt_remn_indv_tot",
         )
         
         # 디버깅
         logger.info(f"Holdings (kt00018) Output Keys: {data.keys()}")
 
-        # 보유종목 리스트: acnt_evlt_remn_indv_tot
-        output_list = data.get("acnt_evlt_remn_indv_tot", [])
-
-        holdings = []
-        for item in output_list:
-            holdings.append(
-                HoldingInfo(
-                    symbol=item.get("stk_cd", ""),
-                    symbol_name=item.get("stk_nm", ""),
-                    quantity=int(item.get("rmnd_qty", "0")),
-                    avg_price=Decimal(item.get("pur_pric", "0")),
-                    current_price=Decimal(item.get("cur_prc", "0")),
-                    profit_rate=Decimal(item.get("prft_rt", "0")),
-                )
-            )
-
-        return holdings
+        return parse_holdings(data)
 
-    async def buy(self, symbol: str, quantity: int, price: Decimal) -> OrderResult:
+    async def buy(self, symbol: str, quantity: int, price: Won) -> OrderResult:
         """지정가 매수 주문 (현재가 기준)"""
         # kt10000: 주식매수주문
         data = await self._request(
             method="POST",
             endpoint="/api/dostk/ordr",
             api_id="kt10000",
+            timeout=settings.kiwoom_order_timeout,
             json_data={
                 "dmst_stex_tp": "KRX",  # 한국거래소
                 "stk_cd": symbol,
                 "ord_qty": str(quantity),
-                "ord_uv": str(int(price)),  # 현재가
+                "ord_uv": str(Won.of(price, Rounding.DOWN)),  # 지정가 (원 미만 내림)
                 "trde_tp": "0",  # 지정가
             },
         )
@@ -239,18 +401,19 @@ class KiwoomRestAPI(StockAPIBase):
             status="PENDING",
         )
 
-    async def sell(self, symbol: str, quantity: int, price: Decimal) -> OrderResult:
+    async def sell(self, symbol: str, quantity: int, price: Won) -> OrderResult:
         """지정가 매도 주문 (현재가 기준)"""
         # kt10001: 주식매도주문
         data = await self._request(
             method="POST",
             endpoint="/api/dostk/ordr",
             api_id="kt10001",
+            timeout=settings.kiwoom_order_timeout,
             json_data={
                 "dmst_stex_tp": "KRX",  # 한국거래소
                 "stk_cd": symbol,
                 "ord_qty": str(quantity),
-                "ord_uv": str(int(price)),  # 현재가
+                "ord_uv": str(Won.of(price, Rounding.UP)),  # 지정가 (원 미만 올림)
                 "trde_tp": "0",  # 지정가
             },
         )
@@ -276,35 +439,21 @@ class KiwoomRestAPI(StockAPIBase):
     async def get_pending_orders(self) -> list[OrderResult]:
         """미체결 주문 조회"""
         # ka10075: 미체결요청
-        data = await self._request(
-            method="POST",
+        data = await self._request_paged(
             endpoint="/api/dostk/acnt",
             api_id="ka10075",
-            params={
-                "all_stk_tp": "0",  # 전체종목
-                "trde_tp": "0",     # 전체(매수+매도)
-                "stex_tp": "1",     # KRX
-            },
+            params=PENDING_ORDER_PARAMS,
+            list_key="oso",
         )
 
         logger.info(f"Pending orders (ka10075) response keys: {data.keys()}")
 
-        orders = []
-        for item in data.get("oso", []):
-            # trde_tp: 1=매도, 2=매수
-            order_type = "BUY" if item.get("trde_tp") == "2" else "SELL"
-            orders.append(
-                OrderResult(
-                    order_id=item.get("ord_no", ""),
-                    symbol=item.get("stk_cd", ""),
-                    order_type=order_type,
-                    quantity=int(item.get("oso_qty", "0")),  # 미체결수량
-                    price=Decimal(item.get("ord_pric", "0")),
-                    status="PENDING",
-                )
-            )
+        return parse_pending_orders(data)
 
-        return orders
+    async def iter_pending_orders(self) -> AsyncIterator[list[OrderResult]]:
+        """미체결 주문 조회 - 연속조회 페이지 단위"""
+        async for page in self._iter_pages("/api/dostk/acnt", "ka10075", PENDING_ORDER_PARAMS):
+            yield parse_pending_orders(page)
 
     async def cancel_order(self, order_id: str, symbol: str = "", quantity: int = 0) -> bool:
         """주문 취소
@@ -320,6 +469,7 @@ class KiwoomRestAPI(StockAPIBase):
                 method="POST",
                 endpoint="/api/dostk/ordr",
                 api_id="kt10003",
+                timeout=settings.kiwoom_order_timeout,
                 json_data={
                     "dmst_stex_tp": "KRX",  # 한국거래소
                     "orig_ord_no": order_id,  # 원주문번호
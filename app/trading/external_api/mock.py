@@ -2,6 +2,7 @@
 
 from decimal import Decimal
 
+from app.common.money import Rounding, Won, div_round
 from app.trading.external_api.base import (
     BalanceInfo,
     HoldingInfo,
@@ -17,12 +18,12 @@ class MockStockAPI(StockAPIBase):
     def __init__(self):
         self._holdings: dict[str, HoldingInfo] = {}
         self._orders: list[OrderResult] = []
-        self._balance = Decimal("10000000")  # 1000만원
+        self._balance = Won(10_000_000)  # 1000만원
         self._order_counter = 0
 
         # Mock 가격 데이터
-        self._prices: dict[str, Decimal] = {
-            "133690": Decimal("167750"),  # TIGER 미국나스닥100
+        self._prices: dict[str, Won] = {
+            "133690": Won(167_750),  # TIGER 미국나스닥100
         }
 
     async def get_token(self) -> str:
@@ -31,13 +32,13 @@ class MockStockAPI(StockAPIBase):
 
     async def get_price(self, symbol: str) -> PriceInfo:
         """Mock 현재가 조회"""
-        price = self._prices.get(symbol, Decimal("100000"))
+        price = self._prices.get(symbol, Won(100_000))
 
         return PriceInfo(
             symbol=symbol,
             symbol_name=self._get_symbol_name(symbol),
             current_price=price,
-            prev_close=price * Decimal("0.99"),
+            prev_close=Won(price * 99 // 100),
             change_rate=Decimal("1.01"),
         )
 
@@ -52,26 +53,27 @@ class MockStockAPI(StockAPIBase):
         """Mock 보유 종목 조회"""
         return list(self._holdings.values())
 
-    async def buy(self, symbol: str, quantity: int, price: Decimal) -> OrderResult:
+    async def buy(self, symbol: str, quantity: int, price: Won) -> OrderResult:
         """Mock 매수 주문"""
         self._order_counter += 1
         order_id = f"MOCK_BUY_{self._order_counter}"
+        price = Won.of(price)
 
         # 잔고 차감
-        total_amount = price * Decimal(quantity)
-        self._balance -= total_amount
+        total_amount = price * quantity
+        self._balance = Won(self._balance - total_amount)
 
         # 보유 종목 업데이트
         if symbol in self._holdings:
             holding = self._holdings[symbol]
             # 평단가 재계산
-            total_cost = holding.avg_price * Decimal(holding.quantity) + total_amount
+            total_cost = holding.avg_price * holding.quantity + total_amount
             new_quantity = holding.quantity + quantity
             self._holdings[symbol] = HoldingInfo(
                 symbol=symbol,
                 symbol_name=holding.symbol_name,
                 quantity=new_quantity,
-                avg_price=total_cost / Decimal(new_quantity),
+                avg_price=Won(div_round(total_cost, new_quantity, Rounding.HALF_UP)),
                 current_price=price,
                 profit_rate=Decimal("0"),
             )
@@ -94,14 +96,15 @@ class MockStockAPI(StockAPIBase):
             status="FILLED",  # Mock은 즉시 체결
         )
 
-    async def sell(self, symbol: str, quantity: int, price: Decimal) -> OrderResult:
+    async def sell(self, symbol: str, quantity: int, price: Won) -> OrderResult:
         """Mock 매도 주문"""
         self._order_counter += 1
         order_id = f"MOCK_SELL_{self._order_counter}"
+        price = Won.of(price)
 
         # 잔고 추가
-        total_amount = price * Decimal(quantity)
-        self._balance += total_amount
+        total_amount = price * quantity
+        self._balance = Won(self._balance + total_amount)
 
         # 보유 종목 업데이트
         if symbol in self._holdings:
@@ -140,13 +143,13 @@ class MockStockAPI(StockAPIBase):
                 return True
         return False
 
-    def set_price(self, symbol: str, price: Decimal) -> None:
+    def set_price(self, symbol: str, price: Won | Decimal) -> None:
         """테스트용: 가격 설정"""
-        self._prices[symbol] = price
+        self._prices[symbol] = Won.of(price)
 
-    def set_balance(self, balance: Decimal) -> None:
+    def set_balance(self, balance: Won | Decimal) -> None:
         """테스트용: 잔고 설정"""
-        self._balance = balance
+        self._balance = Won.of(balance)
 
     def _get_symbol_name(self, symbol: str) -> str:
         """종목명 반환"""
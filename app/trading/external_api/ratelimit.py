@@ -0,0 +1,52 @@
+"""요청 속도 제한 - 비동기 토큰 버킷
+
+증권사 초당 호출 제한(키움 1700 오류)을 넘지 않도록 클라이언트 쪽에서 요청을 늦춘다.
+대기는 락 안에서 하므로 요청 순서(FIFO)가 유지된다.
+"""
+
+import asyncio
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """초당 rate회, 최대 burst회 연속 허용"""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """토큰 1개 획득 → 대기한 시간(초)"""
+        async with self._lock:
+            self._refill()
+            waited = 0.0
+            if self._tokens < 1:
+                waited = (1 - self._tokens) / self.rate
+                await asyncio.sleep(waited)
+                self._refill()
+            self._tokens -= 1
+            return waited
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        pass
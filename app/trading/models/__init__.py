@@ -3,5 +3,6 @@
 from app.trading.models.position import Position
 from app.trading.models.cycle_history import CycleHistory
 from app.trading.models.order import Order
+from app.trading.models.daily_snapshot import DailySnapshot
 
-__all__ = ["Position", "CycleHistory", "Order"]
+__all__ = ["Position", "CycleHistory", "Order", "DailySnapshot"]
@@ -4,17 +4,24 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import Numeric, String, func
+from sqlalchemy import Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column
-from uuid_utils import uuid7
+from uuid_utils.compat import uuid7
 
 from app.common.database import Base
+from app.common.money import Rate, Won
+from app.common.utils import kst_now_naive
 
 
 class CycleHistory(Base):
     """사이클 히스토리 (과거 기록)"""
 
     __tablename__ = "cycle_histories"
+    __table_args__ = (
+        # 종목/사이클별 조회 + 전체 기록의 종료 순 keyset 페이지네이션
+        Index("ix_cycle_histories_symbol_cycle_ended", "symbol", "cycle_number", "ended_at"),
+        Index("ix_cycle_histories_ended_at_id", "ended_at", "id"),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
     symbol: Mapped[str] = mapped_column(String(10), index=True)
@@ -25,28 +32,30 @@ class CycleHistory(Base):
     profit_rate: Mapped[Decimal] = mapped_column(Numeric(5, 4))
     total_trades: Mapped[int]  # 해당 사이클의 총 매수 횟수
     started_at: Mapped[datetime]
-    ended_at: Mapped[datetime] = mapped_column(default=func.now())
+    ended_at: Mapped[datetime] = mapped_column(default=kst_now_naive)
 
     @classmethod
     def create_from_position(
         cls,
         symbol: str,
         cycle_number: int,
-        start_investment: Decimal,
-        end_proceeds: Decimal,
+        start_investment: Won | Decimal,
+        end_proceeds: Won | Decimal,
         total_trades: int,
         started_at: datetime,
     ) -> "CycleHistory":
-        """Position 정보로부터 CycleHistory 생성"""
-        profit = end_proceeds - start_investment
-        profit_rate = profit / start_investment if start_investment > 0 else Decimal("0")
+        """Position 정보로부터 CycleHistory 생성 (원 단위 내림, 수익률 소수 4자리 반올림)"""
+        start = Won.of(start_investment)
+        end = Won.of(end_proceeds)
+        profit = end - start
+        profit_rate = Rate.ratio(profit, start).to_decimal(places=4)
 
         return cls(
             symbol=symbol,
             cycle_number=cycle_number,
-            start_investment=start_investment,
-            end_proceeds=end_proceeds,
-            profit=profit,
+            start_investment=start.to_decimal(),
+            end_proceeds=end.to_decimal(),
+            profit=Decimal(profit),
             profit_rate=profit_rate,
             total_trades=total_trades,
             started_at=started_at,
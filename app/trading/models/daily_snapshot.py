@@ -0,0 +1,33 @@
+"""DailySnapshot 모델 - 종목별 장 마감 평가 (일별 1행)"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import Numeric, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from uuid_utils.compat import uuid7
+
+from app.common.database import Base
+from app.common.utils import kst_now_naive
+
+
+class DailySnapshot(Base):
+    """종목별 장 마감 평가 (일별 1행)"""
+
+    __tablename__ = "daily_snapshots"
+    __table_args__ = (
+        UniqueConstraint("symbol", "trading_date", name="uq_daily_snapshots_symbol_date"),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
+    symbol: Mapped[str] = mapped_column(String(10))
+    trading_date: Mapped[date]
+    cycle_number: Mapped[int]
+    quantity: Mapped[int]
+    avg_price: Mapped[Decimal | None] = mapped_column(Numeric(15, 2), nullable=True)
+    close: Mapped[Decimal] = mapped_column(Numeric(15, 2))
+    investment: Mapped[Decimal] = mapped_column(Numeric(15, 2))  # 현재 사이클 투자금
+    unrealized_pnl: Mapped[Decimal] = mapped_column(Numeric(15, 2))  # (종가 - 평단가) × 수량
+    splits_used: Mapped[int]
+    created_at: Mapped[datetime] = mapped_column(default=kst_now_naive)
@@ -5,11 +5,12 @@ from decimal import Decimal
 from enum import Enum
 from uuid import UUID
 
-from sqlalchemy import Numeric, String, func
+from sqlalchemy import Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column
-from uuid_utils import uuid7
+from uuid_utils.compat import uuid7
 
 from app.common.database import Base
+from app.common.utils import kst_now_naive
 
 
 class OrderType(str, Enum):
@@ -33,6 +34,13 @@ class Order(Base):
     """주문 기록"""
 
     __tablename__ = "orders"
+    __table_args__ = (
+        # 종목/사이클별 조회 + 전체 기록의 생성 순 keyset 페이지네이션
+        Index("ix_orders_symbol_cycle_created", "symbol", "cycle_number", "created_at"),
+        Index("ix_orders_created_at_id", "created_at", "id"),
+        # 미체결 정리 결과를 증권사 주문번호로 주문 행에 반영
+        Index("ix_orders_kiwoom_order_id", "kiwoom_order_id"),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
     symbol: Mapped[str] = mapped_column(String(10), index=True)
@@ -43,13 +51,17 @@ class Order(Base):
     filled_price: Mapped[Decimal | None] = mapped_column(Numeric(15, 2), nullable=True)
     status: Mapped[OrderStatus] = mapped_column(String(20), default=OrderStatus.PENDING)
     kiwoom_order_id: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    # 주문 의도 식별자 (거래일-종목-사이클-분할-방향) - 제출 전에 기록해 재시도 시 중복 방지
+    client_order_id: Mapped[str | None] = mapped_column(
+        String(64), unique=True, index=True, nullable=True
+    )
 
     # 사이클 정보
     cycle_number: Mapped[int]
     split_number: Mapped[int]  # 몇 번째 분할 매수인지
 
     # 타임스탬프
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(default=kst_now_naive)
     filled_at: Mapped[datetime | None] = mapped_column(nullable=True)
 
     def mark_filled(self, filled_quantity: int, filled_price: Decimal) -> None:
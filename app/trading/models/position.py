@@ -1,14 +1,19 @@
 """Position 모델 - 종목별 포지션 (현재 사이클)"""
 
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from uuid import UUID
 
-from sqlalchemy import Numeric, String, func
+from sqlalchemy import Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column
-from uuid_utils import uuid7
+from uuid_utils.compat import uuid7
 
 from app.common.database import Base
+from app.common.money import Won
+from app.common.utils import kst_now_naive
+
+# Numeric(15, 2) 컬럼 자릿수
+CENT = Decimal("0.01")
 
 
 class Position(Base):
@@ -29,8 +34,16 @@ class Position(Base):
     initial_investment: Mapped[Decimal] = mapped_column(Numeric(15, 2))  # 최초 투자금 (기록용)
 
     # 타임스탬프
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now())
+    created_at: Mapped[datetime] = mapped_column(default=kst_now_naive)
+    updated_at: Mapped[datetime] = mapped_column(default=kst_now_naive, onupdate=kst_now_naive)
+
+    # 낙관적 잠금 - UPDATE는 읽은 version과 같을 때만 반영 (다르면 StaleDataError)
+    version: Mapped[int] = mapped_column(default=1, server_default="1")
+
+    # version_id_col: 갱신마다 version + 1
+    # eager_defaults: INSERT/UPDATE 때 DB 기본값(server_default)을 RETURNING으로 받아
+    # 커밋 후 다시 조회하지 않아도 모든 속성이 채워져 있다 (포지션 캐시)
+    __mapper_args__ = {"version_id_col": version, "eager_defaults": True}
 
     @property
     def total_cost(self) -> Decimal:
@@ -39,10 +52,9 @@ class Position(Base):
             return Decimal("0")
         return Decimal(self.quantity) * self.avg_price
 
-    @property
-    def investment_per_split(self) -> Decimal:
-        """1회 분할 매수 금액"""
-        return self.current_investment / 40  # TODO: num_splits from config
+    def investment_per_split(self, num_splits: int) -> Won:
+        """1회 분할 매수 금액 (원 단위 내림)"""
+        return Won.of(self.current_investment).split(num_splits)
 
     def reset_for_new_cycle(self, sell_proceeds: Decimal) -> None:
         """새 사이클을 위한 포지션 리셋"""
@@ -50,18 +62,20 @@ class Position(Base):
         self.avg_price = None
         self.splits_used = 0
         self.cycle_count += 1
-        self.current_investment = sell_proceeds
+        self.current_investment = Decimal(sell_proceeds)
 
-    def update_after_buy(self, buy_quantity: int, buy_price: Decimal) -> None:
-        """매수 체결 후 포지션 업데이트"""
+    def update_after_buy(self, buy_quantity: int, buy_price: Won | Decimal) -> None:
+        """매수 체결 후 포지션 업데이트 (평단가는 0.01원 단위 반올림)"""
         if self.avg_price is None:
             # 첫 매수
-            self.avg_price = buy_price
+            self.avg_price = Decimal(buy_price).quantize(CENT, rounding=ROUND_HALF_UP)
             self.quantity = buy_quantity
         else:
             # 평단가 재계산
             total_cost = self.total_cost + (Decimal(buy_quantity) * buy_price)
             self.quantity += buy_quantity
-            self.avg_price = total_cost / Decimal(self.quantity)
+            self.avg_price = (total_cost / Decimal(self.quantity)).quantize(
+                CENT, rounding=ROUND_HALF_UP
+            )
 
         self.splits_used += 1
@@ -1,5 +1,21 @@
 """Repository 모듈"""
 
+from app.trading.repository.cycle_history import CycleHistoryRepository
+from app.trading.repository.memory import (
+    InMemoryOrderRepository,
+    InMemoryPositionRepository,
+    InMemorySession,
+)
+from app.trading.repository.order import OrderRepository
 from app.trading.repository.position import PositionRepository
+from app.trading.repository.snapshot import SnapshotRepository
 
-__all__ = ["PositionRepository"]
+__all__ = [
+    "PositionRepository",
+    "OrderRepository",
+    "CycleHistoryRepository",
+    "SnapshotRepository",
+    "InMemoryPositionRepository",
+    "InMemoryOrderRepository",
+    "InMemorySession",
+]
@@ -0,0 +1,254 @@
+"""Analytics Repository - 사이클/포트폴리오 성과 통계 (DB에서 윈도 함수로 집계)
+
+행을 Python으로 가져오지 않고 DB에서 집계해 종목별 한 행만 받는다.
+- 종목 통계 (cycle_histories): 사이클 수, 승률, 평균 사이클 기간, 누적 수익률, 사이클 간 최대 낙폭
+- 사이클별 분해 (orders): 체결된 매수 횟수, 매수 금액, 기간, 사이클 내 매수가 최대 낙폭
+
+Postgres에서는 종목 통계를 구체화 뷰(cycle_performance)로 저장해 두고 사이클 완료 시 갱신할 수
+있다 (ANALYTICS_MATERIALIZED_VIEW=true, 뷰는 Alembic 마이그레이션이 생성).
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Select,
+    and_,
+    case,
+    cast,
+    column,
+    extract,
+    func,
+    literal_column,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.tracing import get_tracer
+from app.trading.models.cycle_history import CycleHistory
+from app.trading.models.order import Order, OrderStatus, OrderType
+from app.trading.repository.position import DB_QUERY_LATENCY
+
+tracer = get_tracer()
+
+MATERIALIZED_VIEW = "cycle_performance"
+
+_STATS_COLUMNS = (
+    "symbol",
+    "cycles",
+    "wins",
+    "avg_cycle_days",
+    "avg_profit_rate",
+    "total_profit",
+    "cumulative_return",
+    "max_drawdown",
+)
+
+
+@dataclass(frozen=True)
+class CycleStats:
+    """종목별 완료 사이클 통계"""
+
+    symbol: str
+    cycles: int
+    wins: int
+    avg_cycle_days: float
+    avg_profit_rate: float
+    total_profit: Decimal
+    cumulative_return: float  # 첫 사이클 시작 투자금 대비 마지막 사이클 종료 금액
+    max_drawdown: float  # 사이클 종료 금액의 직전 고점 대비 최대 하락률 (양수)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.cycles if self.cycles else 0.0
+
+
+@dataclass(frozen=True)
+class CycleBreakdown:
+    """사이클별 주문 집계"""
+
+    symbol: str
+    cycle_number: int
+    buys: int
+    invested: Decimal
+    first_buy_at: datetime
+    last_buy_at: datetime
+    max_drawdown: float  # 사이클 내 매수가의 직전 고점 대비 최대 하락률 (양수)
+    profit_rate: Decimal | None  # 진행 중인 사이클은 None
+
+
+def _days_between(dialect: str, start: ColumnElement, end: ColumnElement) -> ColumnElement:
+    if dialect == "sqlite":
+        return func.julianday(end) - func.julianday(start)
+    return extract("epoch", end - start) / 86400.0
+
+
+def stats_query(dialect: str, symbol: str | None = None) -> Select:
+    """종목별 통계 쿼리 (구체화 뷰 정의와 같은 결과)"""
+    ch = CycleHistory
+    by_symbol = {"partition_by": ch.symbol, "order_by": (ch.ended_at, ch.id)}
+    ranked = select(
+        ch.symbol,
+        ch.profit,
+        cast(ch.profit_rate, Float).label("profit_rate"),
+        ch.end_proceeds,
+        _days_between(dialect, ch.started_at, ch.ended_at).label("days"),
+        func.first_value(ch.start_investment).over(**by_symbol).label("first_investment"),
+        # 다음 사이클 시작 투자금 = 직전 종료 금액 → 시작 투자금의 누적 최댓값이 직전 고점
+        (
+            cast(ch.end_proceeds, Float)
+            / cast(func.max(ch.start_investment).over(**by_symbol, rows=(None, 0)), Float)
+            - 1
+        ).label("drawdown"),
+        func.row_number()
+        .over(partition_by=ch.symbol, order_by=(ch.ended_at.desc(), ch.id.desc()))
+        .label("recency"),
+    )
+    if symbol is not None:
+        ranked = ranked.where(ch.symbol == symbol)
+    ranked = ranked.cte("ranked")
+
+    last_proceeds = func.max(case((ranked.c.recency == 1, ranked.c.end_proceeds)))
+    return select(
+        ranked.c.symbol,
+        func.count().label("cycles"),
+        func.sum(case((ranked.c.profit > 0, 1), else_=0)).label("wins"),
+        func.avg(ranked.c.days).label("avg_cycle_days"),
+        func.avg(ranked.c.profit_rate).label("avg_profit_rate"),
+        func.sum(ranked.c.profit).label("total_profit"),
+        (
+            cast(last_proceeds, Float) / cast(func.max(ranked.c.first_investment), Float) - 1
+        ).label("cumulative_return"),
+        func.min(ranked.c.drawdown).label("max_drawdown"),
+    ).group_by(ranked.c.symbol)
+
+
+def breakdown_query(symbol: str | None = None) -> Select:
+    """사이클별 매수 체결 집계 쿼리 (체결 확인된 FILLED/PARTIAL 주문의 체결 수량/가격 기준)"""
+    price = func.coalesce(Order.filled_price, Order.price)
+    buys = (
+        select(
+            Order.symbol,
+            Order.cycle_number,
+            price.label("price"),
+            Order.filled_quantity.label("quantity"),
+            Order.created_at,
+            (
+                cast(price, Float)
+                / cast(
+                    func.max(price).over(
+                        partition_by=(Order.symbol, Order.cycle_number),
+                        order_by=(Order.created_at, Order.id),
+                        rows=(None, 0),
+                    ),
+                    Float,
+                )
+                - 1
+            ).label("drawdown"),
+        )
+        .where(
+            Order.order_type == OrderType.BUY,
+            Order.status.in_((OrderStatus.FILLED, OrderStatus.PARTIAL)),
+        )
+    )
+    if symbol is not None:
+        buys = buys.where(Order.symbol == symbol)
+    buys = buys.cte("buys")
+    return (
+        select(
+            buys.c.symbol,
+            buys.c.cycle_number,
+            func.count().label("buys"),
+            func.sum(buys.c.price * buys.c.quantity).label("invested"),
+            func.min(buys.c.created_at).label("first_buy_at"),
+            func.max(buys.c.created_at).label("last_buy_at"),
+            func.min(buys.c.drawdown).label("max_drawdown"),
+            func.max(CycleHistory.profit_rate).label("profit_rate"),
+        )
+        .outerjoin(
+            CycleHistory,
+            and_(
+                CycleHistory.symbol == buys.c.symbol,
+                CycleHistory.cycle_number == buys.c.cycle_number,
+            ),
+        )
+        .group_by(buys.c.symbol, buys.c.cycle_number)
+        .order_by(buys.c.symbol, buys.c.cycle_number)
+    )
+
+
+def _stats(row) -> CycleStats:
+    return CycleStats(
+        symbol=row.symbol,
+        cycles=row.cycles,
+        wins=row.wins,
+        avg_cycle_days=float(row.avg_cycle_days),
+        avg_profit_rate=float(row.avg_profit_rate),
+        total_profit=Decimal(str(row.total_profit)),
+        cumulative_return=float(row.cumulative_return),
+        max_drawdown=max(0.0, -float(row.max_drawdown)),
+    )
+
+
+class AnalyticsRepository:
+    """성과 통계 조회"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @property
+    def dialect(self) -> str:
+        return self.session.bind.dialect.name
+
+    async def _execute(self, op: str, statement):
+        """쿼리 실행 (지연시간 측정)"""
+        started = time.perf_counter()
+        try:
+            with tracer.span("db.query", repository="analytics", op=op):
+                return await self.session.execute(statement)
+        finally:
+            DB_QUERY_LATENCY.labels("analytics", op).observe(time.perf_counter() - started)
+
+    async def cycle_stats(
+        self, symbol: str | None = None, use_view: bool = False
+    ) -> list[CycleStats]:
+        """종목별 완료 사이클 통계 (use_view: 구체화 뷰에서 조회, Postgres 전용)"""
+        if use_view:
+            view = table(MATERIALIZED_VIEW, *(column(c) for c in _STATS_COLUMNS))
+            statement = select(view)
+            if symbol is not None:
+                statement = statement.where(view.c.symbol == symbol)
+        else:
+            statement = stats_query(self.dialect, symbol)
+        result = await self._execute("cycle_stats", statement.order_by(literal_column("symbol")))
+        return [_stats(row) for row in result]
+
+    async def cycle_breakdown(self, symbol: str | None = None) -> list[CycleBreakdown]:
+        """사이클별 매수 주문 집계 (진행 중인 사이클 포함)"""
+        result = await self._execute("cycle_breakdown", breakdown_query(symbol))
+        return [
+            CycleBreakdown(
+                symbol=row.symbol,
+                cycle_number=row.cycle_number,
+                buys=row.buys,
+                invested=Decimal(str(row.invested)),
+                first_buy_at=row.first_buy_at,
+                last_buy_at=row.last_buy_at,
+                max_drawdown=max(0.0, -float(row.max_drawdown)),
+                profit_rate=row.profit_rate,
+            )
+            for row in result
+        ]
+
+    async def refresh_view(self) -> None:
+        """구체화 뷰 갱신 (읽기를 막지 않도록 CONCURRENTLY, 뷰의 symbol 유일 인덱스 필요)"""
+        await self._execute(
+            "refresh_view", text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {MATERIALIZED_VIEW}")
+        )
+        await self.session.commit()
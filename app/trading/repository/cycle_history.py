@@ -0,0 +1,72 @@
+"""CycleHistory Repository - 사이클 히스토리 조회"""
+
+import time
+from datetime import datetime
+from typing import AsyncIterator
+
+from sqlalchemy import RowMapping, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.tracing import get_tracer
+from app.trading.models.cycle_history import CycleHistory
+from app.trading.repository.keyset import Cursor, Page, keyset, page_of, stream_batches
+from app.trading.repository.position import DB_QUERY_LATENCY
+
+tracer = get_tracer()
+
+
+class CycleHistoryRepository:
+    """CycleHistory 데이터 접근 레포지토리 (종료 시각 순)"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _execute(self, op: str, statement):
+        """쿼리 실행 (지연시간 측정)"""
+        started = time.perf_counter()
+        try:
+            with tracer.span("db.query", repository="cycle_history", op=op):
+                return await self.session.execute(statement)
+        finally:
+            DB_QUERY_LATENCY.labels("cycle_history", op).observe(time.perf_counter() - started)
+
+    @staticmethod
+    def _filter(
+        statement: Select,
+        symbol: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Select:
+        if symbol is not None:
+            statement = statement.where(CycleHistory.symbol == symbol)
+        if since is not None:
+            statement = statement.where(CycleHistory.ended_at >= since.replace(tzinfo=None))
+        if until is not None:
+            statement = statement.where(CycleHistory.ended_at < until.replace(tzinfo=None))
+        return statement
+
+    async def page(
+        self,
+        symbol: str | None = None,
+        after: Cursor | None = None,
+        limit: int = 100,
+    ) -> Page[CycleHistory]:
+        """사이클 히스토리 페이지 (종료 순, after 커서 다음부터)"""
+        statement = self._filter(select(CycleHistory), symbol)
+        statement = keyset(statement, CycleHistory.ended_at, CycleHistory.id, after)
+        result = await self._execute("page", statement.limit(limit + 1))
+        return page_of(list(result.scalars().all()), limit, "ended_at")
+
+    async def stream(
+        self,
+        symbol: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[RowMapping]]:
+        """사이클 히스토리 전체를 종료 순으로 batch_size 행씩"""
+        statement = self._filter(select(*CycleHistory.__table__.columns), symbol, since, until)
+        statement = keyset(statement, CycleHistory.ended_at, CycleHistory.id, None)
+        with tracer.span("db.stream", repository="cycle_history"):
+            async for rows in stream_batches(self.session, statement, batch_size):
+                yield rows
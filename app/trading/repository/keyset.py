@@ -0,0 +1,72 @@
+"""Keyset 페이지네이션 - (시각, uuid7 id) 기준 커서
+
+OFFSET은 건너뛴 행을 매번 다시 읽으므로 뒤 페이지일수록 느려진다.
+마지막으로 본 행의 (시각, id) 다음부터 읽으면 페이지 위치와 무관하게 인덱스 범위 조회 1회로 끝난다.
+시각이 같은 행은 uuid7 id로 순서를 정한다 (uuid7은 생성 순서대로 증가).
+내보내기처럼 전체를 훑을 때는 서버 측 커서로 배치 단위 스트리밍한다.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Generic, TypeVar
+from uuid import UUID
+
+from sqlalchemy import RowMapping, Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """페이지 경계 (마지막으로 본 행)"""
+
+    at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        return f"{self.at.isoformat()}_{self.id}"
+
+    @classmethod
+    def decode(cls, value: str) -> "Cursor":
+        at, _, id_ = value.rpartition("_")
+        return cls(datetime.fromisoformat(at), UUID(id_))
+
+
+@dataclass
+class Page(Generic[T]):
+    """페이지 (next_cursor가 None이면 마지막 페이지)"""
+
+    items: list[T]
+    next_cursor: Cursor | None
+
+
+def keyset(
+    statement: Select,
+    at: InstrumentedAttribute,
+    id_: InstrumentedAttribute,
+    after: Cursor | None,
+) -> Select:
+    """(at, id) 오름차순 + after 다음 행부터"""
+    if after is not None:
+        statement = statement.where(tuple_(at, id_) > tuple_(after.at, after.id))
+    return statement.order_by(at, id_)
+
+
+def page_of(items: list, limit: int, at_attr: str) -> Page:
+    """limit + 1개 조회 결과 → 페이지 (초과분이 있으면 다음 커서)"""
+    if len(items) <= limit:
+        return Page(items, None)
+    items = items[:limit]
+    last = items[-1]
+    return Page(items, Cursor(getattr(last, at_attr), last.id))
+
+
+async def stream_batches(
+    session: AsyncSession, statement: Select, batch_size: int
+) -> AsyncIterator[list[RowMapping]]:
+    """서버 측 커서로 batch_size 행씩 읽기 (결과 전체를 메모리에 올리지 않음)"""
+    result = await session.stream(statement.execution_options(yield_per=batch_size))
+    async for rows in result.mappings().partitions():
+        yield list(rows)
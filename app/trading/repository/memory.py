@@ -0,0 +1,175 @@
+"""인메모리 레포지토리 - 백테스트/시뮬레이션용 (DB, 커밋 없음)
+
+TradingService가 쓰는 세션(add/commit)과 PositionRepository 인터페이스를
+딕셔너리/리스트로 구현한다. 타임스탬프는 주입된 시계(시뮬레이션 시각)로 채운다.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Callable, Collection
+from uuid import UUID
+
+from uuid_utils.compat import uuid7
+
+from app.common.utils import get_kst_now
+from app.trading.models.cycle_history import CycleHistory
+from app.trading.models.order import Order, OrderStatus, OrderType
+from app.trading.models.position import Position
+
+Clock = Callable[[], datetime]
+
+
+class InMemorySession:
+    """AsyncSession 대용 - add된 객체를 보관만 한다"""
+
+    def __init__(self, clock: Clock = get_kst_now):
+        self.clock = clock
+        self.orders: list[Order] = []
+        self.cycles: list[CycleHistory] = []
+        self.commits = 0
+        self._added: set[int] = set()
+
+    def add(self, instance) -> None:
+        """객체 보관 (DB 기본값 대신 시뮬레이션 시각 기록, 이미 보관한 객체는 무시)"""
+        if id(instance) in self._added:
+            return
+        self._added.add(id(instance))
+        if isinstance(instance, Order):
+            if instance.created_at is None:
+                instance.created_at = self.clock()
+            self.orders.append(instance)
+        elif isinstance(instance, CycleHistory):
+            if instance.ended_at is None:
+                instance.ended_at = self.clock()
+            self.cycles.append(instance)
+
+    def add_all(self, instances) -> None:
+        for instance in instances:
+            self.add(instance)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def refresh(self, instance) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class InMemoryOrderRepository:
+    """OrderRepository 인메모리 구현 (InMemorySession에 add된 주문 조회)"""
+
+    def __init__(self, session: InMemorySession):
+        self.session = session
+
+    async def get_by_client_ids(self, client_ids: list[str]) -> dict[str, Order]:
+        """주문 의도 식별자로 기존 주문 조회"""
+        wanted = set(client_ids)
+        return {o.client_order_id: o for o in self.session.orders if o.client_order_id in wanted}
+
+    async def get_by_broker_ids(self, broker_ids: list[str]) -> dict[str, Order]:
+        """증권사 주문번호로 주문 조회"""
+        wanted = set(broker_ids)
+        return {o.kiwoom_order_id: o for o in self.session.orders if o.kiwoom_order_id in wanted}
+
+    async def broker_ids_since(self, since: datetime, marker: str | None = None) -> set[str]:
+        """since 이후 기록된 주문의 증권사 주문번호 (marker: 식별자에 이 표시가 있는 주문만)"""
+        return {
+            o.kiwoom_order_id
+            for o in self.session.orders
+            if o.kiwoom_order_id is not None
+            and o.created_at >= since
+            and (marker is None or marker in (o.client_order_id or ""))
+        }
+
+    async def open_orders(
+        self, symbol: str, order_type: OrderType, resting: Collection[str] = ()
+    ) -> list[Order]:
+        """체결 확인 대상 주문 (PENDING + 잔량이 미체결 목록에 있는 PARTIAL, 오래된 순)"""
+        return sorted(
+            (
+                o
+                for o in self.session.orders
+                if o.symbol == symbol
+                and o.order_type == order_type
+                and o.kiwoom_order_id is not None
+                and (
+                    o.status in (None, OrderStatus.PENDING)  # 상태 없음 = DB 기본값 PENDING
+                    or (o.status == OrderStatus.PARTIAL and o.kiwoom_order_id in resting)
+                )
+            ),
+            key=lambda o: o.created_at,
+        )
+
+    async def filled_amounts(self, symbol: str, cycle_number: int) -> dict[OrderType, Decimal]:
+        """사이클의 방향별 체결 금액 합계 (체결 수량 × 체결가)"""
+        amounts = {side: Decimal("0") for side in OrderType}
+        for o in self.session.orders:
+            if (
+                o.symbol == symbol
+                and o.cycle_number == cycle_number
+                and o.status in (OrderStatus.FILLED, OrderStatus.PARTIAL)
+            ):
+                amounts[OrderType(o.order_type)] += o.filled_quantity * Decimal(o.filled_price)
+        return amounts
+
+
+class InMemoryPositionRepository:
+    """PositionRepository 인메모리 구현"""
+
+    def __init__(self, clock: Clock = get_kst_now):
+        self.clock = clock
+        self._by_symbol: dict[str, Position] = {}
+
+    async def get_by_symbol(self, symbol: str) -> Position | None:
+        """종목코드로 포지션 조회"""
+        return self._by_symbol.get(symbol)
+
+    async def get_by_id(self, position_id: UUID) -> Position | None:
+        """ID로 포지션 조회"""
+        return next((p for p in self._by_symbol.values() if p.id == position_id), None)
+
+    async def get_all(self) -> list[Position]:
+        """전체 포지션 조회"""
+        return list(self._by_symbol.values())
+
+    async def create(self, position: Position) -> Position:
+        """포지션 생성"""
+        now = self.clock()
+        if position.id is None:
+            position.id = uuid7()
+        position.created_at = position.created_at or now
+        position.updated_at = now
+        self._by_symbol[position.symbol] = position
+        return position
+
+    async def update(self, position: Position) -> Position:
+        """포지션 업데이트 (객체가 곧 저장소)"""
+        position.updated_at = self.clock()
+        return position
+
+    async def create_or_get(
+        self,
+        symbol: str,
+        symbol_name: str,
+        initial_investment: Decimal,
+    ) -> Position:
+        """포지션이 없으면 생성, 있으면 조회"""
+        position = self._by_symbol.get(symbol)
+
+        if position is None:
+            position = await self.create(
+                Position(
+                    symbol=symbol,
+                    symbol_name=symbol_name,
+                    quantity=0,
+                    avg_price=None,
+                    splits_used=0,
+                    cycle_count=1,
+                    current_investment=initial_investment,
+                    initial_investment=initial_investment,
+                )
+            )
+
+        return position
@@ -0,0 +1,153 @@
+"""Order Repository - 주문 기록 조회"""
+
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import AsyncIterator, Collection
+
+from sqlalchemy import RowMapping, Select, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.tracing import get_tracer
+from app.trading.models.order import Order, OrderStatus, OrderType
+from app.trading.repository.keyset import Cursor, Page, keyset, page_of, stream_batches
+from app.trading.repository.position import DB_QUERY_LATENCY
+
+tracer = get_tracer()
+
+
+class OrderRepository:
+    """Order 데이터 접근 레포지토리 (저장/커밋은 TradingService가 세션으로 직접)"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _execute(self, op: str, statement):
+        """쿼리 실행 (지연시간 측정)"""
+        started = time.perf_counter()
+        try:
+            with tracer.span("db.query", repository="order", op=op):
+                return await self.session.execute(statement)
+        finally:
+            DB_QUERY_LATENCY.labels("order", op).observe(time.perf_counter() - started)
+
+    async def get_by_client_ids(self, client_ids: list[str]) -> dict[str, Order]:
+        """주문 의도 식별자로 기존 주문 조회"""
+        if not client_ids:
+            return {}
+        result = await self._execute(
+            "get_by_client_ids", select(Order).where(Order.client_order_id.in_(client_ids))
+        )
+        return {order.client_order_id: order for order in result.scalars().all()}
+
+    async def get_by_broker_ids(self, broker_ids: list[str]) -> dict[str, Order]:
+        """증권사 주문번호로 주문 조회"""
+        if not broker_ids:
+            return {}
+        result = await self._execute(
+            "get_by_broker_ids", select(Order).where(Order.kiwoom_order_id.in_(broker_ids))
+        )
+        return {order.kiwoom_order_id: order for order in result.scalars().all()}
+
+    async def broker_ids_since(self, since: datetime, marker: str | None = None) -> set[str]:
+        """since 이후 기록된 주문의 증권사 주문번호 (미체결 대조 시 이미 연결된 주문 제외용)
+
+        Args:
+            marker: 지정 시 주문 의도 식별자에 이 표시가 있는 주문만 (예: 트리거 주문)
+        """
+        since = since.replace(tzinfo=None)  # created_at은 timezone 없는 컬럼
+        statement = select(Order.kiwoom_order_id).where(
+            Order.created_at >= since, Order.kiwoom_order_id.is_not(None)
+        )
+        if marker is not None:
+            statement = statement.where(Order.client_order_id.contains(marker))
+        result = await self._execute("broker_ids_since", statement)
+        return set(result.scalars().all())
+
+    async def open_orders(
+        self, symbol: str, order_type: OrderType, resting: Collection[str] = ()
+    ) -> list[Order]:
+        """체결 확인 대상 주문 (오래된 순)
+
+        PENDING 주문과, 일부 체결 후 잔량이 아직 미체결 목록에 있는(resting) PARTIAL 주문.
+        """
+        is_open = Order.status == OrderStatus.PENDING
+        if resting:
+            is_open = or_(
+                is_open,
+                and_(Order.status == OrderStatus.PARTIAL, Order.kiwoom_order_id.in_(resting)),
+            )
+        result = await self._execute(
+            "open_orders",
+            select(Order)
+            .where(
+                Order.symbol == symbol,
+                Order.order_type == order_type,
+                Order.kiwoom_order_id.is_not(None),
+                is_open,
+            )
+            .order_by(Order.created_at, Order.id),
+        )
+        return list(result.scalars().all())
+
+    async def filled_amounts(self, symbol: str, cycle_number: int) -> dict[OrderType, Decimal]:
+        """사이클의 방향별 체결 금액 합계 (체결 수량 × 체결가)"""
+        result = await self._execute(
+            "filled_amounts",
+            select(Order.order_type, func.sum(Order.filled_quantity * Order.filled_price))
+            .where(
+                Order.symbol == symbol,
+                Order.cycle_number == cycle_number,
+                Order.status.in_((OrderStatus.FILLED, OrderStatus.PARTIAL)),
+            )
+            .group_by(Order.order_type),
+        )
+        amounts = {side: Decimal("0") for side in OrderType}
+        for side, amount in result.all():
+            amounts[OrderType(side)] = Decimal(amount or 0)
+        return amounts
+
+    @staticmethod
+    def _filter(
+        statement: Select,
+        symbol: str | None = None,
+        cycle_number: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Select:
+        if symbol is not None:
+            statement = statement.where(Order.symbol == symbol)
+        if cycle_number is not None:
+            statement = statement.where(Order.cycle_number == cycle_number)
+        if since is not None:
+            statement = statement.where(Order.created_at >= since.replace(tzinfo=None))
+        if until is not None:
+            statement = statement.where(Order.created_at < until.replace(tzinfo=None))
+        return statement
+
+    async def page(
+        self,
+        symbol: str | None = None,
+        cycle_number: int | None = None,
+        after: Cursor | None = None,
+        limit: int = 100,
+    ) -> Page[Order]:
+        """주문 기록 페이지 (생성 순, after 커서 다음부터)"""
+        statement = self._filter(select(Order), symbol, cycle_number)
+        statement = keyset(statement, Order.created_at, Order.id, after).limit(limit + 1)
+        result = await self._execute("page", statement)
+        return page_of(list(result.scalars().all()), limit, "created_at")
+
+    async def stream(
+        self,
+        symbol: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[RowMapping]]:
+        """주문 기록 전체를 생성 순으로 batch_size 행씩 (ORM 객체 대신 컬럼 값)"""
+        statement = self._filter(select(*Order.__table__.columns), symbol, None, since, until)
+        statement = keyset(statement, Order.created_at, Order.id, None)
+        with tracer.span("db.stream", repository="order"):
+            async for rows in stream_batches(self.session, statement, batch_size):
+                yield rows
@@ -0,0 +1,159 @@
+"""월별 파티션 관리 - orders / daily_snapshots (Postgres 전용)
+
+두 테이블은 Alembic 마이그레이션(a4c7e93d2b15)이 월 단위 RANGE 파티션 테이블로 바꾼다.
+- 파티션 이름: <테이블>_yYYYYmMM (예: orders_y2026m10), 범위 [해당 월 1일, 다음 달 1일)
+- 파티션 테이블의 유일 제약은 파티션 키를 포함해야 한다. 그래서 기본키는 (id, 파티션 키)이고,
+  orders.client_order_id 유일 인덱스는 파티션마다 만든다. 주문 의도 식별자에는 거래일이 들어 있고
+  같은 식별자의 행은 그 거래일에 만들어지므로 같은 파티션에 들어간다.
+- DEFAULT 파티션은 두지 않는다. 앞으로 쓸 달의 파티션을 미리 만들어 둔다 (maintain, 매일 실행).
+- 보존 기간이 지난 파티션은 분리(DETACH, 별도 테이블로 보관) 또는 삭제한다.
+
+다른 DB(SQLite 등)에서는 파티션을 쓰지 않으므로 모든 작업이 아무것도 하지 않는다.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Iterable
+
+from sqlalchemy import Column, Table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.utils import get_kst_now
+
+logger = logging.getLogger(__name__)
+
+# 테이블 → 파티션 키 컬럼
+PARTITIONED: dict[str, str] = {"orders": "created_at", "daily_snapshots": "trading_date"}
+
+# 파티션마다 만드는 유일 인덱스 (부모 테이블에 둘 수 없는 제약)
+PARTITION_UNIQUE: dict[str, tuple[str, ...]] = {"orders": ("client_order_id",)}
+
+_NAME = re.compile(r"_y(\d{4})m(\d{2})$")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(name: str) -> date | None:
+    """파티션 이름 → 해당 월 1일 (형식이 다르면 None)"""
+    match = _NAME.search(name)
+    return date(int(match[1]), int(match[2]), 1) if match else None
+
+
+def conflict_columns(table: Table, dialect: str) -> list[Column]:
+    """id 기준 upsert의 ON CONFLICT 대상 (Postgres 파티션 테이블은 기본키가 (id, 파티션 키))"""
+    if dialect == "postgresql" and table.name in PARTITIONED:
+        return [table.c.id, table.c[PARTITIONED[table.name]]]
+    return [table.c.id]
+
+
+def create_statements(table: str, month: date) -> list[str]:
+    """월 파티션 생성 SQL (이미 있으면 무시)"""
+    name = partition_name(table, month)
+    statements = [
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    ]
+    for column in PARTITION_UNIQUE.get(table, ()):
+        statements.append(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {name}_{column} ON {name} ({column})"
+        )
+    return statements
+
+
+def expired_partitions(names: Iterable[str], this_month: date, retention_months: int) -> list[str]:
+    """보존 기간(이번 달 포함 retention_months개월)이 지난 파티션 (0이면 없음)"""
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(this_month, -(retention_months - 1))
+    return sorted(
+        name for name in names if (month := partition_month(name)) is not None and month < cutoff
+    )
+
+
+@dataclass
+class PartitionReport:
+    """파티션 관리 결과"""
+
+    created: list[str] = field(default_factory=list)
+    detached: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+
+
+class PartitionManager:
+    """월별 파티션 생성/보존 기간 정리"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @property
+    def enabled(self) -> bool:
+        return self.session.bind.dialect.name == "postgresql"
+
+    async def partitions(self, table: str) -> list[str]:
+        """테이블에 붙어 있는 파티션 이름"""
+        result = await self.session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = :table ORDER BY c.relname"
+            ),
+            {"table": table},
+        )
+        return list(result.scalars().all())
+
+    async def maintain(
+        self,
+        months_ahead: int = 3,
+        retention_months: int = 0,
+        archive: bool = True,
+        today: date | None = None,
+    ) -> PartitionReport:
+        """이번 달부터 months_ahead개월 뒤까지 파티션을 만들고 보존 기간이 지난 파티션 정리
+
+        Args:
+            retention_months: 이번 달 포함 보존 개월 수 (0이면 정리하지 않음)
+            archive: True면 DETACH(별도 테이블로 보관), False면 DROP
+        """
+        report = PartitionReport()
+        if not self.enabled:
+            return report
+
+        this_month = month_start(today or get_kst_now().date())
+        for table in PARTITIONED:
+            existing = set(await self.partitions(table))
+            for offset in range(months_ahead + 1):
+                month = add_months(this_month, offset)
+                if partition_name(table, month) in existing:
+                    continue
+                for statement in create_statements(table, month):
+                    await self.session.execute(text(statement))
+                report.created.append(partition_name(table, month))
+
+            for name in expired_partitions(existing, this_month, retention_months):
+                if archive:
+                    await self.session.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+                    report.detached.append(name)
+                else:
+                    await self.session.execute(text(f"DROP TABLE {name}"))
+                    report.dropped.append(name)
+
+        await self.session.commit()
+        if report.created or report.detached or report.dropped:
+            logger.info(
+                f"파티션 관리: 생성 {report.created}, 분리 {report.detached}, 삭제 {report.dropped}"
+            )
+        return report
@@ -1,13 +1,25 @@
 """Position Repository - 포지션 데이터 접근 계층"""
 
+import time
 from decimal import Decimal
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.metrics import REGISTRY
+from app.common.tracing import get_tracer
 from app.trading.models.position import Position
 
+tracer = get_tracer()
+
+DB_QUERY_LATENCY = REGISTRY.histogram(
+    "db_query_seconds", "레포지토리 쿼리 지연시간", ("repository", "op")
+)
+DB_COMMIT_LATENCY = REGISTRY.histogram(
+    "db_commit_seconds", "레포지토리 커밋 지연시간", ("repository",)
+)
+
 
 class PositionRepository:
     """Position 데이터 접근 레포지토리"""
@@ -15,36 +27,63 @@ class PositionRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    async def _execute(self, op: str, statement):
+        """쿼리 실행 (지연시간 측정)"""
+        started = time.perf_counter()
+        try:
+            with tracer.span("db.query", repository="position", op=op):
+                return await self.session.execute(statement)
+        finally:
+            DB_QUERY_LATENCY.labels("position", op).observe(time.perf_counter() - started)
+
+    async def _commit(self) -> None:
+        """커밋 (지연시간 측정)"""
+        started = time.perf_counter()
+        try:
+            with tracer.span("db.commit", repository="position"):
+                await self.session.commit()
+        finally:
+            DB_COMMIT_LATENCY.labels("position").observe(time.perf_counter() - started)
+
+    async def _refresh(self, position: Position) -> None:
+        """리프레시 (지연시간 측정)"""
+        started = time.perf_counter()
+        try:
+            with tracer.span("db.query", repository="position", op="refresh"):
+                await self.session.refresh(position)
+        finally:
+            DB_QUERY_LATENCY.labels("position", "refresh").observe(time.perf_counter() - started)
+
     async def get_by_symbol(self, symbol: str) -> Position | None:
         """종목코드로 포지션 조회"""
-        result = await self.session.execute(
-            select(Position).where(Position.symbol == symbol)
+        result = await self._execute(
+            "get_by_symbol", select(Position).where(Position.symbol == symbol)
         )
         return result.scalar_one_or_none()
 
     async def get_by_id(self, position_id: UUID) -> Position | None:
         """ID로 포지션 조회"""
-        result = await self.session.execute(
-            select(Position).where(Position.id == position_id)
+        result = await self._execute(
+            "get_by_id", select(Position).where(Position.id == position_id)
         )
         return result.scalar_one_or_none()
 
     async def get_all(self) -> list[Position]:
         """전체 포지션 조회"""
-        result = await self.session.execute(select(Position))
+        result = await self._execute("get_all", select(Position))
         return list(result.scalars().all())
 
     async def create(self, position: Position) -> Position:
         """포지션 생성"""
         self.session.add(position)
-        await self.session.commit()
-        await self.session.refresh(position)
+        await self._commit()
+        await self._refresh(position)
         return position
 
     async def update(self, position: Position) -> Position:
         """포지션 업데이트"""
-        await self.session.commit()
-        await self.session.refresh(position)
+        await self._commit()
+        await self._refresh(position)
         return position
 
     async def create_or_get(
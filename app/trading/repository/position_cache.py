@@ -0,0 +1,267 @@
+"""포지션 캐시 - 프로세스 전역, DB가 기준 (write-through)
+
+작업마다 포지션을 DB에서 다시 읽지 않도록 종목별 포지션을 메모리에 둔다.
+- 시작 시 전체 포지션을 읽어 둔다 (load). 이후 조회는 쿼리 없이 캐시에서 꺼낸다.
+- 캐시에는 세션에 붙지 않은(detached) 사본을 두고, 조회할 때 작업 세션에 merge(load=False)로
+  붙여 준다. 작업끼리 같은 객체를 공유하지 않는다.
+- 갱신은 DB에 먼저 커밋하고(write-through) 성공하면 캐시를 바꾼다. UPDATE는 version이 캐시와
+  같을 때만 반영되므로, 다른 곳에서 DB를 바꿨다면 PositionConflictError가 나고 해당 종목 캐시를
+  비운다 (다음 조회는 DB에서 다시 읽음).
+- DB를 직접 고쳤다면 invalidate()로 비우고, check()로 캐시/DB/키움 보유 수량을 대조한다.
+
+전체를 읽어 둔 뒤에는 캐시에 없는 종목은 포지션이 없는 것으로 본다 (포지션 생성도 캐시를 거침).
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable
+from uuid import UUID
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.common.metrics import REGISTRY
+from app.trading.external_api.base import StockAPIBase
+from app.trading.models.position import Position
+from app.trading.repository.position import PositionRepository
+
+logger = logging.getLogger(__name__)
+
+CACHE_LOOKUPS = REGISTRY.counter(
+    "position_cache_lookups_total", "포지션 캐시 조회 수", ("result",)
+)
+CACHE_CONFLICTS = REGISTRY.counter(
+    "position_cache_conflicts_total", "포지션 갱신 version 충돌 수"
+)
+
+
+class PositionConflictError(Exception):
+    """포지션이 캐시에 읽어 둔 뒤 다른 곳에서 바뀜 (version 불일치)"""
+
+
+def _detached_copy(position: Position) -> Position:
+    """세션과 무관한 사본 (속성 변경 이력 없음, merge(load=False) 가능)"""
+    values = {attr.key: getattr(position, attr.key) for attr in inspect(Position).column_attrs}
+    copy = Position(**values)
+    make_transient_to_detached(copy)
+    return copy
+
+
+@dataclass(frozen=True)
+class PositionMismatch:
+    """캐시와 다른 값"""
+
+    symbol: str
+    source: str  # "db" | "kiwoom"
+    field: str
+    cached: Any
+    actual: Any
+
+
+@dataclass
+class ConsistencyReport:
+    """캐시 대조 결과"""
+
+    mismatches: list[PositionMismatch] = field(default_factory=list)
+    repaired: list[str] = field(default_factory=list)  # DB 값으로 다시 채운 종목
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+
+class PositionCache:
+    """종목별 포지션 캐시"""
+
+    # DB와 대조하는 컬럼 (타임스탬프 제외)
+    COMPARED = (
+        "id",
+        "symbol_name",
+        "quantity",
+        "avg_price",
+        "splits_used",
+        "cycle_count",
+        "current_investment",
+        "initial_investment",
+        "version",
+    )
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]):
+        self.session_factory = session_factory
+        self._positions: dict[str, Position] = {}
+        self.complete = False  # 전체를 읽어 둔 상태 (없는 종목 = 포지션 없음)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._positions
+
+    async def load(self) -> int:
+        """DB의 전체 포지션을 캐시에 채움"""
+        async with self.session_factory() as session:
+            positions = await PositionRepository(session).get_all()
+        self._positions = {p.symbol: _detached_copy(p) for p in positions}
+        self.complete = True
+        logger.info(f"포지션 캐시 적재: {len(positions)}개")
+        return len(positions)
+
+    def get(self, symbol: str) -> Position | None:
+        """캐시된 사본 (세션에 붙이지 않음, 수정 금지)"""
+        return self._positions.get(symbol)
+
+    def values(self) -> list[Position]:
+        return list(self._positions.values())
+
+    def put(self, position: Position) -> None:
+        """커밋된 포지션을 캐시에 반영"""
+        self._positions[position.symbol] = _detached_copy(position)
+
+    def invalidate(self, symbol: str | None = None) -> None:
+        """캐시 비우기 - 종목 1개 또는 전체 (다음 조회는 DB에서 읽음)"""
+        if symbol is None:
+            self._positions.clear()
+        else:
+            self._positions.pop(symbol, None)
+        self.complete = False
+
+    async def check(
+        self,
+        api: StockAPIBase | None = None,
+        repair: bool = False,
+    ) -> ConsistencyReport:
+        """캐시를 DB(전 컬럼)와 키움 보유 수량에 대조
+
+        키움 수량 차이는 체결 확인 전(주문 체결 후 15:40 전)에는 정상일 수 있어 보고만 한다.
+
+        Args:
+            api: 지정 시 보유 종목 수량도 대조
+            repair: DB와 다른 종목을 DB 값으로 다시 채움
+        """
+        report = ConsistencyReport()
+        async with self.session_factory() as session:
+            stored = {p.symbol: p for p in await PositionRepository(session).get_all()}
+
+        for symbol in sorted(set(stored) | set(self._positions)):
+            cached, actual = self._positions.get(symbol), stored.get(symbol)
+            if cached is None or actual is None:
+                if cached is None and not self.complete:
+                    continue  # 아직 읽지 않은 종목
+                report.mismatches.append(
+                    PositionMismatch(symbol, "db", "exists", cached is not None, actual is not None)
+                )
+            else:
+                for name in self.COMPARED:
+                    value, stored_value = getattr(cached, name), getattr(actual, name)
+                    if value != stored_value:
+                        report.mismatches.append(
+                            PositionMismatch(symbol, "db", name, value, stored_value)
+                        )
+            if repair and any(m.symbol == symbol for m in report.mismatches):
+                if actual is None:
+                    self._positions.pop(symbol, None)
+                else:
+                    self._positions[symbol] = _detached_copy(actual)
+                report.repaired.append(symbol)
+
+        if api is not None:
+            holdings = {h.symbol: h.quantity for h in await api.get_holdings()}
+            for symbol, cached in sorted(self._positions.items()):
+                held = holdings.get(symbol, 0)
+                if cached.quantity != held:
+                    report.mismatches.append(
+                        PositionMismatch(symbol, "kiwoom", "quantity", cached.quantity, held)
+                    )
+
+        if report.ok:
+            logger.info(f"포지션 캐시 대조 이상 없음: {len(self._positions)}개")
+        else:
+            logger.warning(f"포지션 캐시 불일치: {report.mismatches}")
+        return report
+
+
+class CachedPositionRepository(PositionRepository):
+    """PositionRepository + 포지션 캐시 (조회는 캐시, 갱신은 DB 커밋 후 캐시)"""
+
+    def __init__(self, session: AsyncSession, cache: PositionCache):
+        super().__init__(session)
+        self.cache = cache
+
+    async def _attach(self, cached: Position) -> Position:
+        """캐시 사본을 작업 세션에 붙임 (쿼리 없음)
+
+        이미 세션에 있는 포지션은 그대로 돌려준다 (작업 중 바꾼 값을 캐시 값으로 덮지 않음).
+        """
+        existing = self.session.identity_map.get(inspect(cached).key)
+        if existing is not None:
+            return existing
+        return await self.session.merge(cached, load=False)
+
+    async def get_by_symbol(self, symbol: str) -> Position | None:
+        cached = self.cache.get(symbol)
+        if cached is not None:
+            CACHE_LOOKUPS.labels("hit").inc()
+            return await self._attach(cached)
+        if self.cache.complete:
+            CACHE_LOOKUPS.labels("absent").inc()
+            return None
+
+        CACHE_LOOKUPS.labels("miss").inc()
+        position = await super().get_by_symbol(symbol)
+        if position is not None:
+            self.cache.put(position)
+        return position
+
+    async def get_by_id(self, position_id: UUID) -> Position | None:
+        for cached in self.cache.values():
+            if cached.id == position_id:
+                CACHE_LOOKUPS.labels("hit").inc()
+                return await self._attach(cached)
+        CACHE_LOOKUPS.labels("miss").inc()
+        return await super().get_by_id(position_id)
+
+    async def get_all(self) -> list[Position]:
+        if self.cache.complete:
+            CACHE_LOOKUPS.labels("hit").inc()
+            return [await self._attach(cached) for cached in self.cache.values()]
+
+        CACHE_LOOKUPS.labels("miss").inc()
+        positions = await super().get_all()
+        for position in positions:
+            self.cache.put(position)
+        return positions
+
+    async def create(self, position: Position) -> Position:
+        position = await super().create(position)
+        self.cache.put(position)
+        return position
+
+    async def update(self, position: Position) -> Position:
+        """DB 커밋 후 캐시 반영 (version이 다르면 롤백하고 캐시를 비움)"""
+        symbol = position.symbol  # 롤백하면 속성이 만료됨
+        try:
+            await self._commit()
+        except StaleDataError as e:
+            await self.session.rollback()
+            self.cache.invalidate(symbol)
+            CACHE_CONFLICTS.inc()
+            raise PositionConflictError(
+                f"{symbol} 포지션이 다른 곳에서 변경됨 - 캐시를 비우고 다시 읽어야 합니다"
+            ) from e
+        self.cache.put(position)
+        return position
+
+
+_cache: PositionCache | None = None
+
+
+def get_position_cache() -> PositionCache:
+    """프로세스 전역 포지션 캐시"""
+    global _cache
+    if _cache is None:
+        from app.common.database import async_session
+
+        _cache = PositionCache(async_session)
+    return _cache
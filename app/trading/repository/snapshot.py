@@ -0,0 +1,91 @@
+"""Snapshot Repository - 일별 장 마감 평가 기록"""
+
+import time
+from datetime import date
+
+from sqlalchemy import Row, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.tracing import get_tracer
+from app.trading.models.daily_snapshot import DailySnapshot
+from app.trading.repository.position import DB_COMMIT_LATENCY, DB_QUERY_LATENCY
+
+tracer = get_tracer()
+
+# 시계열 조회 컬럼 (app.trading.services.equity가 배열로 변환)
+SERIES_COLUMNS = (
+    DailySnapshot.trading_date,
+    DailySnapshot.symbol,
+    DailySnapshot.close,
+    DailySnapshot.quantity,
+    DailySnapshot.avg_price,
+    DailySnapshot.investment,
+    DailySnapshot.unrealized_pnl,
+)
+
+
+class SnapshotRepository:
+    """DailySnapshot 데이터 접근 레포지토리"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _execute(self, op: str, statement):
+        """쿼리 실행 (지연시간 측정)"""
+        started = time.perf_counter()
+        try:
+            with tracer.span("db.query", repository="snapshot", op=op):
+                return await self.session.execute(statement)
+        finally:
+            DB_QUERY_LATENCY.labels("snapshot", op).observe(time.perf_counter() - started)
+
+    async def save_many(self, snapshots: list[DailySnapshot]) -> None:
+        """일괄 저장 (INSERT 1회, 같은 종목·거래일이 있으면 덮어씀)"""
+        if not snapshots:
+            return
+        table = DailySnapshot.__table__
+        keys = [c.key for c in table.columns if c.key not in ("id", "created_at")]
+        rows = [{key: getattr(s, key) for key in keys} for s in snapshots]
+
+        dialect = self.session.bind.dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as upsert
+        else:
+            upsert = None
+
+        if upsert is None:
+            statement = insert(table).values(rows)
+        else:
+            statement = upsert(table).values(rows)
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.symbol, table.c.trading_date],
+                set_={key: statement.excluded[key] for key in keys},
+            )
+        await self._execute("save_many", statement)
+
+        started = time.perf_counter()
+        try:
+            with tracer.span("db.commit", repository="snapshot"):
+                await self.session.commit()
+        finally:
+            DB_COMMIT_LATENCY.labels("snapshot").observe(time.perf_counter() - started)
+
+    async def series(
+        self,
+        symbol: str | None = None,
+        since: date | None = None,
+        until: date | None = None,
+    ) -> list[Row]:
+        """거래일 순 시계열 행 (SERIES_COLUMNS, symbol 없으면 전 종목)"""
+        statement = select(*SERIES_COLUMNS)
+        if symbol is not None:
+            statement = statement.where(DailySnapshot.symbol == symbol)
+        if since is not None:
+            statement = statement.where(DailySnapshot.trading_date >= since)
+        if until is not None:
+            statement = statement.where(DailySnapshot.trading_date <= until)
+        statement = statement.order_by(DailySnapshot.trading_date, DailySnapshot.symbol)
+        result = await self._execute("series", statement)
+        return list(result.all())
@@ -0,0 +1,266 @@
+"""쓰기 지연(write-behind) 저장 - 주문/사이클 기록을 로컬 저널에 먼저 남기고 DB에는 배치로 반영
+
+주문 경로에서는 행 스냅샷을 append-only 저널(JSON Lines)에 쓰고 fsync만 한 뒤 바로 돌아간다.
+백그라운드 작업이 버퍼를 모아 한 트랜잭션으로 upsert(id 기준)하고, 버퍼가 비면 저널을 비운다.
+- 같은 행을 여러 번 기록하면 (제출 전 → 주문번호 확정) 마지막 스냅샷이 반영된다.
+- 시작 시 저널에 남은 기록을 다시 반영한다 (upsert라 이미 반영된 기록이 있어도 안전).
+- 종료 시 남은 버퍼를 모두 반영한다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid_utils.compat import uuid7
+
+from app.common.database import Base
+from app.common.metrics import REGISTRY
+from app.trading.models.cycle_history import CycleHistory
+from app.trading.models.order import Order
+from app.trading.repository.partitions import conflict_columns
+
+logger = logging.getLogger(__name__)
+
+WB_PENDING = REGISTRY.gauge("write_behind_pending", "DB 반영 대기 중인 기록 수")
+WB_FLUSH = REGISTRY.histogram(
+    "write_behind_flush_seconds", "쓰기 지연 배치 반영 소요시간",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+WB_FLUSH_ERRORS = REGISTRY.counter("write_behind_flush_errors_total", "배치 반영 실패 수")
+
+MODELS: dict[str, type[Base]] = {"order": Order, "cycle": CycleHistory}
+_KINDS = {model: kind for kind, model in MODELS.items()}
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _from_json(python_type: type, value: Any) -> Any:
+    if value is None:
+        return None
+    if python_type is UUID:
+        return UUID(value)
+    if python_type is Decimal:
+        return Decimal(value)
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return value
+
+
+def _fill_defaults(instance: Base) -> None:
+    """DB 기본값을 기록 시점에 채움 (id, 생성 시각 등 - 반영 시각과 무관하게 고정)"""
+    if instance.id is None:
+        instance.id = uuid7()
+    for column in instance.__table__.columns:
+        if column.default is None or getattr(instance, column.key) is not None:
+            continue
+        if column.default.is_scalar:
+            setattr(instance, column.key, column.default.arg)
+        elif column.default.is_callable:  # kst_now_naive - 직접 저장과 같은 시계
+            setattr(instance, column.key, column.default.arg(None))
+
+
+def encode(instance: Base) -> dict:
+    """모델 → 저널 기록"""
+    return {
+        "kind": _KINDS[type(instance)],
+        "row": {c.key: _to_json(getattr(instance, c.key)) for c in instance.__table__.columns},
+    }
+
+
+def decode(entry: dict) -> tuple[type[Base], dict]:
+    """저널 기록 → (모델, 컬럼 값)"""
+    model = MODELS[entry["kind"]]
+    columns = model.__table__.columns
+    return model, {
+        key: _from_json(columns[key].type.python_type, value)
+        for key, value in entry["row"].items()
+    }
+
+
+async def upsert(session: AsyncSession, entries: list[dict]) -> None:
+    """기록 일괄 반영 (모델별 id 기준 upsert, 같은 id는 마지막 기록만)"""
+    latest: dict[type[Base], dict[Any, dict]] = {}
+    for entry in entries:
+        model, row = decode(entry)
+        latest.setdefault(model, {})[row["id"]] = row
+
+    dialect = session.bind.dialect.name
+    for model, rows in latest.items():
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            for row in rows.values():
+                await session.merge(model(**row))
+            continue
+
+        table = model.__table__
+        statement = insert(table).values(list(rows.values()))
+        statement = statement.on_conflict_do_update(
+            index_elements=conflict_columns(table, dialect),
+            set_={c.name: statement.excluded[c.name] for c in table.columns if c.name != "id"},
+        )
+        await session.execute(statement)
+    await session.commit()
+
+
+class WriteBehindWriter:
+    """저널 + 백그라운드 배치 반영"""
+
+    def __init__(
+        self,
+        journal_path: str | Path,
+        session_factory: Callable[[], AsyncSession],
+        flush_interval: float = 1.0,
+        batch_size: int = 500,
+    ):
+        self.journal_path = Path(journal_path)
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        self._buffer: list[dict] = []
+        self._journal_lock = asyncio.Lock()  # 저널 쓰기/비우기 + 버퍼 추가 순서 보장
+        self._drain_lock = asyncio.Lock()  # 백그라운드/명시적 flush 중복 반영 방지
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    async def record(self, *instances: Base) -> None:
+        """행 스냅샷을 저널에 기록 (fsync 후 반환, DB 반영은 백그라운드)"""
+        entries = []
+        for instance in instances:
+            _fill_defaults(instance)
+            entries.append(encode(instance))
+
+        async with self._journal_lock:
+            await asyncio.to_thread(self._append, entries)
+            self._buffer.extend(entries)
+        WB_PENDING.set(len(self._buffer))
+        self._wake.set()
+
+    def _append(self, entries: list[dict]) -> None:
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.journal_path.open("a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read_journal(self) -> list[dict]:
+        if not self.journal_path.exists():
+            return []
+        entries = []
+        with self.journal_path.open(encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # 기록 도중 종료된 마지막 줄
+                    logger.warning(f"저널 {number}행 손상 (무시됨)")
+        return entries
+
+    async def start(self) -> int:
+        """저널에 남은 기록 재반영 후 백그라운드 작업 시작 → 재반영한 기록 수"""
+        async with self._journal_lock:
+            replay = await asyncio.to_thread(self._read_journal)
+            self._buffer[:0] = replay
+        if replay:
+            logger.info(f"쓰기 지연 저널 재반영: {len(replay)}건")
+            try:
+                await self.flush()
+            except Exception as e:
+                # DB가 아직 준비되지 않았으면 백그라운드 작업이 재시도
+                WB_FLUSH_ERRORS.inc()
+                logger.warning(f"저널 재반영 실패 (재시도 예정): {e}")
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+        return len(replay)
+
+    async def stop(self) -> None:
+        """백그라운드 작업 종료 (남은 기록 반영)
+
+        반영 도중 취소하면 DB 연결 정리가 끝나지 않을 수 있어, 종료 표시 후 루프가 스스로
+        끝나기를 기다린다.
+        """
+        if self._task is not None:
+            self._stopping = True
+            self._wake.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """지금까지 기록한 내용을 DB에 반영 (실패 시 예외, 저널은 유지)"""
+        async with self._drain_lock:
+            while self._buffer:
+                batch = self._buffer[: self.batch_size]
+                started = time.perf_counter()
+                async with self.session_factory() as session:
+                    await upsert(session, batch)
+                WB_FLUSH.observe(time.perf_counter() - started)
+                del self._buffer[: len(batch)]
+                WB_PENDING.set(len(self._buffer))
+
+            async with self._journal_lock:
+                if not self._buffer:
+                    await asyncio.to_thread(self._truncate)
+
+    def _truncate(self) -> None:
+        if self.journal_path.exists() and self.journal_path.stat().st_size:
+            self.journal_path.write_bytes(b"")
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if self._stopping or not self._buffer:
+                continue
+            try:
+                await self.flush()
+            except Exception as e:
+                WB_FLUSH_ERRORS.inc()
+                logger.warning(f"쓰기 지연 반영 실패 ({len(self._buffer)}건 대기, 재시도): {e}")
+
+
+_writer: WriteBehindWriter | None = None
+
+
+def get_write_behind() -> WriteBehindWriter:
+    """프로세스 전역 쓰기 지연 저장기 (설정 기반)"""
+    global _writer
+    if _writer is None:
+        from app.common.config import settings
+        from app.common.database import async_session
+
+        _writer = WriteBehindWriter(
+            settings.write_behind_journal,
+            async_session,
+            flush_interval=settings.write_behind_flush_seconds,
+        )
+    return _writer
@@ -0,0 +1,81 @@
+"""계좌 스냅샷 - 작업 1회 동안 잔고/보유/미체결을 한 번만 조회
+
+잔고·보유 종목·미체결 주문은 계좌 단위 조회라 종목 수와 무관하게 같은 결과가 온다.
+작업 시작 시 세 조회를 동시에 한 번 실행하고, 이후 종목별 로직은 메모리에서 읽는다.
+주문을 내면 계좌 상태가 바뀌므로 invalidate()로 표시해 두고, 다음 ensure() 때 다시 받아 온다.
+무효화된 스냅샷을 읽으면 RuntimeError - 읽는 쪽은 ensure()로 받은 스냅샷을 쓴다.
+"""
+
+import asyncio
+import logging
+import time
+
+from app.common.metrics import REGISTRY
+from app.trading.external_api.base import BalanceInfo, HoldingInfo, OrderResult, StockAPIBase
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_LOADS = REGISTRY.counter("account_snapshot_loads_total", "계좌 스냅샷 조회 수")
+
+
+class AccountSnapshot:
+    """작업 범위 계좌 스냅샷"""
+
+    def __init__(self, api: StockAPIBase):
+        self.api = api
+        self._balance: BalanceInfo | None = None
+        self._holdings: dict[str, HoldingInfo] = {}
+        self._pending: list[OrderResult] = []
+        self.loaded_at: float | None = None  # time.monotonic(), None이면 다시 조회 필요
+
+    @property
+    def is_stale(self) -> bool:
+        return self.loaded_at is None
+
+    async def refresh(self) -> "AccountSnapshot":
+        """잔고/보유/미체결 동시 조회"""
+        balance, holdings, pending = await asyncio.gather(
+            self.api.get_balance(),
+            self.api.get_holdings(),
+            self.api.get_pending_orders(),
+        )
+        self._balance = balance
+        self._holdings = {h.symbol: h for h in holdings}
+        self._pending = pending
+        self.loaded_at = time.monotonic()
+        SNAPSHOT_LOADS.inc()
+        return self
+
+    async def ensure(self) -> "AccountSnapshot":
+        """조회한 적 없거나 무효화됐으면 다시 조회"""
+        if self.is_stale:
+            await self.refresh()
+        return self
+
+    def invalidate(self) -> None:
+        """주문 후 호출 - 다음 ensure()에서 다시 조회"""
+        self.loaded_at = None
+
+    def _check_fresh(self) -> None:
+        if self.is_stale:
+            raise RuntimeError("계좌 스냅샷이 없거나 무효화됨 - ensure()로 다시 조회해야 합니다")
+
+    @property
+    def balance(self) -> BalanceInfo:
+        self._check_fresh()
+        return self._balance
+
+    @property
+    def holdings(self) -> dict[str, HoldingInfo]:
+        self._check_fresh()
+        return self._holdings
+
+    def holding(self, symbol: str) -> HoldingInfo | None:
+        self._check_fresh()
+        return self._holdings.get(symbol)
+
+    def pending_orders(self, symbol: str | None = None) -> list[OrderResult]:
+        self._check_fresh()
+        if symbol is None:
+            return list(self._pending)
+        return [o for o in self._pending if o.symbol == symbol]
@@ -0,0 +1,87 @@
+"""일별 평가 시계열 - 장 마감 스냅샷(daily_snapshots) → 손익/낙폭 NumPy 배열
+
+차트와 위험 점검용이다. 행 단위 루프 없이 컬럼 배열로 한 번에 계산한다.
+- 평가금(equity) = 사이클 투자금 + 미실현 손익. 사이클이 끝나면 투자금이 매도 대금으로 바뀌므로
+  사이클을 넘어도 이어진다.
+- 전 종목 합산은 거래일별로 더한다 (그날 스냅샷이 없는 종목은 빠짐).
+
+NumPy 필요: `uv sync --extra sim`
+"""
+
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.trading.repository.snapshot import SnapshotRepository
+
+
+@dataclass(frozen=True)
+class PnLSeries:
+    """거래일 순 평가 시계열 (모든 배열 길이 동일)"""
+
+    dates: np.ndarray  # datetime64[D]
+    investment: np.ndarray
+    cost: np.ndarray  # 평단가 × 수량
+    market_value: np.ndarray  # 종가 × 수량
+    unrealized_pnl: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def equity(self) -> np.ndarray:
+        return self.investment + self.unrealized_pnl
+
+    @property
+    def returns(self) -> np.ndarray:
+        """일간 평가금 수익률 (첫날 제외, 길이 n-1)"""
+        equity = self.equity
+        return np.diff(equity) / equity[:-1]
+
+    @property
+    def drawdown(self) -> np.ndarray:
+        """직전 고점 대비 평가금 하락률 (0 이하)"""
+        equity = self.equity
+        return equity / np.maximum.accumulate(equity) - 1
+
+    @property
+    def max_drawdown(self) -> float:
+        """최대 낙폭 (양수, 데이터 없으면 0)"""
+        return float(-self.drawdown.min()) if len(self) else 0.0
+
+
+def _column(rows: list, index: int) -> np.ndarray:
+    return np.fromiter((float(r[index] or 0) for r in rows), dtype=np.float64, count=len(rows))
+
+
+def to_series(rows: list) -> PnLSeries:
+    """시계열 행 (SnapshotRepository.series) → 거래일별 합산 배열"""
+    dates = np.array([r.trading_date for r in rows], dtype="datetime64[D]")
+    close, quantity, avg_price, investment, unrealized = (_column(rows, i) for i in range(2, 7))
+
+    # 거래일별 합산 (행은 거래일 순이라 unique 결과도 거래일 순)
+    days, index = np.unique(dates, return_inverse=True)
+
+    def by_day(values: np.ndarray) -> np.ndarray:
+        return np.bincount(index, weights=values, minlength=len(days))
+
+    return PnLSeries(
+        dates=days,
+        investment=by_day(investment),
+        cost=by_day(avg_price * quantity),
+        market_value=by_day(close * quantity),
+        unrealized_pnl=by_day(unrealized),
+    )
+
+
+async def load_pnl_series(
+    session: AsyncSession,
+    symbol: str | None = None,
+    since: date | None = None,
+    until: date | None = None,
+) -> PnLSeries:
+    """종목(없으면 전 종목 합산)의 일별 평가 시계열"""
+    rows = await SnapshotRepository(session).series(symbol, since, until)
+    return to_series(rows)
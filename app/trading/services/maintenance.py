@@ -0,0 +1,183 @@
+"""미체결 주문 정리 - 전략 계획과 다른 주문을 동시에 취소/정정
+
+미체결 주문을 페이지 단위로 받아 오면서 바로 처리한다.
+- 매수: 계획상 유지하지 않으면 (매수 시각 이전 = 이전 거래일 주문) 취소
+- 매도: 목표가 주문은 필요한 수량까지만 유지하고, 초과분은 일부 취소,
+  목표가가 아닌 주문은 부족분만큼 목표가로 정정, 나머지는 취소
+- 정정은 여기서 취소만 한다. 재주문은 호출자(TradingService)가 주문 행을 먼저 기록한 뒤
+  멱등 제출한다 (타임아웃 시 미체결 대조, 기록 없는 주문이 남지 않음).
+- 계획이 없는 종목의 주문은 건드리지 않는다 (여러 종목 계획은 미체결 조회 1회로 처리)
+
+취소/정정은 세마포어로 동시 실행 수를 제한하며, 실제 초당 호출 수는 API 클라이언트의
+속도 제한(KIWOOM_RATE_LIMIT_PER_SEC)을 따른다.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+
+from app.common.metrics import REGISTRY
+from app.common.money import Won
+from app.trading.external_api.base import OrderResult, StockAPIBase
+from app.trading.models.order import Order
+
+logger = logging.getLogger(__name__)
+
+SWEEP_DURATION = REGISTRY.histogram(
+    "order_sweep_duration_seconds", "미체결 주문 정리 소요시간",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+SWEEP_CHANGES = REGISTRY.counter(
+    "order_sweep_changes_total", "미체결 정리로 변경한 주문 수", ("action", "result")
+)
+
+
+class SweepAction(str, Enum):
+    """정리 동작"""
+
+    CANCEL = "cancel"  # 전량 취소
+    PARTIAL_CANCEL = "partial_cancel"  # 초과 수량만 취소
+    REPLACE = "replace"  # 취소 후 목표가 재주문 (재주문은 호출자)
+
+
+@dataclass
+class OrderPlan:
+    """전략이 기대하는 미체결 상태 (종목 1개)"""
+
+    symbol: str
+    sell_price: Won | None = None  # None이면 매도 주문이 없어야 함
+    sell_quantity: int = 0
+    keep_buys: bool = True  # False면 미체결 매수는 모두 취소
+    keep_orders: frozenset[str] = frozenset()  # 건드리지 않을 주문번호 (오늘 트리거 매도 등)
+
+
+@dataclass
+class SweepChange:
+    """주문 1건 처리 결과"""
+
+    order: OrderResult
+    action: SweepAction
+    reason: str
+    quantity: int  # 취소(정정) 수량
+    cancelled: bool = False  # 취소 성공 (정정도 취소가 성공하면 원주문은 취소된 것)
+    replaced: Order | None = None  # 정정 재주문 행 (호출자가 제출 후 채움)
+
+    @property
+    def replace_failed(self) -> bool:
+        """원주문은 취소했는데 재주문이 없음 (목표가 매도가 비어 있음)"""
+        return self.action is SweepAction.REPLACE and self.cancelled and self.replaced is None
+
+
+@dataclass
+class SweepReport:
+    """정리 결과"""
+
+    scanned: int = 0
+    changes: list[SweepChange] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def changed(self) -> int:
+        return sum(1 for c in self.changes if c.cancelled)
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for c in self.changes if not c.cancelled)
+
+    def summary(self) -> str:
+        return (
+            f"미체결 {self.scanned}건 확인, {self.changed}건 변경"
+            f"{f', {self.failed}건 실패' if self.failed else ''} ({self.elapsed:.2f}초)"
+        )
+
+
+class OrderSweeper:
+    """미체결 주문 정리기"""
+
+    def __init__(self, api: StockAPIBase, concurrency: int = 4):
+        self.api = api
+        self.concurrency = concurrency
+
+    async def sweep(self, *plans: OrderPlan) -> SweepReport:
+        """미체결 조회 → 종목별 계획과 비교 → 취소/정정 (동시 실행)"""
+        started = time.perf_counter()
+        report = SweepReport()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks: list[asyncio.Task] = []
+        by_symbol = {plan.symbol: plan for plan in plans}
+        sells: dict[str, list[OrderResult]] = {symbol: [] for symbol in by_symbol}
+
+        # 매수 취소는 페이지가 도착하는 대로 시작, 매도는 전체를 본 뒤 수량 배분
+        async for page in self.api.iter_pending_orders():
+            for order in page:
+                report.scanned += 1
+                plan = by_symbol.get(order.symbol)
+                if plan is None or order.order_id in plan.keep_orders:
+                    continue
+                if order.order_type == "SELL":
+                    sells[order.symbol].append(order)
+                elif not plan.keep_buys:
+                    change = SweepChange(order, SweepAction.CANCEL, "이전 거래일 매수", 0)
+                    tasks.append(asyncio.create_task(self._apply(change, semaphore)))
+
+        for symbol, plan in by_symbol.items():
+            for change in self._reconcile_sells(sells[symbol], plan):
+                tasks.append(asyncio.create_task(self._apply(change, semaphore)))
+
+        report.changes = list(await asyncio.gather(*tasks))
+        report.elapsed = time.perf_counter() - started
+        SWEEP_DURATION.observe(report.elapsed)
+        logger.info(report.summary())
+        return report
+
+    def _reconcile_sells(self, sells: list[OrderResult], plan: OrderPlan) -> list[SweepChange]:
+        """매도 주문 → 필요한 변경 목록"""
+        needed = plan.sell_quantity if plan.sell_price is not None else 0
+        on_target = [o for o in sells if o.price == plan.sell_price]
+        stale = [o for o in sells if o.price != plan.sell_price]
+        changes = []
+
+        for order in on_target:
+            if order.quantity <= needed:
+                needed -= order.quantity
+            elif needed > 0:
+                changes.append(
+                    SweepChange(
+                        order, SweepAction.PARTIAL_CANCEL, "보유 수량 초과",
+                        order.quantity - needed,
+                    )
+                )
+                needed = 0
+            else:
+                changes.append(SweepChange(order, SweepAction.CANCEL, "중복 매도", 0))
+
+        for order in stale:
+            if needed > 0:
+                quantity = min(order.quantity, needed)
+                changes.append(SweepChange(order, SweepAction.REPLACE, "목표가 변경", quantity))
+                needed -= quantity
+            else:
+                changes.append(SweepChange(order, SweepAction.CANCEL, "목표가 아님", 0))
+        return changes
+
+    async def _apply(self, change: SweepChange, semaphore: asyncio.Semaphore) -> SweepChange:
+        """취소 실행 (실패는 기록만 하고 다른 주문 처리는 계속)"""
+        order = change.order
+        cancel_qty = change.quantity if change.action is SweepAction.PARTIAL_CANCEL else 0
+        async with semaphore:
+            try:
+                change.cancelled = await self.api.cancel_order(
+                    order.order_id, order.symbol, cancel_qty
+                )
+            except Exception as e:
+                change.cancelled = False
+                logger.warning(f"주문 {order.order_id} {change.action.value} 실패: {e}")
+
+        SWEEP_CHANGES.labels(change.action.value, "ok" if change.cancelled else "failed").inc()
+        logger.info(
+            f"{change.action.value}: {order.order_type} {order.order_id} "
+            f"{order.quantity}주 @ {order.price:,}원 ({change.reason})"
+        )
+        return change
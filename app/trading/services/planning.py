@@ -0,0 +1,189 @@
+"""일일 주문 계획 - 한 시점의 스냅샷으로 전 종목 주문을 먼저 결정
+
+1단계(계획)는 포지션/현재가/잔고 스냅샷만 보고 불변 TradePlan을 만든다 (I/O 없음).
+2단계(제출)는 TradingService가 계획을 동시에 제출하고 결과 Order를 한 번에 저장한다.
+계획 단계에서 잔고를 종목 간에 나눠 쓰므로 제출 중 잔고 부족 거절이 생기지 않는다.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable
+
+from app.common.money import Won
+from app.trading.models.position import Position
+from app.trading.strategy.infinite_buy import InfiniteBuyStrategy
+
+
+@dataclass(frozen=True)
+class PlannedOrder:
+    """제출할 주문 1건"""
+
+    symbol: str
+    side: str  # "BUY" | "SELL"
+    quantity: int
+    price: Won
+    cycle_number: int
+    split_number: int  # 매도는 0
+    key: str  # 멱등 키 (같은 의도의 주문은 같은 키)
+    emergency: bool = False
+    is_half_amount: bool = False  # 0.5회분 매수
+    trigger: bool = False  # 장중 트리거 발동 매도
+
+    @property
+    def amount(self) -> int:
+        return self.price * self.quantity
+
+
+@dataclass(frozen=True)
+class TradePlan:
+    """종목별 주문 계획 (불변)"""
+
+    trading_date: date
+    orders: tuple[PlannedOrder, ...]
+    skipped: tuple[tuple[str, str], ...] = ()  # (종목, 사유)
+    available: int = 0  # 계획 시점 주문 가능 금액
+
+    @property
+    def buy_amount(self) -> int:
+        return sum(o.amount for o in self.orders if o.side == "BUY")
+
+
+# 트리거가 낸 주문의 식별 키 표시 (미체결 정리에서 제외)
+TRIGGER_MARK = "-TRG-"
+
+
+def order_key(trading_date: date, symbol: str, cycle: int, split: int, side: str) -> str:
+    """주문 의도 식별 키 - 종목/사이클/분할/거래일/방향"""
+    return f"{trading_date:%Y%m%d}-{symbol}-{cycle}-{split}-{side}"
+
+
+def trigger_order_key(trading_date: date, symbol: str, cycle: int, split: int, kind: str) -> str:
+    """트리거 주문 식별 키 - 같은 날 같은 분할 상태에서 같은 종류 트리거는 한 번만 주문"""
+    return f"{trading_date:%Y%m%d}-{symbol}-{cycle}-{split}{TRIGGER_MARK}{kind}"
+
+
+def replace_order_key(trading_date: date, symbol: str, cycle: int, original_id: str) -> str:
+    """정정 재주문 식별 키 - 취소한 원주문번호로 구분 (원주문 1건당 재주문 1건)"""
+    return f"{trading_date:%Y%m%d}-{symbol}-{cycle}-RP-{original_id}"
+
+
+def plan_symbol(
+    trading_date: date,
+    position: Position,
+    price: Won,
+    strategy: InfiniteBuyStrategy,
+) -> PlannedOrder | str:
+    """종목 1개 결정 → 주문 또는 건너뛴 사유"""
+    symbol, cycle = position.symbol, position.cycle_count
+
+    # 분할 소진 → 쿼터 손절
+    if strategy.should_emergency_sell and position.splits_used >= strategy.num_splits:
+        sell = strategy.calculate_emergency_sell(position.quantity)
+        if sell is None:
+            return "대기 모드 - 긴급 매도 없음"
+        return PlannedOrder(
+            symbol=symbol,
+            side="SELL",
+            quantity=sell.quantity,
+            price=strategy.grid.floor(price),
+            cycle_number=cycle,
+            split_number=0,
+            key=order_key(trading_date, symbol, cycle, position.splits_used, "SELL"),
+            emergency=True,
+        )
+
+    if position.avg_price and strategy.should_sell(price, position.avg_price):
+        return "목표 수익률 도달 - 매도 대기 중"
+
+    buy = strategy.calculate_buy_order(
+        current_price=price, avg_price=position.avg_price, splits_used=position.splits_used
+    )
+    if buy is None:
+        return "매수 조건 미충족"
+
+    split = position.splits_used + 1
+    return PlannedOrder(
+        symbol=symbol,
+        side="BUY",
+        quantity=buy.quantity,
+        price=buy.price,
+        cycle_number=cycle,
+        split_number=split,
+        key=order_key(trading_date, symbol, cycle, split, "BUY"),
+        is_half_amount=buy.is_half_amount,
+    )
+
+
+def plan_take_profit(
+    trading_date: date,
+    position: Position,
+    strategy: InfiniteBuyStrategy,
+) -> PlannedOrder | str:
+    """종목 1개 목표가 매도 결정 (매일 09:00, 보유 전량 @ 평단가 기준 목표가)"""
+    if position.quantity == 0 or position.avg_price is None:
+        return "매도할 포지션 없음"
+    symbol, cycle = position.symbol, position.cycle_count
+    return PlannedOrder(
+        symbol=symbol,
+        side="SELL",
+        quantity=position.quantity,
+        price=strategy.calculate_sell_price(position.avg_price),
+        cycle_number=cycle,
+        split_number=0,
+        # 같은 날 긴급 매도(…-SELL)와 구분
+        key=order_key(trading_date, symbol, cycle, position.splits_used, "TP"),
+    )
+
+
+def build_sell_plan(
+    trading_date: date,
+    positions: dict[str, Position],
+    strategy_for: Callable[[Position], InfiniteBuyStrategy],
+) -> TradePlan:
+    """보유 종목 전체 목표가 매도 계획"""
+    orders: list[PlannedOrder] = []
+    skipped: list[tuple[str, str]] = []
+    for symbol in sorted(positions):
+        position = positions[symbol]
+        decision = plan_take_profit(trading_date, position, strategy_for(position))
+        if isinstance(decision, str):
+            skipped.append((symbol, decision))
+        else:
+            orders.append(decision)
+    return TradePlan(trading_date=trading_date, orders=tuple(orders), skipped=tuple(skipped))
+
+
+def build_plan(
+    trading_date: date,
+    positions: dict[str, Position],
+    prices: dict[str, Won],
+    available: int,
+    strategy_for: Callable[[Position], InfiniteBuyStrategy],
+) -> TradePlan:
+    """스냅샷 → 전 종목 주문 계획 (매수 금액은 주문 가능 금액 안에서 종목 순서대로 배정)"""
+    orders: list[PlannedOrder] = []
+    skipped: list[tuple[str, str]] = []
+    budget = available
+
+    for symbol in sorted(positions):
+        if symbol not in prices:
+            skipped.append((symbol, "현재가 없음"))
+            continue
+        position = positions[symbol]
+        decision = plan_symbol(trading_date, position, prices[symbol], strategy_for(position))
+        if isinstance(decision, str):
+            skipped.append((symbol, decision))
+            continue
+        if decision.side == "BUY":
+            if decision.amount > budget:
+                skipped.append((symbol, "주문 가능 금액 부족"))
+                continue
+            budget -= decision.amount
+        orders.append(decision)
+
+    return TradePlan(
+        trading_date=trading_date,
+        orders=tuple(orders),
+        skipped=tuple(skipped),
+        available=available,
+    )
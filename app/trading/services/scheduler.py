@@ -1,99 +1,259 @@
 """스케줄러 서비스 - APScheduler 기반 작업 스케줄링"""
 
 import logging
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Awaitable, Callable
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+from app.common.metrics import REGISTRY
+from app.common.profiling import get_profiler
+from app.common.tracing import get_tracer
+from app.common.utils import get_kst_now, is_market_open, is_weekday
 
-from app.common.database import async_session
-from app.common.utils import is_weekday
-from app.notifications.telegram import NotificationService
-from app.trading.external_api.kiwoom import KiwoomRestAPI
-from app.trading.services.trading import TradingService
+if TYPE_CHECKING:
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.trading.external_api.base import StockAPIBase
+    from app.trading.services.trading import TradingService
 
 logger = logging.getLogger(__name__)
+tracer = get_tracer()
+
+JOB_DURATION = REGISTRY.histogram(
+    "scheduler_job_duration_seconds", "스케줄러 작업 소요시간", ("job",),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+JOB_LAG = REGISTRY.histogram(
+    "scheduler_job_lag_seconds", "예정 시각 대비 작업 시작 지연", ("job",)
+)
+JOB_SKIPPED = REGISTRY.counter(
+    "scheduler_job_skipped_total", "스킵/누락된 작업 수", ("job", "reason")
+)
+JOB_FAILED = REGISTRY.counter("scheduler_job_failed_total", "실패한 작업 수", ("job",))
 
-# 실행 중 플래그 (중복 실행 방지)
+# 실행 중 플래그 (정해진 시각 작업끼리 중복 실행 방지)
 _is_running = False
+# 트리거 폴링 실행 중 플래그 - 폴링은 정해진 시각 작업을 막지 않도록 따로 관리
+_is_polling = False
+# 트리거 폴링용 API (토큰/HTTP 연결 재사용, 종료 시 close_poll_api)
+_poll_api: "StockAPIBase | None" = None
+
+
+def _create_api() -> "StockAPIBase":
+    """키움 API 클라이언트 생성"""
+    from app.trading.external_api.kiwoom import KiwoomRestAPI
+
+    return KiwoomRestAPI()
 
 
-async def _get_trading_service() -> TradingService:
-    """TradingService 인스턴스 생성"""
-    session = async_session()
-    api = KiwoomRestAPI()
+def _get_poll_api() -> "StockAPIBase":
+    """트리거 폴링용 API (프로세스 동안 1개)"""
+    global _poll_api
+    if _poll_api is None:
+        _poll_api = _create_api()
+    return _poll_api
+
+
+async def close_poll_api() -> None:
+    """트리거 폴링용 API 종료 (프로그램 종료 시)"""
+    global _poll_api
+    if _poll_api is not None:
+        await _poll_api.close()
+    _poll_api = None
+
+
+async def _get_trading_service(
+    session: "AsyncSession", api: "StockAPIBase"
+) -> "TradingService":
+    """TradingService 인스턴스 생성 (세션/API는 작업이 열고 닫음)"""
+    # 무거운 의존성(DB/HTTP/텔레그램)은 첫 작업 실행 시점에 로드
+    from app.common.config import settings
+    from app.notifications.telegram import NotificationService
+    from app.trading.repository.position_cache import (
+        CachedPositionRepository,
+        get_position_cache,
+    )
+    from app.trading.repository.write_behind import get_write_behind
+    from app.trading.services.trading import TradingService
+    from app.trading.strategy.triggers import get_trigger_engine
+
     notifier = NotificationService()
-    return TradingService(session, api, notifier)
+    triggers = get_trigger_engine() if settings.intraday_triggers else None
+    writer = get_write_behind() if settings.write_behind_enabled else None
+    position_repo = (
+        CachedPositionRepository(session, get_position_cache())
+        if settings.position_cache_enabled
+        else None
+    )
+    return TradingService(
+        session, api, notifier, position_repo=position_repo, triggers=triggers, writer=writer
+    )
 
 
-async def job_set_sell_order():
-    """매도 주문 설정 (09:00)"""
-    global _is_running
-    if _is_running:
-        logger.warning("이전 작업 실행 중 - 스킵")
+async def _run_job(
+    job_id: str,
+    title: str,
+    action: Callable[["TradingService"], Awaitable],
+    poll: bool = False,
+):
+    """작업 공통 실행 (중복 실행/주말 스킵, 소요시간 측정)
+
+    Args:
+        poll: 짧은 주기 폴링 작업 - 로그를 DEBUG로 낮추고, 정해진 시각 작업과 별도 플래그를
+            쓰며(폴링이 매매 작업을 스킵시키지 않음), 폴링용 API를 재사용한다.
+            이름으로 예약된 경우에만 프로파일링하고 추적 루트 스팬은 만들지 않는다
+    """
+    global _is_running, _is_polling
+    log = logger.debug if poll else logger.info
+    warn = logger.debug if poll else logger.warning
+    if _is_polling if poll else _is_running:
+        warn("이전 작업 실행 중 - 스킵")
+        JOB_SKIPPED.labels(job_id, "running").inc()
         return
 
     if not is_weekday():
-        logger.info("주말 - 스킵")
+        log("주말 - 스킵")
+        JOB_SKIPPED.labels(job_id, "weekend").inc()
         return
 
-    _is_running = True
+    if poll:
+        _is_polling = True
+    else:
+        _is_running = True
+    started = time.perf_counter()
+    api = None
     try:
-        logger.info("=== 매도 주문 설정 시작 ===")
-        service = await _get_trading_service()
-        await service.execute_daily_sell_order()
+        log(f"=== {title} 시작 ===")
+        from app.common.database import async_session
+
+        api = _get_poll_api() if poll else _create_api()
+        # 폴링은 "all" 프로파일링 예약을 소진하지 않고, 5초마다 루트 스팬을 만들지 않음
+        profile = get_profiler().profile(job_id, explicit_only=poll)
+        span = nullcontext() if poll else tracer.root_span(f"job.{job_id}", job=job_id)
+        with profile, span:
+            # 작업이 끝나거나 실패해도 세션을 닫아 연결을 풀에 돌려줌
+            async with async_session() as session:
+                service = await _get_trading_service(session, api)
+                await action(service)
     except Exception as e:
-        logger.error(f"매도 주문 설정 실패: {e}")
+        JOB_FAILED.labels(job_id).inc()
+        logger.error(f"{title} 실패: {e}")
     finally:
-        _is_running = False
+        if api is not None and not poll:
+            await api.close()
+        JOB_DURATION.labels(job_id).observe(time.perf_counter() - started)
+        if poll:
+            _is_polling = False
+        else:
+            _is_running = False
 
 
-async def job_execute_buy_order():
-    """매수 주문 실행 (14:30)"""
-    global _is_running
-    if _is_running:
-        logger.warning("이전 작업 실행 중 - 스킵")
-        return
+async def job_set_sell_order():
+    """매도 주문 설정 (09:00)"""
+    await _run_job(
+        "set_sell_order", "매도 주문 설정", lambda service: service.execute_daily_sell_orders()
+    )
 
-    if not is_weekday():
-        logger.info("주말 - 스킵")
-        return
 
-    _is_running = True
-    try:
-        logger.info("=== 매수 주문 실행 시작 ===")
-        service = await _get_trading_service()
-        await service.execute_daily_buy_order()
-    except Exception as e:
-        logger.error(f"매수 주문 실행 실패: {e}")
-    finally:
-        _is_running = False
+async def job_execute_buy_order():
+    """매수 주문 실행 (14:30)"""
+    await _run_job(
+        "execute_buy_order", "매수 주문 실행", lambda service: service.execute_daily_buy_orders()
+    )
 
 
 async def job_check_execution():
     """체결 확인 (15:40)"""
-    global _is_running
-    if _is_running:
-        logger.warning("이전 작업 실행 중 - 스킵")
-        return
+    await _run_job(
+        "check_execution", "체결 확인", lambda service: service.check_order_execution()
+    )
 
-    if not is_weekday():
-        logger.info("주말 - 스킵")
+
+async def job_close_day():
+    """장 마감 평가 기록 + 일일 리포트 (15:50)"""
+    await _run_job("close_day", "장 마감 기록", lambda service: service.close_day())
+
+
+async def job_maintain_partitions():
+    """월별 파티션 생성/보존 기간 정리 (16:10, Postgres)"""
+    from app.common.config import settings
+    from app.trading.repository.partitions import PartitionManager
+
+    await _run_job(
+        "maintain_partitions",
+        "파티션 관리",
+        lambda service: PartitionManager(service.session).maintain(
+            months_ahead=settings.partition_months_ahead,
+            retention_months=settings.partition_retention_months,
+            archive=settings.partition_archive,
+        ),
+    )
+
+
+async def job_sweep_orders():
+    """미체결 주문 정리 (09:05)"""
+    await _run_job(
+        "sweep_orders", "미체결 주문 정리", lambda service: service.sweep_orders()
+    )
+
+
+async def job_poll_triggers():
+    """장중 트리거 시세 확인 (INTRADAY_TRIGGERS, TRIGGER_POLL_SECONDS 주기)"""
+    from app.trading.strategy.triggers import get_trigger_engine
+
+    if not is_market_open() or not len(get_trigger_engine()):
         return
+    await _run_job(
+        "poll_triggers", "트리거 시세 확인", lambda service: service.poll_triggers(), poll=True
+    )
 
-    _is_running = True
-    try:
-        logger.info("=== 체결 확인 시작 ===")
-        service = await _get_trading_service()
-        await service.check_order_execution()
-    except Exception as e:
-        logger.error(f"체결 확인 실패: {e}")
-    finally:
-        _is_running = False
+
+async def job_check_position_cache():
+    """포지션 캐시를 DB/키움 보유 수량과 대조 (16:00, POSITION_CACHE_ENABLED)
+
+    DB와 다른 종목은 DB 값으로 다시 채우고, 불일치는 텔레그램으로 알린다.
+    """
+    from app.trading.repository.position_cache import get_position_cache
+
+    async def _check(service: "TradingService") -> None:
+        report = await get_position_cache().check(service.api, repair=True)
+        if not report.ok:
+            lines = [
+                f"{m.symbol} {m.source}.{m.field}: 캐시 {m.cached} / 실제 {m.actual}"
+                for m in report.mismatches
+            ]
+            await service._safe_notify("send_error", "포지션 캐시 불일치\n" + "\n".join(lines))
+
+    await _run_job("check_position_cache", "포지션 캐시 대조", _check)
+
+
+def _on_job_event(event) -> None:
+    """APScheduler 이벤트 → 지연(lag)/누락 메트릭"""
+    from apscheduler.events import EVENT_JOB_MISSED, EVENT_JOB_SUBMITTED
+
+    if event.code == EVENT_JOB_SUBMITTED:
+        for run_time in event.scheduled_run_times:
+            JOB_LAG.labels(event.job_id).observe(
+                max(0.0, (get_kst_now() - run_time).total_seconds())
+            )
+    else:
+        reason = "missed" if event.code == EVENT_JOB_MISSED else "max_instances"
+        JOB_SKIPPED.labels(event.job_id, reason).inc()
 
 
-def create_scheduler() -> AsyncIOScheduler:
+def create_scheduler() -> "AsyncIOScheduler":
     """스케줄러 생성 및 작업 등록"""
+    from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED, EVENT_JOB_SUBMITTED
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    from apscheduler.triggers.cron import CronTrigger
+
+    from app.common.config import settings
+
     scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
+    scheduler.add_listener(
+        _on_job_event, EVENT_JOB_SUBMITTED | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES
+    )
 
     # 매도 주문 설정 (평일 09:00)
     scheduler.add_job(
@@ -104,6 +264,15 @@ def create_scheduler() -> AsyncIOScheduler:
         replace_existing=True,
     )
 
+    # 미체결 주문 정리 (평일 09:05, 매도 주문 설정 이후)
+    scheduler.add_job(
+        job_sweep_orders,
+        CronTrigger(hour=9, minute=5, day_of_week="mon-fri"),
+        id="sweep_orders",
+        name="미체결 주문 정리",
+        replace_existing=True,
+    )
+
     # 매수 주문 실행 (평일 14:30)
     scheduler.add_job(
         job_execute_buy_order,
@@ -122,9 +291,58 @@ def create_scheduler() -> AsyncIOScheduler:
         replace_existing=True,
     )
 
+    # 장 마감 평가 기록 + 일일 리포트 (평일 15:50, 체결 확인 이후)
+    scheduler.add_job(
+        job_close_day,
+        CronTrigger(hour=15, minute=50, day_of_week="mon-fri"),
+        id="close_day",
+        name="장 마감 기록",
+        replace_existing=True,
+    )
+
+    # 포지션 캐시 대조 (평일 16:00, 체결 확인 이후라 키움 보유 수량과 같아야 함)
+    if settings.position_cache_enabled:
+        scheduler.add_job(
+            job_check_position_cache,
+            CronTrigger(hour=16, minute=0, day_of_week="mon-fri"),
+            id="check_position_cache",
+            name="포지션 캐시 대조",
+            replace_existing=True,
+        )
+
+    # 월별 파티션 생성/정리 (평일 16:10, 장 마감 기록 이후 - 멱등이라 매일 실행)
+    scheduler.add_job(
+        job_maintain_partitions,
+        CronTrigger(hour=16, minute=10, day_of_week="mon-fri"),
+        id="maintain_partitions",
+        name="파티션 관리",
+        replace_existing=True,
+    )
+
+    # 장중 트리거 시세 폴링 (선택)
+    if settings.intraday_triggers:
+        from apscheduler.triggers.interval import IntervalTrigger
+
+        scheduler.add_job(
+            job_poll_triggers,
+            IntervalTrigger(seconds=settings.trigger_poll_seconds),
+            id="poll_triggers",
+            name="트리거 시세 확인",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+
     logger.info("스케줄러 작업 등록 완료")
     logger.info("  - 09:00: 매도 주문 설정")
+    logger.info("  - 09:05: 미체결 주문 정리")
     logger.info("  - 14:30: 매수 주문 실행")
     logger.info("  - 15:40: 체결 확인")
+    logger.info("  - 15:50: 장 마감 기록 + 일일 리포트")
+    if settings.position_cache_enabled:
+        logger.info("  - 16:00: 포지션 캐시 대조")
+    logger.info("  - 16:10: 파티션 관리")
+    if settings.intraday_triggers:
+        logger.info(f"  - 장중 {settings.trigger_poll_seconds}초마다: 트리거 시세 확인")
 
     return scheduler
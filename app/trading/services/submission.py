@@ -0,0 +1,114 @@
+"""멱등 주문 제출 - 결과를 알 수 없는 주문은 미체결과 대조한 뒤에만 다시 낸다
+
+주문 행은 제출 전에 client_order_id와 함께 저장되어 있어야 한다 (kiwoom_order_id 없음).
+- 접수되면 주문번호를 기록한다.
+- 증권사가 거절하면 (API 오류 응답) FAILED로 표시하고 재시도하지 않는다.
+- 타임아웃/연결 오류면 접수 여부를 알 수 없다. 미체결 주문 중 같은 종목·방향·가격이고
+  수량이 주문 이하이며 아직 다른 주문 행에 연결되지 않은 주문을 찾는다. 찾으면 그 주문번호를
+  채택하고, 없을 때만 다시 제출한다.
+- 재시도를 모두 써도 불명이면 행을 PENDING(주문번호 없음)으로 남겨 다음 실행에서 다시 대조한다.
+
+미체결 조회에 없는 즉시 전량 체결 주문은 대조로 찾을 수 없다. 그래서 재시도 횟수는 작게 둔다.
+"""
+
+import asyncio
+import logging
+
+import httpx
+
+from app.common.metrics import REGISTRY
+from app.trading.external_api.base import OrderResult, StockAPIBase
+from app.trading.models.order import Order, OrderStatus, OrderType
+
+logger = logging.getLogger(__name__)
+
+# 접수 여부를 알 수 없는 오류 (요청이 증권사에 도달했을 수 있음)
+UNCERTAIN_ERRORS = (httpx.TransportError, asyncio.TimeoutError)
+
+SUBMIT_OUTCOMES = REGISTRY.counter(
+    "order_submit_outcomes_total", "주문 제출 결과", ("outcome",)
+)
+
+
+class OrderSubmitter:
+    """저장된 주문 행을 증권사에 멱등 제출"""
+
+    def __init__(self, api: StockAPIBase, claimed: set[str], retries: int = 2):
+        """
+        Args:
+            claimed: 이미 주문 행에 연결된 증권사 주문번호 (대조 시 제외, 채택 시 추가)
+            retries: 결과 불명 시 재제출 횟수
+        """
+        self.api = api
+        self.claimed = claimed
+        self.retries = retries
+
+    async def submit(self, order: Order, uncertain: bool = False) -> bool:
+        """주문 1건 제출 → 접수 여부
+
+        Args:
+            uncertain: 이전 실행에서 결과 불명으로 남은 행 (제출 전에 먼저 대조)
+        """
+        for attempt in range(self.retries + 1):
+            if (uncertain or attempt) and await self._adopt_pending(order):
+                SUBMIT_OUTCOMES.labels("adopted").inc()
+                return True
+            try:
+                result = await self._send(order)
+            except UNCERTAIN_ERRORS as e:
+                logger.warning(
+                    f"{order.client_order_id} 결과 불명 ({type(e).__name__}) - 대조 후 재시도"
+                )
+                uncertain = True
+                continue
+            except Exception as e:
+                logger.warning(f"{order.client_order_id} 주문 거절: {e}")
+                order.status = OrderStatus.FAILED
+                SUBMIT_OUTCOMES.labels("rejected").inc()
+                return False
+
+            self._link(order, result.order_id)
+            SUBMIT_OUTCOMES.labels("accepted").inc()
+            return True
+
+        if await self._adopt_pending(order):
+            SUBMIT_OUTCOMES.labels("adopted").inc()
+            return True
+        logger.error(f"{order.client_order_id} 접수 여부 확인 불가 - 다음 실행에서 다시 대조")
+        SUBMIT_OUTCOMES.labels("unknown").inc()
+        return False
+
+    async def _send(self, order: Order) -> OrderResult:
+        submit = self.api.buy if order.order_type == OrderType.BUY else self.api.sell
+        return await submit(order.symbol, order.quantity, order.price)
+
+    async def _adopt_pending(self, order: Order) -> bool:
+        """미체결 주문 중 이 주문 행의 것으로 보이는 주문을 찾아 연결"""
+        try:
+            pending = await self.api.get_pending_orders()
+        except Exception as e:
+            logger.warning(f"미체결 조회 실패 (대조 불가): {e}")
+            return False
+
+        match = next(
+            (
+                p
+                for p in pending
+                if p.order_id not in self.claimed
+                and p.symbol == order.symbol
+                and p.order_type == order.order_type
+                and p.price == order.price
+                and p.quantity <= order.quantity
+            ),
+            None,
+        )
+        if match is None:
+            return False
+        logger.info(f"{order.client_order_id} 미체결 주문 {match.order_id}로 확인 (재제출 안 함)")
+        self._link(order, match.order_id)
+        return True
+
+    def _link(self, order: Order, order_id: str) -> None:
+        order.kiwoom_order_id = order_id
+        order.status = OrderStatus.PENDING
+        self.claimed.add(order_id)
@@ -1,25 +1,56 @@
 """Trading 서비스 - 무한매수법 매매 실행"""
 
+import asyncio
 import logging
-from decimal import Decimal
+import time
+from dataclasses import replace
+from datetime import date, datetime
+from datetime import time as dtime
+from decimal import ROUND_HALF_UP, Decimal
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.common.config import settings
-from app.common.utils import get_kst_now
+from app.common.config import Settings, settings
+from app.common.metrics import REGISTRY
+from app.common.tracing import get_tracer
+from app.common.utils import KST, get_kst_now
 from app.trading.external_api.base import StockAPIBase
 from app.trading.models.cycle_history import CycleHistory
+from app.trading.models.daily_snapshot import DailySnapshot
 from app.trading.models.order import Order, OrderStatus, OrderType
-from app.trading.models.position import Position
+from app.trading.models.position import CENT, Position
+from app.trading.repository.order import OrderRepository
 from app.trading.repository.position import PositionRepository
-from app.notifications.decorators import (
-    notify_on_buy,
-    notify_on_sell,
-    notify_on_emergency_sell,
+from app.trading.repository.snapshot import SnapshotRepository
+from app.trading.services.account import AccountSnapshot
+from app.trading.services.maintenance import OrderPlan, OrderSweeper, SweepAction, SweepReport
+from app.trading.services.planning import (
+    TRIGGER_MARK,
+    PlannedOrder,
+    TradePlan,
+    build_plan,
+    build_sell_plan,
+    replace_order_key,
+    trigger_order_key,
 )
+from app.trading.services.submission import OrderSubmitter
+from app.notifications.decorators import notify_on_sell
 from app.trading.strategy.infinite_buy import InfiniteBuyStrategy
+from app.trading.strategy.triggers import Trigger, TriggerEngine, TriggerKind
 
 logger = logging.getLogger(__name__)
+tracer = get_tracer()
+
+# 매수 작업 시각 - 이보다 이른 시각의 미체결 매수는 이전 거래일 주문
+BUY_ORDER_TIME = dtime(14, 30)
+
+ORDER_ACK_LATENCY = REGISTRY.histogram(
+    "order_trigger_to_ack_seconds", "매매 판단 시작부터 주문 접수까지 지연시간", ("side",)
+)
+BATCH_DURATION = REGISTRY.histogram(
+    "order_batch_duration_seconds", "매수 작업 시작부터 마지막 주문 접수까지 소요시간",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
 
 
 class TradingService:
@@ -30,24 +61,58 @@ class TradingService:
         session: AsyncSession,
         api: StockAPIBase,
         notifier: "NotificationService | None" = None,
+        position_repo: PositionRepository | None = None,
+        config: Settings | None = None,
+        triggers: TriggerEngine | None = None,
+        order_repo: OrderRepository | None = None,
+        writer: "WriteBehindWriter | None" = None,
     ):
+        """
+        Args:
+            position_repo: 포지션 레포지토리 (백테스트 시 인메모리 구현 주입)
+            config: 매매 설정 (기본: 전역 settings, 백테스트 시 파라미터 덮어쓰기)
+            triggers: 장중 트리거 엔진 (지정 시 목표가 매도를 지정가 대신 트리거로 처리)
+            order_repo: 주문 레포지토리 (백테스트/테스트 시 인메모리 구현 주입)
+            writer: 쓰기 지연 저장기 (지정 시 주문/히스토리는 저널 기록 후 백그라운드 반영)
+        """
         self.session = session
         self.api = api
         self.notifier = notifier
-        self.position_repo = PositionRepository(session)
+        self.position_repo = position_repo or PositionRepository(session)
+        self.config = config or settings
+        self.triggers = triggers
+        self.order_repo = order_repo or OrderRepository(session)
+        self.writer = writer
+        self.account = AccountSnapshot(api)  # 작업 시작/주문 후 invalidate, 읽을 때 ensure
+
+    async def _commit(self) -> None:
+        """주문/히스토리 커밋"""
+        with tracer.span("db.commit", repository="order"):
+            await self.session.commit()
+
+    async def _save(self, *instances, commit: bool = True) -> None:
+        """주문/히스토리 저장 (쓰기 지연 사용 시 저널에 기록하고 바로 반환)"""
+        if not instances:
+            return
+        if self.writer is not None:
+            await self.writer.record(*instances)
+            return
+        self.session.add_all(instances)
+        if commit:
+            await self._commit()
 
-    async def _safe_notify(self, coro) -> None:
-        """알림 전송 (실패해도 무시)"""
+    async def _safe_notify(self, method: str, *args) -> None:
+        """알림 전송 (notifier 없거나 실패해도 무시)"""
         if self.notifier is None:
             return
         try:
-            await coro
+            await getattr(self.notifier, method)(*args)
         except Exception as e:
             logger.warning(f"알림 전송 실패 (무시됨): {e}")
 
     async def initialize_position(self) -> Position:
         """포지션 초기화 (첫 실행 시)"""
-        symbol = settings.trading_symbol
+        symbol = self.config.trading_symbol
 
         # 현재가 조회하여 종목명 가져오기
         price_info = await self.api.get_price(symbol)
@@ -56,7 +121,7 @@ class TradingService:
         position = await self.position_repo.create_or_get(
             symbol=symbol,
             symbol_name=price_info.symbol_name,
-            initial_investment=settings.total_investment,
+            initial_investment=self.config.total_investment,
         )
 
         # 최소 자본금 검증
@@ -65,7 +130,7 @@ class TradingService:
 
         if not valid:
             logger.error(message)
-            await self._safe_notify(self.notifier.send_error(message))
+            await self._safe_notify("send_error", message)
             raise ValueError(message)
 
         return position
@@ -74,140 +139,419 @@ class TradingService:
         """현재 포지션 기반 전략 인스턴스 생성"""
         return InfiniteBuyStrategy(
             total_investment=position.current_investment,
-            num_splits=settings.num_splits,
-            profit_target=settings.profit_target,
-            emergency_sell_mode=settings.emergency_sell_mode,
+            num_splits=self.config.num_splits,
+            profit_target=self.config.profit_target,
+            emergency_sell_mode=self.config.emergency_sell_mode,
+            instrument_type=self.config.trading_instrument_type,
         )
 
-    @notify_on_sell
     async def execute_daily_sell_order(self) -> Order | None:
-        """매도 주문 설정 (매일 09:00)"""
-        symbol = settings.trading_symbol
-        position = await self.position_repo.get_by_symbol(symbol)
-
-        if position is None or position.quantity == 0 or position.avg_price is None:
-            logger.info("매도할 포지션 없음")
-            return None
-
-        strategy = self._get_strategy(position)
-        target_price = strategy.calculate_sell_price(position.avg_price)
-
-        # 매도 주문
-        result = await self.api.sell(symbol, position.quantity, target_price)
-
-        order = Order(
-            symbol=symbol,
-            order_type=OrderType.SELL,
-            price=target_price,
-            quantity=position.quantity,
-            cycle_number=position.cycle_count,
-            split_number=0,
-            kiwoom_order_id=result.order_id,
-        )
-        self.session.add(order)
-        await self.session.commit()
-
-        logger.info(f"매도 주문 설정: {position.quantity}주 @ {target_price:,}원")
-        return order
+        """매도 주문 설정 (매일 09:00) - 단일 종목용, execute_daily_sell_orders에 위임"""
+        orders = await self.execute_daily_sell_orders([self.config.trading_symbol])
+        return orders[0] if orders else None
+
+    async def execute_daily_sell_orders(self, symbols: list[str] | None = None) -> list[Order]:
+        """다종목 목표가 매도 설정 (매일 09:00) - 보유 종목마다 평단가 기준 목표가 지정가 매도
+
+        매수 작업처럼 선기록 후 멱등 제출한다.
+        트리거 모드에서는 주문 대신 종목별 목표가 트리거를 건다.
+        """
+        started = time.perf_counter()
+        symbols = symbols or self.config.symbol_list
+        positions = {p.symbol: p for p in await self.position_repo.get_all() if p.symbol in symbols}
+        plan = build_sell_plan(get_kst_now().date(), positions, self._get_strategy)
+        for symbol, reason in plan.skipped:
+            logger.info(f"{symbol}: {reason}")
+
+        if self.triggers is not None:
+            for planned in plan.orders:
+                self._arm_take_profit(positions[planned.symbol], planned.price)
+                logger.info(
+                    f"{planned.symbol} 장중 목표가 트리거 설정: "
+                    f"{planned.quantity}주 @ {planned.price:,}원"
+                )
+            return []
+
+        orders = [order for _, order in await self._submit_plan(plan, started)]
+        for order in orders:
+            await self._safe_notify("send_sell_order", order)
+        logger.info(f"매도 작업: 계획 {len(plan.orders)}건, 접수 {len(orders)}건")
+        return orders
 
-    @notify_on_buy
     async def execute_daily_buy_order(self) -> Order | None:
-        """매수 주문 실행 (매일 14:30)"""
-        symbol = settings.trading_symbol
-        position = await self.position_repo.get_by_symbol(symbol)
+        """매수 주문 실행 (매일 14:30) - 단일 종목용, execute_daily_buy_orders에 위임"""
+        orders = await self.execute_daily_buy_orders([self.config.trading_symbol])
+        return orders[0] if orders else None
+
+    async def execute_daily_buy_orders(self, symbols: list[str] | None = None) -> list[Order]:
+        """다종목 매수 작업 (매일 14:30) - 스냅샷 → 주문 계획 → 선기록 → 동시 제출
+
+        분할 소진 종목은 긴급 매도를 계획한다.
+        주문 행은 제출 전에 client_order_id와 함께 한 번에 저장하므로, 작업이 재실행되어도
+        이미 접수된 계획은 다시 내지 않고 결과 불명인 계획은 미체결과 대조한 뒤에만 다시 낸다.
+        """
+        started = time.perf_counter()
+        self.account.invalidate()  # 이전 작업의 스냅샷은 쓰지 않음
+        with tracer.span("orders.plan"):
+            plan = await self.plan_daily_orders(symbols or self.config.symbol_list)
+        for symbol, reason in plan.skipped:
+            logger.info(f"{symbol}: {reason}")
+        accepted = await self._submit_plan(plan, started)
+        for planned, order in accepted:
+            if planned.emergency:
+                await self._safe_notify("send_emergency_sell", order)
+            else:
+                await self._safe_notify("send_buy_order", order)
 
-        if position is None:
-            position = await self.initialize_position()
+        logger.info(
+            f"매수 작업: 계획 {len(plan.orders)}건, 접수 {len(accepted)}건, "
+            f"건너뜀 {len(plan.skipped)}건 ({time.perf_counter() - started:.2f}초)"
+        )
+        return [order for _, order in accepted]
+
+    async def _submit_plan(
+        self, plan: TradePlan, started: float, notify: bool = True
+    ) -> list[tuple[PlannedOrder, Order]]:
+        """계획 주문 선기록 → 동시 제출 → 주문번호 반영 (접수된 주문만 반환)
+
+        Args:
+            notify: 접수 실패를 알림 (False면 호출자가 직접 알림)
+        """
+        if not plan.orders:
+            return []
+
+        # 1) 제출 전 기록 (이전 실행 행은 재사용, 쓰기 지연 대기분은 먼저 반영해 중복 확인)
+        if self.writer is not None:
+            await self.writer.flush()
+        existing = await self.order_repo.get_by_client_ids([p.key for p in plan.orders])
+        batch: list[tuple[PlannedOrder, Order, bool]] = []
+        for planned in plan.orders:
+            order = existing.get(planned.key)
+            if order is not None and order.kiwoom_order_id is not None:
+                logger.info(f"이미 접수된 주문 (건너뜀): {planned.key}")
+                continue
+            uncertain = order is not None and order.status == OrderStatus.PENDING
+            if order is None:
+                order = self._order_from_plan(planned)
+                order.client_order_id = planned.key
+            order.status = OrderStatus.PENDING
+            batch.append((planned, order, uncertain))
+        if not batch:
+            return []
+        await self._save(*(order for _, order, _ in batch))
+
+        # 2) 동시 제출
+        since = datetime.combine(plan.trading_date, dtime.min, tzinfo=KST)
+        submitter = OrderSubmitter(
+            self.api,
+            claimed=await self.order_repo.broker_ids_since(since),
+            retries=self.config.order_submit_retries,
+        )
+        semaphore = asyncio.Semaphore(self.config.order_submit_concurrency)
+        with tracer.span("orders.submit", orders=len(batch)):
+            accepted = await asyncio.gather(
+                *(self._submit_planned(submitter, p, o, u, semaphore, started) for p, o, u in batch)
+            )
+        BATCH_DURATION.observe(time.perf_counter() - started)
+        self.account.invalidate()
+
+        # 3) 주문번호/상태 반영
+        await self._save(*(order for _, order, _ in batch))
+
+        submitted = []
+        for (planned, order, _), ok in zip(batch, accepted):
+            if not ok:
+                if notify:
+                    await self._safe_notify(
+                        "send_error", f"{planned.symbol} 주문 실패: {planned.key}"
+                    )
+                continue
+            submitted.append((planned, order))
+        return submitted
+
+    async def plan_daily_orders(self, symbols: list[str]) -> TradePlan:
+        """포지션/현재가/계좌 스냅샷을 한 번에 조회해 전 종목 주문 계획 생성"""
+        stored, quotes, account = await asyncio.gather(
+            self.position_repo.get_all(),
+            asyncio.gather(*(self.api.get_price(s) for s in symbols), return_exceptions=True),
+            self.account.ensure(),
+        )
+        positions = {p.symbol: p for p in stored if p.symbol in symbols}
+        prices = {}
+        skipped = []
+
+        for symbol, quote in zip(symbols, quotes):
+            if isinstance(quote, Exception):
+                logger.warning(f"{symbol} 현재가 조회 실패: {quote}")
+                skipped.append((symbol, "현재가 조회 실패"))
+                positions.pop(symbol, None)
+                continue
+            prices[symbol] = quote.current_price
+            if symbol in positions:
+                continue
+
+            # 첫 실행 종목 - 포지션 생성 후 최소 자본금 검증
+            position = await self.position_repo.create_or_get(
+                symbol=symbol,
+                symbol_name=quote.symbol_name,
+                initial_investment=self.config.total_investment,
+            )
+            valid, message = self._get_strategy(position).validate_investment(quote.current_price)
+            if not valid:
+                logger.error(f"{symbol}: {message}")
+                await self._safe_notify("send_error", f"{symbol}: {message}")
+                skipped.append((symbol, "최소 자본금 미달"))
+                continue
+            positions[symbol] = position
+
+        plan = build_plan(
+            get_kst_now().date(),
+            positions,
+            prices,
+            account.balance.available_amount,
+            self._get_strategy,
+        )
+        return replace(plan, skipped=tuple(skipped) + plan.skipped)
 
-        strategy = self._get_strategy(position)
+    async def _submit_planned(
+        self,
+        submitter: OrderSubmitter,
+        planned: PlannedOrder,
+        order: Order,
+        uncertain: bool,
+        semaphore: asyncio.Semaphore,
+        started: float,
+    ) -> bool:
+        """계획 1건 제출 (실패는 기록만 하고 계속)"""
+        async with semaphore:
+            ok = await submitter.submit(order, uncertain=uncertain)
+        if not ok:
+            return False
+
+        if planned.emergency:
+            label = "EMERGENCY_SELL"
+        elif planned.trigger:
+            label = "TRIGGER_SELL"
+        else:
+            label = planned.side
+        ORDER_ACK_LATENCY.labels(label).observe(time.perf_counter() - started)
+        logger.info(
+            f"{planned.symbol} {planned.side} 주문: {planned.quantity}주 @ {planned.price:,}원"
+        )
+        return True
+
+    @staticmethod
+    def _order_from_plan(planned: PlannedOrder, order_id: str | None = None) -> Order:
+        return Order(
+            symbol=planned.symbol,
+            order_type=OrderType(planned.side),
+            price=planned.price,
+            quantity=planned.quantity,
+            cycle_number=planned.cycle_number,
+            split_number=planned.split_number,
+            kiwoom_order_id=order_id,
+        )
 
-        # 40회 소진 체크
-        if strategy.should_emergency_sell and position.splits_used >= settings.num_splits:
-            return await self._execute_emergency_sell(position, strategy)
+    def _take_profit_key(self, symbol: str | None = None) -> str:
+        return f"{self.config.kiwoom_account_no}:{symbol or self.config.trading_symbol}:take_profit"
+
+    def _arm_take_profit(self, position: Position, target_price: int) -> Trigger:
+        """목표가 트리거 등록 (기존 조건 대체)"""
+        return self.triggers.add(
+            Trigger(
+                symbol=position.symbol,
+                kind=TriggerKind.TAKE_PROFIT,
+                threshold=target_price,
+                account=self.config.kiwoom_account_no,
+                key=self._take_profit_key(position.symbol),
+            )
+        )
 
-        # 현재가 조회
-        price_info = await self.api.get_price(symbol)
-        current_price = price_info.current_price
+    async def poll_triggers(self) -> list[Order]:
+        """트리거 대상 종목 시세 조회 → on_price (폴링 작업)"""
+        if self.triggers is None:
+            return []
+        orders = []
+        for symbol in self.triggers.symbols:
+            price_info = await self.api.get_price(symbol)
+            orders.extend(await self.on_price(symbol, price_info.current_price))
+        return orders
+
+    async def on_price(self, symbol: str, price: int) -> list[Order]:
+        """시세 틱 반영 → 발동한 트리거의 주문 실행 (폴링/스트리밍 공통 진입점)"""
+        if self.triggers is None:
+            return []
+        orders = []
+        for trigger in self.triggers.on_tick(symbol, price):
+            if trigger.kind is TriggerKind.BUY_ZONE or symbol not in self.config.symbol_list:
+                logger.warning(f"처리기 없는 트리거 발동 (무시됨): {trigger.key}")
+                continue
+            order = await self._execute_trigger_sell(trigger, price)
+            if order is not None:
+                orders.append(order)
+        return orders
 
-        # 목표 수익률 도달 체크
-        if position.avg_price and strategy.should_sell(current_price, position.avg_price):
-            logger.info("목표 수익률 도달 - 매도 대기 중")
+    @notify_on_sell
+    async def _execute_trigger_sell(self, trigger: Trigger, price: int) -> Order | None:
+        """목표가/손절 트리거 발동 → 현재가(이하 유효 호가) 지정가 매도"""
+        started = time.perf_counter()
+        position = await self.position_repo.get_by_symbol(trigger.symbol)
+        if position is None or position.quantity == 0:
             return None
 
-        # 매수 주문 계산
-        buy_order = strategy.calculate_buy_order(
-            current_price=current_price,
-            avg_price=position.avg_price,
-            splits_used=position.splits_used,
+        # 수량 미지정 시 발동 시점 보유 전량
+        quantity = min(trigger.data.get("quantity", position.quantity), position.quantity)
+        sell_price = self._get_strategy(position).grid.floor(price)
+        # 트리거는 이미 소진됐으므로 주문 행을 먼저 기록하고 멱등 제출 (결과 불명 시 미체결 대조)
+        today, cycle = get_kst_now().date(), position.cycle_count
+        planned = PlannedOrder(
+            symbol=trigger.symbol,
+            side="SELL",
+            quantity=quantity,
+            price=sell_price,
+            cycle_number=cycle,
+            split_number=0,
+            # 미체결 정리가 이 주문을 취소하지 않도록 트리거 주문 표시
+            key=trigger_order_key(
+                today, trigger.symbol, cycle, position.splits_used, trigger.kind.value
+            ),
+            trigger=True,
         )
-
-        if buy_order is None:
-            logger.info("매수 조건 미충족")
+        submitted = await self._submit_plan(TradePlan(today, (planned,)), started)
+        if not submitted:
             return None
-
-        # 매수 주문 실행
-        result = await self.api.buy(symbol, buy_order.quantity, buy_order.price)
-
-        order = Order(
-            symbol=symbol,
-            order_type=OrderType.BUY,
-            price=buy_order.price,
-            quantity=buy_order.quantity,
-            cycle_number=position.cycle_count,
-            split_number=position.splits_used + 1,
-            kiwoom_order_id=result.order_id,
-        )
-        self.session.add(order)
-        await self.session.commit()
+        [(_, order)] = submitted
 
         logger.info(
-            f"매수 주문: {buy_order.quantity}주 @ {buy_order.price:,}원 "
-            f"({'0.5회분' if buy_order.is_half_amount else '1회분'})"
+            f"트리거 매도 ({trigger.kind.value}): {quantity}주 @ {sell_price:,}원 "
+            f"(기준가 {trigger.threshold:,}원)"
         )
         return order
 
-    @notify_on_emergency_sell
-    async def _execute_emergency_sell(
-        self, position: Position, strategy: InfiniteBuyStrategy
-    ) -> Order | None:
-        """긴급 매도 (40회 소진 시 1/4 매도)"""
-        sell_order = strategy.calculate_emergency_sell(position.quantity)
-
-        if sell_order is None:
-            logger.info("대기 모드 - 긴급 매도 없음")
-            return None
-
-        symbol = settings.trading_symbol
-
-        price_info = await self.api.get_price(symbol)
-        result = await self.api.sell(symbol, sell_order.quantity, price_info.current_price)
-
-        order = Order(
-            symbol=symbol,
-            order_type=OrderType.SELL,
-            price=price_info.current_price,
-            quantity=sell_order.quantity,
-            cycle_number=position.cycle_count,
-            split_number=0,
-            kiwoom_order_id=result.order_id,
+    async def sweep_orders(self, symbols: list[str] | None = None) -> SweepReport:
+        """미체결 주문 정리 (전 종목, 미체결 조회 1회)
+
+        이전 거래일 매수는 취소하고, 목표가가 바뀐 매도는 정정한다.
+        """
+        symbols = symbols or self.config.symbol_list
+        positions = {p.symbol: p for p in await self.position_repo.get_all() if p.symbol in symbols}
+        now = get_kst_now()
+        keep_buys = now.time() >= BUY_ORDER_TIME
+        if self.writer is not None:
+            await self.writer.flush()  # 주문 행 조회 전 대기분 반영
+
+        # 트리거 모드: 오늘 트리거가 낸 매도는 유지
+        keep_orders = frozenset()
+        if self.triggers is not None:
+            since = datetime.combine(now.date(), dtime.min, tzinfo=KST)
+            keep_orders = frozenset(
+                await self.order_repo.broker_ids_since(since, marker=TRIGGER_MARK)
+            )
+
+        plans = {}
+        for symbol in symbols:
+            plan = OrderPlan(symbol=symbol, keep_buys=keep_buys, keep_orders=keep_orders)
+            position = positions.get(symbol)
+            # 트리거 모드에서는 지정가 매도를 두지 않는다
+            if (
+                self.triggers is None
+                and position is not None
+                and position.quantity > 0
+                and position.avg_price is not None
+            ):
+                strategy = self._get_strategy(position)
+                plan.sell_price = strategy.calculate_sell_price(position.avg_price)
+                plan.sell_quantity = position.quantity
+            plans[symbol] = plan
+
+        sweeper = OrderSweeper(self.api, concurrency=self.config.order_sweep_concurrency)
+        report = await sweeper.sweep(*plans.values())
+        if report.changes:
+            self.account.invalidate()
+
+        # 취소/정정한 주문 행 반영 (전량 취소·정정은 CANCELLED, 일부 취소는 수량 차감)
+        # 정정은 재주문 결과와 관계없이 취소가 성공했으면 원주문 행을 CANCELLED로 둔다
+        changed = [c for c in report.changes if c.cancelled]
+        if not changed:
+            return report
+        rows = await self.order_repo.get_by_broker_ids([c.order.order_id for c in changed])
+        updated = []
+        for change in changed:
+            row = rows.get(change.order.order_id)
+            if row is None:
+                continue
+            if change.action is SweepAction.PARTIAL_CANCEL:
+                row.quantity -= change.quantity
+            else:
+                row.status = OrderStatus.CANCELLED
+            updated.append(row)
+
+        await self._save(*updated)
+
+        # 정정 재주문 - 주문 행 선기록 후 멱등 제출 (원주문번호별 키라 재실행해도 1건)
+        started = time.perf_counter()
+        replacements = {
+            replace_order_key(
+                now.date(), change.order.symbol,
+                positions[change.order.symbol].cycle_count, change.order.order_id,
+            ): change
+            for change in changed
+            if change.action is SweepAction.REPLACE
+        }
+        plan = TradePlan(
+            now.date(),
+            tuple(
+                PlannedOrder(
+                    symbol=change.order.symbol,
+                    side="SELL",
+                    quantity=change.quantity,
+                    price=plans[change.order.symbol].sell_price,
+                    cycle_number=positions[change.order.symbol].cycle_count,
+                    split_number=0,
+                    key=key,
+                )
+                for key, change in replacements.items()
+            ),
         )
-        self.session.add(order)
-        await self.session.commit()
+        for planned, order in await self._submit_plan(plan, started, notify=False):
+            replacements[planned.key].replaced = order
 
-        logger.warning(f"긴급 매도 (쿠터 손절): {sell_order.quantity}주")
-        return order
+        for change in report.changes:
+            if change.replace_failed:
+                message = (
+                    f"{change.order.symbol} 정정 재주문 실패 - 원주문 {change.order.order_id} "
+                    f"취소됨, 목표가 매도 {change.quantity}주 없음"
+                )
+                logger.error(message)
+                await self._safe_notify("send_error", message)
+
+        return report
 
     async def check_order_execution(self) -> None:
-        """체결 확인 및 포지션 업데이트 (매일 15:40)"""
-        symbol = settings.trading_symbol
+        """체결 확인 및 포지션 업데이트 (매일 15:40) - 계좌 조회 1회로 전 종목 처리"""
+        self.account.invalidate()  # 이전 작업의 스냅샷은 쓰지 않음 (종목별 ensure에서 1회 조회)
+        for symbol in self.config.symbol_list:
+            await self._check_symbol_execution(symbol)
+
+    async def _check_symbol_execution(self, symbol: str) -> None:
+        """종목 1개 체결 반영 (계좌 스냅샷 기준)"""
         position = await self.position_repo.get_by_symbol(symbol)
 
         if position is None:
             return
 
-        # API에서 실제 보유 종목 조회
-        holdings = await self.api.get_holdings()
-        holding = next((h for h in holdings if h.symbol == symbol), None)
+        holding = (await self.account.ensure()).holding(symbol)
+
+        # 주문 행 체결/만료 기록 (보유 수량 변화 기준, 포지션 업데이트와 함께 커밋)
+        held = holding.quantity if holding else 0
+        bought, sold = max(held - position.quantity, 0), max(position.quantity - held, 0)
+        buy_price = None
+        if bought:
+            cost = Decimal(holding.avg_price) * holding.quantity - position.total_cost
+            buy_price = cost / bought if cost > 0 else Decimal(holding.avg_price)
+        sells = await self._record_fills(symbol, OrderType.SELL, sold)
+        filled = [*await self._record_fills(symbol, OrderType.BUY, bought, buy_price), *sells]
+        await self._save(*filled, commit=held == position.quantity)
 
         if holding:
             # 매수 체결 확인
@@ -218,39 +562,124 @@ class TradingService:
                 await self.position_repo.update(position)
 
                 logger.info(f"매수 체결: {bought_qty}주, 새 평단가: {position.avg_price:,}원")
+                if self.triggers is not None:
+                    target = self._get_strategy(position).calculate_sell_price(position.avg_price)
+                    self._arm_take_profit(position, target)
 
-                await self._safe_notify(self.notifier.send_execution(
-                    "매수", bought_qty, holding.avg_price, position
-                ))
+                await self._safe_notify(
+                    "send_execution", "매수", bought_qty, holding.avg_price, position
+                )
 
             # 전량 매도 확인
             elif holding.quantity == 0 and position.quantity > 0:
-                await self._complete_cycle(position)
+                await self._complete_cycle(position, sells, holding.current_price)
+
+            # 일부 매도 체결 (긴급 매도 등)
+            elif holding.quantity < position.quantity:
+                sold_qty = position.quantity - holding.quantity
+                position.quantity = holding.quantity
+                await self.position_repo.update(position)
+
+                logger.info(f"매도 체결: {sold_qty}주, 잔여 {holding.quantity}주")
+
+                await self._safe_notify(
+                    "send_execution", "매도", sold_qty, holding.current_price, position
+                )
 
         elif position.quantity > 0:
             # 보유 종목이 없으면 전량 매도됨
-            await self._complete_cycle(position)
+            await self._complete_cycle(position, sells)
 
-    async def _complete_cycle(self, position: Position) -> None:
-        """사이클 완료 처리"""
-        # 잔고 조회하여 매도 대금 확인
-        balance = await self.api.get_balance()
+    async def _record_fills(
+        self,
+        symbol: str,
+        order_type: OrderType,
+        quantity: int,
+        price: Decimal | None = None,
+    ) -> list[Order]:
+        """체결 수량을 제출된 주문 행에 오래된 순으로 배분 (저장은 호출자)
+
+        미체결 목록에 남은 잔량은 배분하지 않고, 미체결 목록에 없는데 배분받지 못한 주문은
+        체결 없이 만료된 것으로 보고 CANCELLED로 기록한다.
+        같은 날 같은 종목의 매수와 매도가 모두 체결되면 순변화만 보이므로 한쪽이 덜 잡힌다.
+
+        Args:
+            quantity: 이번 확인에서 체결된 수량 (보유 수량 변화)
+            price: 체결가 (None이면 주문 지정가)
+        """
+        if self.writer is not None:
+            await self.writer.flush()  # 주문 행 조회 전 대기분 반영
+        account = await self.account.ensure()
+        resting = {o.order_id: o.quantity for o in account.pending_orders(symbol)}
+        changed = []
+        for row in await self.order_repo.open_orders(symbol, order_type, resting):
+            done = row.filled_quantity or 0
+            remaining = resting.get(row.kiwoom_order_id)
+            fill = min(quantity, row.quantity - done - (remaining or 0))
+            if fill > 0:
+                fill_price = Decimal(row.price if price is None else price)
+                total = done + fill
+                average = (done * Decimal(row.filled_price or 0) + fill * fill_price) / total
+                row.mark_filled(total, average.quantize(CENT, rounding=ROUND_HALF_UP))
+                quantity -= fill
+            elif remaining is None:
+                row.status = OrderStatus.CANCELLED
+            else:
+                continue
+            changed.append(row)
+        return changed
+
+    async def _complete_cycle(
+        self,
+        position: Position,
+        sells: list[Order] | None = None,
+        price: Decimal | None = None,
+    ) -> None:
+        """사이클 완료 처리
+
+        매도 대금은 계좌 잔고(전 종목 공유)가 아니라 이 종목의 체결 기록으로 계산하고,
+        다음 사이클 투자금도 이 종목 몫만 이어받는다.
+
+        Args:
+            sells: 이번 체결 확인에서 기록한 매도 주문 (체결 기록이 없는 수량은 price로 평가)
+            price: 체결 기록이 없는 수량의 평가 가격 (None이면 현재가 조회)
+        """
+        symbol, cycle = position.symbol, position.cycle_count
+        recorded = sum(
+            o.filled_quantity
+            for o in sells or ()
+            if o.status in (OrderStatus.FILLED, OrderStatus.PARTIAL)
+        )
+        if self.writer is not None:
+            await self.writer.flush()  # 방금 기록한 체결 반영 후 합계 조회
+        amounts = await self.order_repo.filled_amounts(symbol, cycle)
+        sold = amounts[OrderType.SELL]
+        if position.quantity > recorded:
+            if price is None:
+                price = (await self.api.get_price(symbol)).current_price
+            sold += (position.quantity - recorded) * Decimal(price)
+        # 사이클 투자금 - 매수 체결 + 매도 체결 = 이 종목의 사이클 종료 금액
+        end_proceeds = (position.current_investment - amounts[OrderType.BUY] + sold).quantize(
+            CENT, rounding=ROUND_HALF_UP
+        )
 
         # CycleHistory 기록
         history = CycleHistory.create_from_position(
-            symbol=position.symbol,
-            cycle_number=position.cycle_count,
+            symbol=symbol,
+            cycle_number=cycle,
             start_investment=position.initial_investment
-            if position.cycle_count == 1
+            if cycle == 1
             else position.current_investment,
-            end_proceeds=balance.available_amount,  # 대략적인 값
+            end_proceeds=end_proceeds,
             total_trades=position.splits_used,
             started_at=position.created_at,
         )
-        self.session.add(history)
+        await self._save(history, commit=False)  # 포지션 업데이트와 함께 커밋
 
         # 포지션 리셋
-        position.reset_for_new_cycle(balance.available_amount)
+        position.reset_for_new_cycle(end_proceeds)
+        if self.triggers is not None:
+            self.triggers.cancel(self._take_profit_key(position.symbol))
         await self.position_repo.update(position)
 
         logger.info(
@@ -258,7 +687,95 @@ class TradingService:
             f"수익률: {history.profit_rate * 100:.2f}%"
         )
 
-        await self._safe_notify(self.notifier.send_cycle_complete(history))
+        if self.config.analytics_materialized_view:
+            await self._refresh_analytics()
+
+        await self._safe_notify("send_cycle_complete", history)
+
+    async def close_day(self) -> list[DailySnapshot]:
+        """장 마감 작업 - 평가 기록 후 일일 리포트 전송"""
+        snapshots = await self.record_daily_snapshots()
+        await self.send_daily_reports()
+        return snapshots
+
+    async def record_daily_snapshots(
+        self, trading_date: date | None = None
+    ) -> list[DailySnapshot]:
+        """종목별 장 마감 평가 기록 (종가 동시 조회, INSERT 1회)"""
+        trading_date = trading_date or get_kst_now().date()
+        positions = await self.position_repo.get_all()
+        quotes = await asyncio.gather(
+            *(self.api.get_price(p.symbol) for p in positions), return_exceptions=True
+        )
+
+        snapshots = []
+        for position, quote in zip(positions, quotes):
+            if isinstance(quote, Exception):
+                logger.warning(f"{position.symbol} 종가 조회 실패 - 평가 기록 제외: {quote}")
+                continue
+            close = Decimal(quote.current_price)
+            unrealized = (
+                (close - position.avg_price) * position.quantity
+                if position.avg_price is not None
+                else Decimal("0")
+            )
+            snapshots.append(
+                DailySnapshot(
+                    symbol=position.symbol,
+                    trading_date=trading_date,
+                    cycle_number=position.cycle_count,
+                    quantity=position.quantity,
+                    avg_price=position.avg_price,
+                    close=close,
+                    investment=position.current_investment,
+                    unrealized_pnl=unrealized.quantize(CENT),
+                    splits_used=position.splits_used,
+                )
+            )
+
+        await SnapshotRepository(self.session).save_many(snapshots)
+        logger.info(f"장 마감 평가 기록: {len(snapshots)}종목")
+        return snapshots
+
+    async def send_daily_reports(self) -> None:
+        """종목별 일일 리포트 (완료 사이클 통계 포함)"""
+        if self.notifier is None:
+            return
+        from app.trading.repository.analytics import AnalyticsRepository
+
+        analytics = AnalyticsRepository(self.session)
+        for position in await self.position_repo.get_all():
+            try:
+                stats = await analytics.cycle_stats(
+                    position.symbol, use_view=self.config.analytics_materialized_view
+                )
+            except Exception as e:
+                logger.warning(f"{position.symbol} 성과 통계 조회 실패 (리포트는 전송): {e}")
+                await self._rollback_quietly()
+                stats = []
+            await self._safe_notify("send_daily_report", position, stats[0] if stats else None)
+
+    async def _refresh_analytics(self) -> None:
+        """성과 통계 구체화 뷰 갱신 (실패해도 매매는 계속)"""
+        from app.trading.repository.analytics import AnalyticsRepository
+
+        try:
+            if self.writer is not None:
+                await self.writer.flush()  # 방금 기록한 사이클 히스토리부터 반영
+            await AnalyticsRepository(self.session).refresh_view()
+        except Exception as e:
+            logger.warning(f"성과 통계 갱신 실패 (무시됨): {e}")
+            await self._rollback_quietly()
+
+    async def _rollback_quietly(self) -> None:
+        """실패한 문장으로 중단된 트랜잭션 정리 (Postgres는 롤백 전까지 이후 쿼리를 모두 거부)"""
+        rollback = getattr(self.session, "rollback", None)
+        if rollback is None:  # 인메모리 세션
+            return
+        try:
+            await rollback()
+        except Exception as e:
+            logger.warning(f"세션 롤백 실패: {e}")
 
 
 # 타입 힌트를 위한 임포트 (순환 참조 방지)
@@ -266,3 +783,4 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.notifications.telegram import NotificationService
+    from app.trading.repository.write_behind import WriteBehindWriter
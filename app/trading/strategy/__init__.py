@@ -1,5 +1,6 @@
 """전략 모듈"""
 
 from app.trading.strategy.infinite_buy import InfiniteBuyStrategy
+from app.trading.strategy.price_grid import ETF_GRID, STOCK_GRID, PriceGrid, get_grid
 
-__all__ = ["InfiniteBuyStrategy"]
+__all__ = ["InfiniteBuyStrategy", "PriceGrid", "ETF_GRID", "STOCK_GRID", "get_grid"]
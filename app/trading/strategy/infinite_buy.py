@@ -3,14 +3,16 @@
 from dataclasses import dataclass
 from decimal import Decimal
 
-from app.common.config import EmergencySellMode
+from app.common.config import EmergencySellMode, InstrumentType
+from app.common.money import UP, Rate, Won
+from app.trading.strategy.price_grid import get_grid
 
 
 @dataclass
 class BuyOrder:
     """매수 주문 정보"""
 
-    price: Decimal
+    price: Won
     quantity: int
     is_half_amount: bool  # 0.5회분 매수 여부
 
@@ -19,31 +21,47 @@ class BuyOrder:
 class SellOrder:
     """매도 주문 정보"""
 
-    price: Decimal
+    price: Won
     quantity: int
     is_emergency: bool  # 긴급 매도 (40회 소진) 여부
 
 
 class InfiniteBuyStrategy:
-    """라오어 무한매수법 전략"""
+    """라오어 무한매수법 전략
+
+    금액은 원 단위 정수(Won), 목표 수익률은 고정소수점(Rate)으로 계산한다.
+    Decimal 입력은 생성/호출 시점에 명시적 반올림 규칙으로 변환된다.
+    주문 가격은 모두 종목 구분(instrument_type)의 호가 격자를 거친다.
+    """
 
     def __init__(
         self,
-        total_investment: Decimal,
+        total_investment: Won | Decimal,
         num_splits: int = 40,
         profit_target: Decimal = Decimal("1.10"),
         emergency_sell_mode: EmergencySellMode = EmergencySellMode.QUARTER,
+        instrument_type: InstrumentType = InstrumentType.ETF,
     ):
-        self.total_investment = total_investment
+        self.total_investment = Won.of(total_investment)
         self.num_splits = num_splits
         self.profit_target = profit_target
+        self.target_rate = Rate.of(profit_target)
         self.emergency_sell_mode = emergency_sell_mode
-        self.investment_per_split = total_investment / Decimal(num_splits)
+        self.instrument_type = instrument_type
+        self.grid = get_grid(instrument_type)
+        self.investment_per_split = self.total_investment.split(num_splits)
+        # 평단가는 하루 동안 고정 → 마지막 목표가 1건 캐시
+        self._target_cache: tuple[Won | Decimal | None, Won] = (None, Won(0))
+
+    @property
+    def should_emergency_sell(self) -> bool:
+        """분할 소진 시 긴급 매도(쿼터 손절) 여부"""
+        return self.emergency_sell_mode == EmergencySellMode.QUARTER
 
     def calculate_buy_order(
         self,
-        current_price: Decimal,
-        avg_price: Decimal | None,
+        current_price: Won | Decimal,
+        avg_price: Won | Decimal | None,
         splits_used: int,
     ) -> BuyOrder | None:
         """
@@ -60,18 +78,19 @@ class InfiniteBuyStrategy:
         if splits_used >= self.num_splits:
             return None  # 40회 소진
 
-        # 현재가 기준 1회분 수량 계산 → 시장가 매수
-        quantity = int(self.investment_per_split / current_price)
+        # 현재가(이하 유효 호가) 기준 1회분 수량 계산
+        price = self.grid.floor(current_price)
+        quantity = self.investment_per_split.shares(price)
         if quantity <= 0:
             return None
 
         return BuyOrder(
-            price=current_price,  # 참고용 (시장가이므로 실제 체결가는 다를 수 있음)
+            price=price,  # 참고용 (시장가이므로 실제 체결가는 다를 수 있음)
             quantity=quantity,
             is_half_amount=False,
         )
 
-    def calculate_sell_price(self, avg_price: Decimal) -> Decimal:
+    def calculate_sell_price(self, avg_price: Won | Decimal) -> Won:
         """
         매도 목표가 계산
 
@@ -79,11 +98,16 @@ class InfiniteBuyStrategy:
             avg_price: 평균 매입가
 
         Returns:
-            목표 매도가 (평단가 * profit_target)
+            목표 매도가 (평단가 * profit_target 이상 최소 유효 호가)
         """
-        return avg_price * self.profit_target
-
-    def should_sell(self, current_price: Decimal, avg_price: Decimal) -> bool:
+        cached_avg, cached_target = self._target_cache
+        if avg_price == cached_avg:
+            return cached_target
+        target = self.grid.ceil(self.target_rate.apply(avg_price, UP))
+        self._target_cache = (avg_price, target)
+        return target
+
+    def should_sell(self, current_price: Won | Decimal, avg_price: Won | Decimal) -> bool:
         """
         매도 조건 확인
 
@@ -116,12 +140,12 @@ class InfiniteBuyStrategy:
             return None
 
         return SellOrder(
-            price=Decimal("0"),  # 시장가로 매도
+            price=Won(0),  # 시장가로 매도
             quantity=sell_quantity,
             is_emergency=True,
         )
 
-    def reset_with_proceeds(self, sell_proceeds: Decimal) -> "InfiniteBuyStrategy":
+    def reset_with_proceeds(self, sell_proceeds: Won | Decimal) -> "InfiniteBuyStrategy":
         """
         사이클 리셋: 매도 대금을 새 투자금으로 설정
 
@@ -136,9 +160,10 @@ class InfiniteBuyStrategy:
             num_splits=self.num_splits,
             profit_target=self.profit_target,
             emergency_sell_mode=self.emergency_sell_mode,
+            instrument_type=self.instrument_type,
         )
 
-    def validate_investment(self, current_price: Decimal) -> tuple[bool, str]:
+    def validate_investment(self, current_price: Won | Decimal) -> tuple[bool, str]:
         """
         최소 자본금 검증
 
@@ -148,7 +173,7 @@ class InfiniteBuyStrategy:
         Returns:
             (valid, message)
         """
-        min_required = current_price * Decimal(self.num_splits)
+        min_required = Won.of(current_price, UP) * self.num_splits
         if self.total_investment < min_required:
             return False, (
                 f"최소 자본금 미달: 필요 {min_required:,.0f}원, "
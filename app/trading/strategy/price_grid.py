@@ -0,0 +1,134 @@
+"""KRX 호가 격자 - 종목 구분별 호가단위 테이블과 유효 호가 반올림
+
+가격 구간 경계는 모두 구간 단위(unit, 경계값들의 최대공약수)의 배수이므로
+price // unit 인덱스 테이블 한 번 조회로 호가단위를 찾는다 (O(1)).
+각 경계값은 다음 구간 호가단위의 배수여야 하며, 그래야 구간을 넘는 올림/내림 결과도
+항상 유효 호가가 된다 (생성 시 검증).
+
+백테스터용 round_array()는 float/int 가격 배열 전체를 한 번에 반올림한다 (NumPy).
+"""
+
+from functools import reduce
+from math import gcd
+from typing import TYPE_CHECKING
+
+from app.common.config import InstrumentType
+from app.common.money import DOWN, HALF_UP, UP, Rounding, Won, div_round
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+    import numpy as np
+
+# float 가격의 부동소수점 오차 허용치 (원) - 176000.00000000003 을 176001로 올리지 않도록
+FLOAT_TOLERANCE = 1e-6
+
+
+class PriceGrid:
+    """종목 구분별 호가 격자
+
+    Args:
+        bands: (구간 상한 미만, 호가단위) 목록 (오름차순)
+        top_tick: 마지막 구간 이상 호가단위
+    """
+
+    __slots__ = ("name", "bands", "top_tick", "_unit", "_table", "_size", "_lookup")
+
+    def __init__(self, name: str, bands: tuple[tuple[int, int], ...], top_tick: int):
+        ticks = [tick for _, tick in bands] + [top_tick]
+        for (upper, _), next_tick in zip(bands, ticks[1:]):
+            if upper % next_tick:
+                raise ValueError(f"{name}: 구간 경계 {upper}가 호가단위 {next_tick}의 배수 아님")
+
+        self.name = name
+        self.bands = bands
+        self.top_tick = top_tick
+        self._unit = reduce(gcd, (upper for upper, _ in bands))
+        table: list[int] = []
+        lower = 0
+        for upper, tick in bands:
+            table.extend([tick] * ((upper - lower) // self._unit))
+            lower = upper
+        self._table = tuple(table)
+        self._size = len(table)
+        self._lookup = None  # round_array용 NumPy 테이블 (첫 호출 시 생성)
+
+    def tick_size(self, price: int) -> int:
+        """가격이 속한 구간의 호가단위"""
+        i = price // self._unit
+        return self._table[i] if i < self._size else self.top_tick
+
+    def round(self, price: "int | Decimal", rounding: Rounding = DOWN) -> Won:
+        """유효 호가로 반올림 (원 미만도 같은 규칙, HALF_UP은 가까운 호가)"""
+        won = price if isinstance(price, int) else Won.of(price, rounding)
+        i = won // self._unit
+        tick = self._table[i] if i < self._size else self.top_tick
+        if tick == 1:
+            return won if type(won) is Won else Won(won)
+        return Won(div_round(won, tick, rounding) * tick)
+
+    def floor(self, price: "int | Decimal") -> Won:
+        """이하 최대 유효 호가 (매수 지정가, 시장성 매도가)"""
+        return self.round(price, DOWN)
+
+    def ceil(self, price: "int | Decimal") -> Won:
+        """이상 최소 유효 호가 (매도 목표가)"""
+        return self.round(price, UP)
+
+    def is_valid(self, price: "int | Decimal") -> bool:
+        """유효 호가 여부"""
+        return price == int(price) and int(price) % self.tick_size(int(price)) == 0
+
+    def round_array(self, prices: "np.ndarray", rounding: Rounding = DOWN) -> "np.ndarray":
+        """가격 배열 일괄 반올림 (NumPy 필요)
+
+        float 배열은 float64(정수 값), 정수 배열은 int64로 돌려준다.
+        원 단위 정수 값은 float64로 정확히 표현되므로 float 경로도 결과가 같다.
+        """
+        import numpy as np
+
+        prices = np.asarray(prices)
+        if self._lookup is None:
+            self._lookup = np.array(self._table + (self.top_tick,), dtype=np.int64)
+
+        if prices.dtype.kind != "f":
+            won = prices.astype(np.int64)
+            tick = self._lookup[np.minimum(won // self._unit, self._size)]
+            if rounding is UP:
+                return -(-won // tick) * tick
+            if rounding is HALF_UP:
+                return (2 * won + tick) // (2 * tick) * tick
+            return won // tick * tick
+
+        if rounding is UP:
+            won = np.ceil(prices - FLOAT_TOLERANCE)
+        elif rounding is HALF_UP:
+            won = np.floor(prices + 0.5 + FLOAT_TOLERANCE)
+        else:
+            won = np.floor(prices + FLOAT_TOLERANCE)
+        index = np.minimum(won * (1 / self._unit), self._size).astype(np.intp)
+        tick = self._lookup[index].astype(np.float64)
+        if rounding is UP:
+            return np.ceil(won / tick) * tick
+        if rounding is HALF_UP:
+            return np.floor(won / tick + 0.5) * tick
+        return np.floor(won / tick) * tick
+
+    def __repr__(self) -> str:
+        return f"PriceGrid({self.name})"
+
+
+# (구간 상한 미만, 호가단위)
+STOCK_GRID = PriceGrid(
+    "stock",
+    ((2_000, 1), (5_000, 5), (20_000, 10), (50_000, 50), (200_000, 100), (500_000, 500)),
+    top_tick=1_000,
+)
+ETF_GRID = PriceGrid("etf", ((2_000, 1),), top_tick=5)
+
+_GRIDS = {InstrumentType.STOCK: STOCK_GRID, InstrumentType.ETF: ETF_GRID}
+
+
+def get_grid(instrument_type: InstrumentType | str) -> PriceGrid:
+    """종목 구분 → 호가 격자"""
+    return _GRIDS[InstrumentType(instrument_type)]
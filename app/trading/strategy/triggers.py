@@ -0,0 +1,201 @@
+"""장중 가격 트리거 엔진 - 종목별 힙으로 다수 조건을 틱당 O(log n)에 평가
+
+조건은 방향에 따라 두 힙에 나뉜다.
+- 상향(TAKE_PROFIT): 가격 >= 기준가 → 기준가 최소 힙 (현재가 위 가장 가까운 조건이 top)
+- 하향(BUY_ZONE, STOP): 가격 <= 기준가 → 기준가 최대 힙 (현재가 아래 가장 가까운 조건이 top)
+
+틱이 들어오면 힙 top만 비교하고 충족된 조건만 꺼내므로 비용은 O((k+1) log n)
+(k = 발동 수)이다. 같은 key로 다시 등록하면 기존 조건을 대체하며, 취소/대체된 항목은
+힙에서 바로 빼지 않고 표시만 해 두었다가 top에 올라올 때 버린다 (지연 삭제).
+발동한 조건은 1회성으로 제거된다.
+"""
+
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from app.common.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+TRIGGERS_FIRED = REGISTRY.counter("price_triggers_fired_total", "발동한 가격 트리거 수", ("kind",))
+TRIGGERS_ARMED = REGISTRY.gauge("price_triggers_armed", "대기 중인 가격 트리거 수")
+
+# 지연 삭제 항목이 이 수 이상이고 힙의 절반을 넘으면 힙 재구성
+COMPACT_MIN_DEAD = 64
+
+
+class TriggerKind(str, Enum):
+    """트리거 종류"""
+
+    TAKE_PROFIT = "take_profit"  # 목표가 이상 → 매도
+    BUY_ZONE = "buy_zone"  # 기준가 이하 → 매수
+    STOP = "stop"  # 기준가 이하 → 손절
+
+    @property
+    def fires_above(self) -> bool:
+        return self is TriggerKind.TAKE_PROFIT
+
+
+@dataclass(eq=False)
+class Trigger:
+    """가격 조건 1건
+
+    Args:
+        key: 대체/취소 단위 (기본: "계좌:종목:종류")
+        data: 발동 시 처리기에 넘길 부가 정보 (수량 등)
+    """
+
+    symbol: str
+    kind: TriggerKind
+    threshold: int
+    account: str = ""
+    key: str = ""
+    data: dict[str, Any] = field(default_factory=dict)
+    active: bool = field(default=True, repr=False)
+    seq: int = field(default=-1, repr=False)  # 현재 유효한 힙 항목 순번
+
+    def __post_init__(self):
+        if not self.key:
+            self.key = f"{self.account}:{self.symbol}:{self.kind.value}"
+
+    def is_hit(self, price: int) -> bool:
+        if self.kind.fires_above:
+            return price >= self.threshold
+        return price <= self.threshold
+
+
+def _live(entry: tuple[int, int, Trigger]) -> bool:
+    trigger = entry[2]
+    return trigger.active and trigger.seq == entry[1]
+
+
+class _SymbolBook:
+    """종목 1개의 상향/하향 힙"""
+
+    __slots__ = ("above", "below", "dead")
+
+    def __init__(self):
+        self.above: list[tuple[int, int, Trigger]] = []  # (기준가, 순번, 트리거)
+        self.below: list[tuple[int, int, Trigger]] = []  # (-기준가, 순번, 트리거)
+        self.dead = 0
+
+    def push(self, trigger: Trigger, seq: int) -> None:
+        trigger.seq = seq
+        if trigger.kind.fires_above:
+            heapq.heappush(self.above, (trigger.threshold, seq, trigger))
+        else:
+            heapq.heappush(self.below, (-trigger.threshold, seq, trigger))
+
+    def pop_hits(self, price: int) -> list[Trigger]:
+        fired = []
+        above, below = self.above, self.below
+        while above and (not _live(above[0]) or above[0][0] <= price):
+            self._take(heapq.heappop(above), fired)
+        while below and (not _live(below[0]) or -below[0][0] >= price):
+            self._take(heapq.heappop(below), fired)
+        return fired
+
+    def _take(self, entry: tuple[int, int, Trigger], fired: list[Trigger]) -> None:
+        if _live(entry):
+            entry[2].active = False
+            fired.append(entry[2])
+        else:
+            self.dead -= 1
+
+    def heads(self) -> tuple[Trigger | None, Trigger | None]:
+        """지연 삭제분을 걷어낸 (상향, 하향) top"""
+        for heap in (self.above, self.below):
+            while heap and not _live(heap[0]):
+                heapq.heappop(heap)
+                self.dead -= 1
+        return (
+            self.above[0][2] if self.above else None,
+            self.below[0][2] if self.below else None,
+        )
+
+    def compact(self) -> None:
+        """지연 삭제 항목 정리"""
+        if self.dead < COMPACT_MIN_DEAD or self.dead * 2 < len(self.above) + len(self.below):
+            return
+        self.above = [entry for entry in self.above if _live(entry)]
+        self.below = [entry for entry in self.below if _live(entry)]
+        heapq.heapify(self.above)
+        heapq.heapify(self.below)
+        self.dead = 0
+
+    def __len__(self) -> int:
+        return len(self.above) + len(self.below) - self.dead
+
+
+class TriggerEngine:
+    """종목별 가격 트리거 집합"""
+
+    def __init__(self):
+        self._books: dict[str, _SymbolBook] = {}
+        self._by_key: dict[str, Trigger] = {}
+        self._seq = itertools.count()
+
+    def add(self, trigger: Trigger) -> Trigger:
+        """조건 등록 (같은 key가 있으면 대체)"""
+        self.cancel(trigger.key)
+        trigger.active = True
+        self._by_key[trigger.key] = trigger
+        self._books.setdefault(trigger.symbol, _SymbolBook()).push(trigger, next(self._seq))
+        TRIGGERS_ARMED.set(len(self._by_key))
+        return trigger
+
+    def cancel(self, key: str) -> bool:
+        """조건 취소"""
+        trigger = self._by_key.pop(key, None)
+        if trigger is None:
+            return False
+        trigger.active = False
+        book = self._books[trigger.symbol]
+        book.dead += 1
+        book.compact()
+        TRIGGERS_ARMED.set(len(self._by_key))
+        return True
+
+    def on_tick(self, symbol: str, price: int) -> list[Trigger]:
+        """현재가 반영 → 발동한 조건 목록 (등록 해제됨)"""
+        book = self._books.get(symbol)
+        if book is None:
+            return []
+        fired = book.pop_hits(price)
+        for trigger in fired:
+            del self._by_key[trigger.key]
+            TRIGGERS_FIRED.labels(trigger.kind.value).inc()
+        if fired:
+            TRIGGERS_ARMED.set(len(self._by_key))
+        return fired
+
+    def get(self, key: str) -> Trigger | None:
+        return self._by_key.get(key)
+
+    def nearest(self, symbol: str) -> tuple[Trigger | None, Trigger | None]:
+        """현재 가장 가까운 (상향, 하향) 조건"""
+        book = self._books.get(symbol)
+        return book.heads() if book is not None else (None, None)
+
+    @property
+    def symbols(self) -> list[str]:
+        """대기 조건이 있는 종목 (시세 조회 대상)"""
+        return [symbol for symbol, book in self._books.items() if len(book)]
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+
+_engine: TriggerEngine | None = None
+
+
+def get_trigger_engine() -> TriggerEngine:
+    """프로세스 전역 트리거 엔진 (스케줄러 작업 간 조건 유지)"""
+    global _engine
+    if _engine is None:
+        _engine = TriggerEngine()
+    return _engine
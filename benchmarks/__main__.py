@@ -0,0 +1,57 @@
+"""벤치마크 실행기
+
+    uv run python -m benchmarks                       # 전체 실행, results/<commit>.json 저장
+    uv run python -m benchmarks --only strategy parsing
+    uv run python -m benchmarks --compare benchmarks/results/abc1234.json
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import sys
+from pathlib import Path
+
+from benchmarks.harness import compare, save_results
+
+SUITES = (
+    "strategy", "money", "triggers", "parsing", "metrics", "repository", "database", "trading_day"
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="kang-stock 벤치마크")
+    parser.add_argument("--only", nargs="+", choices=SUITES, help="실행할 스위트")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로")
+    parser.add_argument("--compare", type=Path, help="비교 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.10, help="회귀 판정 비율")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    results = []
+    for suite in args.only or SUITES:
+        module = importlib.import_module(f"benchmarks.bench_{suite}")
+        for result in module.run():
+            print(result)
+            results.append(result)
+
+    path = save_results(results, args.output)
+    print(f"\n결과 저장: {path}")
+
+    if args.compare:
+        current = json.loads(path.read_text(encoding="utf-8"))
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\n⚠️ 성능 회귀 ({args.threshold:.0%} 초과):")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print(f"회귀 없음 (기준: {baseline['commit']})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
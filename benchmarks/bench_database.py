@@ -0,0 +1,132 @@
+"""백엔드별 레포지토리 처리량 벤치마크 - SQLite(인메모리/WAL/기본 저널) vs Postgres
+
+같은 작업(포지션 조회/갱신, 주문 일괄 저장, keyset 페이지 조회, 평가 기록 upsert)을
+백엔드마다 실행한다. Postgres는 `BENCH_DATABASE_URL`에 postgresql URL을 주면 함께 측정한다.
+
+    uv run python -m benchmarks --only database
+"""
+
+import os
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal
+
+from app.common.money import Won
+from app.trading.models.daily_snapshot import DailySnapshot
+from app.trading.models.order import Order, OrderType
+from app.trading.repository.order import OrderRepository
+from app.trading.repository.position import PositionRepository
+from app.trading.repository.snapshot import SnapshotRepository
+from benchmarks.harness import BenchResult, bench_async, create_bench_sessionmaker, run_async
+
+ORDER_BATCH = 100
+SNAPSHOT_BATCH = 50
+
+
+def _backends() -> list[tuple[str, str, dict]]:
+    """(이름, URL, 엔진 옵션)"""
+    workdir = tempfile.mkdtemp(prefix="kang_bench_db_")
+    backends = [
+        ("sqlite_memory", "sqlite+aiosqlite:///:memory:", {}),
+        ("sqlite_wal", f"sqlite+aiosqlite:///{workdir}/wal.db", {}),
+        # SQLite 기본값 (롤백 저널, 커밋마다 fsync) - WAL 효과 비교용
+        (
+            "sqlite_delete",
+            f"sqlite+aiosqlite:///{workdir}/delete.db",
+            {"journal_mode": "delete", "synchronous": "full"},
+        ),
+    ]
+    url = os.environ.get("BENCH_DATABASE_URL", "")
+    if url.startswith("postgresql"):
+        backends.append(("postgres", url, {}))
+    return backends
+
+
+def _orders(start: int) -> list[Order]:
+    return [
+        Order(
+            symbol="133690",
+            order_type=OrderType.BUY,
+            price=Won(150000 + i % 100),
+            quantity=3,
+            cycle_number=1 + i // 40,
+            split_number=i % 40 + 1,
+        )
+        for i in range(start, start + ORDER_BATCH)
+    ]
+
+
+async def _run_backend(name: str, url: str, options: dict) -> list[BenchResult]:
+    engine, sessionmaker = await create_bench_sessionmaker(url, **options)
+    try:
+        async with sessionmaker() as session:
+            positions = PositionRepository(session)
+            orders = OrderRepository(session)
+            snapshots = SnapshotRepository(session)
+            position = await positions.create_or_get("133690", "TIGER미국나스닥100", Decimal("1e7"))
+            inserted = 0
+            day = [date(2026, 1, 1)]
+
+            async def read():
+                await positions.get_by_symbol("133690")
+
+            async def update():
+                position.update_after_buy(1, Decimal("167750"))
+                await positions.update(position)
+
+            async def insert_orders():
+                nonlocal inserted
+                session.add_all(_orders(inserted))
+                await session.commit()
+                inserted += ORDER_BATCH
+
+            async def page_orders():
+                page = await orders.page("133690", limit=100)
+                session.expunge_all()  # 식별 맵 누적 방지 (조회 비용만 측정)
+                return page
+
+            async def save_snapshots():
+                day[0] += timedelta(days=1)
+                await snapshots.save_many(
+                    [
+                        DailySnapshot(
+                            symbol=f"{i:06d}",
+                            trading_date=day[0],
+                            cycle_number=1,
+                            quantity=10,
+                            avg_price=Decimal("150000"),
+                            close=Decimal("151000"),
+                            investment=Decimal("10000000"),
+                            unrealized_pnl=Decimal("10000"),
+                            splits_used=1,
+                        )
+                        for i in range(SNAPSHOT_BATCH)
+                    ]
+                )
+
+            prefix = f"database.{name}"
+            return [
+                await bench_async(f"{prefix}.get_by_symbol", read, 300, unit="roundtrip"),
+                await bench_async(f"{prefix}.update", update, 100, unit="commit"),
+                await bench_async(
+                    f"{prefix}.insert_orders", insert_orders, 20, unit="row", batch=ORDER_BATCH
+                ),
+                await bench_async(f"{prefix}.page_orders", page_orders, 100, unit="page"),
+                await bench_async(
+                    f"{prefix}.save_snapshots", save_snapshots, 20, unit="row",
+                    batch=SNAPSHOT_BATCH,
+                ),
+            ]
+    finally:
+        await engine.dispose()
+
+
+async def _run() -> list[BenchResult]:
+    results = []
+    for name, url, options in _backends():
+        results.extend(await _run_backend(name, url, options))
+    return results
+
+
+def run() -> list[BenchResult]:
+    return run_async(_run())
@@ -0,0 +1,55 @@
+"""메트릭 관측 오버헤드 벤치마크
+
+관측 1회 비용이 예산(기본 1µs) 이내인지 확인한다.
+
+    uv run python -m benchmarks.bench_metrics
+"""
+
+import sys
+
+from app.common.metrics import MetricsRegistry
+from benchmarks.harness import BenchResult, bench
+
+BUDGET_NS = 1000
+ITERATIONS = 200_000
+
+
+def run() -> list[BenchResult]:
+    registry = MetricsRegistry()
+    hist = registry.histogram("bench_seconds", "bench", ("api_id",))
+    counter = registry.counter("bench_total", "bench", ("api_id", "code"))
+    gauge = registry.gauge("bench_depth", "bench")
+
+    baseline = bench("noop", lambda: None, ITERATIONS).per_op_ns
+    results = [
+        bench(
+            "metrics.histogram_observe",
+            lambda: hist.labels("ka10001").observe(0.042),
+            ITERATIONS,
+            unit="obs",
+        ),
+        bench(
+            "metrics.counter_inc",
+            lambda: counter.labels("kt10000", "1").inc(),
+            ITERATIONS,
+            unit="obs",
+        ),
+        bench("metrics.gauge_inc", gauge.inc, ITERATIONS, unit="obs"),
+    ]
+    # 람다 호출 비용 제외
+    for r in results:
+        r.per_op_ns = max(r.per_op_ns - baseline, 0.0)
+    return results
+
+
+def main() -> int:
+    failed = False
+    for result in run():
+        over = result.per_op_ns >= BUDGET_NS
+        failed |= over
+        print(f"{result}  [{'OVER BUDGET' if over else 'OK'}]")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""금액 표현 벤치마크 - Decimal vs 정수 원(Won)/고정소수점(Rate)
+
+전략 핫 루프(1회분 수량, 목표가, 매도 판단)를 같은 입력으로 두 방식으로 계산한다.
+avg_target은 DB에서 읽은 Decimal 평단가(0.01원 단위)로 매도 목표가를 계산한다.
+이 경로는 입력이 Decimal이라 Won/Rate로 계산해도 Decimal과 비슷하다 (측정 오차 수준).
+정수 연산 이득은 가격이 이미 정수인 daily_decision/sell_price_tick에서만 기대한다.
+"""
+
+from decimal import ROUND_CEILING, Decimal
+
+from app.common.money import UP, Rate, Won
+from app.trading.strategy.price_grid import STOCK_GRID
+from benchmarks.harness import BenchResult, bench
+
+N = 400
+
+
+def run() -> list[BenchResult]:
+    dec_prices = [Decimal(150000 + i * 25) for i in range(N)]
+    won_prices = [Won(150000 + i * 25) for i in range(N)]
+    dec_avg = Decimal("160123.45")
+    won_avg = Won(160123)
+
+    dec_split = Decimal("10000000") / Decimal(40)
+    dec_target = Decimal("1.10")
+    won_split = Won(10_000_000).split(40)
+    won_target = Rate.of("1.10")
+
+    def decimal_loop():
+        target = (dec_avg * dec_target).to_integral_value(rounding=ROUND_CEILING)
+        for price in dec_prices:
+            if price < target:
+                int(dec_split / price)
+
+    def won_loop():
+        target = won_target.apply(won_avg, UP)
+        for price in won_prices:
+            if price < target:
+                won_split // price
+
+    def decimal_sell_price():
+        for price in dec_prices:
+            target = price * dec_target
+            tick = Decimal(STOCK_GRID.tick_size(int(target)))
+            (target / tick).to_integral_value(rounding=ROUND_CEILING) * tick
+
+    def won_sell_price():
+        for price in won_prices:
+            STOCK_GRID.ceil(won_target.apply(price, UP))
+
+    dec_avgs = [Decimal(16012345 + i * 37) / 100 for i in range(N)]  # Numeric(15, 2) 값
+
+    def decimal_avg_target():
+        for avg in dec_avgs:
+            target = (avg * dec_target).to_integral_value(rounding=ROUND_CEILING)
+            tick = Decimal(STOCK_GRID.tick_size(int(target)))
+            (target / tick).to_integral_value(rounding=ROUND_CEILING) * tick
+
+    def won_avg_target():
+        for avg in dec_avgs:
+            STOCK_GRID.ceil(won_target.apply(avg, UP))
+
+    return [
+        bench("money.decimal.daily_decision", decimal_loop, 500, unit="calc", batch=N),
+        bench("money.won.daily_decision", won_loop, 500, unit="calc", batch=N),
+        bench("money.decimal.sell_price_tick", decimal_sell_price, 500, unit="calc", batch=N),
+        bench("money.won.sell_price_tick", won_sell_price, 500, unit="calc", batch=N),
+        bench("money.decimal.avg_target", decimal_avg_target, 500, unit="calc", batch=N),
+        bench("money.won.avg_target", won_avg_target, 500, unit="calc", batch=N),
+    ]
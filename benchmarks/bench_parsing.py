@@ -0,0 +1,127 @@
+"""키움 응답 디코딩 벤치마크 (JSON 파싱 + 도메인 객체 변환)"""
+
+import json
+import os
+
+from app.trading.external_api.kiwoom import (
+    parse_balance,
+    parse_holdings,
+    parse_pending_orders,
+    parse_price,
+)
+from benchmarks.harness import BenchResult, bench
+
+# api-id → 녹화 응답 파서
+CASSETTE_PARSERS = {
+    "ka10001": lambda data: parse_price(data.get("stk_cd", ""), data),
+    "kt00001": parse_balance,
+    "kt00018": parse_holdings,
+    "ka10075": parse_pending_orders,
+}
+
+PRICE_PAYLOAD = json.dumps({
+    "return_code": 0,
+    "return_msg": "정상적으로 처리되었습니다",
+    "stk_cd": "133690",
+    "stk_nm": "TIGER 미국나스닥100",
+    "cur_prc": "+167,750",
+    "base_pric": "166,100",
+    "flu_rt": "+0.99",
+})
+
+BALANCE_PAYLOAD = json.dumps({
+    "return_code": 0,
+    "entr": "000000010000000",
+    "ord_alow_amt": "000000009750000",
+})
+
+HOLDINGS_PAYLOAD = json.dumps({
+    "return_code": 0,
+    "acnt_evlt_remn_indv_tot": [
+        {
+            "stk_cd": f"A{100000 + i}",
+            "stk_nm": f"종목{i}",
+            "rmnd_qty": "000000000012",
+            "pur_pric": "000000160000",
+            "cur_prc": "000000167750",
+            "prft_rt": "4.84",
+        }
+        for i in range(20)
+    ],
+})
+
+PENDING_PAYLOAD = json.dumps({
+    "return_code": 0,
+    "oso": [
+        {
+            "ord_no": f"{1000000 + i}",
+            "stk_cd": "133690",
+            "trde_tp": "2" if i % 2 else "1",
+            "oso_qty": "1",
+            "ord_pric": "167750",
+        }
+        for i in range(20)
+    ],
+})
+
+
+def _cassette_cases(path: str) -> list[BenchResult]:
+    """녹화 파일(BENCH_CASSETTE)의 실제 응답으로 api-id별 디코딩 측정"""
+    from app.trading.external_api.cassette import load_cassette
+
+    payloads: dict[str, list[str]] = {}
+    for entry in load_cassette(path):
+        api_id = entry["request"]["headers"].get("api-id")
+        body = entry["response"]["body"]
+        if api_id in CASSETTE_PARSERS and isinstance(body, dict):
+            payloads.setdefault(api_id, []).append(json.dumps(body, ensure_ascii=False))
+
+    results = []
+    for api_id, bodies in sorted(payloads.items()):
+        parser = CASSETTE_PARSERS[api_id]
+
+        def decode_all(parser=parser, bodies=bodies) -> None:
+            for body in bodies:
+                parser(json.loads(body))
+
+        results.append(
+            bench(
+                f"parse.cassette.{api_id}",
+                decode_all,
+                max(1, 20_000 // len(bodies)),
+                unit="payload",
+                batch=len(bodies),
+            )
+        )
+    return results
+
+
+def run() -> list[BenchResult]:
+    cassette = os.environ.get("BENCH_CASSETTE")
+    extra = _cassette_cases(cassette) if cassette else []
+    return extra + [
+        bench(
+            "parse.ka10001_price",
+            lambda: parse_price("133690", json.loads(PRICE_PAYLOAD)),
+            20_000,
+            unit="payload",
+        ),
+        bench(
+            "parse.kt00001_balance",
+            lambda: parse_balance(json.loads(BALANCE_PAYLOAD)),
+            20_000,
+            unit="payload",
+        ),
+        bench(
+            "parse.kt00018_holdings_20",
+            lambda: parse_holdings(json.loads(HOLDINGS_PAYLOAD)),
+            2_000,
+            unit="payload",
+        ),
+        bench(
+            "parse.ka10075_pending_20",
+            lambda: parse_pending_orders(json.loads(PENDING_PAYLOAD)),
+            2_000,
+            unit="payload",
+        ),
+    ]
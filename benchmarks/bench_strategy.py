@@ -0,0 +1,41 @@
+"""InfiniteBuyStrategy 계산 처리량 벤치마크"""
+
+from decimal import Decimal
+
+from app.common.config import EmergencySellMode
+from app.common.money import Won
+from app.trading.strategy.infinite_buy import InfiniteBuyStrategy
+from benchmarks.harness import BenchResult, bench
+
+
+def run() -> list[BenchResult]:
+    strategy = InfiniteBuyStrategy(
+        total_investment=Decimal("10000000"),
+        num_splits=40,
+        profit_target=Decimal("1.10"),
+        emergency_sell_mode=EmergencySellMode.QUARTER,
+    )
+    # 시세는 파서에서 Won으로, 평단가는 DB(Numeric)에서 Decimal로 들어온다
+    prices = [Won(150000 + i * 25) for i in range(400)]
+    avg_price = Decimal("160000.00")
+
+    def buy_orders():
+        for price in prices:
+            strategy.calculate_buy_order(price, avg_price, 5)
+
+    def sell_checks():
+        for price in prices:
+            strategy.should_sell(price, avg_price)
+
+    def full_decision():
+        for i, price in enumerate(prices):
+            if not strategy.should_sell(price, avg_price):
+                strategy.calculate_buy_order(price, avg_price, i % 40)
+            strategy.calculate_sell_price(avg_price)
+
+    n = len(prices)
+    return [
+        bench("strategy.calculate_buy_order", buy_orders, 200, unit="calc", batch=n),
+        bench("strategy.should_sell", sell_checks, 200, unit="calc", batch=n),
+        bench("strategy.daily_decision", full_decision, 200, unit="calc", batch=n),
+    ]
@@ -0,0 +1,54 @@
+"""TradingService + MockStockAPI 종단간 거래일 시뮬레이션 벤치마크
+
+하루 = 09:00 매도 주문 → 14:30 매수 주문 → 15:40 체결 확인.
+"""
+
+import random
+from decimal import Decimal
+
+from benchmarks.harness import (
+    BenchResult,
+    bench_async,
+    create_bench_sessionmaker,
+    default_database_url,
+    ensure_settings_env,
+    run_async,
+)
+
+DAYS = 60
+
+
+async def _run(database_url: str) -> list[BenchResult]:
+    ensure_settings_env()
+
+    from app.common.config import settings
+    from app.trading.external_api.mock import MockStockAPI
+    from app.trading.services.trading import TradingService
+
+    engine, sessionmaker = await create_bench_sessionmaker(database_url)
+    rng = random.Random(42)
+    try:
+        async with sessionmaker() as session:
+            api = MockStockAPI()
+            api.set_balance(Decimal("100000000"))
+            service = TradingService(session, api)
+            await service.initialize_position()
+            price = Decimal("167750")
+
+            async def trading_day():
+                nonlocal price
+                price = (price * Decimal(str(1 + rng.gauss(0, 0.015)))).quantize(Decimal("5"))
+                api.set_price(settings.trading_symbol, price)
+                await service.execute_daily_sell_order()
+                await service.execute_daily_buy_order()
+                await service.check_order_execution()
+
+            return [
+                await bench_async("trading_day.mock_e2e", trading_day, DAYS, unit="day"),
+            ]
+    finally:
+        await engine.dispose()
+
+
+def run() -> list[BenchResult]:
+    return run_async(_run(default_database_url()))
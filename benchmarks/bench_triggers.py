@@ -0,0 +1,56 @@
+"""장중 트리거 엔진 벤치마크 - 조건 수에 따른 틱당 평가 비용
+
+종목 100개 × 종목당 조건 n개를 등록하고, 아무 조건도 발동하지 않는 틱(정상 상태)과
+매 틱 조건 1개가 발동·재등록되는 경우를 잰다. 전수 비교(should_sell 반복) 대비 기준선.
+"""
+
+import random
+
+from app.trading.strategy.triggers import Trigger, TriggerEngine, TriggerKind
+from benchmarks.harness import BenchResult, bench
+
+SYMBOLS = [f"{i:06d}" for i in range(100)]
+TICKS = 1000
+
+
+def _engine(per_symbol: int, rng: random.Random) -> tuple[TriggerEngine, list[Trigger]]:
+    engine = TriggerEngine()
+    triggers = []
+    for symbol in SYMBOLS:
+        for i in range(per_symbol):
+            kind = TriggerKind.TAKE_PROFIT if i % 2 else TriggerKind.STOP
+            threshold = rng.randint(110_000, 200_000) if i % 2 else rng.randint(1_000, 90_000)
+            triggers.append(engine.add(Trigger(symbol, kind, threshold, key=f"{symbol}:{i}")))
+    return engine, triggers
+
+
+def run() -> list[BenchResult]:
+    rng = random.Random(0)
+    ticks = [(rng.choice(SYMBOLS), rng.randint(95_000, 105_000)) for _ in range(TICKS)]
+    results = []
+
+    for per_symbol in (10, 100, 1000):
+        engine, triggers = _engine(per_symbol, rng)
+
+        def quiet_ticks():
+            for symbol, price in ticks:
+                engine.on_tick(symbol, price)
+
+        def brute_force():
+            for symbol, price in ticks:
+                [t for t in triggers if t.symbol == symbol and t.is_hit(price)]
+
+        def firing_ticks():
+            # 조건 1개 발동 → 같은 key로 재등록
+            for symbol, price in ticks:
+                trigger = engine.nearest(symbol)[0]
+                for fired in engine.on_tick(symbol, trigger.threshold):
+                    engine.add(fired)
+
+        n = per_symbol * len(SYMBOLS)
+        results.append(bench(f"triggers.tick.{n}", quiet_ticks, 20, unit="tick", batch=TICKS))
+        results.append(bench(f"triggers.fire.{n}", firing_ticks, 5, unit="tick", batch=TICKS))
+        if per_symbol <= 100:
+            name = f"triggers.brute_force.{n}"
+            results.append(bench(name, brute_force, 1, repeat=3, unit="tick", batch=TICKS))
+    return results
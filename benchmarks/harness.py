@@ -0,0 +1,170 @@
+"""벤치마크 공통 도구 - 측정, JSON 저장, 회귀 비교"""
+
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from app.common.utils import get_kst_now
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+@dataclass
+class BenchResult:
+    """벤치마크 결과 (best-of-N 기준)"""
+
+    name: str
+    iterations: int
+    per_op_ns: float
+    unit: str = "op"
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1e9 / self.per_op_ns if self.per_op_ns > 0 else float("inf")
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["ops_per_sec"] = round(self.ops_per_sec, 2)
+        data["per_op_ns"] = round(self.per_op_ns, 1)
+        return data
+
+    def __str__(self) -> str:
+        per_op = self.per_op_ns
+        if per_op >= 1e6:
+            text = f"{per_op / 1e6:10.2f} ms/{self.unit}"
+        elif per_op >= 1e3:
+            text = f"{per_op / 1e3:10.2f} µs/{self.unit}"
+        else:
+            text = f"{per_op:10.1f} ns/{self.unit}"
+        return f"{self.name:40s} {text}  ({self.ops_per_sec:,.0f}/s)"
+
+
+def bench(
+    name: str,
+    func: Callable[[], object],
+    iterations: int,
+    repeat: int = 5,
+    unit: str = "op",
+    batch: int = 1,
+) -> BenchResult:
+    """동기 함수 벤치마크 (func 1회 호출 = batch개 연산)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            func()
+        best = min(best, (time.perf_counter_ns() - start) / (iterations * batch))
+    return BenchResult(name, iterations, best, unit)
+
+
+async def bench_async(
+    name: str,
+    func: Callable[[], Awaitable[object]],
+    iterations: int,
+    repeat: int = 3,
+    unit: str = "op",
+    batch: int = 1,
+) -> BenchResult:
+    """코루틴 함수 벤치마크 (func 1회 호출 = batch개 연산)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            await func()
+        best = min(best, (time.perf_counter_ns() - start) / (iterations * batch))
+    return BenchResult(name, iterations, best, unit)
+
+
+def run_async(coro):
+    """동기 run() 안에서 비동기 벤치마크 실행"""
+    return asyncio.run(coro)
+
+
+def ensure_settings_env() -> None:
+    """벤치마크용 필수 설정 기본값 (.env 없이 실행 가능하도록)"""
+    for key, value in {
+        "KIWOOM_APP_KEY": "bench",
+        "KIWOOM_APP_SECRET": "bench",
+        "KIWOOM_ACCOUNT_NO": "00000000",
+        "DATABASE_URL": "sqlite+aiosqlite:///:memory:",
+        "TELEGRAM_BOT_TOKEN": "bench",
+        "TELEGRAM_CHAT_ID": "0",
+    }.items():
+        os.environ.setdefault(key, value)
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def save_results(results: list[BenchResult], path: Path | None = None) -> Path:
+    """결과를 JSON으로 저장 (기본: results/<commit>.json)"""
+    commit = _git_commit()
+    path = path or RESULTS_DIR / f"{commit}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "commit": commit,
+        "timestamp": get_kst_now().isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {r.name: r.to_dict() for r in results},
+    }
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.10) -> list[str]:
+    """기준 대비 threshold 이상 느려진 케이스 목록"""
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        ratio = result["per_op_ns"] / base["per_op_ns"] - 1
+        if ratio > threshold:
+            regressions.append(
+                f"{name}: {base['per_op_ns']:.1f} → {result['per_op_ns']:.1f} ns ({ratio:+.1%})"
+            )
+    return regressions
+
+
+async def create_bench_sessionmaker(database_url: str, **engine_options):
+    """벤치마크용 엔진/세션 팩토리 생성 및 테이블 생성 (engine_options: SQLite PRAGMA)
+
+    Returns:
+        (engine, sessionmaker)
+    """
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from app.common.database import Base, create_engine_for
+    from app.trading import models  # noqa: F401 - 메타데이터 등록
+
+    engine = create_engine_for(database_url, **engine_options)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    return engine, async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def default_database_url() -> str:
+    """BENCH_DATABASE_URL 또는 임시 SQLite 파일"""
+    import tempfile
+
+    url = os.environ.get("BENCH_DATABASE_URL")
+    if url:
+        return url
+    return f"sqlite+aiosqlite:///{tempfile.mkdtemp(prefix='kang_bench_')}/bench.db"
@@ -0,0 +1,141 @@
+"""KiwoomRestAPI 부하 테스트 - N개 종목 동시 요청 처리량/꼬리 지연시간
+
+기본은 프로세스 내 FakeKiwoomServer(ASGI)를 대상으로 하며,
+`--base-url`을 주면 별도로 띄운 fake 서버(uvicorn)를 대상으로 한다.
+
+    uv run python -m benchmarks.load_kiwoom --symbols 50 --requests 20 --latency-ms 30
+    uv run python -m benchmarks.load_kiwoom --symbols 100 --rate-limit 20 --mix order
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from collections import Counter
+from decimal import Decimal
+
+import httpx
+
+from benchmarks.harness import ensure_settings_env
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run_load(
+    symbols: int,
+    requests_per_symbol: int,
+    mix: str = "quote",
+    latency_ms: float = 0.0,
+    sigma: float = 0.0,
+    rate_limit: float | None = None,
+    error_rate: float = 0.0,
+    base_url: str | None = None,
+) -> dict:
+    """부하 실행 → 요약 통계"""
+    ensure_settings_env()
+
+    from app.trading.external_api.fake_server import FakeKiwoomServer, LatencyModel
+    from app.trading.external_api.kiwoom import KiwoomAPIError, KiwoomRestAPI
+
+    transport = None
+    if base_url is None:
+        latency = LatencyModel(
+            kind="lognormal" if sigma else "fixed", median=latency_ms / 1000, spread=sigma
+        )
+        server = FakeKiwoomServer(
+            latency=latency, rate_limit_per_sec=rate_limit, error_rate=error_rate, seed=7
+        )
+        transport = httpx.ASGITransport(app=server)
+
+    api = KiwoomRestAPI(transport=transport)
+    if base_url is not None:
+        api.base_url = base_url
+
+    latencies: list[float] = []
+    errors: Counter[str] = Counter()
+
+    async def timed(coro) -> None:
+        started = time.perf_counter()
+        try:
+            await coro
+        except KiwoomAPIError as e:
+            errors[e.code] += 1
+        except httpx.HTTPError as e:
+            errors[type(e).__name__] += 1
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    async def worker(symbol: str) -> None:
+        for i in range(requests_per_symbol):
+            if mix == "order" and i % 3 == 1:
+                await timed(api.buy(symbol, 1, Decimal("10000")))
+            elif mix == "order" and i % 3 == 2:
+                await timed(api.get_pending_orders())
+            else:
+                await timed(api.get_price(symbol))
+
+    await api.get_token()
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker(f"{100000 + i:06d}") for i in range(symbols)))
+    finally:
+        elapsed = time.perf_counter() - started
+        await api.close()
+
+    latencies.sort()
+    total = len(latencies)
+    return {
+        "symbols": symbols,
+        "requests": total,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_rps": round(total / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies) * 1000, 3) if latencies else 0.0,
+            "p50": round(_percentile(latencies, 50) * 1000, 3),
+            "p95": round(_percentile(latencies, 95) * 1000, 3),
+            "p99": round(_percentile(latencies, 99) * 1000, 3),
+            "max": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+        },
+        "errors": dict(errors),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="KiwoomRestAPI 부하 테스트")
+    parser.add_argument("--symbols", type=int, default=20, help="동시 종목 수")
+    parser.add_argument("--requests", type=int, default=20, help="종목당 요청 수")
+    parser.add_argument("--mix", choices=("quote", "order"), default="quote")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="fake 서버 지연 중앙값")
+    parser.add_argument("--sigma", type=float, default=0.5, help="지연 lognormal sigma")
+    parser.add_argument("--rate-limit", type=float, default=None, help="fake 서버 초당 요청 제한")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fake 서버 에러 주입 비율")
+    parser.add_argument("--base-url", default=None, help="외부 fake 서버 URL")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    summary = asyncio.run(
+        run_load(
+            symbols=args.symbols,
+            requests_per_symbol=args.requests,
+            mix=args.mix,
+            latency_ms=args.latency_ms,
+            sigma=args.sigma,
+            rate_limit=args.rate_limit,
+            error_rate=args.error_rate,
+            base_url=args.base_url,
+        )
+    )
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,12 +6,10 @@ import signal
 import sys
 
 from app.common.config import settings
-from app.common.database import async_session
+from app.common.profiling import configure_profiling
+from app.common.tracing import get_tracer
 from app.common.utils import get_kst_now
-from app.notifications.telegram import NotificationService
-from app.trading.external_api.kiwoom import KiwoomRestAPI
-from app.trading.services.scheduler import create_scheduler
-from app.trading.services.trading import TradingService
+from app.trading.services.scheduler import close_poll_api, create_scheduler
 
 # 로깅 설정
 logging.basicConfig(
@@ -24,6 +22,15 @@ logger = logging.getLogger(__name__)
 
 async def startup() -> None:
     """시작 시 초기화"""
+    from app.common.database import async_session
+    from app.notifications.telegram import NotificationService
+    from app.trading.external_api.kiwoom import KiwoomRestAPI
+    from app.trading.repository.position_cache import (
+        CachedPositionRepository,
+        get_position_cache,
+    )
+    from app.trading.services.trading import TradingService
+
     logger.info("=" * 50)
     logger.info("🚀 라오어 무한매수법 자동매매 시스템 시작")
     logger.info("=" * 50)
@@ -40,7 +47,13 @@ async def startup() -> None:
     async with async_session() as session:
         api = KiwoomRestAPI()
         notifier = NotificationService()
-        service = TradingService(session, api, notifier)
+        position_repo = None
+        if settings.position_cache_enabled:
+            # 전체 포지션을 캐시에 적재 - 이후 작업은 포지션을 DB에서 다시 읽지 않음
+            cache = get_position_cache()
+            await cache.load()
+            position_repo = CachedPositionRepository(session, cache)
+        service = TradingService(session, api, notifier, position_repo=position_repo)
 
         try:
             position = await service.initialize_position()
@@ -54,9 +67,45 @@ async def startup() -> None:
 
 async def main() -> None:
     """메인 함수"""
+    from app.common.database import init_db, warmup_pool
+
+    await init_db()  # 인메모리 SQLite면 테이블 생성
+    if settings.db_pool_warmup:
+        await warmup_pool()
+
+    # 쓰기 지연 저장 - 이전 실행에서 DB에 반영하지 못한 저널 기록부터 반영
+    writer = None
+    if settings.write_behind_enabled:
+        from app.trading.repository.write_behind import get_write_behind
+
+        writer = get_write_behind()
+        await writer.start()
+
     # 초기화
     await startup()
 
+    # 트레이싱
+    if settings.tracing_exporter != "none":
+        from app.common.tracing import configure_tracing
+
+        configure_tracing(
+            settings.tracing_exporter,
+            file_path=settings.tracing_file,
+            otlp_endpoint=settings.tracing_otlp_endpoint,
+            sample_ratio=settings.tracing_sample_ratio,
+            slow_threshold=settings.tracing_slow_threshold,
+        )
+
+    # 프로파일링 (PROFILE_JOBS 예약, SIGUSR1로 다음 작업 1회 예약)
+    profiler = configure_profiling(settings.profile_dir, settings.profile_jobs)
+
+    # 메트릭 엔드포인트
+    metrics_server = None
+    if settings.metrics_enabled:
+        from app.common.metrics import start_metrics_server
+
+        metrics_server = await start_metrics_server(settings.metrics_host, settings.metrics_port)
+
     # 스케줄러 생성 및 시작
     scheduler = create_scheduler()
     scheduler.start()
@@ -71,6 +120,7 @@ async def main() -> None:
 
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, signal_handler)
+    loop.add_signal_handler(signal.SIGUSR1, profiler.arm)
 
     logger.info("스케줄러 실행 중... (Ctrl+C로 종료)")
 
@@ -79,6 +129,14 @@ async def main() -> None:
         await stop_event.wait()
     finally:
         scheduler.shutdown()
+        await close_poll_api()
+        if writer is not None:
+            await writer.stop()
+        if metrics_server is not None:
+            metrics_server.close()
+        exporter = get_tracer().exporter
+        if exporter is not None:
+            await exporter.shutdown()
         logger.info("스케줄러 종료됨")
 
 
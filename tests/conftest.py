@@ -16,3 +16,50 @@ def sample_position_data():
         "current_investment": 10000000,
         "initial_investment": 10000000,
     }
+
+
+@pytest.fixture
+def settings_env(monkeypatch):
+    """테스트용 필수 설정 (.env 없이 Settings 생성)"""
+    from app.common.config import get_settings
+
+    for key, value in {
+        "KIWOOM_APP_KEY": "test_key",
+        "KIWOOM_APP_SECRET": "test_secret",
+        "KIWOOM_ACCOUNT_NO": "00000000",
+        "DATABASE_URL": "sqlite+aiosqlite:///:memory:",
+        "TELEGRAM_BOT_TOKEN": "test_token",
+        "TELEGRAM_CHAT_ID": "0",
+        "TRADING_SYMBOL": "133690",
+    }.items():
+        monkeypatch.setenv(key, value)
+
+    get_settings.cache_clear()
+    yield get_settings()
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def fake_server_options():
+    """fake_server 생성 옵션 (테스트 모듈에서 덮어써 page_size/latency 지정)"""
+    return {}
+
+
+@pytest.fixture
+def fake_server(fake_server_options):
+    """Fake 키움 서버 (시드 고정)"""
+    from app.trading.external_api.fake_server import FakeKiwoomServer
+
+    return FakeKiwoomServer(**{"seed": 1, **fake_server_options})
+
+
+@pytest.fixture
+async def kiwoom_api(settings_env, fake_server):
+    """fake_server에 직접 연결한 키움 REST 어댑터"""
+    import httpx
+
+    from app.trading.external_api.kiwoom import KiwoomRestAPI
+
+    client = KiwoomRestAPI(transport=httpx.ASGITransport(app=fake_server))
+    yield client
+    await client.close()
@@ -0,0 +1,67 @@
+"""계좌 스냅샷 테스트"""
+
+from decimal import Decimal
+
+import pytest
+
+from app.common.config import Settings
+from app.common.money import Won
+from app.trading.external_api.fake_server import FakeKiwoomServer
+from app.trading.repository.memory import (
+    InMemoryOrderRepository,
+    InMemoryPositionRepository,
+    InMemorySession,
+)
+from app.trading.services.account import AccountSnapshot
+from app.trading.services.trading import TradingService
+
+ACCOUNT_APIS = ("kt00001", "kt00018", "ka10075")  # 잔고, 보유, 미체결
+
+
+def _account_calls(server: FakeKiwoomServer) -> dict[str, int]:
+    return {api_id: server.request_counts.get(api_id, 0) for api_id in ACCOUNT_APIS}
+
+
+async def test_check_execution_reads_account_once(kiwoom_api, fake_server):
+    config = Settings.model_construct(
+        trading_symbol="133690", trading_symbols="133690,379800", kiwoom_account_no="1"
+    )
+    session = InMemorySession()
+    service = TradingService(
+        session,
+        kiwoom_api,
+        position_repo=InMemoryPositionRepository(),
+        order_repo=InMemoryOrderRepository(session),
+        config=config,
+    )
+    bought = await service.position_repo.create_or_get("133690", "A", Decimal("10000000"))
+    sold = await service.position_repo.create_or_get("379800", "B", Decimal("10000000"))
+    sold.update_after_buy(10, Won(10000))
+    fake_server.add_holding("133690", 5, 150000)
+
+    await service.check_order_execution()
+
+    assert bought.quantity == 5 and bought.avg_price == 150000
+    assert sold.quantity == 0 and sold.cycle_count == 2  # 사이클 완료 (잔고도 스냅샷에서)
+    assert _account_calls(fake_server) == {"kt00001": 1, "kt00018": 1, "ka10075": 1}
+
+    await service.check_order_execution()  # 다음 작업은 이전 스냅샷을 쓰지 않음
+    assert _account_calls(fake_server) == {"kt00001": 2, "kt00018": 2, "ka10075": 2}
+
+
+async def test_snapshot_refetches_only_after_invalidate(kiwoom_api, fake_server):
+    snapshot = AccountSnapshot(kiwoom_api)
+    await snapshot.ensure()
+    await snapshot.ensure()
+    assert _account_calls(fake_server) == {"kt00001": 1, "kt00018": 1, "ka10075": 1}
+
+    await kiwoom_api.buy("133690", 1, Won(150000))
+    snapshot.invalidate()
+    with pytest.raises(RuntimeError):
+        snapshot.pending_orders("133690")  # 무효화된 스냅샷은 읽지 않음
+    account = await snapshot.ensure()
+
+    [pending] = account.pending_orders("133690")
+    assert pending.order_type == "BUY"
+    assert account.balance.available_amount == fake_server.account.deposit - 150000
+    assert _account_calls(fake_server) == {"kt00001": 2, "kt00018": 2, "ka10075": 2}
@@ -0,0 +1,127 @@
+"""성과 통계 (SQL 집계) 테스트"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.common.config import Settings
+from app.common.database import Base
+from app.common.money import Won
+from app.trading.models.cycle_history import CycleHistory
+from app.trading.models.order import Order, OrderStatus, OrderType
+from app.trading.repository.analytics import AnalyticsRepository
+from app.trading.services.trading import TradingService
+
+START = datetime(2024, 1, 2, 14, 30)
+
+
+@pytest.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+def _cycle(symbol, number, start, end, started_at, days) -> CycleHistory:
+    history = CycleHistory.create_from_position(
+        symbol=symbol,
+        cycle_number=number,
+        start_investment=Won(start),
+        end_proceeds=Won(end),
+        total_trades=10,
+        started_at=started_at,
+    )
+    history.ended_at = started_at + timedelta(days=days)
+    return history
+
+
+async def test_cycle_stats(session):
+    # +10% → -10% → +10% (다음 사이클은 직전 종료 금액으로 시작)
+    session.add_all(
+        [
+            _cycle("133690", 1, 10_000_000, 11_000_000, START, 10),
+            _cycle("133690", 2, 11_000_000, 9_900_000, START + timedelta(days=10), 20),
+            _cycle("133690", 3, 9_900_000, 10_890_000, START + timedelta(days=30), 30),
+            _cycle("379800", 1, 5_000_000, 5_500_000, START, 5),
+        ]
+    )
+    await session.commit()
+
+    repo = AnalyticsRepository(session)
+    stats, other = await repo.cycle_stats()
+    assert (stats.symbol, stats.cycles, stats.wins) == ("133690", 3, 2)
+    assert stats.win_rate == pytest.approx(2 / 3)
+    assert stats.avg_cycle_days == pytest.approx(20)
+    assert stats.avg_profit_rate == pytest.approx(0.1 / 3)
+    assert stats.total_profit == Decimal("890000")
+    assert stats.cumulative_return == pytest.approx(0.089)
+    assert stats.max_drawdown == pytest.approx(0.1)  # 11,000,000 → 9,900,000
+
+    assert other.max_drawdown == 0.0 and other.cumulative_return == pytest.approx(0.1)
+    assert [s.symbol for s in await repo.cycle_stats("379800")] == ["379800"]
+
+
+async def test_cycle_breakdown_from_orders(session):
+    prices = [150000, 160000, 144000, 152000]  # 체결가 160,000 → 144,000 (-10%)
+    for i, price in enumerate(prices):
+        order = Order(
+            symbol="133690",
+            order_type=OrderType.BUY,
+            price=Won(price + 1000),  # 지정가가 아닌 체결가로 집계
+            quantity=3,
+            cycle_number=1,
+            split_number=i + 1,
+            created_at=START + timedelta(days=i),
+        )
+        order.mark_filled(2, Won(price))  # 일부 체결
+        session.add(order)
+    excluded = (OrderStatus.FAILED, OrderStatus.PENDING, OrderStatus.CANCELLED)
+    for split, status in enumerate(excluded, start=5):
+        session.add(
+            Order(
+                symbol="133690",
+                order_type=OrderType.BUY,
+                price=Won(100000),
+                quantity=2,
+                cycle_number=1,
+                split_number=split,
+                status=status,  # 체결 확인 전/미체결은 제외
+                created_at=START + timedelta(days=split),
+            )
+        )
+    session.add(_cycle("133690", 1, 10_000_000, 11_000_000, START, 10))
+    await session.commit()
+
+    [cycle] = await AnalyticsRepository(session).cycle_breakdown()
+    assert (cycle.cycle_number, cycle.buys) == (1, 4)
+    assert cycle.invested == Decimal(sum(prices) * 2)
+    assert cycle.first_buy_at == START and cycle.last_buy_at == START + timedelta(days=3)
+    assert cycle.max_drawdown == pytest.approx(0.1)
+    assert cycle.profit_rate == Decimal("0.1000")
+
+
+async def test_failed_view_refresh_rolls_back(session, monkeypatch):
+    # SQLite엔 구체화 뷰가 없어 REFRESH가 실패 - Postgres처럼 중단된 트랜잭션을 남기면 안 됨
+    rollbacks = []
+    rollback = session.rollback
+
+    async def tracked():
+        rollbacks.append(True)
+        await rollback()
+
+    monkeypatch.setattr(session, "rollback", tracked)
+    service = TradingService(
+        session, api=None, config=Settings.model_construct(analytics_materialized_view=True)
+    )
+    await service._refresh_analytics()
+
+    assert rollbacks
+    session.add(_cycle("133690", 1, 10_000_000, 11_000_000, START, 10))
+    await session.commit()  # 이후 쓰기는 정상
+    [stats] = await AnalyticsRepository(session).cycle_stats()
+    assert stats.cycles == 1
@@ -0,0 +1,134 @@
+"""이벤트 기반 백테스트 테스트"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.common.config import EmergencySellMode
+from app.trading.backtest import (
+    BacktestConfig,
+    Backtester,
+    Bar,
+    PriceReplayAPI,
+    run_backtest,
+)
+from app.trading.backtest.replay import OrderRejectedError
+
+
+def _bars(closes: list[int], start: date = date(2024, 1, 1)) -> list[Bar]:
+    """종가 목록 → 일봉 (시가 = 전일 종가)"""
+    bars = []
+    prev = Decimal(closes[0])
+    for i, c in enumerate(closes):
+        close = Decimal(c)
+        bars.append(
+            Bar(start + timedelta(days=i), prev, max(prev, close), min(prev, close), close)
+        )
+        prev = close
+    return bars
+
+
+@pytest.fixture
+def config():
+    return BacktestConfig(total_investment=Decimal("1000000"), num_splits=10)
+
+
+@pytest.mark.asyncio
+async def test_cycle_completes_on_target(config):
+    """매수 누적 후 목표가 도달 시 매도 체결 → 사이클 완료"""
+    bars = _bars([10000] * 5 + [11500, 11500])
+
+    result = await run_backtest(bars, config)
+
+    assert len(result.cycles) == 1
+    cycle = result.cycles[0]
+    assert cycle.total_trades == 5
+    assert cycle.profit > 0
+    assert cycle.ended_at.date() == bars[5].date
+    assert result.final_equity > config.total_investment
+    assert not result.errors
+
+
+@pytest.mark.asyncio
+async def test_orders_follow_service_path(config):
+    """주문 기록은 TradingService가 만든 Order 그대로"""
+    result = await run_backtest(_bars([10000] * 3), config)
+
+    assert [o.order_type for o in result.orders] == ["BUY", "SELL", "BUY", "SELL", "BUY"]
+    assert all(o.kiwoom_order_id.startswith("BT") for o in result.orders)
+    assert all(o.client_order_id for o in result.orders)  # 운영과 같은 선기록 제출 경로
+    assert result.orders[0].quantity == 10  # 100,000원 / 10,000원
+
+
+@pytest.mark.asyncio
+async def test_emergency_sell_updates_position(config):
+    """분할 소진 → 쿼터 매도 체결이 포지션 수량에 반영"""
+    closes = [10000 - i * 100 for i in range(12)]
+
+    backtester = Backtester(config)
+    result = await backtester.run(_bars(closes))
+
+    emergency = [o for o in result.orders if o.order_type == "SELL" and o.split_number == 0]
+    assert emergency
+    position = await backtester.position_repo.get_by_symbol(config.symbol)
+    assert position.quantity == backtester.api.quantity
+    assert not result.errors
+
+
+@pytest.mark.asyncio
+async def test_wait_mode_holds(config):
+    """대기 모드는 긴급 매도 없음"""
+    config.emergency_sell_mode = EmergencySellMode.WAIT
+    closes = [10000 - i * 100 for i in range(15)]
+
+    result = await run_backtest(_bars(closes), config)
+
+    buys = [o for o in result.orders if o.order_type == "BUY"]
+    assert len(buys) == config.num_splits
+    assert result.max_drawdown > 0
+
+
+@pytest.mark.asyncio
+async def test_replay_api_rejects_oversell():
+    """보유 수량 초과 매도는 거부"""
+    api = PriceReplayAPI("133690", Decimal("1000000"))
+    api.start_day(_bars([10000])[0])
+
+    with pytest.raises(OrderRejectedError):
+        await api.sell("133690", 1, Decimal("10000"))
+
+
+@pytest.mark.asyncio
+async def test_intraday_order_does_not_fill_at_earlier_open():
+    """14:30 주문은 제출 전 시가/저가로 체결하지 않음 (미래 정보 사용 방지)"""
+    api = PriceReplayAPI("133690", Decimal("1000000"))
+    # 시가 10000 → 종가 11000
+    api.start_day(Bar(date(2024, 1, 1), *map(Decimal, (10000, 11000, 10000, 11000))))
+    api.intraday()
+    marketable = await api.buy("133690", 10, Decimal("11000"))
+    below_close = await api.buy("133690", 10, Decimal("10500"))  # 저가는 장중 이전
+
+    filled = api.close_day()
+
+    assert filled == [marketable]
+    assert marketable.price == Decimal("11000")
+    assert below_close.status == "PENDING"
+    assert api.cash == Decimal("1000000") - Decimal("110000")
+
+
+@pytest.mark.asyncio
+async def test_open_order_gets_gap_price():
+    """09:00 매도는 시가가 지정가보다 높게 열리면 시가로 체결"""
+    api = PriceReplayAPI("133690", Decimal("1000000"))
+    api.start_day(_bars([10000])[0])
+    api.intraday()
+    await api.buy("133690", 10, Decimal("10000"))
+    api.close_day()
+
+    api.start_day(Bar(date(2024, 1, 2), *map(Decimal, (12000, 12500, 11500, 12000))))
+    sell = await api.sell("133690", 10, Decimal("11000"))
+    api.intraday()
+    api.close_day()
+
+    assert sell.status == "FILLED" and sell.price == Decimal("12000")
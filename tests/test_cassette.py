@@ -0,0 +1,71 @@
+"""키움 API 녹화/재생 테스트"""
+
+import json
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from app.trading.external_api.cassette import (
+    REDACTED,
+    CassetteMissError,
+    RecordingTransport,
+    ReplayTransport,
+)
+from app.trading.external_api.fake_server import FakeKiwoomServer
+from app.trading.external_api.kiwoom import KiwoomRestAPI
+
+
+async def _session(api: KiwoomRestAPI) -> tuple:
+    price = await api.get_price("133690")
+    order = await api.buy("133690", 1, price.current_price)
+    pending = await api.get_pending_orders()
+    return price, order.order_id, [o.order_id for o in pending]
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay(settings_env, tmp_path):
+    """녹화한 세션을 네트워크 없이 동일하게 재생"""
+    path = tmp_path / "cassette.jsonl"
+    server = FakeKiwoomServer(seed=3)
+    recorder = RecordingTransport(path, inner=httpx.ASGITransport(app=server))
+
+    api = KiwoomRestAPI(transport=recorder)
+    recorded = await _session(api)
+    await api.close()
+
+    replay_api = KiwoomRestAPI(transport=ReplayTransport(path, strict=True))
+    replayed = await _session(replay_api)
+    await replay_api.close()
+
+    assert replayed == recorded
+
+
+@pytest.mark.asyncio
+async def test_credentials_redacted(settings_env, tmp_path):
+    """appkey/secretkey/token/Authorization은 파일에 남지 않음"""
+    path = tmp_path / "cassette.jsonl"
+    recorder = RecordingTransport(path, inner=httpx.ASGITransport(app=FakeKiwoomServer()))
+
+    api = KiwoomRestAPI(transport=recorder)
+    await api.get_price("133690")
+    await api.close()
+
+    text = path.read_text()
+    assert "test_secret" not in text
+    assert "test_key" not in text
+    assert "Bearer" not in text
+
+    token_entry = json.loads(text.splitlines()[0])
+    assert token_entry["request"]["body"]["secretkey"] == REDACTED
+    assert token_entry["response"]["body"]["token"] == REDACTED
+
+
+@pytest.mark.asyncio
+async def test_replay_miss_strict(settings_env):
+    """녹화에 없는 요청은 CassetteMissError"""
+    api = KiwoomRestAPI(transport=ReplayTransport(entries=[], strict=True))
+
+    with pytest.raises(CassetteMissError):
+        await api.buy("133690", 1, Decimal("1000"))
+    await api.close()
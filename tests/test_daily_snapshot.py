@@ -0,0 +1,121 @@
+"""장 마감 평가 기록 / 평가 시계열 테스트"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import httpx
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.common.config import Settings
+from app.common.database import Base
+from app.common.money import Won
+from app.common.utils import get_kst_now
+from app.trading.external_api.fake_server import FakeKiwoomServer
+from app.trading.external_api.kiwoom import KiwoomRestAPI
+from app.trading.models.cycle_history import CycleHistory
+from app.trading.models.daily_snapshot import DailySnapshot
+from app.trading.repository.memory import InMemoryPositionRepository
+from app.trading.repository.snapshot import SnapshotRepository
+from app.trading.services.trading import TradingService
+
+DAY = date(2026, 1, 5)
+
+
+@pytest.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+class ReportRecorder:
+    def __init__(self):
+        self.reports = []
+
+    async def send_daily_report(self, position, stats=None):
+        self.reports.append((position.symbol, stats))
+
+
+async def test_close_day_records_snapshots_and_reports(settings_env, session):
+    server = FakeKiwoomServer(seed=1)
+    api = KiwoomRestAPI(transport=httpx.ASGITransport(app=server))
+    notifier = ReportRecorder()
+    service = TradingService(
+        session,
+        api,
+        notifier,
+        position_repo=InMemoryPositionRepository(),
+        config=Settings.model_construct(kiwoom_account_no="1"),
+    )
+    held = await service.position_repo.create_or_get("133690", "A", Decimal("10000000"))
+    held.update_after_buy(10, Won(150000))
+    await service.position_repo.create_or_get("379800", "B", Decimal("5000000"))
+    session.add(
+        CycleHistory.create_from_position(
+            "133690", 1, Won(10_000_000), Won(11_000_000), 40, datetime(2025, 12, 1)
+        )
+    )
+    await session.commit()
+
+    snapshots = await service.close_day()
+    by_symbol = {s.symbol: s for s in snapshots}
+    assert by_symbol["133690"].unrealized_pnl == (by_symbol["133690"].close - 150000) * 10
+    assert by_symbol["379800"].unrealized_pnl == 0 and by_symbol["379800"].avg_price is None
+
+    reports = dict(notifier.reports)
+    assert reports["133690"].cycles == 1 and reports["379800"] is None
+
+    # 같은 날 재실행은 덮어쓰기, 다음 날은 추가
+    await service.record_daily_snapshots()
+    await service.record_daily_snapshots(get_kst_now().date() + timedelta(days=1))
+    count = await session.scalar(select(func.count()).select_from(DailySnapshot))
+    assert count == 4
+    await api.close()
+
+
+def _snapshot(symbol, day, investment, unrealized, quantity=10) -> DailySnapshot:
+    return DailySnapshot(
+        symbol=symbol,
+        trading_date=DAY + timedelta(days=day),
+        cycle_number=1,
+        quantity=quantity,
+        avg_price=Decimal("1000"),
+        close=Decimal(1000) + Decimal(unrealized) / quantity,
+        investment=Decimal(investment),
+        unrealized_pnl=Decimal(unrealized),
+        splits_used=1,
+    )
+
+
+async def test_pnl_series_and_drawdown(session):
+    np = pytest.importorskip("numpy")
+    from app.trading.services.equity import load_pnl_series
+
+    await SnapshotRepository(session).save_many(
+        [
+            _snapshot("133690", 0, 10_000, 0),
+            _snapshot("379800", 0, 5_000, 0),
+            _snapshot("133690", 1, 10_000, 2_000),
+            _snapshot("379800", 1, 5_000, 1_000),
+            _snapshot("133690", 2, 10_000, -1_000),
+            _snapshot("379800", 2, 5_000, -500),
+            _snapshot("133690", 3, 10_000, 500),  # 379800 기록 누락
+        ]
+    )
+
+    total = await load_pnl_series(session)
+    assert total.dates.tolist() == [DAY + timedelta(days=d) for d in range(4)]
+    np.testing.assert_allclose(total.equity, [15_000, 18_000, 13_500, 10_500])
+    np.testing.assert_allclose(total.cost, [20_000, 20_000, 20_000, 10_000])
+    np.testing.assert_allclose(total.market_value, total.cost + total.unrealized_pnl)
+    np.testing.assert_allclose(total.drawdown, [0, 0, -0.25, 10_500 / 18_000 - 1])
+    assert total.max_drawdown == pytest.approx(1 - 10_500 / 18_000)
+
+    one = await load_pnl_series(session, "133690", since=DAY + timedelta(days=1))
+    np.testing.assert_allclose(one.unrealized_pnl, [2_000, -1_000, 500])
+    np.testing.assert_allclose(one.returns, [-3_000 / 12_000, 1_500 / 9_000])
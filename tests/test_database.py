@@ -0,0 +1,114 @@
+"""SQLite 백엔드 테스트"""
+
+from decimal import Decimal
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.common import database
+from app.common.database import Base, create_engine_for
+from app.trading import models  # noqa: F401 - 메타데이터 등록
+from app.trading.repository.position import PositionRepository
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+async def test_sqlite_file_uses_wal(tmp_path):
+    engine = create_engine_for(f"sqlite+aiosqlite:///{tmp_path / 'nested' / 'db.sqlite'}")
+    async with engine.connect() as conn:
+        assert await conn.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert await conn.scalar(text("PRAGMA synchronous")) == 1  # NORMAL
+        assert await conn.scalar(text("PRAGMA foreign_keys")) == 1
+    await engine.dispose()
+
+
+async def test_in_memory_database_is_shared_across_sessions(settings_env):
+    await database.init_db()
+    try:
+        async with database.async_session() as session:
+            await PositionRepository(session).create_or_get("133690", "A", Decimal("10000000"))
+        async with database.async_session() as session:
+            assert await PositionRepository(session).get_by_symbol("133690") is not None
+    finally:
+        await database.dispose_engine()
+
+
+def test_migrations_run_on_sqlite(settings_env, monkeypatch, tmp_path):
+    from alembic.config import Config
+
+    from alembic import command
+    from app.common.config import get_settings
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+    get_settings.cache_clear()
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+
+    command.upgrade(config, "head")
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    with engine.connect() as conn:
+        tables = set(inspect(conn).get_table_names())
+    engine.dispose()
+    assert set(Base.metadata.tables) <= tables
+
+    command.downgrade(config, "base")
+
+
+async def test_pool_reports_checkout_wait_and_connections(tmp_path):
+    engine = create_engine_for(
+        f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}", pool_size=2, max_overflow=0
+    )
+    assert isinstance(engine.pool, database.TimedQueuePool)
+    waits = database.POOL_CHECKOUT_WAIT._default().count
+
+    async with engine.connect() as first, engine.connect() as second:
+        await first.exec_driver_sql("SELECT 1")
+        await second.exec_driver_sql("SELECT 1")
+        assert database.POOL_CHECKED_OUT._default().value == 2
+        assert database.POOL_CONNECTIONS._default().value == 2
+    assert database.POOL_CHECKED_OUT._default().value == 0
+    assert database.POOL_CONNECTIONS._default().value == 2
+    assert database.POOL_CHECKOUT_WAIT._default().count == waits + 2
+    await engine.dispose()
+
+
+async def test_warmup_opens_pool_connections(settings_env, monkeypatch, tmp_path):
+    from app.common.config import get_settings
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    get_settings.cache_clear()
+    try:
+        assert await database.warmup_pool() == 3
+        assert database.get_engine().pool.checkedin() == 3
+    finally:
+        await database.dispose_engine()
+
+
+async def test_scheduled_job_closes_its_session(monkeypatch):
+    from app.trading.services import scheduler
+
+    closed = []
+
+    class _Session:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            closed.append("session")
+
+    class _API:
+        async def close(self):
+            closed.append("api")
+
+    async def _failing_service(session, api):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(database, "async_session", _Session)
+    monkeypatch.setattr(scheduler, "_create_api", _API)
+    monkeypatch.setattr(scheduler, "_get_trading_service", _failing_service)
+    monkeypatch.setattr(scheduler, "is_weekday", lambda: True)
+
+    await scheduler.job_check_execution()
+    assert closed == ["session", "api"]
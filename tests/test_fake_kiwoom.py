@@ -0,0 +1,96 @@
+"""Fake 키움 서버 + KiwoomRestAPI 통합 테스트"""
+
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from app.trading.external_api.fake_server import FakeKiwoomServer
+from app.trading.external_api.kiwoom import KiwoomAPIError, KiwoomRestAPI
+
+
+@pytest.fixture
+def server():
+    return FakeKiwoomServer(seed=1, page_size=3)
+
+
+@pytest.fixture
+async def api(settings_env, server):
+    client = KiwoomRestAPI(transport=httpx.ASGITransport(app=server))
+    yield client
+    await client.close()
+
+
+class TestFakeKiwoomServer:
+    """KiwoomRestAPI ↔ FakeKiwoomServer"""
+
+    @pytest.mark.asyncio
+    async def test_get_price(self, api, server):
+        """현재가 조회"""
+        server.set_price("133690", 167750)
+
+        price = await api.get_price("133690")
+
+        assert price.symbol_name == "FAKE133690"
+        assert price.current_price > 0
+
+    @pytest.mark.asyncio
+    async def test_order_pending_then_fill(self, api, server):
+        """매수 → 미체결 → 체결 후 보유종목/잔고 반영"""
+        result = await api.buy("133690", 2, Decimal("167750"))
+
+        pending = await api.get_pending_orders()
+        assert [o.order_id for o in pending] == [result.order_id]
+        assert pending[0].order_type == "BUY"
+
+        server.fill_all()
+
+        holdings = await api.get_holdings()
+        assert holdings[0].quantity == 2
+        assert holdings[0].avg_price == Decimal("167750")
+        balance = await api.get_balance()
+        assert balance.total_deposit == Decimal(100_000_000 - 2 * 167750)
+
+    @pytest.mark.asyncio
+    async def test_cancel_order(self, api):
+        """주문 취소"""
+        result = await api.sell("133690", 1, Decimal("180000"))
+
+        assert await api.cancel_order(result.order_id, "133690") is True
+        assert await api.get_pending_orders() == []
+        assert await api.cancel_order(result.order_id, "133690") is False
+
+    @pytest.mark.asyncio
+    async def test_holdings_pagination(self, api, server):
+        """연속조회: page_size를 넘는 보유종목 전체 수집"""
+        for i in range(8):
+            server.add_holding(f"{100000 + i}", 1, 10000)
+
+        holdings = await api.get_holdings()
+
+        assert len(holdings) == 8
+        assert server.request_counts["kt00018"] == 3
+
+    @pytest.mark.asyncio
+    async def test_token_issued_once_under_concurrency(self, api, server):
+        """동시 요청에도 토큰은 1회만 발급"""
+        import asyncio
+
+        await asyncio.gather(*(api.get_price(f"{i:06d}") for i in range(10)))
+
+        assert server.request_counts["token"] == 1
+
+    @pytest.mark.asyncio
+    async def test_throttling_error(self, settings_env):
+        """초당 요청 제한 초과 시 KiwoomAPIError(5)"""
+        server = FakeKiwoomServer(rate_limit_per_sec=2)
+        client = KiwoomRestAPI(transport=httpx.ASGITransport(app=server))
+
+        try:
+            await client.get_price("133690")  # 토큰 + 1회
+            with pytest.raises(KiwoomAPIError) as exc:
+                await client.get_price("133690")
+        finally:
+            await client.close()
+
+        assert exc.value.code == "5"
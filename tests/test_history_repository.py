@@ -0,0 +1,134 @@
+"""주문/사이클 기록 조회 및 내보내기 테스트"""
+
+import csv
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.common.database import Base
+from app.common.money import Won
+from app.trading.export import export
+from app.trading.models.cycle_history import CycleHistory
+from app.trading.models.order import Order, OrderType
+from app.trading.repository.cycle_history import CycleHistoryRepository
+from app.trading.repository.keyset import Cursor
+from app.trading.repository.order import OrderRepository
+
+START = datetime(2024, 1, 2, 9, 0)
+
+
+@pytest.fixture
+async def sessions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with sessions() as session:
+        for i in range(25):
+            session.add(
+                Order(
+                    symbol="133690" if i % 2 else "379800",
+                    order_type=OrderType.BUY,
+                    price=Won(150000 + i),
+                    quantity=3,
+                    cycle_number=1 + i // 10,
+                    split_number=i % 10 + 1,
+                    # 같은 시각 행이 섞이도록 두 건씩 같은 시각
+                    created_at=START + timedelta(days=i // 2),
+                )
+            )
+        for cycle in range(1, 4):
+            session.add(
+                CycleHistory.create_from_position(
+                    symbol="133690",
+                    cycle_number=cycle,
+                    start_investment=Won(10_000_000),
+                    end_proceeds=Won(11_000_000),
+                    total_trades=10,
+                    started_at=START,
+                )
+            )
+        await session.commit()
+    yield sessions
+    await engine.dispose()
+
+
+async def test_order_pages_cover_all_rows_in_keyset_order(sessions):
+    async with sessions() as session:
+        repo = OrderRepository(session)
+        seen, cursor = [], None
+        while True:
+            page = await repo.page(after=cursor, limit=10)
+            seen.extend(page.items)
+            if page.next_cursor is None:
+                break
+            cursor = Cursor.decode(page.next_cursor.encode())  # API로 주고받는 형태
+
+        assert len(seen) == 25 and len({o.id for o in seen}) == 25
+        assert [(o.created_at, o.id) for o in seen] == sorted((o.created_at, o.id) for o in seen)
+
+        page = await repo.page(symbol="133690", cycle_number=2, limit=10)
+        assert [o.split_number for o in page.items] == [2, 4, 6, 8, 10]
+        assert page.next_cursor is None
+
+
+async def test_stream_yields_batches(sessions):
+    async with sessions() as session:
+        repo = OrderRepository(session)
+        batches = [rows async for rows in repo.stream(batch_size=7)]
+        assert [len(b) for b in batches] == [7, 7, 7, 4]
+        assert batches[0][0]["price"] == Decimal("150000")
+
+        since = START + timedelta(days=10)
+        rows = [r async for rows in repo.stream("133690", since=since) for r in rows]
+        assert [r["split_number"] for r in rows] == [2, 4]
+
+        cycles = [r async for rows in CycleHistoryRepository(session).stream() for r in rows]
+        assert [r["cycle_number"] for r in cycles] == [1, 2, 3]
+
+
+async def test_export_csv(sessions, tmp_path):
+    path = tmp_path / "orders.csv"
+    assert await export("orders", path, batch_size=4, session_factory=sessions) == 25
+
+    with path.open() as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 25
+    assert rows[0]["created_at"] == START.isoformat() and rows[0]["filled_price"] == ""
+
+
+async def test_export_parquet(sessions, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = tmp_path / "cycles.parquet"
+    assert await export("cycles", path, batch_size=2, session_factory=sessions) == 3
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 2
+    assert parquet.read().column("profit_rate").to_pylist() == [Decimal("0.1000")] * 3
+
+
+async def test_filled_amounts_per_cycle(sessions):
+    async with sessions() as session:
+        orders = (await OrderRepository(session).page(symbol="133690", cycle_number=1)).items
+        orders[0].mark_filled(3, Decimal("150001"))
+        orders[1].mark_filled(1, Decimal("150003"))  # 일부 체결
+        session.add(
+            Order(
+                symbol="133690",
+                order_type=OrderType.SELL,
+                price=Won(165000),
+                quantity=4,
+                cycle_number=1,
+                split_number=0,
+                created_at=START + timedelta(days=30),
+            )
+        )
+        await session.commit()
+
+        amounts = await OrderRepository(session).filled_amounts("133690", 1)
+
+    assert amounts == {OrderType.BUY: Decimal("600006"), OrderType.SELL: Decimal("0")}
@@ -0,0 +1,90 @@
+"""임포트 비용(콜드 스타트) 테스트
+
+`python -X importtime` 출력을 파싱하여 가벼워야 하는 모듈이
+무거운 의존성(DB/HTTP/텔레그램/스케줄러)을 끌어오지 않는지,
+전체 임포트 시간이 예산 이내인지 확인한다.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 누적 임포트 시간 예산 (마이크로초) - 느린 CI에서는 환경변수로 조정
+IMPORT_BUDGET_US = int(os.environ.get("IMPORT_BUDGET_US", "1000000"))
+
+HEAVY_MODULES = ("sqlalchemy", "httpx", "telegram", "apscheduler", "asyncpg")
+
+
+def _import_profile(module: str) -> dict[str, int]:
+    """서브프로세스에서 모듈 임포트 → {모듈명: 누적 us}"""
+    env = {k: v for k, v in os.environ.items() if not k.upper().startswith(
+        ("KIWOOM_", "DATABASE_", "TELEGRAM_")
+    )}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    profile: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def _top_level(profile: dict[str, int]) -> set[str]:
+    return {name.split(".")[0] for name in profile}
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "app.trading.strategy.infinite_buy",
+        "app.trading.external_api.mock",
+        "app.trading.services.scheduler",
+        "app.notifications.telegram",
+        "main",
+    ],
+)
+def test_no_heavy_imports(module):
+    """설정/클라이언트 없이 임포트 가능하고 무거운 의존성을 로드하지 않음"""
+    loaded = _top_level(_import_profile(module))
+
+    assert not loaded & set(HEAVY_MODULES)
+
+
+def test_database_module_does_not_connect():
+    """database 모듈 임포트만으로 엔진/설정이 생성되지 않음"""
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import app.common.database as db, app.common.config as c;"
+            "assert db._engine is None;"
+            "assert c.get_settings.cache_info().currsize == 0",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_entrypoint_import_budget():
+    """main 모듈 콜드 임포트 시간 예산"""
+    profile = _import_profile("main")
+
+    assert profile["main"] <= IMPORT_BUDGET_US
@@ -0,0 +1,66 @@
+"""키움 응답 파싱 테스트"""
+
+from decimal import Decimal
+
+from app.trading.external_api.kiwoom import (
+    parse_balance,
+    parse_holdings,
+    parse_pending_orders,
+    parse_price,
+)
+
+
+def test_parse_price_strips_sign_and_commas():
+    """현재가: 부호/콤마 제거"""
+    info = parse_price("133690", {
+        "stk_nm": "TIGER미국나스닥100",
+        "cur_prc": "+167,750",
+        "base_pric": "166100",
+        "flu_rt": "-0.99",
+    })
+
+    assert info.current_price == Decimal("167750")
+    assert info.prev_close == Decimal("166100")
+    assert info.change_rate == Decimal("0.99")
+
+
+def test_parse_price_missing_fields():
+    """필드 누락 시 0"""
+    info = parse_price("133690", {"cur_prc": ""})
+
+    assert info.current_price == Decimal("0")
+    assert info.symbol_name == ""
+
+
+def test_parse_balance_output_list():
+    """예수금: output 리스트 래퍼 지원"""
+    balance = parse_balance({"output": [{"entr": "1000", "ord_alow_amt": "900"}]})
+
+    assert balance.total_deposit == Decimal("1000")
+    assert balance.available_amount == Decimal("900")
+
+
+def test_parse_holdings():
+    """보유종목"""
+    holdings = parse_holdings({
+        "acnt_evlt_remn_indv_tot": [
+            {"stk_cd": "A133690", "rmnd_qty": "000012", "pur_pric": "160000"},
+        ]
+    })
+
+    assert len(holdings) == 1
+    assert holdings[0].quantity == 12
+    assert holdings[0].avg_price == Decimal("160000")
+
+
+def test_parse_pending_orders_side():
+    """미체결: trde_tp 2=매수, 1=매도"""
+    orders = parse_pending_orders({
+        "oso": [
+            {"ord_no": "1", "trde_tp": "2", "oso_qty": "3", "ord_pric": "100"},
+            {"ord_no": "2", "trde_tp": "1", "oso_qty": "1", "ord_pric": "110"},
+        ]
+    })
+
+    assert [o.order_type for o in orders] == ["BUY", "SELL"]
+    assert orders[0].quantity == 3
@@ -0,0 +1,88 @@
+"""메트릭 레지스트리 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.common.metrics import MetricsRegistry, start_metrics_server
+
+
+class TestMetricsRegistry:
+    """MetricsRegistry 테스트"""
+
+    @pytest.fixture
+    def registry(self):
+        return MetricsRegistry()
+
+    def test_counter_with_labels(self, registry):
+        """라벨별 카운터 누적"""
+        counter = registry.counter("errors_total", "에러 수", ("api_id",))
+        counter.labels("ka10001").inc()
+        counter.labels("ka10001").inc(2)
+        counter.labels("kt10000").inc()
+
+        text = registry.render()
+        assert "# TYPE errors_total counter" in text
+        assert 'errors_total{api_id="ka10001"} 3' in text
+        assert 'errors_total{api_id="kt10000"} 1' in text
+
+    def test_histogram_cumulative_buckets(self, registry):
+        """히스토그램 버킷은 누적값, le 경계 포함"""
+        hist = registry.histogram("latency_seconds", "지연", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            hist.observe(value)
+
+        text = registry.render()
+        assert 'latency_seconds_bucket{le="0.1"} 2' in text
+        assert 'latency_seconds_bucket{le="1"} 3' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+        assert "latency_seconds_count 4" in text
+        assert "latency_seconds_sum 2.65" in text
+
+    def test_gauge(self, registry):
+        """게이지 증감"""
+        gauge = registry.gauge("queue_depth", "대기 수")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        assert "queue_depth 1" in registry.render()
+
+    def test_get_or_create(self, registry):
+        """같은 이름은 같은 메트릭, 다른 타입은 에러"""
+        first = registry.counter("calls_total", "호출")
+        assert registry.counter("calls_total", "호출") is first
+
+        with pytest.raises(ValueError):
+            registry.gauge("calls_total", "호출")
+
+    def test_label_count_mismatch(self, registry):
+        """라벨 개수 불일치"""
+        counter = registry.counter("x_total", "x", ("a", "b"))
+        with pytest.raises(ValueError):
+            counter.labels("only_one")
+
+    def test_label_escaping(self, registry):
+        """라벨 값 이스케이프"""
+        registry.counter("esc_total", "x", ("msg",)).labels('a"b').inc()
+        assert 'esc_total{msg="a\\"b"} 1' in registry.render()
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint():
+    """/metrics HTTP 엔드포인트"""
+    server = await start_metrics_server("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert response.startswith(b"HTTP/1.0 200 OK")
+    assert b"text/plain; version=0.0.4" in response
@@ -0,0 +1,80 @@
+"""정수 원/고정소수점 비율 테스트"""
+
+from decimal import Decimal
+
+from app.common.money import Rate, Rounding, Won
+from app.trading.models.cycle_history import CycleHistory
+from app.trading.models.position import Position
+from app.trading.strategy.infinite_buy import InfiniteBuyStrategy
+
+
+class TestWon:
+    def test_of_rounding(self):
+        assert Won.of(Decimal("1234.5")) == 1234
+        assert Won.of(Decimal("1234.5"), Rounding.UP) == 1235
+        assert Won.of(Decimal("1234.5"), Rounding.HALF_UP) == 1235
+        assert Won.of(Decimal("1234.4"), Rounding.HALF_UP) == 1234
+        assert Won.of("000000167750") == 167750
+        assert Won.of("1.5", Rounding.UP) == 2
+
+    def test_is_int(self):
+        won = Won(250000)
+        assert won == Decimal("250000")
+        assert str(won) == "250000"
+        assert f"{won:,}" == "250,000"
+        assert won.split(40) == 6250
+        assert won.shares(Won(167750)) == 1
+        assert won.to_decimal() == Decimal("250000")
+
+
+class TestRate:
+    def test_apply(self):
+        rate = Rate.of("1.10")
+        assert rate == 1_100_000
+        assert rate.apply(160000) == 176000
+        assert rate.apply(Decimal("160123.45"), Rounding.UP) == 176136
+        assert rate.apply(Decimal("160123.45"), Rounding.DOWN) == 176135
+
+    def test_ratio(self):
+        assert Rate.ratio(1, 3).to_decimal(4) == Decimal("0.3333")
+        assert Rate.ratio(-500, 10000).to_decimal(4) == Decimal("-0.0500")
+        assert Rate.ratio(1, 0) == 0
+
+
+def test_sell_price_rounded_up():
+    """목표가는 원 단위로 올린 뒤 호가단위로 올림"""
+    strategy = InfiniteBuyStrategy(total_investment=Decimal("10000000"))
+
+    assert strategy.calculate_sell_price(Decimal("160123.45")) == 176140  # 176135.795
+    assert strategy.should_sell(Won(176135), Decimal("160123.45")) is False
+    assert strategy.should_sell(Won(176140), Decimal("160123.45")) is True
+
+
+def test_position_split_uses_num_splits(sample_position_data):
+    position = Position(**sample_position_data)
+
+    assert position.investment_per_split(40) == 250000
+    assert position.investment_per_split(20) == 500000
+
+
+def test_position_avg_price_rounded(sample_position_data):
+    position = Position(**{**sample_position_data, "avg_price": Decimal("160000")})
+
+    position.update_after_buy(3, Won(150001))
+
+    assert position.quantity == 13
+    assert position.avg_price == Decimal("157692.54")  # 2,050,003 / 13
+
+
+def test_cycle_history_profit_rate():
+    history = CycleHistory.create_from_position(
+        symbol="133690",
+        cycle_number=1,
+        start_investment=Decimal("10000000.00"),
+        end_proceeds=Won(10333333),
+        total_trades=12,
+        started_at=None,
+    )
+
+    assert history.profit == Decimal("333333")
+    assert history.profit_rate == Decimal("0.0333")
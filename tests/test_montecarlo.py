@@ -0,0 +1,93 @@
+"""몬테카를로 시뮬레이터 테스트"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.trading.backtest import BacktestConfig, Bar, montecarlo, run_backtest  # noqa: E402
+from app.trading.backtest.montecarlo import (  # noqa: E402
+    bar_returns,
+    bootstrap_paths,
+    run_monte_carlo,
+    simulate_paths,
+)
+
+
+def _bars(closes: list[int]) -> list[Bar]:
+    bars = []
+    prev = Decimal(closes[0])
+    for i, c in enumerate(closes):
+        close = Decimal(c)
+        day = date(2024, 1, 1) + timedelta(days=i)
+        bars.append(Bar(day, prev, max(prev, close), min(prev, close), close))
+        prev = close
+    return bars
+
+
+def _random_bars(n: int = 300) -> list[Bar]:
+    rng = np.random.default_rng(0)
+    closes = (10000 * np.cumprod(1 + rng.normal(0.0005, 0.02, n))).astype(int)
+    return _bars(closes.tolist())
+
+
+def test_block_bootstrap_keeps_consecutive_days():
+    """블록 내 일자는 원본 순서 유지"""
+    returns = np.column_stack([np.ones(10), np.ones(10), 1 + np.arange(10) / 100])
+
+    _, _, close = bootstrap_paths(
+        returns, 4, 10, 100.0, block_size=5, rng=np.random.default_rng(1)
+    )
+
+    daily = close / np.concatenate([np.full((4, 1), 100.0), close[:, :-1]], axis=1)
+    steps = np.round((daily - 1) * 100).astype(int)
+    assert close.shape == (4, 10)
+    assert np.all((np.diff(steps[:, :5], axis=1) % 10) == 1)
+
+
+@pytest.mark.asyncio
+async def test_matches_event_backtest():
+    """단일 경로 결과가 이벤트 기반 백테스트와 일치"""
+    bars = _bars([10000] * 5 + [11500, 11500])
+    config = BacktestConfig(total_investment=Decimal("1000000"), num_splits=10)
+
+    expected = await run_backtest(bars, config)
+    row = lambda key: np.array([[float(getattr(b, key)) for b in bars]])  # noqa: E731
+    result = simulate_paths(row("open"), row("high"), row("close"), config)
+
+    assert result.final_equity[0] == pytest.approx(float(expected.final_equity))
+    assert result.cycles[0] == len(expected.cycles) == 1
+    assert result.cycle_profit[0] == pytest.approx(float(expected.cycles[0].profit_rate))
+
+
+def test_percentiles_report():
+    """지표별 백분위 요약"""
+    result = run_monte_carlo(_random_bars(), n_paths=200, n_days=250, seed=1)
+
+    stats = result.percentiles()
+    assert set(stats) == {
+        "total_return", "max_drawdown", "emergency_sells", "cycles", "cycle_length",
+        "cycle_profit",
+    }
+    assert stats["max_drawdown"][5] <= stats["max_drawdown"][95]
+    assert result.final_equity.shape == (200,)
+    assert "p50" in result.summary()
+
+
+def test_parallel_chunks_deterministic(monkeypatch):
+    """프로세스 분할 실행도 시드 고정 시 재현 가능"""
+    monkeypatch.setattr(montecarlo, "PARALLEL_MIN_PATHS", 0)
+    bars = _random_bars(120)
+
+    a = run_monte_carlo(bars, n_paths=40, n_days=60, seed=7, workers=2)
+    b = run_monte_carlo(bars, n_paths=40, n_days=60, seed=7, workers=2)
+
+    assert a.n_paths == 40
+    np.testing.assert_array_equal(a.final_equity, b.final_equity)
+
+
+def test_bar_returns_shape():
+    bars = _random_bars(50)
+    assert bar_returns(bars).shape == (49, 3)
@@ -0,0 +1,173 @@
+"""다종목 주문 계획/동시 제출 테스트"""
+
+import time
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.common.config import Settings
+from app.common.money import Won
+from app.trading.external_api.fake_server import LatencyModel
+from app.trading.models.position import Position
+from app.trading.repository.memory import (
+    InMemoryOrderRepository,
+    InMemoryPositionRepository,
+    InMemorySession,
+)
+from app.trading.services.planning import build_plan
+from app.trading.services.trading import TradingService
+from app.trading.strategy.infinite_buy import InfiniteBuyStrategy
+
+SYMBOLS = ["133690", "379800", "360750", "381170"]
+
+
+def _position(symbol: str, splits_used: int = 0) -> Position:
+    return Position(
+        symbol=symbol,
+        symbol_name=symbol,
+        quantity=0,
+        avg_price=None,
+        splits_used=splits_used,
+        cycle_count=1,
+        current_investment=Decimal("10000000"),
+        initial_investment=Decimal("10000000"),
+    )
+
+
+def _strategy(position: Position) -> InfiniteBuyStrategy:
+    return InfiniteBuyStrategy(total_investment=position.current_investment, num_splits=40)
+
+
+def test_plan_allocates_balance_in_symbol_order():
+    positions = {s: _position(s) for s in ("B", "A", "C")}
+    prices = {"A": Won(10000), "B": Won(10000), "C": Won(10000)}
+
+    plan = build_plan(date(2026, 1, 5), positions, prices, 500_000, _strategy)
+
+    # 1회분 250,000원 → 잔고 500,000원으로 두 종목까지만
+    assert [o.symbol for o in plan.orders] == ["A", "B"]
+    assert plan.skipped == (("C", "주문 가능 금액 부족"),)
+    assert plan.buy_amount == 500_000
+    assert plan.orders[0].key == "20260105-A-1-1-BUY"
+
+
+def test_plan_emergency_sell_does_not_use_balance():
+    position = _position("A", splits_used=40)
+    position.quantity, position.avg_price = 100, Decimal("12000")
+
+    plan = build_plan(date(2026, 1, 5), {"A": position}, {"A": Won(10003)}, 0, _strategy)
+
+    [order] = plan.orders
+    assert order.side == "SELL" and order.emergency
+    assert order.quantity == 25 and order.price == 10000  # ETF 5원 단위 내림
+
+
+@pytest.fixture
+def fake_server_options():
+    return {"latency": LatencyModel(median=0.05)}
+
+
+@pytest.fixture
+def service(kiwoom_api):
+    config = Settings.model_construct(
+        trading_symbol=SYMBOLS[0],
+        trading_symbols=",".join(SYMBOLS),
+        kiwoom_account_no="1234567890",
+    )
+    session = InMemorySession()
+    return TradingService(
+        session,
+        kiwoom_api,
+        position_repo=InMemoryPositionRepository(),
+        order_repo=InMemoryOrderRepository(session),
+        config=config,
+    )
+
+
+async def test_batch_submits_concurrently_and_inserts_once(service, fake_server):
+    await service.api.get_token()
+    started = time.perf_counter()
+    orders = await service.execute_daily_buy_orders()
+    elapsed = time.perf_counter() - started
+
+    assert sorted(o.symbol for o in orders) == sorted(SYMBOLS)
+    assert service.session.orders == orders  # 제출 전 한 번에 추가
+    assert all(o.kiwoom_order_id and o.client_order_id for o in orders)
+    assert len(fake_server.account.orders) == len(SYMBOLS)
+    # 순차 처리면 (시세 + 주문) x 종목 수 = 0.4초
+    assert elapsed < 0.3
+
+
+async def test_batch_rerun_skips_submitted_keys(service, fake_server):
+    await service.execute_daily_buy_orders()
+    again = await service.execute_daily_buy_orders()
+
+    assert again == []
+    assert len(fake_server.account.orders) == len(SYMBOLS)
+
+
+async def test_sell_side_covers_every_symbol(service, fake_server):
+    """매수한 종목마다 목표가 매도가 나가고, 미체결 정리도 전 종목에 적용"""
+    await service.execute_daily_buy_orders(SYMBOLS[:3])
+    fake_server.fill_all()
+    await service.check_order_execution()
+
+    orders = await service.execute_daily_sell_orders()
+
+    held = {p.symbol: p for p in await service.position_repo.get_all() if p.quantity}
+    assert sorted(held) == sorted(SYMBOLS[:3])
+    assert sorted((o.symbol, o.quantity) for o in orders) == sorted(
+        (s, p.quantity) for s, p in held.items()
+    )
+    for order in orders:
+        target = service._get_strategy(held[order.symbol]).calculate_sell_price(
+            held[order.symbol].avg_price
+        )
+        assert order.order_type.value == "SELL" and order.price == target
+        assert order.client_order_id.endswith("-TP")
+    assert await service.execute_daily_sell_orders() == []  # 재실행 시 중복 없음
+
+    # 목표가가 바뀌면 (평단가 변경) 전 종목 매도를 정정
+    for position in held.values():
+        position.avg_price -= 100
+    report = await service.sweep_orders()
+    replaced = sorted(c.order.symbol for c in report.changes if c.replaced)
+    assert replaced == sorted(SYMBOLS[:3])
+
+
+async def test_check_execution_records_fills(service, fake_server):
+    """체결 확인 시 체결된 주문은 FILLED, 미체결 잔량은 유지, 만료된 주문은 CANCELLED"""
+    filled, resting = await service.execute_daily_buy_orders(SYMBOLS[:2])
+    fake_server._fill(fake_server.account.orders[filled.kiwoom_order_id])
+    await service.check_order_execution()
+
+    assert filled.status.value == "FILLED"
+    assert filled.filled_quantity == filled.quantity
+    assert filled.filled_price == filled.price
+    assert resting.status.value == "PENDING" and not resting.filled_quantity  # 아직 미체결
+
+    del fake_server.account.orders[resting.kiwoom_order_id]  # 장 마감으로 만료
+    await service.check_order_execution()
+
+    assert resting.status.value == "CANCELLED"
+    assert filled.status.value == "FILLED"
+
+
+async def test_cycles_complete_with_own_proceeds(service, fake_server):
+    """같은 체결 확인에서 두 종목이 사이클을 마쳐도 각자 체결 금액만 이어받음"""
+    buys = await service.execute_daily_buy_orders(SYMBOLS[:2])
+    fake_server.fill_all()
+    await service.check_order_execution()
+    sells = await service.execute_daily_sell_orders()
+    fake_server.fill_all()
+    await service.check_order_execution()
+
+    histories = {h.symbol: h for h in service.session.cycles}
+    assert sorted(histories) == sorted(SYMBOLS[:2])
+    for buy in buys:
+        [sell] = [o for o in sells if o.symbol == buy.symbol]
+        expected = Decimal("10000000") - buy.price * buy.quantity + sell.price * sell.quantity
+        position = await service.position_repo.get_by_symbol(buy.symbol)
+        assert histories[buy.symbol].end_proceeds == expected
+        assert (position.cycle_count, position.current_investment) == (2, expected)
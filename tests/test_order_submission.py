@@ -0,0 +1,114 @@
+"""멱등 주문 제출 테스트"""
+
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.common.database import Base
+from app.common.money import Won
+from app.trading.external_api.kiwoom import KiwoomAPIError, KiwoomRestAPI
+from app.trading.models.order import Order, OrderStatus, OrderType
+from app.trading.repository.order import OrderRepository
+from app.trading.services.submission import OrderSubmitter
+
+
+def _order(key: str = "20260105-133690-1-1-BUY") -> Order:
+    return Order(
+        symbol="133690",
+        order_type=OrderType.BUY,
+        price=Won(150000),
+        quantity=3,
+        cycle_number=1,
+        split_number=1,
+        status=OrderStatus.PENDING,
+        client_order_id=key,
+    )
+
+
+def _flaky_buy(api: KiwoomRestAPI, reach_broker: bool):
+    """첫 호출은 타임아웃 (reach_broker면 주문은 접수된 뒤 응답만 유실)"""
+    buy = api.buy
+    calls = []
+
+    async def flaky(symbol, quantity, price):
+        calls.append(symbol)
+        if len(calls) == 1:
+            if reach_broker:
+                await buy(symbol, quantity, price)
+            raise httpx.ReadTimeout("timed out")
+        return await buy(symbol, quantity, price)
+
+    api.buy = flaky
+    return calls
+
+
+async def test_lost_ack_is_adopted_not_resubmitted(kiwoom_api, fake_server):
+    calls = _flaky_buy(kiwoom_api, reach_broker=True)
+    order = _order()
+
+    assert await OrderSubmitter(kiwoom_api, claimed=set()).submit(order)
+
+    assert len(calls) == 1
+    [placed] = fake_server.account.orders.values()
+    assert order.kiwoom_order_id == placed.ord_no
+
+
+async def test_lost_request_is_resubmitted_once(kiwoom_api, fake_server):
+    calls = _flaky_buy(kiwoom_api, reach_broker=False)
+    order = _order()
+
+    assert await OrderSubmitter(kiwoom_api, claimed=set()).submit(order)
+
+    assert len(calls) == 2
+    assert len(fake_server.account.orders) == 1
+
+
+async def test_claimed_pending_order_is_not_adopted(kiwoom_api, fake_server):
+    """같은 가격의 기존 주문(다른 주문 행에 연결됨)은 내 주문으로 보지 않음"""
+    existing = await kiwoom_api.buy("133690", 3, Won(150000))
+    _flaky_buy(kiwoom_api, reach_broker=False)
+    order = _order()
+
+    assert await OrderSubmitter(kiwoom_api, claimed={existing.order_id}).submit(order)
+
+    assert order.kiwoom_order_id != existing.order_id
+    assert len(fake_server.account.orders) == 2
+
+
+async def test_rejection_is_not_retried(kiwoom_api, fake_server):
+    calls = []
+
+    async def reject(symbol, quantity, price):
+        calls.append(symbol)
+        raise KiwoomAPIError("20", "주문가능금액 부족")
+
+    kiwoom_api.buy = reject
+    order = _order()
+
+    assert not await OrderSubmitter(kiwoom_api, claimed=set()).submit(order)
+    assert order.status == OrderStatus.FAILED and len(calls) == 1
+
+
+async def test_order_repository_dedup_queries():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        repo = OrderRepository(session)
+        submitted, unknown = _order("A"), _order("B")
+        submitted.kiwoom_order_id = "0000001"
+        session.add_all([submitted, unknown])
+        await session.commit()
+
+        found = await repo.get_by_client_ids(["A", "B", "C"])
+        assert set(found) == {"A", "B"}
+        assert await repo.broker_ids_since(datetime.now() - timedelta(days=1)) == {"0000001"}
+
+        session.add(_order("A"))
+        with pytest.raises(IntegrityError):
+            await session.commit()
+    await engine.dispose()
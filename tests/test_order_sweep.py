@@ -0,0 +1,206 @@
+"""미체결 주문 정리 테스트"""
+
+import asyncio
+import time
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from app.common.money import Won
+from app.trading.external_api.fake_server import FakeKiwoomServer
+from app.trading.external_api.ratelimit import RateLimiter
+from app.trading.models.order import Order, OrderStatus, OrderType
+from app.trading.repository.memory import (
+    InMemoryOrderRepository,
+    InMemoryPositionRepository,
+    InMemorySession,
+)
+from app.trading.services.maintenance import OrderPlan, OrderSweeper, SweepAction
+from app.trading.services.trading import TradingService
+from app.trading.strategy.triggers import TriggerEngine
+
+
+@pytest.fixture
+def fake_server_options():
+    return {"page_size": 2}
+
+
+def _remaining(server: FakeKiwoomServer) -> list[tuple[str, int, int]]:
+    return sorted(
+        (o.side, o.price, o.remaining)
+        for o in server.account.orders.values()
+        if o.stk_cd == "133690"
+    )
+
+
+async def test_sweep_cancels_and_trims(kiwoom_api, fake_server):
+    await kiwoom_api.buy("133690", 3, Won(150000))  # 이전 거래일 매수
+    await kiwoom_api.sell("133690", 6, Won(176000))
+    await kiwoom_api.sell("133690", 6, Won(176000))  # 4주 초과
+    await kiwoom_api.sell("133690", 3, Won(170000))  # 옛 목표가
+    await kiwoom_api.buy("379800", 1, Won(10000))  # 다른 종목
+
+    plan = OrderPlan("133690", sell_price=Won(176000), sell_quantity=8, keep_buys=False)
+    report = await OrderSweeper(kiwoom_api).sweep(plan)
+
+    assert report.scanned == 5
+    assert report.changed == 3 and report.failed == 0
+    assert sorted(c.action for c in report.changes) == [
+        SweepAction.CANCEL, SweepAction.CANCEL, SweepAction.PARTIAL_CANCEL
+    ]
+    assert _remaining(fake_server) == [("SELL", 176000, 2), ("SELL", 176000, 6)]
+    assert len(fake_server.account.orders) == 3  # 다른 종목 주문 유지
+
+
+async def test_sweep_cancels_stale_target_for_replacement(kiwoom_api, fake_server):
+    """정정 대상은 취소만 하고 재주문은 호출자에게 맡김"""
+    await kiwoom_api.sell("133690", 10, Won(170000))
+    await kiwoom_api.buy("133690", 3, Won(150000))
+
+    plan = OrderPlan("133690", sell_price=Won(176000), sell_quantity=10, keep_buys=True)
+    report = await OrderSweeper(kiwoom_api).sweep(plan)
+
+    [change] = report.changes
+    assert change.action is SweepAction.REPLACE and change.cancelled
+    assert (change.quantity, change.replaced) == (10, None)
+    assert _remaining(fake_server) == [("BUY", 150000, 3)]
+
+
+async def test_failed_cancel_is_not_resubmitted(kiwoom_api, fake_server):
+    """조회 후 체결되어 취소가 실패하면 재주문하지 않음 (중복 매도 방지)"""
+    await kiwoom_api.sell("133690", 10, Won(170000))
+    stale = await kiwoom_api.get_pending_orders()
+    fake_server.fill_all()
+
+    async def pages():
+        yield stale
+
+    kiwoom_api.iter_pending_orders = pages
+    plan = OrderPlan("133690", sell_price=Won(176000), sell_quantity=10)
+    report = await OrderSweeper(kiwoom_api).sweep(plan)
+
+    assert report.failed == 1
+    assert report.changes[0].replaced is None
+    assert fake_server.account.orders == {}
+
+
+class _Alerts:
+    def __init__(self):
+        self.errors: list[str] = []
+
+    async def send_error(self, message: str) -> None:
+        self.errors.append(message)
+
+
+def _service(api, triggers: TriggerEngine | None = None, notifier=None) -> TradingService:
+    session = InMemorySession()
+    return TradingService(
+        session,
+        api,
+        notifier=notifier,
+        position_repo=InMemoryPositionRepository(),
+        order_repo=InMemoryOrderRepository(session),
+        triggers=triggers,
+    )
+
+
+def _sell_row(result, quantity: int) -> Order:
+    return Order(
+        symbol="133690",
+        order_type=OrderType.SELL,
+        price=result.price,
+        quantity=quantity,
+        cycle_number=1,
+        split_number=0,
+        kiwoom_order_id=result.order_id,
+    )
+
+
+async def test_service_records_replacement(kiwoom_api, fake_server):
+    service = _service(kiwoom_api)
+    position = await service.position_repo.create_or_get("133690", "TIGER", Decimal("10000000"))
+    position.update_after_buy(10, Won(160000))
+    stale = _sell_row(await kiwoom_api.sell("133690", 10, Won(170000)), 10)
+    service.session.add(stale)
+
+    report = await service.sweep_orders()
+
+    assert report.changed == 1
+    assert stale.status == OrderStatus.CANCELLED  # 정정 전 주문 행
+    [_, order] = service.session.orders
+    assert order.price == 176000 and order.quantity == 10
+    assert order is report.changes[0].replaced
+    assert order.client_order_id.endswith(f"-RP-{stale.kiwoom_order_id}")  # 제출 전 기록
+    assert _remaining(fake_server) == [("SELL", 176000, 10)]
+
+
+async def test_replacement_timeout_is_reconciled(kiwoom_api, fake_server, monkeypatch):
+    """정정 재주문이 타임아웃돼도 미체결과 대조해 주문 행에 연결 (기록 없는 주문 없음)"""
+    service = _service(kiwoom_api)
+    position = await service.position_repo.create_or_get("133690", "TIGER", Decimal("10000000"))
+    position.update_after_buy(10, Won(160000))
+    service.session.add(_sell_row(await kiwoom_api.sell("133690", 10, Won(170000)), 10))
+    sell = kiwoom_api.sell
+
+    async def accepted_then_timeout(*args):
+        await sell(*args)
+        raise httpx.ReadTimeout("timeout")
+
+    monkeypatch.setattr(kiwoom_api, "sell", accepted_then_timeout)
+    report = await service.sweep_orders()
+
+    [pending] = await kiwoom_api.get_pending_orders()
+    assert report.changes[0].replaced.kiwoom_order_id == pending.order_id
+
+
+async def test_rejected_replacement_still_marks_cancel(kiwoom_api, fake_server, monkeypatch):
+    """취소 후 재주문이 거절돼도 원주문 행은 CANCELLED, 매도 공백은 알림"""
+    alerts = _Alerts()
+    service = _service(kiwoom_api, notifier=alerts)
+    position = await service.position_repo.create_or_get("133690", "TIGER", Decimal("10000000"))
+    position.update_after_buy(10, Won(160000))
+    stale = _sell_row(await kiwoom_api.sell("133690", 10, Won(170000)), 10)
+    service.session.add(stale)
+
+    async def rejected(*args):
+        raise RuntimeError("주문 거절")
+
+    monkeypatch.setattr(kiwoom_api, "sell", rejected)
+    report = await service.sweep_orders()
+
+    [change] = report.changes
+    assert change.cancelled and change.replaced is None and change.replace_failed
+    assert report.changed == 1 and report.failed == 0
+    assert stale.status == OrderStatus.CANCELLED
+    [alert] = alerts.errors
+    assert "정정 재주문 실패" in alert and stale.kiwoom_order_id in alert
+
+
+async def test_trigger_mode_keeps_todays_trigger_sell(kiwoom_api, fake_server):
+    """트리거 모드: 오늘 트리거가 낸 매도는 두고, 나머지 매도만 취소"""
+    service = _service(kiwoom_api, triggers=TriggerEngine())
+    position = await service.position_repo.create_or_get("133690", "TIGER", Decimal("10000000"))
+    position.update_after_buy(10, Won(160000))
+    leftover = _sell_row(await kiwoom_api.sell("133690", 4, Won(170000)), 4)
+    service.session.add(leftover)
+    service._arm_take_profit(position, Won(176000))
+    [fired] = await service.on_price("133690", Won(180000))
+
+    report = await service.sweep_orders()
+
+    assert [c.order.order_id for c in report.changes] == [leftover.kiwoom_order_id]
+    assert leftover.status == OrderStatus.CANCELLED
+    assert fired.status != OrderStatus.CANCELLED
+    pending = {o.order_id for o in await kiwoom_api.get_pending_orders()}
+    assert pending == {fired.kiwoom_order_id}
+
+
+async def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(rate=50, burst=1)
+
+    started = time.perf_counter()
+    waits = await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+
+    assert time.perf_counter() - started >= 0.07  # 4 × 20ms
+    assert waits[0] == 0.0
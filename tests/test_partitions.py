@@ -0,0 +1,57 @@
+"""월별 파티션 관리 테스트 (Postgres 없이 확인 가능한 부분)"""
+
+from datetime import date
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.trading.models.cycle_history import CycleHistory
+from app.trading.models.order import Order
+from app.trading.repository.partitions import (
+    PartitionManager,
+    add_months,
+    conflict_columns,
+    create_statements,
+    expired_partitions,
+    partition_month,
+    partition_name,
+)
+
+
+def test_month_arithmetic_and_names():
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert partition_name("orders", date(2026, 3, 1)) == "orders_y2026m03"
+    assert partition_month("daily_snapshots_y2026m03") == date(2026, 3, 1)
+    assert partition_month("orders_legacy") is None
+
+
+def test_create_statements_add_per_partition_unique_index():
+    orders = create_statements("orders", date(2026, 12, 1))
+    assert orders == [
+        "CREATE TABLE IF NOT EXISTS orders_y2026m12 PARTITION OF orders "
+        "FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')",
+        "CREATE UNIQUE INDEX IF NOT EXISTS orders_y2026m12_client_order_id "
+        "ON orders_y2026m12 (client_order_id)",
+    ]
+    assert len(create_statements("daily_snapshots", date(2026, 12, 1))) == 1
+
+
+def test_expired_partitions_keep_retention_window():
+    names = ["orders_y2026m07", "orders_y2026m08", "orders_y2026m09", "orders_y2026m10"]
+    assert expired_partitions(names, date(2026, 10, 1), 3) == ["orders_y2026m07"]
+    assert expired_partitions(names, date(2026, 10, 1), 0) == []
+
+
+def test_upsert_conflict_target_includes_partition_key_on_postgres():
+    orders = Order.__table__
+    assert [c.name for c in conflict_columns(orders, "postgresql")] == ["id", "created_at"]
+    assert [c.name for c in conflict_columns(orders, "sqlite")] == ["id"]
+    assert [c.name for c in conflict_columns(CycleHistory.__table__, "postgresql")] == ["id"]
+
+
+async def test_maintain_is_noop_without_postgres():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with AsyncSession(engine) as session:
+        report = await PartitionManager(session).maintain(retention_months=1)
+    assert report.created == report.detached == report.dropped == []
+    await engine.dispose()
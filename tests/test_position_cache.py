@@ -0,0 +1,144 @@
+"""포지션 캐시 테스트"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.common.database import Base
+from app.common.money import Won
+from app.trading.external_api.base import HoldingInfo
+from app.trading.models.position import Position
+from app.trading.repository.position import PositionRepository
+from app.trading.repository.position_cache import (
+    CachedPositionRepository,
+    PositionCache,
+    PositionConflictError,
+)
+
+
+@pytest.fixture
+async def factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessionmaker() as session:
+        await PositionRepository(session).create_or_get("133690", "A", Decimal("10000000"))
+    sessionmaker.statements = statements = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement.split()[0])
+
+    yield sessionmaker
+    await engine.dispose()
+
+
+@pytest.fixture
+async def cache(factory):
+    cache = PositionCache(factory)
+    await cache.load()
+    factory.statements.clear()
+    return cache
+
+
+async def test_reads_come_from_cache(factory, cache):
+    async with factory() as session:
+        repo = CachedPositionRepository(session, cache)
+        position = await repo.get_by_symbol("133690")
+        assert position.current_investment == Decimal("10000000")
+        assert position in session
+        assert await repo.get_by_symbol("133690") is position
+        assert [p.symbol for p in await repo.get_all()] == ["133690"]
+        assert await repo.get_by_symbol("379800") is None  # 전체 적재 후 없는 종목
+    assert factory.statements == []
+
+
+async def test_update_writes_through(factory, cache):
+    async with factory() as session:
+        repo = CachedPositionRepository(session, cache)
+        position = await repo.get_by_symbol("133690")
+        position.update_after_buy(10, Won(150000))
+        await repo.update(position)
+
+    assert "SELECT" not in factory.statements
+    assert cache.get("133690").quantity == 10
+    assert cache.get("133690").version == 2
+    async with factory() as session:
+        stored = await PositionRepository(session).get_by_symbol("133690")
+    assert (stored.quantity, stored.version) == (10, 2)
+
+
+async def test_version_conflict_invalidates(factory, cache):
+    async with factory() as session:
+        await session.execute(
+            text("UPDATE positions SET quantity = 5, version = version + 1")
+        )
+        await session.commit()
+
+    async with factory() as session:
+        repo = CachedPositionRepository(session, cache)
+        position = await repo.get_by_symbol("133690")
+        position.update_after_buy(10, Won(150000))
+        with pytest.raises(PositionConflictError):
+            await repo.update(position)
+
+    assert "133690" not in cache
+    async with factory() as session:
+        position = await CachedPositionRepository(session, cache).get_by_symbol("133690")
+    assert (position.quantity, position.version) == (5, 2)
+    assert cache.get("133690").quantity == 5
+
+
+async def test_invalidate_reloads_from_db(factory, cache):
+    cache.invalidate()
+    async with factory() as session:
+        repo = CachedPositionRepository(session, cache)
+        assert await repo.get_by_symbol("133690") is not None
+    assert factory.statements == ["SELECT"]
+    assert "133690" in cache
+
+
+class _Holdings:
+    def __init__(self, quantities: dict[str, int]):
+        self.quantities = quantities
+
+    async def get_holdings(self) -> list[HoldingInfo]:
+        return [
+            HoldingInfo(symbol, "A", quantity, Won(150000), Won(151000), Decimal("0"))
+            for symbol, quantity in self.quantities.items()
+        ]
+
+
+async def test_check_reports_and_repairs(factory, cache):
+    assert (await cache.check(_Holdings({}))).ok
+
+    async with factory() as session:
+        await session.execute(text("UPDATE positions SET quantity = 7, version = version + 1"))
+        session.add(
+            Position(
+                symbol="379800",
+                symbol_name="B",
+                quantity=0,
+                current_investment=Decimal("1"),
+                initial_investment=Decimal("1"),
+            )
+        )
+        await session.commit()
+
+    report = await cache.check(_Holdings({"133690": 7}), repair=True)
+    found = {(m.symbol, m.source, m.field) for m in report.mismatches}
+    assert found == {
+        ("133690", "db", "quantity"),
+        ("133690", "db", "version"),
+        ("379800", "db", "exists"),
+    }
+    assert report.repaired == ["133690", "379800"]
+    assert cache.get("133690").quantity == 7
+
+    report = await cache.check(_Holdings({"133690": 10}))
+    assert [(m.symbol, m.source, m.cached, m.actual) for m in report.mismatches] == [
+        ("133690", "kiwoom", 7, 10)
+    ]
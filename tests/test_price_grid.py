@@ -0,0 +1,83 @@
+"""KRX 호가 격자 테스트"""
+
+from decimal import Decimal
+
+import pytest
+
+from app.common.config import InstrumentType
+from app.common.money import Rounding, Won
+from app.trading.backtest.engine import BacktestConfig
+from app.trading.strategy.infinite_buy import InfiniteBuyStrategy
+from app.trading.strategy.price_grid import ETF_GRID, STOCK_GRID, PriceGrid, get_grid
+
+
+@pytest.mark.parametrize(
+    "price, tick",
+    [(0, 1), (1999, 1), (2000, 5), (4999, 5), (5000, 10), (19990, 10), (20000, 50),
+     (199900, 100), (200000, 500), (499500, 500), (500000, 1000), (3_000_000, 1000)],
+)
+def test_stock_tick_size(price, tick):
+    assert STOCK_GRID.tick_size(price) == tick
+
+
+def test_etf_tick_size():
+    assert ETF_GRID.tick_size(1999) == 1
+    assert ETF_GRID.tick_size(2000) == 5
+    assert ETF_GRID.tick_size(167_750) == 5
+    assert get_grid("etf") is ETF_GRID
+    assert get_grid(InstrumentType.STOCK) is STOCK_GRID
+
+
+def test_round():
+    assert STOCK_GRID.ceil(176135) == 176200
+    assert STOCK_GRID.floor(176135) == 176100
+    assert STOCK_GRID.round(176149, Rounding.HALF_UP) == 176100
+    assert STOCK_GRID.round(176150, Rounding.HALF_UP) == 176200
+    assert STOCK_GRID.ceil(4998) == 5000  # 구간 경계를 넘는 올림
+    assert STOCK_GRID.floor(5003) == 5000
+    assert STOCK_GRID.ceil(Decimal("1999.5")) == 2000
+    assert ETF_GRID.ceil(Decimal("176135.795")) == 176140
+    assert type(ETF_GRID.floor(1500)) is Won
+
+
+def test_results_are_valid_ticks():
+    for grid in (STOCK_GRID, ETF_GRID):
+        for price in range(1, 600_000, 37):
+            for rounding in Rounding:
+                rounded = grid.round(price, rounding)
+                assert grid.is_valid(rounded), (grid, price, rounding)
+                assert abs(rounded - price) < grid.tick_size(price) + grid.tick_size(rounded)
+
+
+def test_rejects_invalid_bands():
+    with pytest.raises(ValueError):
+        PriceGrid("bad", ((2_000, 1), (4_999, 5)), top_tick=10)
+
+
+def test_round_array_matches_scalar():
+    np = pytest.importorskip("numpy")
+    prices = np.arange(1, 600_000, 113)
+
+    for rounding in Rounding:
+        expected = [STOCK_GRID.round(int(p), rounding) for p in prices]
+        assert STOCK_GRID.round_array(prices, rounding).tolist() == expected
+
+    # float 오차: 160000 × 1.1 = 176000.00000000003 → 176000 (올림해도 그대로)
+    floats = np.array([160000 * 1.1, 176135.795, 1999.2])
+    assert ETF_GRID.round_array(floats, Rounding.UP).tolist() == [176000, 176140, 2000]
+
+
+def test_strategy_prices_on_grid():
+    strategy = InfiniteBuyStrategy(
+        total_investment=Decimal("10000000"), instrument_type=InstrumentType.STOCK
+    )
+
+    assert strategy.calculate_sell_price(Decimal("160123.45")) == 176200
+    assert strategy.calculate_buy_order(Decimal("16743"), None, 0).price == 16740
+    assert strategy.reset_with_proceeds(Won(1)).grid is STOCK_GRID
+
+
+def test_backtest_config_passes_instrument_type():
+    config = BacktestConfig(instrument_type=InstrumentType.STOCK).to_settings()
+
+    assert config.trading_instrument_type == InstrumentType.STOCK
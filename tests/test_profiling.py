@@ -0,0 +1,103 @@
+"""작업 프로파일링 테스트"""
+
+import pytest
+
+from app.common.profiling import JobProfiler
+from app.trading.services import scheduler
+
+
+class TestJobProfiler:
+    """JobProfiler 테스트"""
+
+    @pytest.fixture
+    def profiler(self, tmp_path):
+        return JobProfiler(output_dir=tmp_path)
+
+    def test_not_armed_is_noop(self, profiler, tmp_path):
+        """예약 없으면 프로파일링 안 함"""
+        with profiler.profile("execute_buy_order") as path:
+            assert path is None
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_armed_job_profiled_once(self, profiler, tmp_path):
+        """예약된 작업은 1회만 프로파일링, 요약 파일 포함"""
+        profiler.arm("job_execute_buy_order")
+
+        with profiler.profile("set_sell_order") as path:
+            assert path is None
+
+        with profiler.profile("execute_buy_order") as path:
+            sum(range(1000))
+
+        assert path.exists()
+        assert path.name.startswith("execute_buy_order_")
+        summary = path.with_suffix(".txt").read_text()
+        assert "cumulative" in summary
+
+        with profiler.profile("execute_buy_order") as again:
+            assert again is None
+
+    def test_arm_all(self, profiler):
+        """all 예약은 다음 작업 아무거나 1회"""
+        profiler.arm_from_spec("all")
+
+        with profiler.profile("check_execution") as path:
+            pass
+
+        assert path is not None
+        with profiler.profile("set_sell_order") as path:
+            assert path is None
+
+    def test_arm_all_skips_explicit_only(self, profiler):
+        """폴링 작업은 all 예약을 소진하지 않고 이름 예약만 사용"""
+        profiler.arm("all")
+
+        with profiler.profile("poll_triggers", explicit_only=True) as path:
+            assert path is None
+        with profiler.profile("check_execution") as path:
+            assert path is not None
+
+        profiler.arm("poll_triggers")
+        with profiler.profile("poll_triggers", explicit_only=True) as path:
+            assert path is not None
+
+    def test_nested_profile_keeps_reservation(self, profiler):
+        """프로파일링 중 시작한 작업은 예약을 소진하지 않음 (cProfile 동시 실행 방지)"""
+        profiler.arm("set_sell_order")
+        profiler.arm("execute_buy_order")
+
+        with profiler.profile("set_sell_order") as outer:
+            with profiler.profile("execute_buy_order") as inner:
+                assert inner is None
+        assert outer is not None
+
+        with profiler.profile("execute_buy_order") as path:
+            assert path is not None
+
+
+@pytest.mark.asyncio
+async def test_run_job_uses_profiler(tmp_path, monkeypatch):
+    """스케줄러 작업 실행 시 예약된 프로파일링 적용"""
+
+    class _StubService:
+        async def check_order_execution(self):
+            return None
+
+    class _StubAPI:
+        async def close(self):
+            return None
+
+    async def _stub_service(session, api):
+        return _StubService()
+
+    profiler = JobProfiler(output_dir=tmp_path)
+    profiler.arm("check_execution")
+    monkeypatch.setattr(scheduler, "get_profiler", lambda: profiler)
+    monkeypatch.setattr(scheduler, "_get_trading_service", _stub_service)
+    monkeypatch.setattr(scheduler, "_create_api", _StubAPI)
+    monkeypatch.setattr(scheduler, "is_weekday", lambda: True)
+
+    await scheduler.job_check_execution()
+
+    assert len(list(tmp_path.glob("check_execution_*.prof"))) == 1
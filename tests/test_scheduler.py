@@ -0,0 +1,100 @@
+"""스케줄러 작업 실행 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.trading.services import scheduler
+
+
+class _Session:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+
+class _API:
+    created = 0
+
+    def __init__(self):
+        type(self).created += 1
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def jobs(monkeypatch):
+    from app.common import database
+
+    _API.created = 0
+    services = []
+
+    async def _service(session, api):
+        services.append(api)
+        return api
+
+    monkeypatch.setattr(database, "async_session", _Session)
+    monkeypatch.setattr(scheduler, "_create_api", _API)
+    monkeypatch.setattr(scheduler, "_get_trading_service", _service)
+    monkeypatch.setattr(scheduler, "_poll_api", None)
+    monkeypatch.setattr(scheduler, "is_weekday", lambda: True)
+    return services
+
+
+async def test_poll_does_not_block_scheduled_jobs(jobs):
+    release = asyncio.Event()
+    ran = []
+
+    async def _slow_poll(service):
+        await release.wait()
+
+    async def _trade(service):
+        ran.append("buy")
+
+    poll = asyncio.create_task(
+        scheduler._run_job("poll_triggers", "폴링", _slow_poll, poll=True)
+    )
+    await asyncio.sleep(0)
+    await scheduler._run_job("execute_buy_order", "매수", _trade)
+    release.set()
+    await poll
+
+    assert ran == ["buy"]
+
+
+async def test_poll_reuses_api_and_jobs_close_theirs(jobs):
+    async def _noop(service):
+        return None
+
+    await scheduler._run_job("poll_triggers", "폴링", _noop, poll=True)
+    await scheduler._run_job("poll_triggers", "폴링", _noop, poll=True)
+    await scheduler._run_job("check_execution", "체결 확인", _noop)
+
+    poll_api, again, job_api = jobs
+    assert poll_api is again and not poll_api.closed
+    assert job_api is not poll_api and job_api.closed
+    assert _API.created == 2
+
+    await scheduler.close_poll_api()
+    assert poll_api.closed
+
+
+async def test_poll_leaves_any_job_profile_for_scheduled_jobs(jobs, tmp_path, monkeypatch):
+    from app.common.profiling import JobProfiler
+
+    profiler = JobProfiler(output_dir=tmp_path)
+    profiler.arm("all")
+    monkeypatch.setattr(scheduler, "get_profiler", lambda: profiler)
+
+    async def _noop(service):
+        return None
+
+    await scheduler._run_job("poll_triggers", "폴링", _noop, poll=True)
+    assert list(tmp_path.glob("*.prof")) == []
+
+    await scheduler._run_job("check_execution", "체결 확인", _noop)
+    assert len(list(tmp_path.glob("check_execution_*.prof"))) == 1
@@ -113,6 +113,16 @@ class TestInfiniteBuyStrategy:
         assert sell_order.quantity == 10  # 40 / 4 = 10주
         assert sell_order.is_emergency is True
 
+    def test_should_emergency_sell(self, strategy):
+        """쿼터 모드만 긴급 매도 대상"""
+        assert strategy.should_emergency_sell is True
+
+        wait = InfiniteBuyStrategy(
+            total_investment=Decimal("10000000"),
+            emergency_sell_mode=EmergencySellMode.WAIT,
+        )
+        assert wait.should_emergency_sell is False
+
     def test_emergency_sell_wait_mode(self):
         """대기 모드: 매도 없음"""
         strategy = InfiniteBuyStrategy(
@@ -0,0 +1,106 @@
+"""트레이싱 테스트"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.common.tracing import FileSpanExporter, SpanExporter, Tracer, format_breakdown
+
+
+class _MemoryExporter(SpanExporter):
+    """테스트용 메모리 익스포터"""
+
+    def __init__(self):
+        self.traces = []
+
+    def export(self, spans):
+        self.traces.append(list(spans))
+
+
+class TestTracer:
+    """Tracer 테스트"""
+
+    @pytest.fixture
+    def exporter(self):
+        return _MemoryExporter()
+
+    @pytest.mark.asyncio
+    async def test_child_spans_nested_under_root(self, exporter):
+        """루트 아래 자식 span이 부모-자식 관계로 기록"""
+        tracer = Tracer(exporter)
+
+        async def request(api_id):
+            with tracer.span("kiwoom.request", api_id=api_id):
+                await asyncio.sleep(0)
+
+        with tracer.root_span("job.execute_buy_order") as root:
+            await request("ka10001")
+            with tracer.span("db.commit"):
+                await asyncio.gather(request("kt10000"), request("kt00001"))
+
+        assert len(exporter.traces) == 1
+        spans = exporter.traces[0]
+        assert len(spans) == 5
+        assert all(s.trace_id == root.trace_id for s in spans)
+
+        by_name = {}
+        for s in spans:
+            by_name.setdefault(s.name, []).append(s)
+        commit = by_name["db.commit"][0]
+        assert commit.parent_id == root.span_id
+        nested = [s for s in by_name["kiwoom.request"] if s.parent_id == commit.span_id]
+        assert {s.attributes["api_id"] for s in nested} == {"kt10000", "kt00001"}
+
+    def test_span_outside_trace_is_noop(self, exporter):
+        """루트 밖 span은 기록하지 않음"""
+        tracer = Tracer(exporter)
+
+        with tracer.span("db.query") as span:
+            assert span is None
+
+        assert exporter.traces == []
+
+    def test_sampling_zero(self, exporter):
+        """샘플링 비율 0이면 내보내지 않음"""
+        tracer = Tracer(exporter, sample_ratio=0.0)
+
+        with tracer.root_span("job") as root:
+            with tracer.span("child") as child:
+                assert child is None
+
+        assert root is None
+        assert exporter.traces == []
+
+    def test_error_recorded(self, exporter):
+        """예외 발생 시 span에 에러 기록 후 전파"""
+        tracer = Tracer(exporter)
+
+        with pytest.raises(ValueError):
+            with tracer.root_span("job"):
+                with tracer.span("kiwoom.request"):
+                    raise ValueError("boom")
+
+        spans = exporter.traces[0]
+        assert all(s.error == "ValueError: boom" for s in spans)
+        assert "kiwoom.request" in format_breakdown(spans)
+
+    def test_file_exporter_otlp_json(self, tmp_path):
+        """파일 익스포터는 트레이스당 OTLP JSON 1줄"""
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer(FileSpanExporter(path))
+
+        for _ in range(2):
+            with tracer.root_span("job", job="check_execution"):
+                with tracer.span("telegram.send"):
+                    pass
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        payload = json.loads(lines[0])
+        spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert [s["name"] for s in spans] == ["job", "telegram.send"]
+        assert spans[1]["parentSpanId"] == spans[0]["spanId"]
+        assert spans[0]["attributes"] == [
+            {"key": "job", "value": {"stringValue": "check_execution"}}
+        ]
@@ -0,0 +1,157 @@
+"""장중 가격 트리거 엔진 테스트"""
+
+import random
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from app.common.config import Settings
+from app.trading.external_api.mock import MockStockAPI
+from app.trading.models.order import OrderStatus
+from app.trading.models.position import Position
+from app.trading.repository.memory import (
+    InMemoryOrderRepository,
+    InMemoryPositionRepository,
+    InMemorySession,
+)
+from app.trading.services.planning import TRIGGER_MARK
+from app.trading.services.trading import TradingService
+from app.trading.strategy.triggers import Trigger, TriggerEngine, TriggerKind
+
+
+def test_fires_only_hit_conditions():
+    engine = TriggerEngine()
+    engine.add(Trigger("A", TriggerKind.TAKE_PROFIT, 110))
+    engine.add(Trigger("A", TriggerKind.BUY_ZONE, 95))
+    engine.add(Trigger("A", TriggerKind.STOP, 90, account="acc2"))
+    engine.add(Trigger("B", TriggerKind.TAKE_PROFIT, 100))
+
+    assert engine.on_tick("A", 100) == []
+    assert [t.kind for t in engine.on_tick("A", 93)] == [TriggerKind.BUY_ZONE]
+    assert engine.on_tick("A", 93) == []  # 1회성
+    assert [t.kind for t in engine.on_tick("A", 115)] == [TriggerKind.TAKE_PROFIT]
+    assert len(engine) == 2
+    assert sorted(engine.symbols) == ["A", "B"]
+
+
+def test_replace_and_cancel():
+    engine = TriggerEngine()
+    first = engine.add(Trigger("A", TriggerKind.TAKE_PROFIT, 110, key="tp"))
+    engine.add(Trigger("A", TriggerKind.TAKE_PROFIT, 120, key="tp"))
+    engine.add(first)  # 같은 객체 재등록도 1건
+
+    assert len(engine) == 1
+    assert engine.nearest("A") == (first, None)
+    assert engine.on_tick("A", 115) == [first]
+
+    engine.add(Trigger("A", TriggerKind.STOP, 90, key="stop"))
+    assert engine.cancel("stop") is True
+    assert engine.cancel("stop") is False
+    assert engine.on_tick("A", 50) == []
+    assert engine.symbols == []
+
+
+def test_matches_brute_force():
+    """무작위 등록/취소/틱 시퀀스에서 전수 비교와 같은 결과"""
+    rng = random.Random(7)
+    engine = TriggerEngine()
+    armed: dict[str, Trigger] = {}
+
+    for step in range(5000):
+        symbol = rng.choice("ABC")
+        op = rng.random()
+        if op < 0.5:
+            trigger = Trigger(
+                symbol, rng.choice(list(TriggerKind)), rng.randint(900, 1100),
+                key=f"k{rng.randint(0, 300)}",
+            )
+            engine.add(trigger)
+            armed[trigger.key] = trigger
+        elif op < 0.6:
+            key = f"k{rng.randint(0, 300)}"
+            assert engine.cancel(key) == (armed.pop(key, None) is not None)
+        else:
+            price = rng.randint(900, 1100)
+            expected = {k for k, t in armed.items() if t.symbol == symbol and t.is_hit(price)}
+            fired = engine.on_tick(symbol, price)
+            assert {t.key for t in fired} == expected, step
+            for key in expected:
+                del armed[key]
+        assert len(engine) == len(armed)
+
+
+@pytest.fixture
+def service():
+    api = MockStockAPI()
+    config = Settings.model_construct(
+        kiwoom_account_no="00000000",
+        trading_symbol="133690",
+        total_investment=Decimal("10000000"),
+    )
+    session = InMemorySession()
+    return TradingService(
+        session,
+        api,
+        position_repo=InMemoryPositionRepository(),
+        order_repo=InMemoryOrderRepository(session),
+        config=config,
+        triggers=TriggerEngine(),
+    )
+
+
+async def _hold(service: TradingService, quantity: int, avg_price: int) -> Position:
+    await service.api.buy("133690", quantity, avg_price)
+    position = await service.position_repo.create_or_get("133690", "TIGER", Decimal("10000000"))
+    position.update_after_buy(quantity, avg_price)
+    return position
+
+
+async def test_take_profit_sells_intraday(service):
+    await _hold(service, 10, 160000)
+
+    assert await service.execute_daily_sell_order() is None  # 지정가 대신 트리거
+    assert service.session.orders == []
+    trigger = service.triggers.get(service._take_profit_key())
+    assert trigger.threshold == 176000
+
+    assert await service.on_price("133690", 175995) == []
+    orders = await service.on_price("133690", 176003)
+
+    assert len(orders) == 1
+    assert orders[0].order_type == "SELL"
+    assert orders[0].quantity == 10
+    assert orders[0].price == 176000  # 현재가 이하 유효 호가 (ETF 5원)
+    assert await service.on_price("133690", 180000) == []
+    assert len(service.triggers) == 0
+
+
+async def test_trigger_sell_recorded_before_submit(service, monkeypatch):
+    """트리거 매도는 제출 전에 기록 - 결과를 알 수 없어도 주문 행이 남음"""
+    await _hold(service, 10, 160000)
+    await service.execute_daily_sell_order()
+
+    async def timeout(*args):
+        raise httpx.ReadTimeout("timeout")
+
+    monkeypatch.setattr(service.api, "sell", timeout)
+    assert await service.on_price("133690", 176003) == []
+
+    [order] = service.session.orders
+    assert order.kiwoom_order_id is None and order.status == OrderStatus.PENDING
+    assert order.client_order_id.endswith(f"{TRIGGER_MARK}take_profit")
+
+
+async def test_buy_fill_rearms_target(service):
+    await _hold(service, 10, 160000)
+    await service.execute_daily_sell_order()
+
+    await service.api.buy("133690", 10, 140000)
+    await service.check_order_execution()
+
+    position = await service.position_repo.get_by_symbol("133690")
+    trigger = service.triggers.get(service._take_profit_key())
+    assert trigger.threshold == service._get_strategy(position).calculate_sell_price(
+        position.avg_price
+    )
+    assert trigger.threshold < 176000
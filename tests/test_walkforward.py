@@ -0,0 +1,67 @@
+"""워크포워드 최적화 테스트"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.trading.backtest import BacktestConfig, Bar  # noqa: E402
+from app.trading.backtest.walkforward import split_windows, walk_forward  # noqa: E402
+
+
+def _bars(n: int, seed: int = 0) -> list[Bar]:
+    rng = np.random.default_rng(seed)
+    closes = 10000 * np.cumprod(1 + rng.normal(0.0003, 0.02, n))
+    bars = []
+    prev = Decimal(int(closes[0]))
+    for i, c in enumerate(closes):
+        close = Decimal(int(c))
+        day = date(2020, 1, 1) + timedelta(days=i)
+        bars.append(Bar(day, prev, max(prev, close) * Decimal("1.01"), min(prev, close), close))
+        prev = close
+    return bars
+
+
+def test_split_windows_roll_by_test_length():
+    assert split_windows(10, 4, 3) == [(0, 4, 7), (3, 7, 10)]
+    assert split_windows(4, 4, 3) == []
+
+
+def test_out_of_sample_curve_stitched(tmp_path):
+    """검증 구간 곡선을 이어 붙여 누적 수익률 계산"""
+    result = walk_forward(
+        _bars(400), 200, 50, [10, 20], [1.05, 1.10],
+        config=BacktestConfig(total_investment=Decimal("10000000")),
+        cache_dir=tmp_path, workers=1,
+    )
+
+    assert len(result.windows) == 4
+    curve = result.equity_curve
+    assert [d for d, _ in curve] == [b.date for b in _bars(400)[200:]]
+    expected = np.prod([1 + w.test_return for w in result.windows]) - 1
+    assert result.total_return == pytest.approx(expected)
+    grid = {(10, 1.05), (10, 1.1), (20, 1.05), (20, 1.1)}
+    assert all((w.num_splits, w.profit_target) in grid for w in result.windows)
+
+
+def test_rerun_with_new_data_uses_cache(tmp_path):
+    """데이터 추가 후 재실행 시 새 구간만 계산"""
+    kwargs = dict(num_splits=[10, 20], profit_targets=[1.05, 1.10], cache_dir=tmp_path, workers=1)
+
+    first = walk_forward(_bars(400)[:350], 200, 50, **kwargs)
+    second = walk_forward(_bars(400), 200, 50, **kwargs)
+
+    assert first.cached == 0
+    assert second.cached == len(first.windows) == 3
+    assert len(second.windows) == 4
+    assert second.windows[0] == first.windows[0]
+
+
+def test_parallel_matches_serial(tmp_path):
+    bars = _bars(300)
+    serial = walk_forward(bars, 150, 50, [10, 20], [1.1], cache_dir=None, workers=1)
+    parallel = walk_forward(bars, 150, 50, [10, 20], [1.1], cache_dir=None, workers=2)
+
+    assert serial.windows == parallel.windows
@@ -0,0 +1,143 @@
+"""쓰기 지연 저장 테스트"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import httpx
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.common.config import Settings
+from app.common.database import Base
+from app.common.money import Won
+from app.common.utils import KST
+from app.trading.external_api.fake_server import FakeKiwoomServer
+from app.trading.external_api.kiwoom import KiwoomRestAPI
+from app.trading.models.cycle_history import CycleHistory
+from app.trading.models.order import Order, OrderStatus, OrderType
+from app.trading.repository.memory import InMemoryPositionRepository
+from app.trading.repository.write_behind import WriteBehindWriter
+from app.trading.services.trading import TradingService
+
+
+@pytest.fixture
+async def sessions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _rows(sessions, model) -> list:
+    async with sessions() as session:
+        return list((await session.execute(select(model))).scalars().all())
+
+
+def _order(split: int = 1) -> Order:
+    return Order(
+        symbol="133690",
+        order_type=OrderType.BUY,
+        price=Won(150000),
+        quantity=3,
+        cycle_number=1,
+        split_number=split,
+        client_order_id=f"20260105-133690-1-{split}-BUY",
+    )
+
+
+async def test_record_journals_then_flush_upserts_latest(sessions, tmp_path):
+    writer = WriteBehindWriter(tmp_path / "wb.jsonl", sessions)
+    order = _order()
+    await writer.record(order)
+    order.kiwoom_order_id = "0000001"
+    await writer.record(order)
+
+    assert writer.pending == 2
+    assert len((tmp_path / "wb.jsonl").read_text().splitlines()) == 2
+    assert await _rows(sessions, Order) == []  # 아직 DB 반영 전
+
+    await writer.flush()
+
+    [row] = await _rows(sessions, Order)
+    assert row.id == order.id and row.kiwoom_order_id == "0000001"
+    assert row.status == OrderStatus.PENDING and row.price == Decimal("150000")
+    assert row.created_at is not None
+    assert (tmp_path / "wb.jsonl").read_text() == ""  # 반영 후 저널 비움
+
+
+async def test_created_at_uses_same_clock_on_both_paths(sessions, tmp_path, monkeypatch):
+    """쓰기 지연 저장과 직접 저장 모두 Python의 KST 시각으로 생성 시각을 채움"""
+    now = datetime(2026, 1, 5, 14, 30)
+    monkeypatch.setattr("app.common.utils.get_kst_now", lambda: now.replace(tzinfo=KST))
+    writer = WriteBehindWriter(tmp_path / "wb.jsonl", sessions)
+    await writer.record(_order(1))
+    await writer.flush()
+    async with sessions() as session:
+        session.add(_order(2))
+        await session.commit()
+
+    assert [row.created_at for row in await _rows(sessions, Order)] == [now, now]
+
+
+async def test_journal_is_replayed_on_start(sessions, tmp_path):
+    crashed = WriteBehindWriter(tmp_path / "wb.jsonl", sessions)
+    history = CycleHistory.create_from_position(
+        symbol="133690",
+        cycle_number=1,
+        start_investment=Won(10_000_000),
+        end_proceeds=Won(11_000_000),
+        total_trades=12,
+        started_at=datetime(2026, 1, 5, 14, 30),
+    )
+    await crashed.record(_order(), history)
+    with (tmp_path / "wb.jsonl").open("a") as f:
+        f.write('{"kind": "order", "ro')  # 기록 도중 종료
+
+    writer = WriteBehindWriter(tmp_path / "wb.jsonl", sessions)
+    assert await writer.start() == 2
+    await writer.stop()
+
+    assert len(await _rows(sessions, Order)) == 1
+    [cycle] = await _rows(sessions, CycleHistory)
+    assert cycle.profit_rate == Decimal("0.1000")
+
+
+async def test_stop_flushes_background_buffer(sessions, tmp_path):
+    writer = WriteBehindWriter(tmp_path / "wb.jsonl", sessions, flush_interval=60)
+    await writer.start()
+    await writer.record(*(_order(split) for split in (1, 2, 3)))
+    await writer.stop()
+
+    async with sessions() as session:
+        count = await session.scalar(select(func.count()).select_from(Order))
+    assert count == 3 and writer.pending == 0
+
+
+async def test_buy_job_orders_go_through_journal(settings_env, sessions, tmp_path):
+    server = FakeKiwoomServer(seed=1)
+    api = KiwoomRestAPI(transport=httpx.ASGITransport(app=server))
+    writer = WriteBehindWriter(tmp_path / "wb.jsonl", sessions, flush_interval=60)
+    config = Settings.model_construct(trading_symbols="133690,379800", kiwoom_account_no="1")
+
+    async with sessions() as session:
+        service = TradingService(
+            session,
+            api,
+            position_repo=InMemoryPositionRepository(),
+            config=config,
+            writer=writer,
+        )
+        orders = await service.execute_daily_buy_orders()
+        assert len(orders) == 2 and writer.pending == 4  # 제출 전 + 주문번호 확정
+        assert not session.new and await _rows(sessions, Order) == []
+
+        await writer.flush()
+        rows = await _rows(sessions, Order)
+        assert {r.kiwoom_order_id for r in rows} == {o.kiwoom_order_id for o in orders}
+
+        # 재실행 - DB에 반영된 client_order_id로 중복 제출 방지
+        assert await service.execute_daily_buy_orders() == []
+    assert len(server.account.orders) == 2
+    await api.close()